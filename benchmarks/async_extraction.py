@@ -0,0 +1,94 @@
+"""Benchmark ``extract_data_async`` against a sequential ``extract_data`` loop.
+
+Replicates the ``tests/compare`` documents into a batch and extracts it twice:
+one ``extract_data`` call after another, then every document at once with
+``asyncio.gather(extract_data_async(...))`` on a single event loop. Also
+reports the worst event-loop stall seen while the async batch runs (a ticker
+coroutine measures how late its 10 ms sleeps wake up). No backend call runs on
+the loop, so what remains is the loop waiting for the GIL while executor
+threads run templates; it does not grow with per-document I/O latency.
+
+Run with the package installed (pdftotext on the PATH exercises the
+subprocess path):
+
+    python benchmarks/async_extraction.py [copies]
+"""
+
+import asyncio
+import logging
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from invoice2data import extract_data
+from invoice2data import extract_data_async
+from invoice2data.extract.loader import read_templates
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPARE = ROOT / "tests" / "compare"
+TICK = 0.01
+
+
+def _batch(folder: Path, copies: int) -> list[str]:
+    # Distinct paths so nothing is served from the per-file text caches.
+    files = sorted(p for p in COMPARE.iterdir() if p.suffix in (".pdf", ".txt"))
+    batch = []
+    for copy in range(copies):
+        for source in files:
+            target = folder / f"{source.stem}-{copy}{source.suffix}"
+            shutil.copyfile(source, target)
+            batch.append(str(target))
+    return batch
+
+
+async def _gather(batch: list[str], templates: Any) -> tuple[float, float]:
+    stall = 0.0
+    done = False
+
+    async def ticker() -> None:
+        nonlocal stall
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            stall = max(stall, time.perf_counter() - start - TICK)
+
+    tick = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(*(extract_data_async(p, templates) for p in batch))
+    elapsed = time.perf_counter() - start
+    done = True
+    await tick
+    return elapsed, stall
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    templates = read_templates()
+    with tempfile.TemporaryDirectory() as tmp:
+        sync_dir, async_dir = Path(tmp) / "sync", Path(tmp) / "async"
+        sync_dir.mkdir()
+        async_dir.mkdir()
+        sync_batch = _batch(sync_dir, copies)
+        async_batch = _batch(async_dir, copies)
+        print(f"{len(sync_batch)} files\n")
+
+        start = time.perf_counter()
+        for path in sync_batch:
+            extract_data(path, templates)
+        sequential = time.perf_counter() - start
+        print(f"sequential extract_data   {sequential:7.2f} s")
+
+        elapsed, stall = asyncio.run(_gather(async_batch, templates))
+        print(
+            f"gathered extract_data_async {elapsed:5.2f} s "
+            f"({sequential / elapsed:.2f}x), worst loop stall {stall * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
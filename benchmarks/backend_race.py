@@ -0,0 +1,74 @@
+"""Benchmark the default cascade with and without ``race=True``.
+
+Extracts every ``tests/compare`` PDF through the default backend cascade
+(pdfium, then pdftotext) one backend after another, then with both started at
+once. Documents that pdfium handles alone cost about the same either way; those
+that fall back to pdftotext -- no match, a missing field, a dropped line-item
+table or a template pinning ``input_module: pdftotext`` -- should drop from
+pdfium + pdftotext to roughly the slower of the two. The in-process text memo
+is cleared before each document so every run extracts afresh.
+
+Run with the package installed and pdftotext on the PATH (without it the
+cascade has a single backend and there is nothing to race):
+
+    python benchmarks/backend_race.py [rounds]
+"""
+
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from invoice2data import extract_data
+from invoice2data.api import DEFAULT_INPUT_READERS
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.loader import read_templates
+from invoice2data.input import _cached_to_text
+from invoice2data.input import is_available
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPARE = ROOT / "tests" / "compare"
+
+
+def _latencies(
+    files: list[str], templates: list[InvoiceTemplate], rounds: int, race: bool
+) -> list[float]:
+    latencies = []
+    for _ in range(rounds):
+        for path in files:
+            _cached_to_text.cache_clear()
+            start = time.perf_counter()
+            extract_data(path, templates, race=race)
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    print(
+        f"{label:12s} total {sum(latencies):6.2f} s  "
+        f"median {statistics.median(latencies) * 1000:6.1f} ms  "
+        f"p95 {p95 * 1000:6.1f} ms  max {max(latencies) * 1000:6.1f} ms"
+    )
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    readers = [m.__name__ for m in DEFAULT_INPUT_READERS if is_available(m)]
+    if len(readers) < 2:
+        print(f"only {readers} available: nothing to race")
+        return
+    files = sorted(str(p) for p in COMPARE.iterdir() if p.suffix == ".pdf")
+    templates = read_templates()
+    print(f"{len(files)} PDFs x {rounds} rounds, readers {readers}\n")
+
+    _latencies(files, templates, 1, race=False)  # warm up: imports, templates
+    _report("sequential", _latencies(files, templates, rounds, race=False))
+    _report("race", _latencies(files, templates, rounds, race=True))
+
+
+if __name__ == "__main__":
+    main()
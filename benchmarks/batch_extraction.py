@@ -0,0 +1,60 @@
+"""Benchmark batch throughput of ``extract_many`` vs. worker count.
+
+Replicates the ``tests/compare`` documents into a batch and extracts it with
+1, 2, 4, ... workers (up to the CPU count), reporting files per second and the
+speed-up over a single in-process worker. On an otherwise idle machine the
+speed-up should track the worker count closely: each worker loads templates
+once and files are independent.
+
+Run with the package installed:
+
+    python benchmarks/batch_extraction.py [copies]
+"""
+
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+from invoice2data import extract_many
+from invoice2data.extract.loader import read_templates
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPARE = ROOT / "tests" / "compare"
+
+
+def _worker_counts() -> list[int]:
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    files = sorted(str(p) for p in COMPARE.iterdir() if p.suffix in (".pdf", ".txt"))
+    batch = files * copies
+    templates = read_templates()
+    print(f"{len(batch)} files ({len(files)} documents x {copies})\n")
+    print(f"{'workers':>7s} {'seconds':>9s} {'files/s':>9s} {'speed-up':>9s}")
+    baseline = None
+    for workers in _worker_counts():
+        start = time.perf_counter()
+        results = list(extract_many(batch, templates, workers))
+        elapsed = time.perf_counter() - start
+        assert len(results) == len(batch)
+        baseline = baseline or elapsed
+        print(
+            f"{workers:7d} {elapsed:9.2f} {len(batch) / elapsed:9.1f} "
+            f"{baseline / elapsed:8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark coercing a large ``lines`` table per cell against per column.
+
+Builds 5,000 line items with two number columns (``1.234,56`` style, so each
+goes through the separator cleanup), an integer column and a date column
+(``date_formats: ["%d.%m.%Y"]``) and coerces them two ways:
+
+- ``per cell``: :meth:`InvoiceTemplate.coerce_type` for every cell, as the
+  ``lines`` parser does for short blocks;
+- ``per column``: :func:`invoice2data.extract._columns.coerce_rows`, one
+  ``str.translate`` table per number column and each distinct date parsed
+  once.
+
+Both results are checked to be equal before timing. The date memo of
+:func:`~invoice2data.extract._dates.parse_date` is cleared before every run so
+neither side is timed on the other's cache.
+
+Run with the package installed:
+
+    python benchmarks/columnar_coercion.py
+"""
+
+import copy
+import time
+from typing import Any
+
+from invoice2data.extract import _columns
+from invoice2data.extract import _dates
+from invoice2data.extract.invoice_template import InvoiceTemplate
+
+
+ROWS = 5_000
+RUNS = 7
+TYPES = {"price": "float", "total": "float", "qty": "int", "date": "date"}
+TEMPLATE = InvoiceTemplate(
+    [
+        ("issuer", "bench"),
+        ("keywords", ["bench"]),
+        ("template_name", "bench.yml"),
+        ("options", {"decimal_separator": ",", "date_formats": ["%d.%m.%Y"]}),
+    ]
+)
+
+
+def _rows() -> list[dict[str, Any]]:
+    return [
+        {
+            "description": f"Item {i}",
+            "price": f"{i % 97}.{i % 1000:03d},{i % 100:02d}",
+            "total": f"{i}.{i % 1000:03d},{i % 100:02d}",
+            "qty": str(i % 12 + 1),
+            "date": f"{i % 28 + 1:02d}.{i % 12 + 1:02d}.20{i % 30:02d}",
+        }
+        for i in range(ROWS)
+    ]
+
+
+def _per_cell(rows: list[dict[str, Any]]) -> None:
+    for row in rows:
+        for name in row:
+            if name in TYPES:
+                row[name] = TEMPLATE.coerce_type(row[name], TYPES[name])
+
+
+def _per_column(rows: list[dict[str, Any]]) -> None:
+    _columns.coerce_rows(TEMPLATE, rows, TYPES)
+
+
+def _time(coerce: Any, rows: list[dict[str, Any]]) -> float:
+    times = []
+    for _ in range(RUNS):
+        copied = copy.deepcopy(rows)
+        _dates.parse_date.cache_clear()
+        start = time.perf_counter()
+        coerce(copied)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main() -> None:
+    rows = _rows()
+    expected, columnar = copy.deepcopy(rows), copy.deepcopy(rows)
+    _per_cell(expected)
+    _per_column(columnar)
+    assert expected == columnar
+    print(f"{ROWS} rows x {len(TYPES)} typed columns, best of {RUNS} runs\n")
+    for name, coerce in (("per cell", _per_cell), ("per column", _per_column)):
+        print(f"{name:11s} {_time(coerce, rows):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark per-extract template overhead with and without a compiled plan.
+
+For every ``tests/compare`` document a template matches, times
+``prepare_input`` + ``extract`` two ways: with the plan :func:`read_templates`
+compiles at load time, and with the plan thrown away before each call, which
+re-derives everything from the raw template the way ``extract`` used to
+(field dispatch, parser lookup, ``replace`` normalization, line-rule defaults,
+required fields).
+
+Run with the package installed:
+
+    python benchmarks/compiled_templates.py
+"""
+
+import contextlib
+import logging
+import statistics
+import time
+from pathlib import Path
+
+from invoice2data.api import _by_priority
+from invoice2data.api import _match_template
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.loader import read_templates
+from invoice2data.input import available_modules
+from invoice2data.input import extract_text
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPARE = ROOT / "tests" / "compare"
+RUNS = 7
+REPEAT = 50
+
+
+def _documents() -> list[tuple[str, str]]:
+    docs = [
+        (path.name, path.read_text(encoding="utf-8")) for path in COMPARE.glob("*.txt")
+    ]
+    modules = available_modules()
+    reader = modules.get("pdftotext") or modules.get("pdfium")
+    if reader is not None:
+        for pdf in sorted(COMPARE.glob("*.pdf")):
+            with contextlib.suppress(Exception):
+                docs.append((pdf.name, extract_text(reader, str(pdf))))
+    return docs
+
+
+def _extract(template: InvoiceTemplate, text: str, cold: bool) -> None:
+    if cold:
+        vars(template).pop("_compiled", None)
+    with contextlib.suppress(ValueError):
+        template.extract(template.prepare_input(text), "", None)
+
+
+def _time(template: InvoiceTemplate, text: str, cold: bool) -> float:
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            _extract(template, text, cold)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) / REPEAT * 1000
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    templates = _by_priority(read_templates())
+    print(f"Per-extract time ({RUNS} runs x {REPEAT} extracts, median)\n")
+    print(f"{'document':28s} {'uncompiled':>13s} {'compiled':>11s} {'saved':>8s}")
+    totals = [0.0, 0.0]
+    for name, text in _documents():
+        template = _match_template(text, templates)
+        if template is None:
+            continue
+        cold = _time(template, text, cold=True)
+        warm = _time(template, text, cold=False)
+        totals[0] += cold
+        totals[1] += warm
+        print(f"{name:28s} {cold:10.3f} ms {warm:8.3f} ms {1 - warm / cold:7.0%}")
+    print(
+        f"{'total':28s} {totals[0]:10.3f} ms {totals[1]:8.3f} ms "
+        f"{1 - totals[1] / totals[0]:7.0%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
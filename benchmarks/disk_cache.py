@@ -0,0 +1,61 @@
+"""Benchmark re-processing a batch with the persistent text cache.
+
+Extracts the ``tests/compare`` documents three times: without the disk cache,
+then twice with it -- a cold run that fills it and a warm run that reads it
+back, as a second CLI run (or a run after a template change) would. The
+in-process memo is cleared before every run, so only the disk cache carries
+text over. The warm run should skip all PDF parsing and OCR.
+
+Run with the package installed:
+
+    python benchmarks/disk_cache.py [copies]
+"""
+
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from invoice2data import extract_data
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.loader import read_templates
+from invoice2data.input import _cached_to_text
+from invoice2data.input.disk_cache import configure_disk_cache
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPARE = ROOT / "tests" / "compare"
+
+
+def _run(batch: list[str], templates: list[InvoiceTemplate]) -> float:
+    _cached_to_text.cache_clear()
+    start = time.perf_counter()
+    for path in batch:
+        extract_data(path, templates)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    files = sorted(str(p) for p in COMPARE.iterdir() if p.suffix == ".pdf")
+    batch = files * copies
+    templates = read_templates()
+    print(f"{len(batch)} files ({len(files)} PDFs x {copies})\n")
+
+    configure_disk_cache(None)
+    _run(files, templates)  # warm up: imports, compiled templates
+    uncached = _run(batch, templates)
+    print(f"{'no disk cache':16s} {uncached:7.2f} s")
+    with tempfile.TemporaryDirectory() as folder:
+        configure_disk_cache(folder)
+        cold = _run(batch, templates)
+        warm = _run(batch, templates)
+        configure_disk_cache(None)
+    print(f"{'cold disk cache':16s} {cold:7.2f} s")
+    print(f"{'warm disk cache':16s} {warm:7.2f} s ({uncached / warm:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark template matching time vs. template count (keyword index).
+
+Pads the bundled templates with synthetic ones (random keywords that never occur
+in the sample texts, the common case for a large in-house template set) and times
+matching every ``tests/compare`` text two ways: the linear ``matches_input`` scan
+``_match_template`` used to run, and the Aho-Corasick :class:`KeywordIndex`.
+
+Run with the package installed:
+
+    python benchmarks/keyword_matching.py
+"""
+
+import contextlib
+import logging
+import random
+import statistics
+import string
+import time
+from pathlib import Path
+
+from invoice2data.api import _by_priority
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.keyword_index import KeywordIndex
+from invoice2data.extract.loader import read_templates
+from invoice2data.input import available_modules
+from invoice2data.input import extract_text
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPARE = ROOT / "tests" / "compare"
+COUNTS = [215, 1000, 3000, 6000]
+RUNS = 5
+
+
+def _texts() -> list[str]:
+    texts = [path.read_text(encoding="utf-8") for path in COMPARE.glob("*.txt")]
+    modules = available_modules()
+    reader = modules.get("pdftotext") or modules.get("pdfium")
+    if reader is not None:
+        for pdf in sorted(COMPARE.glob("*.pdf")):
+            with contextlib.suppress(Exception):
+                texts.append(extract_text(reader, str(pdf)))
+    return texts
+
+
+def _synthetic(count: int, rng: random.Random) -> list[InvoiceTemplate]:
+    def word() -> str:
+        return "".join(rng.choices(string.ascii_letters, k=rng.randint(5, 12)))
+
+    return [
+        InvoiceTemplate(
+            {
+                "template_name": f"synthetic-{i}.yml",
+                "issuer": f"synthetic {i}",
+                "keywords": [word() for _ in range(rng.randint(1, 4))],
+                "exclude_keywords": [],
+                "priority": rng.randint(1, 9),
+            }
+        )
+        for i in range(count)
+    ]
+
+
+def _linear(text: str, templates: list[InvoiceTemplate]) -> InvoiceTemplate | None:
+    for template in templates:
+        if template.matches_input(text):
+            return template
+    return None
+
+
+def _time(func: object, texts: list[str]) -> float:
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)  # type: ignore[operator]
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) / len(texts) * 1000
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(0)  # noqa: S311 - reproducible synthetic keywords
+    builtin = read_templates()
+    texts = _texts()
+    print(f"Matching {len(texts)} sample texts ({RUNS} runs, median)\n")
+    print(
+        f"{'templates':>9s} {'linear':>12s} {'index':>12s} {'build':>10s} {'speedup':>8s}"
+    )
+    for count in COUNTS:
+        templates = _by_priority(builtin + _synthetic(count - len(builtin), rng))
+        start = time.perf_counter()
+        index = KeywordIndex(templates)
+        build = (time.perf_counter() - start) * 1000
+        for text in texts:
+            assert index.match(text) is _linear(text, templates)
+        linear = _time(lambda text, t=templates: _linear(text, t), texts)
+        indexed = _time(index.match, texts)
+        print(
+            f"{count:9d} {linear:9.3f} ms {indexed:9.3f} ms {build:7.1f} ms "
+            f"{linear / indexed:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark finding ``lines`` blocks in long statements against block count.
+
+Builds synthetic statements of 250 to 2,000 repeated ``start``/``end`` blocks
+(three item lines and a page of filler each) and runs one ``lines`` rule over
+them two ways:
+
+- ``sliced``: the old loop, which cut the remaining text after every ``start``
+  and ``end`` match (``content = content[match.end():]``), copying the rest of
+  the statement twice per block;
+- ``positional``: :func:`~invoice2data.extract.parsers.lines.parse_by_rule`,
+  which searches the one buffer from a position and copies only each block.
+
+Both parse the blocks' lines the same way. The time per block stays flat for
+``positional`` as blocks grow and rises with the statement's length for
+``sliced``.
+
+Run with the package installed:
+
+    python benchmarks/lines_blocks.py
+"""
+
+import logging
+import statistics
+import time
+from typing import Any
+
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.parsers import lines
+
+
+BLOCKS = (250, 500, 1000, 2000)
+RUNS = 5
+FILLER = "Terms and conditions apply. " * 60 + "\n"
+SETTINGS = {
+    "start": r"(?m)^Item\s+Qty\s+Amount$",
+    "end": r"(?m)^Subtotal",
+    "line": r"(?m)^(?P<item>\w+)\s+(?P<qty>\d+)\s+(?P<amount>[\d.]+)$",
+}
+TEMPLATE = InvoiceTemplate(
+    [("issuer", "bench"), ("keywords", ["bench"]), ("template_name", "bench.yml")]
+)
+
+
+def _statement(blocks: int) -> str:
+    return "".join(
+        f"Item Qty Amount\nA{i} 1 1.00\nB{i} 2 4.00\nC{i} 3 9.00\n"
+        f"Subtotal 14.00\n{FILLER}"
+        for i in range(blocks)
+    )
+
+
+def _sliced(content: str) -> list[dict[str, Any]]:
+    rule = lines._prepare_rule(TEMPLATE, dict(SETTINGS))
+    start_pattern = lines._regex.compile(SETTINGS["start"])
+    end_pattern = lines._regex.compile(SETTINGS["end"])
+    rows = []
+    while True:
+        start = start_pattern.search(content)
+        if not start:
+            break
+        content = content[start.end() :]
+        end = end_pattern.search(content)
+        if not end:
+            break
+        rows += lines._parse_block(TEMPLATE, "lines", rule, content[: end.start()])
+        content = content[end.end() :]
+    return rows
+
+
+def _positional(content: str) -> list[dict[str, Any]]:
+    return lines.parse_by_rule(TEMPLATE, "lines", dict(SETTINGS), content)
+
+
+def _time(parse: Any, content: str) -> float:
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        parse(content)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    print(f"Median of {RUNS} runs; ms per statement (us per block)\n")
+    print(f"{'blocks':>6s} {'KiB':>7s} {'sliced':>17s} {'positional':>17s}")
+    for blocks in BLOCKS:
+        content = _statement(blocks)
+        assert _sliced(content) == _positional(content)
+        sliced = _time(_sliced, content)
+        positional = _time(_positional, content)
+        print(
+            f"{blocks:6d} {len(content) / 1024:7.0f} "
+            f"{sliced:8.1f} ({sliced / blocks * 1000:6.1f}) "
+            f"{positional:8.1f} ({positional / blocks * 1000:6.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
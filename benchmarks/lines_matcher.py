@@ -0,0 +1,78 @@
+"""Benchmark the combined line matcher on a 10,000-row bank-style statement.
+
+Parses one ``lines`` block of 10,000 transactions (a ``first_line`` per
+booking, an indented ``line`` of details, a ``last_line`` balance, and a
+repeated page header dropped by ``skip_line``) two ways:
+
+- ``one by one``: each line searched with every ``skip_line`` pattern, then
+  ``first_line``, ``last_line`` and ``line`` in turn, as before;
+- ``combined``: the rule's patterns compiled into one alternation, one regex
+  pass per line (:class:`~invoice2data.extract.parsers.lines._LineMatcher`).
+
+Both produce the same rows, which is checked before timing.
+
+Run with the package installed:
+
+    python benchmarks/lines_matcher.py
+"""
+
+import dataclasses
+import logging
+import time
+
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.parsers import lines
+
+
+ROWS = 10_000
+RUNS = 11
+SETTINGS = {
+    **lines.DEFAULT_OPTIONS,
+    "first_line": r"^(?P<date>\d{2}\.\d{2}\.\d{4})\s+(?P<text>.+?)\s+(?P<amount>-?[\d,]+\.\d{2})$",
+    "line": r"^\s{4,}(?P<text>\S.*)$",
+    "last_line": r"^\s+Balance\s+(?P<balance>-?[\d,]+\.\d{2})$",
+    "skip_line": [r"^Statement of account", r"^\s*Page \d+ of \d+$"],
+}
+TEMPLATE = InvoiceTemplate(
+    [("issuer", "bench"), ("keywords", ["bench"]), ("template_name", "bench.yml")]
+)
+
+
+def _statement() -> str:
+    rows = []
+    for i in range(ROWS):
+        if i % 40 == 0:
+            rows.append(f"Statement of account 123456\n   Page {i // 40 + 1} of 250\n")
+        rows.append(
+            f"{i % 28 + 1:02d}.03.2024  Card payment shop {i}   -{i % 997}.{i % 100:02d}\n"
+            f"      Ref {i:08d} terminal 42\n"
+            f"   Balance  {10_000 - i}.00\n"
+        )
+    return "".join(rows)
+
+
+def _time(rule: lines._Rule, content: str) -> float:
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        lines._parse_block(TEMPLATE, "lines", rule, content)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    content = _statement()
+    combined = lines._block_rule(TEMPLATE, dict(SETTINGS))
+    assert combined.matcher is not None
+    one_by_one = dataclasses.replace(combined, matcher=None)
+    rows = lines._parse_block(TEMPLATE, "lines", combined, content)
+    assert len(rows) == ROWS
+    assert rows == lines._parse_block(TEMPLATE, "lines", one_by_one, content)
+    print(f"{ROWS} rows, best of {RUNS} runs\n")
+    for name, rule in (("one by one", one_by_one), ("combined", combined)):
+        print(f"{name:11s} {_time(rule, content):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark two-phase matching (``match_pages``) on long documents.
+
+Builds 200-page PDFs by repeating the first page of a ``tests/compare`` PDF: one
+that a built-in template matches (``oyo.pdf``) and one that none does
+(``saeco.pdf``'s first page, with the templates matching it left out). Each is
+extracted through the default cascade with the whole document read up front
+and with ``match_pages=1``, where only the first page is parsed until a template
+matches it. The in-process caches are cleared before each run.
+
+Run with the package installed (pypdfium2 needed):
+
+    python benchmarks/match_pages.py
+"""
+
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import pypdfium2
+
+from invoice2data import extract_data
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.loader import read_templates
+from invoice2data.input import _cached_head
+from invoice2data.input import _cached_to_text
+from invoice2data.input import pdfium
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPARE = ROOT / "tests" / "compare"
+PAGES = 200
+RUNS = 5
+
+
+def _long(source: Path, target: Path) -> str:
+    original = pypdfium2.PdfDocument(str(source))
+    document = pypdfium2.PdfDocument.new()
+    document.import_pages(original, [0] * PAGES)
+    document.save(str(target))
+    return str(target)
+
+
+def _time(
+    path: str, templates: list[InvoiceTemplate], match_pages: int | None
+) -> float:
+    timings = []
+    for _ in range(RUNS):
+        _cached_to_text.cache_clear()
+        _cached_head.cache_clear()
+        start = time.perf_counter()
+        extract_data(path, templates, match_pages=match_pages)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    templates = read_templates()
+    with tempfile.TemporaryDirectory() as folder:
+        matched = _long(COMPARE / "oyo.pdf", Path(folder) / "matched.pdf")
+        unmatched = _long(COMPARE / "saeco.pdf", Path(folder) / "unmatched.pdf")
+        first_page = pdfium.to_text_head(unmatched, 1)[0]
+        others = [t for t in templates if not t.matches_input(first_page)]
+        print(f"{PAGES}-page PDFs, median of {RUNS} runs\n")
+        for label, path, candidates in (
+            ("matching template", matched, templates),
+            ("no template", unmatched, others),
+        ):
+            full = _time(path, candidates, None)
+            head = _time(path, candidates, 1)
+            print(
+                f"{label:18s} whole document {full * 1000:8.1f} ms  "
+                f"match_pages=1 {head * 1000:8.1f} ms  ({full / head:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark page-parallel OCR: wall time against page count and workers.
+
+Builds 1-, 2-, 4- and 8-page PDFs by repeating the first page of
+``tests/compare/oyo.pdf`` and OCRs each with every available OCR backend
+(tesseract, PaddleOCR, docTR), once per ``max_ocr_workers`` setting. With one
+worker the pages are OCRed one after another, as before; with more, wall time
+should grow with ``pages / workers`` until the cores run out. The OCR cache is
+cleared before each run.
+
+Run with the package installed (pypdfium2 needed, plus the OCR tools):
+
+    python benchmarks/ocr_pages.py
+"""
+
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+
+import pypdfium2
+
+from invoice2data.input import doctr
+from invoice2data.input import paddleocr
+from invoice2data.input import tesseract
+from invoice2data.input.ocr_pool import configure_ocr_workers
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE = ROOT / "tests" / "compare" / "oyo.pdf"
+PAGES = (1, 2, 4, 8)
+WORKERS = (1, 2, 4)
+BACKENDS: dict[str, ModuleType] = {
+    "tesseract": tesseract,
+    "paddleocr": paddleocr,
+    "doctr": doctr,
+}
+
+
+def _pdf(pages: int, folder: Path) -> str:
+    original = pypdfium2.PdfDocument(str(SOURCE))
+    document = pypdfium2.PdfDocument.new()
+    document.import_pages(original, [0] * pages)
+    target = folder / f"scan-{pages}.pdf"
+    document.save(str(target))
+    return str(target)
+
+
+def _time(module: ModuleType, path: str, workers: int) -> float:
+    configure_ocr_workers(workers)
+    tesseract._ocr_pdfs.clear()
+    start = time.perf_counter()
+    module.to_text(path)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    print(f"{os.cpu_count()} CPUs; wall time in seconds per document\n")
+    with tempfile.TemporaryDirectory() as folder:
+        paths = {pages: _pdf(pages, Path(folder)) for pages in PAGES}
+        for name, module in BACKENDS.items():
+            if not module.is_available():
+                print(f"{name:10s} not available here")
+                continue
+            header = "".join(f"  {workers} worker(s)" for workers in WORKERS)
+            print(f"{name:10s} pages{header}")
+            for pages, path in paths.items():
+                cells = "".join(
+                    f"  {_time(module, path, workers):11.2f}" for workers in WORKERS
+                )
+                print(f"{'':10s} {pages:5d}{cells}")
+    configure_ocr_workers(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark peak memory of PaddleOCR page rendering against page count.
+
+Builds 1-, 10-, 50- and 100-page PDFs by repeating the first page of
+``tests/compare/oyo.pdf`` and feeds their pages to OCR two ways:
+
+- ``eager``: every page rendered into a list before OCR starts (the old
+  ``_page_arrays``);
+- ``streamed``: the ``_page_arrays`` generator through
+  :func:`~invoice2data.input.ocr_pool.map_pages` with the backend's prefetch,
+  each bitmap released once OCR'd.
+
+With PaddleOCR installed the pages go through the real engine; without it a
+stand-in "OCR" that only reads the bitmap is used, which still shows the
+rendering side. Each case runs in a fresh process and reports the Python heap
+peak from :mod:`tracemalloc` (numpy allocations included) and the process's
+peak RSS. Streamed peaks should stay flat as pages grow; eager ones grow by
+one bitmap per page.
+
+Run with the package installed (pypdfium2 and numpy needed, PaddleOCR
+optional; peak RSS is read with :mod:`resource`, so Unix only):
+
+    python benchmarks/paddle_memory.py
+"""
+
+import resource
+import sys
+import tempfile
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pypdfium2
+
+from invoice2data.input import paddleocr
+from invoice2data.input.ocr_pool import map_pages
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE = ROOT / "tests" / "compare" / "oyo.pdf"
+PAGES = (1, 10, 50, 100)
+
+
+def _pdf(pages: int, folder: Path) -> str:
+    original = pypdfium2.PdfDocument(str(SOURCE))
+    document = pypdfium2.PdfDocument.new()
+    document.import_pages(original, [0] * pages)
+    target = folder / f"scan-{pages}.pdf"
+    document.save(str(target))
+    return str(target)
+
+
+def _ocr(image: Any) -> str:
+    if paddleocr.paddleocr_available():
+        return paddleocr._extract_text(paddleocr._get_ocr().ocr(image))
+    return str(int(image[::64, ::64].sum()))
+
+
+def _run(mode: str, path: str) -> tuple[float, float]:
+    tracemalloc.start()
+    if mode == "eager":
+        pages: Any = list(paddleocr._page_arrays(path))
+    else:
+        pages = paddleocr._page_arrays(path)
+    map_pages(_ocr, pages, paddleocr._PREFETCH)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss_bytes = rss if sys.platform == "darwin" else rss * 1024
+    return peak / 2**20, rss_bytes / 2**20
+
+
+def main() -> None:
+    engine = "PaddleOCR" if paddleocr.paddleocr_available() else "stand-in OCR"
+    print(f"{engine}; peaks in MiB\n")
+    print(f"{'mode':9s} {'pages':>5s} {'heap':>8s} {'rss':>8s}")
+    with tempfile.TemporaryDirectory() as folder:
+        for pages in PAGES:
+            path = _pdf(pages, Path(folder))
+            for mode in ("eager", "streamed"):
+                with ProcessPoolExecutor(1) as pool:
+                    heap, rss = pool.submit(_run, mode, path).result()
+                print(f"{mode:9s} {pages:5d} {heap:8.1f} {rss:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark the default cascade with a learned routing table.
+
+Extracts every ``tests/compare`` PDF three times through the default cascade:
+without a routing table, then with one -- a first pass that fills it and a
+second that follows its routes, as the next CLI run would. Documents whose
+template only completes on pdftotext (or pins it) should skip the template run
+on pdfium's text and the re-match in the second pass. Also prints the table's
+hit and miss counts. The in-process text memo is cleared before each document
+so every pass extracts afresh.
+
+Run with the package installed and pdftotext on the PATH (without it the
+cascade has a single backend and there is nothing to route):
+
+    python benchmarks/routing.py
+"""
+
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from invoice2data import RoutingTable
+from invoice2data import extract_data
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.loader import read_templates
+from invoice2data.input import _cached_to_text
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPARE = ROOT / "tests" / "compare"
+
+
+def _run(
+    files: list[str], templates: list[InvoiceTemplate], routing: RoutingTable | None
+) -> float:
+    start = time.perf_counter()
+    for path in files:
+        _cached_to_text.cache_clear()
+        extract_data(path, templates, routing=routing)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    files = sorted(str(p) for p in COMPARE.iterdir() if p.suffix == ".pdf")
+    templates = read_templates()
+    print(f"{len(files)} PDFs\n")
+
+    _run(files, templates, None)  # warm up: imports, compiled templates
+    print(f"{'no routing':16s} {_run(files, templates, None):7.2f} s")
+    with tempfile.TemporaryDirectory() as folder:
+        routing = RoutingTable(Path(folder) / "routes.json")
+        print(f"{'learning pass':16s} {_run(files, templates, routing):7.2f} s")
+        print(f"{'routed pass':16s} {_run(files, templates, routing):7.2f} s")
+        statistics = routing.statistics().values()
+        hits = sum(entry.get("hits", 0) for entry in statistics)
+        misses = sum(entry.get("misses", 0) for entry in statistics)
+    print(f"\nrouted documents: {hits} hits, {misses} misses")
+
+
+if __name__ == "__main__":
+    main()
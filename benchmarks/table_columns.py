@@ -0,0 +1,100 @@
+"""Benchmark the ``tables`` plugin's ``columns`` mode on a fixed-width table.
+
+Extracts one table of 10,000 aligned rows (description, quantity, unit price,
+amount) three ways:
+
+- ``body``: every row matched with a ``body`` regex, as before;
+- ``offsets``: rows sliced at ``[start, end]`` positions given in ``columns``;
+- ``labels``: positions inferred from the column labels in the header.
+
+All three produce the same values, which is checked before timing.
+
+Run with the package installed:
+
+    python benchmarks/table_columns.py
+"""
+
+import logging
+import time
+from typing import Any
+
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.plugins import tables
+
+
+ROWS = 10_000
+RUNS = 11
+COMMON = {"start": r"Description\s+Qty", "end": r"\nTotal\n", "types": {"qty": "int"}}
+TABLES: dict[str, dict[str, Any]] = {
+    "body": {
+        **COMMON,
+        "body": r"(?P<description>\S+(?: \S+)*)\s+(?P<qty>\d+)\s+"
+        r"(?P<price>[\d.]+)\s+(?P<amount_line>[\d.]+)",
+    },
+    "offsets": {
+        **COMMON,
+        "columns": {
+            "description": [0, 30],
+            "qty": [30, 36],
+            "price": [36, 46],
+            "amount_line": [46, None],
+        },
+    },
+    "labels": {
+        **COMMON,
+        "columns": {
+            "description": "Description",
+            "qty": "Qty",
+            "price": "Price",
+            "amount_line": "Amount",
+        },
+    },
+}
+
+
+def _template(table: dict[str, Any]) -> InvoiceTemplate:
+    return InvoiceTemplate(
+        [
+            ("issuer", "bench"),
+            ("keywords", ["bench"]),
+            ("template_name", "bench.yml"),
+            ("tables", [table]),
+        ]
+    )
+
+
+def _invoice() -> str:
+    rows = [f"{'Description':30s}{'Qty':>6s}{'Price':>10s}{'Amount':>10s}\n"]
+    for i in range(ROWS):
+        qty = i % 50 + 1
+        price = (i % 997) / 100
+        rows.append(
+            f"{f'Part {i} rev {i % 7}':30s}{qty:6d}{price:10.2f}{qty * price:10.2f}\n"
+        )
+    rows.append("Total\n")
+    return "".join(rows)
+
+
+def _time(template: InvoiceTemplate, content: str) -> float:
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        tables.extract(template, content, {})
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    content = _invoice()
+    templates = {name: _template(table) for name, table in TABLES.items()}
+    outputs = [tables.extract(t, content, {}) for t in templates.values()]
+    assert len(outputs[0]["qty"]) == ROWS
+    assert all(output == outputs[0] for output in outputs)
+    print(f"{ROWS} rows, best of {RUNS} runs\n")
+    for name, template in templates.items():
+        print(f"{name:8s} {_time(template, content):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
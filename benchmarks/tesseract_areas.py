@@ -0,0 +1,53 @@
+"""Benchmark tesseract OCR time for a template with area fields.
+
+A template with five ``area`` fields used to cost six OCR runs per document:
+one for the full text and one per area, because the area only changed the
+final pdftotext flags. The backend now OCRs each document once and crops the
+areas from the OCR layer's word boxes. For each ``tests/compare`` PDF this
+times the full text plus five areas as they run now, and with the OCR cache
+emptied before every area (what the per-area pipeline cost).
+
+Run with the package installed (needs tesseract, ImageMagick and pdftotext):
+
+    python benchmarks/tesseract_areas.py
+"""
+
+import statistics
+import time
+from pathlib import Path
+
+from invoice2data.input import tesseract
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPARE = ROOT / "tests" / "compare"
+AREAS = [
+    {"f": 1, "l": 1, "r": 300, "x": 0, "y": 300 * band, "W": 2500, "H": 300}
+    for band in range(5)
+]
+
+
+def _extract(path: str, reocr: bool) -> float:
+    tesseract._ocr_pdfs.clear()
+    start = time.perf_counter()
+    tesseract.to_text(path)
+    for area in AREAS:
+        if reocr:
+            tesseract._ocr_pdfs.clear()
+        tesseract.to_text(path, dict(area))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    if not tesseract.is_available():
+        print("tesseract or ImageMagick is not installed; nothing to measure")
+        return
+    paths = [str(path) for path in sorted(COMPARE.glob("*.pdf"))]
+    print(f"{len(paths)} PDFs, full text + {len(AREAS)} areas, median per document\n")
+    for label, reocr in (("OCR per area", True), ("OCR once", False)):
+        timings = [_extract(path, reocr) for path in paths]
+        print(f"{label:13s} {statistics.median(timings):7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark rasterizing PDF pages for tesseract: pypdfium2 against ImageMagick.
+
+Builds 1-, 10- and 50-page PDFs by repeating the first page of
+``tests/compare/oyo.pdf`` and rasterizes each at 300 DPI the way the tesseract
+backend does, without running tesseract itself:
+
+- ``pypdfium2``: pages rendered in-process to grayscale PGM buffers, one at a
+  time, each dropped before the next is rendered (what is piped to
+  tesseract's stdin);
+- ``imagemagick``: ``magick``/``convert`` writing one PNG per page, as before
+  (skipped when ImageMagick is not installed).
+
+For each it prints the wall time per page and the Python heap peak reported by
+:mod:`tracemalloc`, which stays at about one page for pypdfium2 whatever the
+page count (ImageMagick's memory is in its own process and not counted).
+
+Run with the package installed (pypdfium2 needed, ImageMagick optional):
+
+    python benchmarks/tesseract_render.py
+"""
+
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import pypdfium2
+
+from invoice2data.input import tesseract
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE = ROOT / "tests" / "compare" / "oyo.pdf"
+PAGES = (1, 10, 50)
+
+
+def _pdf(pages: int, folder: Path) -> str:
+    original = pypdfium2.PdfDocument(str(SOURCE))
+    document = pypdfium2.PdfDocument.new()
+    document.import_pages(original, [0] * pages)
+    target = folder / f"scan-{pages}.pdf"
+    document.save(str(target))
+    return str(target)
+
+
+def _pdfium(path: str, folder: Path) -> int:
+    document = pypdfium2.PdfDocument(path)
+    try:
+        return sum(len(image) > 0 for image in tesseract._page_images(document))
+    finally:
+        document.close()
+
+
+def _imagemagick(path: str, folder: Path) -> int:
+    im_cmd = tesseract._imagemagick_cmd()
+    assert im_cmd is not None
+    pages = tesseract._rasterize(im_cmd, path, str(folder / "page"))
+    for page in pages:
+        Path(page).unlink()
+    return len(pages)
+
+
+def _measure(
+    rasterize: Callable[[str, Path], int], path: str, folder: Path
+) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    pages = rasterize(path, folder)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed / max(pages, 1), peak / 2**20
+
+
+def main() -> None:
+    methods = {"pypdfium2": _pdfium}
+    if tesseract._imagemagick_cmd() is not None:
+        methods["imagemagick"] = _imagemagick
+    else:
+        print("imagemagick not available here\n")
+    print(f"{'method':12s} {'pages':>5s} {'s/page':>8s} {'peak MiB':>9s}")
+    with tempfile.TemporaryDirectory() as folder:
+        for pages in PAGES:
+            path = _pdf(pages, Path(folder))
+            for name, rasterize in methods.items():
+                per_page, peak = _measure(rasterize, path, Path(folder))
+                print(f"{name:12s} {pages:5d} {per_page:8.3f} {peak:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
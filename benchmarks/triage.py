@@ -0,0 +1,107 @@
+"""Benchmark scanned-vs-digital triage on a mixed corpus.
+
+Builds a corpus from the ``tests/compare`` PDFs: each one as is (text) and as a
+"scan" -- every page rendered at 150 dpi and embedded as a full-page image, with
+no text layer. Reports how long :func:`~invoice2data.input.triage.classify`
+takes per document and whether it labels each one correctly, then extracts the
+corpus through the default cascade with and without ``triage=True``. With
+triage, scans skip the pdfium and pdftotext parses (and the template match on
+their empty text) and go straight to the first available OCR backend; text
+PDFs pay only the classification. The in-process caches are cleared before
+each document.
+
+Run with the package installed (pypdfium2 needed; ocrmypdf or tesseract make
+the scans extract rather than fail):
+
+    python benchmarks/triage.py
+"""
+
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import pypdfium2
+
+from invoice2data import extract_data
+from invoice2data.api import DEFAULT_OCR_READERS
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.loader import read_templates
+from invoice2data.input import _cached_to_text
+from invoice2data.input import is_available
+from invoice2data.input.triage import SCANNED
+from invoice2data.input.triage import TEXT
+from invoice2data.input.triage import _classify_pdf
+from invoice2data.input.triage import classify
+
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPARE = ROOT / "tests" / "compare"
+
+
+def _scan(source: Path, target: Path) -> None:
+    original = pypdfium2.PdfDocument(str(source))
+    document = pypdfium2.PdfDocument.new()
+    for index in range(len(original)):
+        width, height = original[index].get_size()
+        page = document.new_page(width, height)
+        image = pypdfium2.PdfImage.new(document)
+        image.set_bitmap(original[index].render(scale=150 / 72))
+        image.set_matrix(pypdfium2.PdfMatrix().scale(width, height))
+        page.insert_obj(image)
+        page.gen_content()
+    document.save(str(target))
+
+
+def _extract(
+    corpus: list[tuple[str, str]], templates: list[InvoiceTemplate], triage: bool
+) -> tuple[float, float]:
+    """Return the seconds spent on the text PDFs and on the scans."""
+    spent = {TEXT: 0.0, SCANNED: 0.0}
+    for path, kind in corpus:
+        _cached_to_text.cache_clear()
+        _classify_pdf.cache_clear()
+        start = time.perf_counter()
+        extract_data(path, templates, triage=triage)
+        spent[kind] += time.perf_counter() - start
+    return spent[TEXT], spent[SCANNED]
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    templates = read_templates()
+    ocr = [m.__name__ for m in DEFAULT_OCR_READERS if is_available(m)]
+    with tempfile.TemporaryDirectory() as folder:
+        corpus = []
+        for source in sorted(COMPARE.glob("*.pdf")):
+            scan = Path(folder) / f"{source.stem}-scan.pdf"
+            _scan(source, scan)
+            corpus += [(str(source), TEXT), (str(scan), SCANNED)]
+        print(f"{len(corpus)} PDFs (half scanned), OCR backends: {ocr or 'none'}\n")
+
+        timings = []
+        correct = 0
+        for path, kind in corpus:
+            _classify_pdf.cache_clear()
+            start = time.perf_counter()
+            verdict = classify(path)
+            timings.append(time.perf_counter() - start)
+            correct += verdict.kind == kind
+        print(
+            f"classify: {correct}/{len(corpus)} correct, median "
+            f"{statistics.median(timings) * 1000:.2f} ms, "
+            f"max {max(timings) * 1000:.2f} ms\n"
+        )
+
+        _extract(corpus, templates, triage=False)  # warm up
+        for triage in (False, True):
+            on_text, on_scans = _extract(corpus, templates, triage)
+            print(
+                f"triage={triage!s:5s}  text PDFs {on_text:6.2f} s  "
+                f"scans {on_scans:6.2f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark area crops and memory of indexed, columnar word boxes.
+
+Builds a synthetic 300-page document (60 lines of 8 words per page, laid out
+like an invoice) and crops 20 areas, each one page band, from it: once by
+scanning and sorting a tuple of word tuples, as ``pdftotext`` did, and once
+through :class:`~invoice2data.input._boxes.WordBoxes`. Also reports what each
+representation holds in memory.
+
+Run with the package installed:
+
+    python benchmarks/word_boxes.py
+"""
+
+import random
+import sys
+import time
+
+from invoice2data.input._boxes import Word
+from invoice2data.input._boxes import WordBoxes
+
+
+PAGES = 300
+AREAS = 20
+
+
+def _document() -> list[Word]:
+    words: list[Word] = []
+    for page in range(1, PAGES + 1):
+        for line in range(60):
+            y = 40.0 + line * 12.5
+            for column in range(8):
+                x = 30.0 + column * 70.0
+                words.append((page, x, y, x + 55.0, y + 9.0, f"w{line}.{column}"))
+    return words
+
+
+def _scan(words: tuple[Word, ...], area: tuple[int, float, float, float, float]) -> int:
+    page, x0, y0, x1, y1 = area
+    selected = [
+        w
+        for w in words
+        if page <= w[0] <= page and w[1] < x1 and w[3] > x0 and w[2] < y1 and w[4] > y0
+    ]
+    selected.sort(key=lambda w: (w[0], w[2], w[1]))
+    return len(selected)
+
+
+def main() -> None:
+    rng = random.Random(0)  # noqa: S311 - reproducible layout, not crypto
+    words = _document()
+    areas = [
+        (rng.randint(1, PAGES), 0.0, y, 600.0, y + 40.0)
+        for y in (rng.uniform(40, 700) for _ in range(AREAS))
+    ]
+    as_tuples = tuple(words)
+    tuple_bytes = sys.getsizeof(as_tuples) + sum(
+        sys.getsizeof(w) + sys.getsizeof(w[5]) + 4 * sys.getsizeof(w[1])
+        for w in as_tuples
+    )
+    start = time.perf_counter()
+    boxes = WordBoxes(words)
+    built = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found_scan = [_scan(as_tuples, area) for area in areas]
+    scanned = time.perf_counter() - start
+    start = time.perf_counter()
+    found_index = [len(boxes.select(a[0], a[0], *a[1:])) for a in areas]
+    indexed = time.perf_counter() - start
+    assert found_scan == found_index
+
+    print(f"{len(words)} words on {PAGES} pages, {AREAS} area crops\n")
+    print(f"tuple scan   {scanned * 1000:8.2f} ms   {tuple_bytes / 2**20:6.1f} MiB")
+    print(
+        f"indexed      {indexed * 1000:8.2f} ms   {boxes.nbytes / 2**20:6.1f} MiB"
+        f"   (built once in {built * 1000:.1f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,17 +2,35 @@
 
 from .api import Invoice2Data
 from .api import extract_data
+from .api import extract_data_async
+from .batch import BatchResult
+from .batch import extract_many
+from .exceptions import ExtractionTimeoutError
 from .exceptions import InvoiceProcessingError
 from .exceptions import NoTemplateFoundError
+from .exceptions import RegexTimeoutError
 from .exceptions import RequiredFieldsMissingError
 from .exceptions import TemplateSyntaxError
+from .input.disk_cache import configure_disk_cache
+from .input.ocr_pool import configure_ocr_batch_size
+from .input.ocr_pool import configure_ocr_workers
+from .routing import RoutingTable
 
 
 __all__ = [
+    "BatchResult",
+    "ExtractionTimeoutError",
     "Invoice2Data",
     "InvoiceProcessingError",
     "NoTemplateFoundError",
+    "RegexTimeoutError",
     "RequiredFieldsMissingError",
+    "RoutingTable",
     "TemplateSyntaxError",
+    "configure_disk_cache",
+    "configure_ocr_batch_size",
+    "configure_ocr_workers",
     "extract_data",
+    "extract_data_async",
+    "extract_many",
 ]
@@ -14,6 +14,7 @@ import logging
 import os
 import re
 import shutil
+from collections.abc import Iterator
 from copy import deepcopy
 from pathlib import Path
 from typing import Any
@@ -25,12 +26,18 @@ from invoice2data.api import DEFAULT_INPUT_READERS
 from invoice2data.api import Invoice2Data
 from invoice2data.api import extract_data
 from invoice2data.api import input_mapping
+from invoice2data.batch import extract_many
 from invoice2data.extract.loader import read_templates
 from invoice2data.extract.template_builder import field_regex
 from invoice2data.extract.template_builder import preview_field
 from invoice2data.extract.template_builder import set_field_regex
 from invoice2data.extract.template_builder import suggested_template
 from invoice2data.extract.template_builder import to_yaml
+from invoice2data.input import INPUT_MODULES
+from invoice2data.input.disk_cache import configure_disk_cache
+from invoice2data.input.ocr_pool import configure_ocr_batch_size
+from invoice2data.input.ocr_pool import configure_ocr_workers
+from invoice2data.routing import RoutingTable
 
 # Private helpers re-exported for backwards compatibility with pre-refactor
 # callers (tests + downstream code doing `from invoice2data.__main__ import _foo`).
@@ -382,6 +389,60 @@ def _run_new_template(
     help="If no template matches, extract fields with the configured AI provider "
     "(opt-in; see INVOICE2DATA_AI_* env vars).",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Extract files in N parallel worker processes (0: one per CPU). Default: 1",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    envvar="INVOICE2DATA_CACHE_DIR",
+    help="Keep extracted text in a persistent cache in this folder, so re-runs "
+    "skip PDF parsing and OCR (also INVOICE2DATA_CACHE_DIR).",
+)
+@click.option(
+    "--race",
+    is_flag=True,
+    help="Start all default backends at once rather than one after another; "
+    "same results, less waiting when pdfium's text falls back to pdftotext. "
+    "Ignored with --match-pages or --routing-table.",
+)
+@click.option(
+    "--routing-table",
+    type=click.Path(dir_okay=False),
+    envvar="INVOICE2DATA_ROUTING_TABLE",
+    help="Learn which backend completes each template in this JSON file and send "
+    "later documents straight to it (also INVOICE2DATA_ROUTING_TABLE).",
+)
+@click.option(
+    "--triage",
+    is_flag=True,
+    help="Check each PDF for a text layer first and send scans straight to OCR "
+    "instead of trying every text backend on them.",
+)
+@click.option(
+    "--match-pages",
+    type=click.IntRange(min=1),
+    help="Match templates on the first N pages only and read the rest of a "
+    "document just when one matches (faster on long, unwanted documents).",
+)
+@click.option(
+    "--max-ocr-workers",
+    type=click.IntRange(min=1),
+    envvar="INVOICE2DATA_MAX_OCR_WORKERS",
+    help="OCR up to N pages of a scan at a time (default: CPU count, at most 4; "
+    "also INVOICE2DATA_MAX_OCR_WORKERS).",
+)
+@click.option(
+    "--ocr-batch-size",
+    type=click.IntRange(min=1),
+    envvar="INVOICE2DATA_OCR_BATCH_SIZE",
+    help="With doctr or paddleocr and one job, OCR the pages of several files "
+    "N at a time in one model call (default: 8; also INVOICE2DATA_OCR_BATCH_SIZE).",
+)
 @click.argument(
     "input_files",
     type=click.File("wb"),
@@ -410,6 +471,14 @@ def main(  # noqa: C901
     template_out: str | None,
     interactive: bool,
     ai_fallback: bool,
+    jobs: int,
+    cache_dir: str | None,
+    race: bool,
+    routing_table: str | None,
+    triage: bool,
+    match_pages: int | None,
+    max_ocr_workers: int | None,
+    ocr_batch_size: int | None,
     input_files: tuple[Any, ...],
 ) -> None:
     """Extract data from PDF files and output it in a structured format."""
@@ -426,6 +495,15 @@ def main(  # noqa: C901
     if debug_optimized_str:
         logging.getLogger("invoice2data.optimized_str").setLevel(logging.DEBUG)
 
+    if cache_dir:
+        configure_disk_cache(cache_dir)
+
+    if max_ocr_workers:
+        configure_ocr_workers(max_ocr_workers)
+
+    if ocr_batch_size:
+        configure_ocr_batch_size(ocr_batch_size)
+
     if new_template:
         _run_new_template(new_template, use_ai, template_out, input_reader, interactive)
         return
@@ -438,30 +516,37 @@ def main(  # noqa: C901
         templates = _filter_templates(templates, template_filter)
 
     output = []
-    for f in input_files:
-        try:
-            res = extract_data(
-                f.name,
-                templates=templates,
-                input_module=input_module,
-                ai_fallback=ai_fallback,
+    for name, res, error in _extract_files(
+        input_files,
+        templates,
+        input_module,
+        ai_fallback,
+        jobs,
+        race,
+        RoutingTable(routing_table) if routing_table else None,
+        triage,
+        match_pages,
+    ):
+        if error is not None:
+            logger.critical(
+                "Invoice2data failed to process %s. \nError message: %s", name, error
             )
+            continue
+        try:
             if res:
                 logger.info(res)
                 output.append(res)
 
                 if copy or move:
                     _process_and_move_copy(
-                        f.name, res, copy, move, filename_format
+                        name, res, copy, move, filename_format
                     )  # Extract file processing and copy/move
             if explain:
-                _explain(f.name, res)
-        except Exception as e:  # noqa: PERF203
+                _explain(name, res)
+        except Exception as e:  # noqa: BLE001
             logger.critical(
-                "Invoice2data failed to process %s. \nError message: %s", f.name, e
+                "Invoice2data failed to process %s. \nError message: %s", name, e
             )
-        finally:
-            f.close()
 
     if output_module is to_csv:
         to_csv.write_to_file(
@@ -471,6 +556,80 @@ def main(  # noqa: C901
         output_module.write_to_file(output, output_name, output_date_format)
 
 
+def _extract_files(
+    input_files: tuple[Any, ...],
+    templates: list[Any],
+    input_module: str | None,
+    ai_fallback: bool,
+    jobs: int,
+    race: bool = False,
+    routing: RoutingTable | None = None,
+    triage: bool = False,
+    match_pages: int | None = None,
+) -> Iterator[tuple[str, dict[str, Any], Any]]:
+    """Extract each input file, serially or with ``--jobs`` worker processes.
+
+    Args:
+        input_files (tuple[Any, ...]): The click file arguments.
+        templates (list[Any]): Loaded templates.
+        input_module (str | None): The ``--input-reader`` backend name.
+        ai_fallback (bool): Whether to fall back to the AI provider.
+        jobs (int): Worker processes; ``1`` extracts in this process (in OCR
+            batches with a backend supporting them) and ``0`` uses one per CPU.
+        race (bool): Start the default backends concurrently (``--race``).
+        routing (RoutingTable | None): The ``--routing-table``.
+        triage (bool): Send scans straight to OCR (``--triage``).
+        match_pages (int | None): Leading pages to match on (``--match-pages``).
+
+    Yields:
+        tuple[str, dict[str, Any], Any]: ``(file name, result, error)``, where
+            ``error`` is ``None`` on success.
+    """
+    batched = callable(
+        getattr(INPUT_MODULES.get(input_module or ""), "to_text_batch", None)
+    )
+    if jobs != 1 or batched:
+        # extract_many OCRs files in batches when the backend supports it.
+        names = []
+        for f in input_files:
+            names.append(f.name)
+            f.close()
+        for result in extract_many(
+            names,
+            templates,
+            jobs,
+            input_module=input_module,
+            ai_fallback=ai_fallback,
+            race=race,
+            routing=routing,
+            triage=triage,
+            match_pages=match_pages,
+        ):
+            yield result.path, result.data, result.error
+        return
+
+    for f in input_files:
+        try:
+            res = extract_data(
+                f.name,
+                templates=templates,
+                input_module=input_module,
+                ai_fallback=ai_fallback,
+                race=race,
+                routing=routing,
+                triage=triage,
+                match_pages=match_pages,
+            )
+        except Exception as e:  # noqa: BLE001, PERF203
+            yield f.name, {}, e
+        else:
+            yield f.name, res, None
+        finally:
+            f.close()
+    if routing is not None:
+        routing.save()
+
+
 def _load_templates(
     template_folder: str | None, exclude_built_in_templates: bool
 ) -> list[Any]:
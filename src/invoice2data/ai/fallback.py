@@ -7,6 +7,7 @@ constrained to the canonical JSON schema and validated. Results are tagged
 template match. Off unless explicitly enabled.
 """
 
+import asyncio
 import contextlib
 import logging
 from typing import Any
@@ -68,16 +69,82 @@ def ai_fallback_extract(
             empty dict when text is empty, the provider is unavailable, or nothing
             was found.
     """
-    if not text:
+    provider = _ready_provider(text, provider)
+    if provider is None:
         return {}
+    raw = provider.extract_structured(
+        text, invoice_json_schema(), instructions=_INSTRUCTIONS
+    )
+    return _finish(raw)
+
+
+async def ai_fallback_extract_async(
+    text: str, *, provider: AIProvider | None = None
+) -> dict[str, Any]:
+    """Awaitable :func:`ai_fallback_extract`.
+
+    Uses the provider's ``extract_structured_async`` coroutine when it has one
+    (the OpenAI-compatible provider does); otherwise its blocking
+    ``extract_structured`` runs on a worker thread.
+
+    Args:
+        text (str): The document's extracted text.
+        provider (AIProvider | None): Provider to use; the configured one
+            (:func:`get_provider`) when None.
+
+    Returns:
+        dict[str, Any]: As for :func:`ai_fallback_extract`.
+    """
+    provider = _ready_provider(text, provider)
+    if provider is None:
+        return {}
+    extract_async = getattr(provider, "extract_structured_async", None)
+    if extract_async is not None:
+        raw = await extract_async(
+            text, invoice_json_schema(), instructions=_INSTRUCTIONS
+        )
+    else:
+        raw = await asyncio.to_thread(
+            provider.extract_structured,
+            text,
+            invoice_json_schema(),
+            instructions=_INSTRUCTIONS,
+        )
+    return _finish(raw)
+
+
+def _ready_provider(text: str, provider: AIProvider | None) -> AIProvider | None:
+    """Return the provider to ask about ``text``, or None to skip the fallback.
+
+    Args:
+        text (str): The document's extracted text.
+        provider (AIProvider | None): Provider to use; the configured one
+            (:func:`get_provider`) when None.
+
+    Returns:
+        AIProvider | None: The provider, or None when text is empty or the
+            provider is unavailable.
+    """
+    if not text:
+        return None
     provider = provider or get_provider()
     if not provider.is_available():
         logger.warning("AI fallback requested but no provider is available.")
-        return {}
+        return None
     logger.info("No template matched; trying AI fallback extraction.")
-    raw = provider.extract_structured(
-        text, invoice_json_schema(), instructions=_INSTRUCTIONS
-    )
+    return provider
+
+
+def _finish(raw: dict[str, Any]) -> dict[str, Any]:
+    """Coerce, normalize and tag a provider's raw result.
+
+    Args:
+        raw (dict[str, Any]): The provider's raw JSON result.
+
+    Returns:
+        dict[str, Any]: The fields tagged ``extraction_method: "ai"``, or ``{}``
+            when nothing was found.
+    """
     result = _coerce(raw)
     if not result:
         return {}
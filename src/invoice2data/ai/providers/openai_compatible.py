@@ -59,6 +59,31 @@ class OpenAICompatibleProvider:
     ) -> dict[str, Any]:
         """Extract structured fields from text via the chat-completions API.
 
+        Raises ``RuntimeError`` if httpx is not installed (install
+        ``invoice2data[ai]``).
+
+        Args:
+            text (str): The document's extracted text.
+            json_schema (dict[str, Any]): JSON Schema the response must match.
+            instructions (str | None): System prompt; a sensible default is used
+                when None.
+
+        Returns:
+            dict[str, Any]: The parsed JSON object returned by the model.
+        """
+        url, payload, headers = self._request(text, json_schema, instructions)
+        response = httpx.post(url, json=payload, headers=headers, timeout=self._timeout)
+        return _parse(response)
+
+    async def extract_structured_async(
+        self,
+        text: str,
+        json_schema: dict[str, Any],
+        *,
+        instructions: str | None = None,
+    ) -> dict[str, Any]:
+        """Awaitable :meth:`extract_structured`, over an ``httpx.AsyncClient``.
+
         Args:
             text (str): The document's extracted text.
             json_schema (dict[str, Any]): JSON Schema the response must match.
@@ -67,6 +92,25 @@ class OpenAICompatibleProvider:
 
         Returns:
             dict[str, Any]: The parsed JSON object returned by the model.
+        """
+        url, payload, headers = self._request(text, json_schema, instructions)
+        async with httpx.AsyncClient(timeout=self._timeout) as client:
+            response = await client.post(url, json=payload, headers=headers)
+        return _parse(response)
+
+    def _request(
+        self, text: str, json_schema: dict[str, Any], instructions: str | None
+    ) -> tuple[str, dict[str, Any], dict[str, str]]:
+        """Build the chat-completions request for ``text``.
+
+        Args:
+            text (str): The document's extracted text.
+            json_schema (dict[str, Any]): JSON Schema the response must match.
+            instructions (str | None): System prompt override.
+
+        Returns:
+            tuple[str, dict[str, Any], dict[str, str]]: URL, JSON payload and
+                headers.
 
         Raises:
             RuntimeError: If httpx is not installed (install ``invoice2data[ai]``).
@@ -92,13 +136,19 @@ class OpenAICompatibleProvider:
         headers = {}
         if config.api_key:
             headers["Authorization"] = f"Bearer {config.api_key}"
-        response = httpx.post(
-            f"{config.base_url}/chat/completions",
-            json=payload,
-            headers=headers,
-            timeout=self._timeout,
-        )
-        response.raise_for_status()
-        content = response.json()["choices"][0]["message"]["content"]
-        data: dict[str, Any] = json.loads(content)
-        return data
+        return f"{config.base_url}/chat/completions", payload, headers
+
+
+def _parse(response: "httpx.Response") -> dict[str, Any]:
+    """Return the JSON object in a chat-completions response.
+
+    Args:
+        response (httpx.Response): The endpoint's reply.
+
+    Returns:
+        dict[str, Any]: The parsed JSON content of the first choice.
+    """
+    response.raise_for_status()
+    content = response.json()["choices"][0]["message"]["content"]
+    data: dict[str, Any] = json.loads(content)
+    return data
@@ -9,25 +9,53 @@ existing import paths (``from invoice2data import extract_data``) via
 ``__init__.py`` re-exports.
 """
 
+import asyncio
 import logging
+import time
+from collections.abc import Generator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import TypeVar
 
+from .exceptions import ExtractionTimeoutError
 from .exceptions import NoTemplateFoundError
 from .exceptions import RequiredFieldsMissingError
 from .extract.invoice_template import InvoiceTemplate
+from .extract.keyword_index import keyword_index
 from .extract.loader import read_templates
 from .input import INPUT_MODULES
 from .input import extract_text
+from .input import extract_text_async
+from .input import extract_text_head
 from .input import is_available
 from .input import ocrmypdf
 from .input import pdfium
 from .input import pdftotext
+from .input import supports_languages
+from .input import tesseract
 from .input import text
+from .input._memory import Source
+from .input._memory import registered
+from .input.triage import SCANNED
+from .input.triage import classify
+from .routing import RoutingTable
+
+
+if TYPE_CHECKING:
+    from .batch import BatchResult
 
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 #: Alias kept for backwards compatibility with call sites that referenced it
 #: via ``invoice2data.__main__.input_mapping``. New code should import
 #: :data:`invoice2data.input.INPUT_MODULES` directly.
@@ -44,21 +72,32 @@ input_mapping = INPUT_MODULES
 #: missing are skipped automatically.
 DEFAULT_INPUT_READERS = [pdfium, pdftotext]
 
+#: OCR backends for documents that triage (``extract_data(triage=True)``) finds
+#: scanned, in order of preference: the first available one reads them.
+DEFAULT_OCR_READERS = [ocrmypdf, tesseract]
+
 
 __all__ = [
     "DEFAULT_INPUT_READERS",
+    "DEFAULT_OCR_READERS",
     "Invoice2Data",
     "extract_data",
+    "extract_data_async",
     "input_mapping",
 ]
 
 
-def extract_data(  # noqa: C901
-    invoicefile: str,
+def extract_data(
+    invoicefile: Source,
     templates: list[InvoiceTemplate] | None = None,
     input_module: Any = None,
     ai_fallback: bool = False,
     raise_on_error: bool = False,
+    *,
+    race: bool = False,
+    routing: RoutingTable | None = None,
+    triage: bool = False,
+    match_pages: int | None = None,
 ) -> dict[str, Any]:
     """Extracts structured data from PDF/image invoices.
 
@@ -69,7 +108,12 @@ def extract_data(  # noqa: C901
     Required fields are matches from templates.
 
     Args:
-        invoicefile (str): Path of electronic invoice file in PDF, JPEG, PNG
+        invoicefile (Source): Path of electronic invoice file in PDF, JPEG, PNG,
+            or the document itself as ``bytes``/``memoryview`` or a binary file
+            object (read from its current position). In-memory documents are
+            handed to backends that can read buffers (pdfium, pdfplumber,
+            pdfminer, pdftotext via stdin, text) as such and written to a
+            temporary file, once, for the others.
         templates (list[InvoiceTemplate] | None): List of instances of class `InvoiceTemplate`.
                                             Templates are loaded using `read_template` function in `loader.py`.
         input_module (Any, optional): Backend used to extract text from the
@@ -87,17 +131,47 @@ def extract_data(  # noqa: C901
             instead of returning ``{}`` -- ``RequiredFieldsMissingError`` when a
             template matched but a required field could not be parsed, otherwise
             ``NoTemplateFoundError``. Defaults to False (the historical ``{}`` contract).
+        race (bool, optional): When True and the default cascade has more than
+            one backend, start every backend's text extraction at once instead
+            of one after another. The cascade still consumes the texts in
+            preference order, so the result is the same as without ``race``;
+            a fallback to pdftotext (or a template pinning it) then costs
+            roughly max(pdfium, pdftotext) instead of their sum. Texts that turn
+            out not to be needed are discarded. ``routing`` and ``match_pages``
+            take precedence: they exist to read fewer backends or pages, so
+            with either set ``race`` is ignored. Defaults to False.
+        routing (RoutingTable | None, optional): A
+            :class:`~invoice2data.routing.RoutingTable` that records which
+            backend completes each template and sends later documents matching
+            it straight there; saved before returning, at most every
+            :data:`~invoice2data.routing.SAVE_INTERVAL` seconds (the rest is
+            saved at exit or by its ``save()``). Applies to the default
+            cascade only. Defaults to None.
+        triage (bool, optional): When True, classify the document first
+            (:func:`~invoice2data.input.triage.classify`: PDFium's character
+            counts and image coverage on the first pages) and send a scan
+            straight to the first available of ``DEFAULT_OCR_READERS`` instead
+            of parsing it with every text backend before falling back to OCR.
+            Text and mixed documents take the default cascade. Defaults to
+            False.
+        match_pages (int | None, optional): Two-phase mode: each backend that
+            can (``to_text_head``: pdfium, pdftotext) first reads only this many
+            leading pages -- more when a template declares a larger
+            ``match_pages:`` -- and the whole document is read only if a
+            template matches them. Saves parsing long documents no template
+            wants; a template whose keywords lie beyond those pages is missed.
+            Defaults to None (read whole documents).
 
     Returns:
         dict[str, Any]: Extracted and matched fields, or an empty dict ``{}`` if
             text extraction fails or no template matches (unless
             ``raise_on_error`` is set).
 
-    Raises:
-        InvoiceProcessingError: When ``raise_on_error`` is True and extraction
-            fails (``RequiredFieldsMissingError`` or ``NoTemplateFoundError``).
-
     Notes:
+        Raises :class:`~invoice2data.exceptions.InvoiceProcessingError` when
+        ``raise_on_error`` is True and extraction fails
+        (``RequiredFieldsMissingError`` or ``NoTemplateFoundError``).
+
         Import the required `input_module` when using invoice2data as a library.
         A template may pin the backend it was authored for with a top-level
         ``input_module:`` key; that backend is then used for that template
@@ -116,15 +190,224 @@ def extract_data(  # noqa: C901
 
     """
     templates = _by_priority(templates or read_templates())
+    with registered(invoicefile) as path:
+        steps = _cascade(
+            path,
+            templates,
+            input_module,
+            ai_fallback,
+            raise_on_error,
+            routing,
+            triage,
+            match_pages,
+        )
+        readers = _race_readers(path, input_module, race, routing, match_pages)
+        if triage and input_module is None and len(readers) > 1:
+            readers = _triaged_readers(path, readers)
+        try:
+            if len(readers) > 1:
+                return _race(steps, path, readers)
+            return _drive(steps, path)
+        finally:
+            if routing is not None:
+                routing.save_if_due()
+
+
+async def extract_data_async(
+    invoicefile: Source,
+    templates: list[InvoiceTemplate] | None = None,
+    input_module: Any = None,
+    ai_fallback: bool = False,
+    raise_on_error: bool = False,
+    *,
+    executor: Executor | None = None,
+    race: bool = False,
+    routing: RoutingTable | None = None,
+    triage: bool = False,
+    match_pages: int | None = None,
+) -> dict[str, Any]:
+    """Awaitable :func:`extract_data`: same cascade, no blocking the event loop.
+
+    Backends with a ``to_text_async`` coroutine (pdftotext, tesseract) run
+    their tools with :func:`asyncio.create_subprocess_exec`; in-process
+    backends, area extraction and the template run itself go to ``executor``;
+    the OpenAI-compatible AI provider is awaited over an
+    ``httpx.AsyncClient``. Many documents can be in flight on one loop.
+
+    Args:
+        invoicefile (Source): As for :func:`extract_data`.
+        templates (list[InvoiceTemplate] | None): As for :func:`extract_data`.
+            Load them once up front when extracting many documents.
+        input_module (Any): As for :func:`extract_data`.
+        ai_fallback (bool): As for :func:`extract_data`.
+        raise_on_error (bool): As for :func:`extract_data`.
+        executor (Executor | None): Where blocking work runs; the event loop's
+            default (bounded) executor when None.
+        race (bool): As for :func:`extract_data`. Backends are started as tasks;
+            those still running once the result is known are cancelled, which
+            kills their subprocesses.
+        routing (RoutingTable | None): As for :func:`extract_data`; saved on
+            ``executor``.
+        triage (bool): As for :func:`extract_data`; classified on ``executor``.
+        match_pages (int | None): As for :func:`extract_data`; the leading pages
+            are read on ``executor``.
+
+    Returns:
+        dict[str, Any]: As for :func:`extract_data`, which it also matches in
+            raising when ``raise_on_error`` is set.
+
+    Examples:
+        >>> import asyncio
+        >>> from invoice2data import extract_data_async
+        >>> from invoice2data.extract.loader import read_templates
+        >>> async def main(paths):
+        ...     templates = read_templates()
+        ...     return await asyncio.gather(
+        ...         *(extract_data_async(p, templates) for p in paths)
+        ...     )
+        >>> asyncio.run(main(["a.pdf", "b.pdf"]))  # doctest: +SKIP
+    """
+    loop = asyncio.get_running_loop()
+    if not templates:
+        templates = await loop.run_in_executor(executor, read_templates)
+    templates = _by_priority(templates)
+    with registered(invoicefile) as path:
+        steps = _cascade(
+            path,
+            templates,
+            input_module,
+            ai_fallback,
+            raise_on_error,
+            routing,
+            triage,
+            match_pages,
+        )
+        readers = _race_readers(path, input_module, race, routing, match_pages)
+        if triage and input_module is None and len(readers) > 1:
+            readers = await loop.run_in_executor(
+                executor, _triaged_readers, path, readers
+            )
+        texts: dict[Any, asyncio.Future[str]] = {}
+        if len(readers) > 1:
+            texts = {
+                reader: asyncio.ensure_future(
+                    _safe_to_text_async(reader, path, executor)
+                )
+                for reader in readers
+            }
+        try:
+            step = next(steps)
+            while True:
+                step = steps.send(await _perform_async(step, path, executor, texts))
+        except StopIteration as done:
+            result: dict[str, Any] = done.value
+            return result
+        finally:
+            for task in texts.values():
+                task.cancel()
+            await asyncio.gather(*texts.values(), return_exceptions=True)
+            if routing is not None:
+                await loop.run_in_executor(executor, routing.save_if_due)
+
+
+# The cascade is written once, as a generator that yields each piece of I/O it
+# needs as a step (read text, run a template, ask the AI) and is sent back the
+# result. extract_data performs the steps by blocking, extract_data_async by
+# awaiting, so the two cannot drift apart.
+
+
+@dataclass(frozen=True)
+class _ReadText:
+    """Step: ``invoicefile``'s text via ``module``, as :func:`_safe_to_text`."""
+
+    module: Any
+    languages: tuple[str, ...] | None = None
+
+
+@dataclass(frozen=True)
+class _ReadHead:
+    """Step: the first ``pages`` pages' text via ``module``, as :func:`_safe_head`."""
+
+    module: Any
+    pages: int
+
+
+@dataclass(frozen=True)
+class _RunTemplate:
+    """Step: run a matched template, as :func:`_run_template`."""
+
+    template: InvoiceTemplate
+    text: str
+    module: Any
+    errors: list[RequiredFieldsMissingError] | None = None
+    languages: tuple[str, ...] | None = None
+
+
+@dataclass(frozen=True)
+class _AskAI:
+    """Step: AI fallback extraction on ``text``."""
+
+    text: str
+
+
+@dataclass(frozen=True)
+class _Triage:
+    """Step: the readers to use after triage, as :func:`_triaged_readers`."""
+
+    readers: list[Any]
+
+
+_Step = _ReadText | _ReadHead | _RunTemplate | _AskAI | _Triage
+
+
+def _cascade(  # noqa: C901
+    invoicefile: str,
+    templates: list[InvoiceTemplate],
+    input_module: Any,
+    ai_fallback: bool,
+    raise_on_error: bool,
+    routing: RoutingTable | None = None,
+    triage: bool = False,
+    match_pages: int | None = None,
+) -> Generator[_Step, Any, dict[str, Any]]:
+    """The backend cascade of :func:`extract_data`, as steps.
+
+    Args:
+        invoicefile (str): Path to the invoice file.
+        templates (list[InvoiceTemplate]): Priority-ordered templates.
+        input_module (Any): Forced input backend, or None for the cascade.
+        ai_fallback (bool): Whether AI fallback is enabled.
+        raise_on_error (bool): Raise instead of returning ``{}``.
+        routing (RoutingTable | None): Learns and applies per-template backend
+            routes (cascade mode only).
+        triage (bool): Send scans straight to OCR (cascade mode only).
+        match_pages (int | None): Match on this many leading pages before
+            reading whole documents.
+
+    Returns:
+        Generator[_Step, Any, dict[str, Any]]: The steps; send each one's
+            result back. Finally returns the extracted fields, or ``{}``.
+
+    Raises:
+        InvoiceProcessingError: When ``raise_on_error`` is True and extraction
+            fails (``RequiredFieldsMissingError`` or ``NoTemplateFoundError``).
+    """
     readers = _resolve_readers(invoicefile, input_module)
     # Per-template backend pins apply only in auto (cascade) mode; an explicit
     # input_module forces that backend, pin or not.
     auto = input_module is None
+    if triage and auto and len(readers) > 1:
+        readers = yield _Triage(readers)
+    routing = routing if auto else None
     best: dict[str, Any] | None = None  # complete-but-lineless result, kept as fallback
     field_errors: list[RequiredFieldsMissingError] = []  # missing-fields reasons (#190)
+    costs: dict[Any, float] = {}  # seconds each backend's text took
+    head_pages = _head_pages(match_pages, templates)
 
     for reader in readers:
-        extracted_str = _safe_to_text(reader, invoicefile)
+        started = time.perf_counter()
+        extracted_str = yield from _read_steps(reader, templates, head_pages)
+        costs[reader] = time.perf_counter() - started
         if not extracted_str:
             continue
         logger.debug(
@@ -135,9 +418,21 @@ def extract_data(  # noqa: C901
         logger.debug("END %s result =============================", reader.__name__)
 
         template = _match_template(extracted_str, templates)
+        languages = None
+        if supports_languages(reader):
+            extracted_str, template, languages = yield from _language_steps(
+                reader, extracted_str, template, templates
+            )
         if template is None:
             continue
 
+        if routing is not None:
+            routed = yield from _routed_steps(
+                routing, template, reader, field_errors, costs
+            )
+            if routed:
+                return routed
+
         # A template may pin the backend it was authored for (e.g. an area or
         # table template that needs poppler's layout). Honour it by re-extracting
         # with that backend; this also short-circuits straight to the right
@@ -145,7 +440,10 @@ def extract_data(  # noqa: C901
         # mode only -- an explicit input_module is taken at face value.
         preferred = _preferred_module(template, used=reader) if auto else None
         if preferred is not None:
-            preferred_str = _safe_to_text(preferred, invoicefile)
+            started = time.perf_counter()
+            preferred_languages = _ocr_languages(template, preferred)
+            preferred_str = yield _ReadText(preferred, preferred_languages)
+            costs[preferred] = time.perf_counter() - started
             preferred_template = (
                 _match_template(preferred_str, templates) if preferred_str else None
             )
@@ -153,11 +451,15 @@ def extract_data(  # noqa: C901
                 reader = preferred
                 extracted_str = preferred_str
                 template = preferred_template
+                languages = preferred_languages
 
         logger.info("Using %s template", template["template_name"])
-        result = _run_template(
-            template, extracted_str, invoicefile, reader, field_errors
+        result: dict[str, Any] = yield _RunTemplate(
+            template, extracted_str, reader, field_errors, languages
         )
+        if routing is not None:
+            complete = bool(result) and not _line_items_missing(template, result)
+            routing.record(template, reader, complete, costs[reader])
         if result:
             # A template that declares line items but yields none usually means a
             # layout-less backend dropped the table: keep the result but try the
@@ -174,12 +476,12 @@ def extract_data(  # noqa: C901
         return best
 
     # Nothing matched (or every match was incomplete): try OCR as a last resort.
-    result = _ocr_last_resort(invoicefile, templates, readers)
+    result = yield from _ocr_steps(templates, readers)
     if result:
         return result
 
     # Opt-in AI fallback: let an LLM extract fields when no template fit.
-    ai_result = _ai_last_resort(invoicefile, input_module, ai_fallback)
+    ai_result = yield from _ai_steps(invoicefile, input_module, ai_fallback)
     if ai_result:
         return ai_result
 
@@ -193,9 +495,163 @@ def extract_data(  # noqa: C901
     return {}
 
 
-def _ai_last_resort(
+def _routed_steps(
+    routing: RoutingTable,
+    template: InvoiceTemplate,
+    probe: Any,
+    field_errors: list[RequiredFieldsMissingError],
+    costs: dict[Any, float],
+) -> Generator[_Step, Any, dict[str, Any]]:
+    """Extract ``template``'s document with the backend its history favours.
+
+    Args:
+        routing (RoutingTable): The learned routes.
+        template (InvoiceTemplate): The template ``probe``'s text matched.
+        probe (Any): The backend that produced that text.
+        field_errors (list[RequiredFieldsMissingError]): Collects missing-fields
+            failures.
+        costs (dict[Any, float]): Seconds each backend's text took; updated.
+
+    Returns:
+        Generator[_Step, Any, dict[str, Any]]: The steps; send each one's
+            result back. Finally returns the complete result, or ``{}`` when
+            there is no route or it failed (the cascade then carries on).
+    """
+    route = routing.route(template, probe)
+    if route is None:
+        return {}
+    started = time.perf_counter()
+    languages = _ocr_languages(template, route)
+    routed_str = yield _ReadText(route, languages)
+    costs[route] = time.perf_counter() - started
+    result: dict[str, Any] = {}
+    if routed_str and template.matches_input(routed_str):
+        logger.info(
+            "Using %s template (routed to %s)",
+            template["template_name"],
+            route.__name__,
+        )
+        result = yield _RunTemplate(
+            template, routed_str, route, field_errors, languages
+        )
+        complete = bool(result) and not _line_items_missing(template, result)
+        routing.record(template, route, complete, costs[route])
+        if complete:
+            routing.hit(template)
+            return result
+    routing.miss(template)
+    return {}
+
+
+def _head_pages(match_pages: int | None, templates: list[InvoiceTemplate]) -> int:
+    """Return how many leading pages two-phase matching reads (0: mode off).
+
+    Args:
+        match_pages (int | None): The ``match_pages`` option.
+        templates (list[InvoiceTemplate]): The candidate templates, whose
+            ``match_pages:`` hints can only raise it.
+
+    Returns:
+        int: The page count.
+    """
+    if not match_pages:
+        return 0
+    hints: list[int] = [t.get("match_pages", 0) for t in templates]
+    return max([match_pages, *hints])
+
+
+def _read_steps(
+    reader: Any, templates: list[InvoiceTemplate], head_pages: int
+) -> Generator[_Step, Any, str]:
+    """Read a document's text, first its leading pages when ``head_pages``.
+
+    Args:
+        reader (Any): The backend.
+        templates (list[InvoiceTemplate]): Candidate templates.
+        head_pages (int): Leading pages to match on first; 0 to read the whole
+            document straight away.
+
+    Returns:
+        Generator[_Step, Any, str]: The steps; send each one's result back.
+            Finally returns the whole document's text, or ``""`` when it is
+            unusable or no template matches its leading pages.
+    """
+    if head_pages:
+        head = yield _ReadHead(reader, head_pages)
+        if head is not None:
+            head_str: str = head[0]
+            if head[1]:
+                return head_str
+            if head_str and _match_template(head_str, templates) is None:
+                logger.debug(
+                    "No template matches the first %d page(s) of %s's text",
+                    head_pages,
+                    reader.__name__,
+                )
+                return ""
+    extracted_str: str = yield _ReadText(reader)
+    return extracted_str
+
+
+def _language_steps(
+    reader: Any,
+    extracted_str: str,
+    template: InvoiceTemplate | None,
+    templates: list[InvoiceTemplate],
+) -> Generator[_Step, Any, tuple[str, InvoiceTemplate | None, tuple[str, ...] | None]]:
+    """Re-OCR with the languages a document needs, after a first pass.
+
+    An OCR backend that takes languages reads with a small default set first.
+    When a template matches that text and declares ``options.languages``, the
+    document is read again in those languages; when none matches, in every
+    language the backend has.
+
+    Args:
+        reader (Any): A backend declaring ``SUPPORTS_LANGUAGES``.
+        extracted_str (str): Its first-pass text.
+        template (InvoiceTemplate | None): The template that text matched.
+        templates (list[InvoiceTemplate]): Candidate templates.
+
+    Returns:
+        Generator[_Step, Any, tuple[str, InvoiceTemplate | None, tuple[str, ...] | None]]:
+            The steps; send each one's result back. Finally returns the text,
+            its template and the languages it was read in (None: the first
+            pass), the second pass's when a template matches it.
+    """
+    if template is None:
+        languages: tuple[str, ...] = ()
+    else:
+        languages = tuple(template.options.get("languages") or ())
+        if not languages:
+            return extracted_str, template, None
+    logger.debug("Re-reading with %s in languages %s", reader.__name__, languages)
+    retry_str = yield _ReadText(reader, languages)
+    retry_template = _match_template(retry_str, templates) if retry_str else None
+    if retry_template is None:
+        return extracted_str, template, None
+    return retry_str, retry_template, languages
+
+
+def _ocr_languages(template: InvoiceTemplate, module: Any) -> tuple[str, ...] | None:
+    """Return the languages to read a template's documents in with ``module``.
+
+    Args:
+        template (InvoiceTemplate): The matched template.
+        module (Any): The backend about to read.
+
+    Returns:
+        tuple[str, ...] | None: The template's ``options.languages``, or None
+            when it declares none or the backend does not take languages.
+    """
+    languages = tuple(template.options.get("languages") or ())
+    if not languages or not supports_languages(module):
+        return None
+    return languages
+
+
+def _ai_steps(
     invoicefile: str, input_module: Any, ai_fallback: bool
-) -> dict[str, Any]:
+) -> Generator[_Step, Any, dict[str, Any]]:
     """Try the configured AI provider when no template matched (opt-in).
 
     Args:
@@ -204,13 +660,150 @@ def _ai_last_resort(
         ai_fallback (bool): Whether AI fallback is enabled.
 
     Returns:
-        dict[str, Any]: AI-extracted fields, or ``{}`` when disabled/unavailable.
+        Generator[_Step, Any, dict[str, Any]]: The steps; send each one's
+            result back. Finally returns the AI-extracted fields, or ``{}`` when
+            disabled/unavailable.
     """
     if not ai_fallback:
         return {}
+    sampled = yield from _sample_steps(invoicefile, input_module)
+    result: dict[str, Any] = yield _AskAI(sampled)
+    return result
+
+
+def _drive(
+    steps: Generator[_Step, Any, _T],
+    invoicefile: str,
+    texts: dict[Any, "Future[str]"] | None = None,
+) -> _T:
+    """Run a step generator to completion, performing each step by blocking.
+
+    Args:
+        steps (Generator[_Step, Any, _T]): The steps, e.g. from :func:`_cascade`.
+        invoicefile (str): Path to the invoice file the steps are about.
+        texts (dict[Any, Future[str]] | None): Text extractions already under
+            way (race mode), by backend.
+
+    Returns:
+        _T: The generator's return value.
+    """
+    try:
+        step = next(steps)
+        while True:
+            step = steps.send(_perform(step, invoicefile, texts))
+    except StopIteration as done:
+        result: _T = done.value
+        return result
+
+
+def _race(steps: Generator[_Step, Any, _T], invoicefile: str, readers: list[Any]) -> _T:
+    """Drive ``steps`` with every reader's text extraction started up front.
+
+    Args:
+        steps (Generator[_Step, Any, _T]): The steps, e.g. from :func:`_cascade`.
+        invoicefile (str): Path to the invoice file.
+        readers (list[Any]): The backends to start.
+
+    Returns:
+        _T: The generator's return value.
+    """
+    pool = ThreadPoolExecutor(len(readers), thread_name_prefix="invoice2data-race")
+    texts = {
+        reader: pool.submit(_safe_to_text, reader, invoicefile) for reader in readers
+    }
+    try:
+        return _drive(steps, invoicefile, texts)
+    finally:
+        # A loser still running finishes on its own thread (its text lands in
+        # the text cache); nothing waits for it.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _perform(
+    step: _Step, invoicefile: str, texts: dict[Any, "Future[str]"] | None = None
+) -> Any:
+    """Perform one cascade step, blocking.
+
+    Args:
+        step (_Step): The step.
+        invoicefile (str): Path to the invoice file.
+        texts (dict[Any, Future[str]] | None): Text extractions already under
+            way, by backend; a matching read waits for its future.
+
+    Returns:
+        Any: The step's result, to send back into the cascade.
+    """
+    if isinstance(step, _ReadText):
+        if texts and step.module in texts and step.languages is None:
+            return texts[step.module].result()
+        return _safe_to_text(step.module, invoicefile, step.languages)
+    if isinstance(step, _RunTemplate):
+        return _run_template(
+            step.template,
+            step.text,
+            invoicefile,
+            step.module,
+            step.errors,
+            step.languages,
+        )
+    if isinstance(step, _ReadHead):
+        return _safe_head(step.module, invoicefile, step.pages)
+    if isinstance(step, _Triage):
+        return _triaged_readers(invoicefile, step.readers)
     from .ai.fallback import ai_fallback_extract
 
-    return ai_fallback_extract(_sample_text(invoicefile, input_module))
+    return ai_fallback_extract(step.text)
+
+
+async def _perform_async(
+    step: _Step,
+    invoicefile: str,
+    executor: Executor | None,
+    texts: dict[Any, "asyncio.Future[str]"] | None = None,
+) -> Any:
+    """Perform one cascade step without blocking the event loop.
+
+    Args:
+        step (_Step): The step.
+        invoicefile (str): Path to the invoice file.
+        executor (Executor | None): Where blocking work runs.
+        texts (dict[Any, asyncio.Future[str]] | None): Text extractions already
+            under way, by backend; a matching read awaits its task.
+
+    Returns:
+        Any: The step's result, to send back into the cascade.
+    """
+    if isinstance(step, _ReadText):
+        if texts and step.module in texts and step.languages is None:
+            return await texts[step.module]
+        return await _safe_to_text_async(
+            step.module, invoicefile, executor, step.languages
+        )
+    if isinstance(step, _RunTemplate):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            _run_template,
+            step.template,
+            step.text,
+            invoicefile,
+            step.module,
+            step.errors,
+            step.languages,
+        )
+    if isinstance(step, _ReadHead):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, _safe_head, step.module, invoicefile, step.pages
+        )
+    if isinstance(step, _Triage):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, _triaged_readers, invoicefile, step.readers
+        )
+    from .ai.fallback import ai_fallback_extract_async
+
+    return await ai_fallback_extract_async(step.text)
 
 
 def _resolve_readers(invoicefile: str, input_module: Any) -> list[Any]:
@@ -234,18 +827,167 @@ def _resolve_readers(invoicefile: str, input_module: Any) -> list[Any]:
     return readers or [pdftotext]
 
 
-def _safe_to_text(module: Any, invoicefile: str) -> str:
+def _race_readers(
+    invoicefile: str,
+    input_module: Any,
+    race: bool,
+    routing: RoutingTable | None,
+    match_pages: int | None,
+) -> list[Any]:
+    """Return the backends to start up front in race mode (none: no race).
+
+    Args:
+        invoicefile (str): Path to the invoice file.
+        input_module (Any): As for :func:`_resolve_readers`.
+        race (bool): The ``race`` option.
+        routing (RoutingTable | None): The ``routing`` option; a route skips
+            backends, so racing them all would defeat it.
+        match_pages (int | None): The ``match_pages`` option; racing would read
+            every backend's whole document before the leading pages are
+            matched.
+
+    Returns:
+        list[Any]: The backends, in cascade order.
+    """
+    if not race:
+        return []
+    if routing is not None or match_pages:
+        logger.debug(
+            "Not racing %s: routing and match_pages take precedence", invoicefile
+        )
+        return []
+    return _resolve_readers(invoicefile, input_module)
+
+
+def _triaged_readers(invoicefile: str, readers: list[Any]) -> list[Any]:
+    """Return ``readers``, or just an OCR backend when the file is a scan.
+
+    Args:
+        invoicefile (str): Path to the invoice file.
+        readers (list[Any]): The cascade's backends.
+
+    Returns:
+        list[Any]: The first available of ``DEFAULT_OCR_READERS`` for a scanned
+            document; ``readers`` for text and mixed documents, when no OCR
+            backend is available or when the file cannot be classified.
+
+    Raises:
+        ExtractionTimeoutError: If the per-file time limit runs out meanwhile;
+            that is not the backend failing.
+    """
+    try:
+        verdict = classify(invoicefile)
+    except ExtractionTimeoutError:
+        raise
+    except Exception:
+        logger.debug("Could not triage %s", invoicefile, exc_info=True)
+        return readers
+    logger.debug("Triage: %s is %s", invoicefile, verdict)
+    if verdict.kind != SCANNED:
+        return readers
+    for module in DEFAULT_OCR_READERS:
+        if is_available(module):
+            logger.debug("Reading scanned %s with %s", invoicefile, module.__name__)
+            return [module]
+    return readers
+
+
+def _safe_head(module: Any, invoicefile: str, pages: int) -> tuple[str, bool] | None:
+    """Extract the leading pages with ``module``, as :func:`_safe_to_text`.
+
+    Args:
+        module (Any): An input backend.
+        invoicefile (str): Path to the invoice file.
+        pages (int): How many leading pages are needed.
+
+    Returns:
+        tuple[str, bool] | None: The text (``""`` if unusable) and whether it is
+            the whole document, or None when the backend cannot read leading
+            pages or failed to (the whole document is read instead).
+
+    Raises:
+        ExtractionTimeoutError: If the per-file time limit runs out meanwhile;
+            that is not the backend failing.
+    """
+    try:
+        head = extract_text_head(module, invoicefile, pages)
+    except ExtractionTimeoutError:
+        raise
+    except Exception:
+        logger.debug(
+            "Backend %s failed to extract the first pages of %s",
+            module.__name__,
+            invoicefile,
+            exc_info=True,
+        )
+        return None
+    if head is None:
+        return None
+    head_str, whole = head
+    return _usable_text(module, invoicefile, head_str), whole
+
+
+def _safe_to_text(
+    module: Any, invoicefile: str, languages: tuple[str, ...] | None = None
+) -> str:
     """Extract text with ``module``, returning ``""`` on any failure.
 
     Args:
         module (Any): An input backend exposing ``to_text``.
         invoicefile (str): Path to the invoice file.
+        languages (tuple[str, ...] | None): OCR languages, as for
+            :func:`~invoice2data.input.extract_text`.
+
+    Returns:
+        str: The extracted text, or ``""`` if extraction failed or was empty.
+
+    Raises:
+        ExtractionTimeoutError: If the per-file time limit runs out meanwhile;
+            that is not the backend failing.
+    """
+    try:
+        extracted_str = extract_text(module, invoicefile, languages=languages)
+    except ExtractionTimeoutError:
+        raise
+    except Exception:
+        logger.debug(
+            "Backend %s failed to extract text from %s",
+            module.__name__,
+            invoicefile,
+            exc_info=True,
+        )
+        return ""
+    return _usable_text(module, invoicefile, extracted_str)
+
+
+async def _safe_to_text_async(
+    module: Any,
+    invoicefile: str,
+    executor: Executor | None,
+    languages: tuple[str, ...] | None = None,
+) -> str:
+    """Awaitable :func:`_safe_to_text`.
+
+    Args:
+        module (Any): An input backend exposing ``to_text``.
+        invoicefile (str): Path to the invoice file.
+        executor (Executor | None): Where blocking extraction runs.
+        languages (tuple[str, ...] | None): OCR languages, as for
+            :func:`~invoice2data.input.extract_text`.
 
     Returns:
         str: The extracted text, or ``""`` if extraction failed or was empty.
+
+    Raises:
+        ExtractionTimeoutError: If the per-file time limit runs out meanwhile;
+            that is not the backend failing.
     """
     try:
-        extracted_str = extract_text(module, invoicefile)
+        extracted_str = await extract_text_async(
+            module, invoicefile, executor=executor, languages=languages
+        )
+    except ExtractionTimeoutError:
+        raise
     except Exception:
         logger.debug(
             "Backend %s failed to extract text from %s",
@@ -254,6 +996,20 @@ def _safe_to_text(module: Any, invoicefile: str) -> str:
             exc_info=True,
         )
         return ""
+    return _usable_text(module, invoicefile, extracted_str)
+
+
+def _usable_text(module: Any, invoicefile: str, extracted_str: Any) -> str:
+    """Return ``extracted_str`` if it is non-blank text, else ``""``.
+
+    Args:
+        module (Any): The backend that produced it.
+        invoicefile (str): Path to the invoice file.
+        extracted_str (Any): The backend's result.
+
+    Returns:
+        str: The text, or ``""``.
+    """
     if not isinstance(extracted_str, str) or not extracted_str.strip():
         logger.debug("Backend %s produced no text for %s", module.__name__, invoicefile)
         return ""
@@ -273,11 +1029,14 @@ def _match_template(
         InvoiceTemplate | None: The first matching template, or ``None``.
             ``templates`` is expected to be priority-ordered already (see
             :func:`_by_priority`, applied once in ``extract_data``).
+
+    Notes:
+        Keywords are looked up through a cached Aho-Corasick index over the whole
+        template list (:mod:`invoice2data.extract.keyword_index`), so the text is
+        scanned once however many templates are loaded. The result is the same
+        template a ``matches_input`` loop in list order would return.
     """
-    for template in templates:
-        if template.matches_input(extracted_str):
-            return template
-    return None
+    return keyword_index(templates).match(extracted_str)
 
 
 def _by_priority(templates: list[InvoiceTemplate]) -> list[InvoiceTemplate]:
@@ -367,6 +1126,7 @@ def _run_template(
     invoicefile: str,
     reader: Any,
     errors: list[RequiredFieldsMissingError] | None = None,
+    languages: tuple[str, ...] | None = None,
 ) -> dict[str, Any]:
     """Run a matched template, returning ``{}`` if required fields are missing.
 
@@ -377,6 +1137,8 @@ def _run_template(
         reader (Any): The backend that produced ``extracted_str``.
         errors (list[RequiredFieldsMissingError] | None): When given, a missing-fields
             failure is appended here (so the caller can surface why it failed).
+        languages (tuple[str, ...] | None): The OCR languages ``extracted_str``
+            was read in; area fields are read in them too.
 
     Returns:
         dict[str, Any]: The extracted fields, or ``{}`` when the template matched
@@ -384,7 +1146,7 @@ def _run_template(
     """
     optimized_str = template.prepare_input(extracted_str)
     try:
-        return template.extract(optimized_str, invoicefile, reader)
+        return template.extract(optimized_str, invoicefile, reader, languages)
     except ValueError as exc:
         logger.debug(
             "Template %s matched under %s but extraction was incomplete: %s",
@@ -397,30 +1159,31 @@ def _run_template(
         return {}
 
 
-def _ocr_last_resort(
-    invoicefile: str, templates: list[InvoiceTemplate], readers: list[Any]
-) -> dict[str, Any]:
+def _ocr_steps(
+    templates: list[InvoiceTemplate], readers: list[Any]
+) -> Generator[_Step, Any, dict[str, Any]]:
     """Try OCR (ocrmypdf) when the primary backends produced no usable match.
 
     Args:
-        invoicefile (str): Path to the invoice file.
         templates (list[InvoiceTemplate]): Candidate templates.
         readers (list[Any]): Backends already attempted (to avoid repeating).
 
     Returns:
-        dict[str, Any]: Extracted fields from the OCR pass, or ``{}``.
+        Generator[_Step, Any, dict[str, Any]]: The steps; send each one's
+            result back. Finally returns the fields from the OCR pass, or ``{}``.
     """
     if not ocrmypdf.ocrmypdf_available() or ocrmypdf in readers:
         return {}
     logger.debug("Primary backends produced no match; falling back to ocrmypdf")
-    extracted_str = _safe_to_text(ocrmypdf, invoicefile)
+    extracted_str = yield _ReadText(ocrmypdf)
     if not extracted_str:
         return {}
     template = _match_template(extracted_str, templates)
     if template is None:
         return {}
     logger.info("Using %s template (ocrmypdf fallback)", template["template_name"])
-    return _run_template(template, extracted_str, invoicefile, ocrmypdf)
+    result: dict[str, Any] = yield _RunTemplate(template, extracted_str, ocrmypdf)
+    return result
 
 
 def _sample_text(invoicefile: str, input_module: Any = None) -> str:
@@ -433,8 +1196,23 @@ def _sample_text(invoicefile: str, input_module: Any = None) -> str:
     Returns:
         str: The extracted text, or ``""`` if every backend failed.
     """
+    return _drive(_sample_steps(invoicefile, input_module), invoicefile)
+
+
+def _sample_steps(invoicefile: str, input_module: Any) -> Generator[_Step, Any, str]:
+    """The steps of :func:`_sample_text`.
+
+    Args:
+        invoicefile (str): Path to the sample document.
+        input_module (Any): Forced input backend, or None for the cascade.
+
+    Returns:
+        Generator[_Step, Any, str]: The steps; send each one's result back.
+            Finally returns the extracted text, or ``""`` if every backend
+            failed.
+    """
     for reader in _resolve_readers(invoicefile, input_module):
-        sampled = _safe_to_text(reader, invoicefile)
+        sampled: str = yield _ReadText(reader)
         if sampled:
             return sampled
     return ""
@@ -476,3 +1254,22 @@ class Invoice2Data:
             dict[str, Any]: Extracted fields, or an empty dict if none matched.
         """
         return extract_data(path, self.templates, input_module)
+
+    def extract_many(
+        self, paths: Iterable[str], workers: int | None = None, **kwargs: Any
+    ) -> Iterator["BatchResult"]:
+        """Extract many invoices in parallel using this instance's templates.
+
+        Args:
+            paths (Iterable[str]): Paths to the invoice files.
+            workers (int | None): Worker processes. Defaults to the CPU count.
+            **kwargs (Any): Further options of
+                :func:`~invoice2data.batch.extract_many`.
+
+        Returns:
+            Iterator[BatchResult]: One result per file, in input order unless
+                ``ordered=False`` is passed.
+        """
+        from .batch import extract_many
+
+        return extract_many(paths, self.templates, workers, **kwargs)
@@ -0,0 +1,481 @@
+"""Parallel batch extraction.
+
+:func:`extract_data` handles one document at a time, so a large batch runs at
+single-core speed. :func:`extract_many` fans a batch out over a process pool
+(template matching and the pure-Python parsers are CPU-bound and hold the GIL,
+so threads would not help):
+
+- templates are loaded (or unpickled) once per worker, not once per file;
+- at most ``2 * workers`` files are in flight, so results stream back as they
+  are produced and memory stays flat however long the batch is;
+- each file may be given a time limit;
+- a worker that dies (segfault in a native backend, OOM kill) costs only the
+  file it was working on, which is reported as an error -- the batch goes on.
+
+With ``workers=1`` and a backend that OCRs in batches (``doctr``,
+``paddleocr``), files are taken :func:`~invoice2data.input.ocr_pool.ocr_batch_size`
+at a time and their pages OCRed together, one model call per batch of pages,
+before each is extracted as usual. One process running the model on batches
+is usually the fastest way through a backlog of scans with these backends;
+with more workers, each file is OCRed on its own.
+"""
+
+import contextlib
+import logging
+import os
+import signal
+import threading
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from dataclasses import field
+from itertools import islice
+from multiprocessing import parent_process
+from multiprocessing.util import Finalize
+from typing import Any
+
+from .api import _by_priority
+from .api import extract_data
+from .exceptions import DEADLINE_ERRORS
+from .exceptions import ExtractionTimeoutError
+from .extract.invoice_template import InvoiceTemplate
+from .extract.loader import read_templates
+from .input import INPUT_MODULES
+from .input import extract_text_batch
+from .input.disk_cache import DiskTextCache
+from .input.disk_cache import configure_disk_cache
+from .input.disk_cache import get_disk_cache
+from .input.ocr_pool import configure_ocr_batch_size
+from .input.ocr_pool import configure_ocr_workers
+from .input.ocr_pool import max_ocr_workers
+from .input.ocr_pool import ocr_batch_size
+from .routing import RoutingTable
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["BatchResult", "extract_many"]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """The outcome of extracting one file of a batch.
+
+    Attributes:
+        path (str): The input file, as given.
+        data (dict[str, Any]): The extracted fields; ``{}`` when no template
+            matched or on error.
+        error (str | None): ``"<ExceptionType>: <message>"`` when extraction
+            failed, timed out or crashed its worker; ``None`` otherwise.
+    """
+
+    path: str
+    data: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class _Job:
+    """What every worker needs to know; sent once, when the worker starts."""
+
+    templates: list[InvoiceTemplate] | str | None
+    input_module: str | None
+    timeout: float | None
+    ai_fallback: bool
+    disk_cache: DiskTextCache | None = None
+    race: bool = False
+    routing: RoutingTable | None = None
+    triage: bool = False
+    match_pages: int | None = None
+    ocr_workers: int | None = None
+    ocr_batch_size: int | None = None
+
+
+#: Per-process state set by :func:`_init_worker`, in pool workers only.
+_job = _Job(None, None, None, False)
+_templates: list[InvoiceTemplate] = []
+
+
+def extract_many(
+    paths: Iterable[str | os.PathLike[str]],
+    templates: list[InvoiceTemplate] | str | None = None,
+    workers: int | None = None,
+    *,
+    input_module: Any = None,
+    ordered: bool = True,
+    timeout: float | None = None,
+    ai_fallback: bool = False,
+    race: bool = False,
+    routing: RoutingTable | None = None,
+    triage: bool = False,
+    match_pages: int | None = None,
+) -> Iterator[BatchResult]:
+    """Extract data from many invoices in parallel.
+
+    Args:
+        paths (Iterable[str | os.PathLike[str]]): Invoice files. Consumed lazily.
+        templates (list[InvoiceTemplate] | str | None): Templates to use, a
+            template folder to load in each worker, or ``None`` for the
+            built-in templates.
+        workers (int | None): Number of worker processes. Defaults to the CPU
+            count; ``1`` runs in this process without a pool, and is the only
+            setting that OCRs files in batches (see above).
+        input_module (Any): As for :func:`extract_data`, but must be a
+            registered backend (a module from, or a name in,
+            :data:`~invoice2data.input.INPUT_MODULES`).
+        ordered (bool): Yield results in input order (the default) or as soon
+            as each file is done.
+        timeout (float | None): Per-file time limit in seconds. Enforced with
+            ``SIGALRM`` inside the worker, so it needs a POSIX system and
+            interrupts Python code only (a blocking native call finishes
+            first). A batch of files OCRed together is given the limits of
+            all its files; when it overruns, each of them is reported as
+            timed out.
+        ai_fallback (bool): As for :func:`extract_data`.
+        race (bool): As for :func:`extract_data`.
+        routing (RoutingTable | None): As for :func:`extract_data`. Each worker
+            opens the table's file and merges its statistics into it at
+            intervals and when it exits.
+        triage (bool): As for :func:`extract_data`.
+        match_pages (int | None): As for :func:`extract_data`.
+
+    Returns:
+        Iterator[BatchResult]: One result per input file.
+
+    Raises:
+        ValueError: If ``input_module`` is not a registered backend.
+
+    Examples:
+        >>> from invoice2data import extract_many
+        >>> for result in extract_many(["a.pdf", "b.pdf"], workers=4):  # doctest: +SKIP
+        ...     print(result.path, result.data.get("amount"), result.error)
+    """
+    backend = _backend_name(input_module)
+    if input_module is not None and backend is None:
+        raise ValueError(
+            f"extract_many needs a registered input module, got {input_module!r}; "
+            f"expected one of {sorted(INPUT_MODULES)}"
+        )
+    job = _Job(
+        templates,
+        backend,
+        timeout,
+        ai_fallback,
+        get_disk_cache(),
+        race,
+        routing,
+        triage,
+        match_pages,
+        max_ocr_workers(),
+        ocr_batch_size(),
+    )
+    workers = workers or os.cpu_count() or 1
+    files = (os.fspath(path) for path in paths)
+    if workers <= 1:
+        return _serial(job, files)
+    return _Batch(job, workers, ordered).run(files)
+
+
+def _backend_name(input_module: Any) -> str | None:
+    """Return the registry name of a backend, for sending it to workers.
+
+    Args:
+        input_module (Any): ``None``, a backend module or a registry name.
+
+    Returns:
+        str | None: The registry name, or ``None`` for the default cascade or
+            an unregistered backend.
+    """
+    if isinstance(input_module, str):
+        return input_module if input_module in INPUT_MODULES else None
+    for name, module in INPUT_MODULES.items():
+        if module is input_module:
+            return name
+    return None
+
+
+def _serial(job: _Job, files: Iterator[str]) -> Iterator[BatchResult]:
+    """Extract ``files`` one by one in this process (``workers=1``).
+
+    The job and templates stay local to this call: the process-wide settings
+    (text cache, OCR workers and batch size) are already the caller's, so
+    they are left alone, and concurrent calls do not share any state.
+
+    Args:
+        job (_Job): The batch settings.
+        files (Iterator[str]): The input files.
+
+    Yields:
+        BatchResult: One per file.
+    """
+    templates = _load_templates(job)
+
+    def extract(path: str) -> BatchResult:
+        return _extract(job, templates, path)
+
+    module = INPUT_MODULES.get(job.input_module or "")
+    if module is None or not callable(getattr(module, "to_text_batch", None)):
+        yield from map(extract, files)
+        _save_routing(job)
+        return
+    while chunk := list(islice(files, job.ocr_batch_size or ocr_batch_size())):
+        limit = job.timeout * len(chunk) if job.timeout else None
+        try:
+            with _deadline(limit, f"Batch OCR of {', '.join(chunk)}"):
+                extract_text_batch(module, chunk)
+        except DEADLINE_ERRORS as error:
+            logger.warning("%s", error)
+            error_text = f"{type(error).__name__}: {error}"
+            yield from (BatchResult(path, {}, error_text) for path in chunk)
+            continue
+        except Exception as error:  # noqa: BLE001 - files are retried one by one
+            logger.warning("Batch OCR failed, reading files one by one: %s", error)
+        yield from map(extract, chunk)
+    _save_routing(job)
+
+
+def _save_routing(job: _Job) -> None:
+    """Save the routing statistics this process has not saved yet.
+
+    Args:
+        job (_Job): The batch settings.
+    """
+    if job.routing is not None:
+        job.routing.save()
+
+
+def _init_worker(job: _Job) -> None:
+    """Set up a pool worker process for the batch.
+
+    Args:
+        job (_Job): The batch settings.
+    """
+    global _job, _templates
+    _job = job
+    # Workers share the parent's persistent text cache, however it was set up.
+    cache = job.disk_cache
+    if cache is None:
+        configure_disk_cache(None)
+    else:
+        configure_disk_cache(cache.directory, cache.max_bytes)
+    configure_ocr_workers(job.ocr_workers)
+    configure_ocr_batch_size(job.ocr_batch_size)
+    _templates = _load_templates(job)
+    if job.routing is not None and parent_process() is not None:
+        # Pool workers exit without running atexit handlers; finalizers run.
+        Finalize(None, job.routing.save, exitpriority=10)
+
+
+def _load_templates(job: _Job) -> list[InvoiceTemplate]:
+    """Load the batch's templates, compiled and in priority order.
+
+    Args:
+        job (_Job): The batch settings.
+
+    Returns:
+        list[InvoiceTemplate]: The templates.
+    """
+    if isinstance(job.templates, str):
+        templates = read_templates(job.templates)
+    else:
+        templates = job.templates or read_templates()
+    templates = _by_priority(templates)
+    for template in templates:
+        template.compile()
+    return templates
+
+
+def _extract_one(path: str) -> BatchResult:
+    """Extract one file with the pool worker's job and templates.
+
+    Args:
+        path (str): The invoice file.
+
+    Returns:
+        BatchResult: As :func:`_extract` returns it.
+    """
+    return _extract(_job, _templates, path)
+
+
+def _extract(job: _Job, templates: list[InvoiceTemplate], path: str) -> BatchResult:
+    """Extract one file; never raises.
+
+    Args:
+        job (_Job): The batch settings.
+        templates (list[InvoiceTemplate]): The batch's templates.
+        path (str): The invoice file.
+
+    Returns:
+        BatchResult: The data, or the error that stopped it.
+    """
+    try:
+        with _deadline(job.timeout, path):
+            data = extract_data(
+                path,
+                templates=templates,
+                input_module=job.input_module,
+                ai_fallback=job.ai_fallback,
+                race=job.race,
+                routing=job.routing,
+                triage=job.triage,
+                match_pages=job.match_pages,
+            )
+    except Exception as error:  # noqa: BLE001 - reported per file
+        logger.warning("Failed to process %s: %s", path, error)
+        return BatchResult(path, {}, f"{type(error).__name__}: {error}")
+    return BatchResult(path, data)
+
+
+@contextlib.contextmanager
+def _deadline(seconds: float | None, path: str) -> Iterator[None]:
+    """Raise :class:`ExtractionTimeoutError` if the block runs too long.
+
+    A no-op without a limit, off the main thread or without ``setitimer``
+    (Windows).
+
+    Args:
+        seconds (float | None): The time limit.
+        path (str): The file being processed, for the error message.
+
+    Yields:
+        None: Control to the guarded block.
+    """
+    if (
+        not seconds
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def expire(signum: int, frame: Any) -> None:
+        raise ExtractionTimeoutError(f"{path} took longer than {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+class _Batch:
+    """Drive one :func:`extract_many` call over a process pool.
+
+    Args:
+        job (_Job): The batch settings.
+        workers (int): Pool size.
+        ordered (bool): Yield in input order rather than completion order.
+    """
+
+    def __init__(self, job: _Job, workers: int, ordered: bool) -> None:
+        self.job = job
+        self.workers = workers
+        self.ordered = ordered
+        #: Files submitted but not yet yielded, bounding memory and latency.
+        self.window = 2 * workers
+
+    def _pool(self, workers: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.job,)
+        )
+
+    def run(self, files: Iterator[str]) -> Iterator[BatchResult]:
+        """Extract ``files``, yielding results as the order allows.
+
+        Args:
+            files (Iterator[str]): The input files.
+
+        Yields:
+            BatchResult: One per file.
+        """
+        pool = self._pool(self.workers)
+        running: dict[Future[BatchResult], tuple[int, str]] = {}
+        finished: dict[int, BatchResult] = {}
+        pending = enumerate(files)
+        next_index = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(running) + len(finished) < self.window:
+                    item = next(pending, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    running[pool.submit(_extract_one, item[1])] = item
+                if not running and not finished:
+                    return
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                crashed = self._collect(done, running, finished)
+                if crashed:
+                    # Every in-flight task fails with the pool; collect them,
+                    # then re-run the suspects one by one to find the culprit.
+                    crashed += self._collect(set(running), running, finished)
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    for index, path in crashed:
+                        finished[index] = self._isolated(path)
+                    pool = self._pool(self.workers)
+
+                if self.ordered:
+                    while next_index in finished:
+                        yield finished.pop(next_index)
+                        next_index += 1
+                else:
+                    for index in list(finished):
+                        yield finished.pop(index)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _collect(
+        done: "set[Future[BatchResult]]",
+        running: "dict[Future[BatchResult], tuple[int, str]]",
+        finished: dict[int, BatchResult],
+    ) -> list[tuple[int, str]]:
+        """Move completed futures from ``running`` to ``finished``.
+
+        Args:
+            done (set[Future[BatchResult]]): Futures to collect (waited for).
+            running (dict[Future[BatchResult], tuple[int, str]]): In-flight
+                futures and their ``(index, path)``.
+            finished (dict[int, BatchResult]): Results by input index.
+
+        Returns:
+            list[tuple[int, str]]: Files whose worker pool broke under them.
+        """
+        crashed = []
+        for future in wait(done).done:
+            index, path = running.pop(future)
+            try:
+                finished[index] = future.result()
+            except BrokenProcessPool:
+                crashed.append((index, path))
+            except Exception as error:  # noqa: BLE001 - e.g. unpicklable result
+                finished[index] = BatchResult(
+                    path, {}, f"{type(error).__name__}: {error}"
+                )
+        return crashed
+
+    def _isolated(self, path: str) -> BatchResult:
+        """Re-run one file alone, so a second crash is pinned on it.
+
+        Args:
+            path (str): The invoice file.
+
+        Returns:
+            BatchResult: The result, or a ``BrokenProcessPool`` error.
+        """
+        with self._pool(1) as pool:
+            try:
+                return pool.submit(_extract_one, path).result()
+            except BrokenProcessPool:
+                pass
+        logger.error("Worker process crashed while processing %s", path)
+        return BatchResult(path, {}, "BrokenProcessPool: worker process crashed")
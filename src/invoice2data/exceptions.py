@@ -68,3 +68,53 @@ class TemplateSyntaxError(InvoiceProcessingError, ValueError):
         if template_name:
             message = f"{message} (template {template_name})"
         super().__init__(message)
+
+
+class ExtractionTimeoutError(InvoiceProcessingError):
+    """Extracting one document took longer than the allowed time.
+
+    Reported per file by :func:`invoice2data.extract_many` when a ``timeout``
+    is set, so one pathological document can't stall a whole batch.
+    """
+
+
+class RegexTimeoutError(InvoiceProcessingError, TimeoutError):
+    """A field's patterns took longer than the template's ``regex_timeout``.
+
+    Raised inside :meth:`InvoiceTemplate.extract`, which records the field as
+    failed (it is left out of the output) and carries on with the others. When
+    the field is required, the resulting :class:`RequiredFieldsMissingError`
+    is chained from this error.
+
+    Args:
+        seconds (float): The time limit that was exceeded.
+        field (str | None): The field (or plugin) being extracted, when known.
+        template_name (str | None): The template, when known.
+
+    Attributes:
+        seconds (float): The time limit that was exceeded.
+        field (str | None): The field (or plugin) being extracted, when known.
+        template_name (str | None): The template, when known.
+    """
+
+    def __init__(
+        self,
+        seconds: float,
+        field: str | None = None,
+        template_name: str | None = None,
+    ) -> None:
+        self.seconds = seconds
+        self.field = field
+        self.template_name = template_name
+        message = f"Regex matching took longer than {seconds}s"
+        if field:
+            message += f" for field {field!r}"
+        if template_name:
+            message += f" (template {template_name})"
+        super().__init__(message)
+
+
+#: Time limits raised from ``SIGALRM`` in whatever code happens to be running.
+#: Handlers that turn errors into a fallback (the next backend, an empty
+#: result) re-raise these, so the limit is not mistaken for that code failing.
+DEADLINE_ERRORS = (ExtractionTimeoutError, RegexTimeoutError)
@@ -0,0 +1,261 @@
+"""Column-at-a-time type coercion for large ``lines`` tables.
+
+Coercing row by row goes through :meth:`InvoiceTemplate.coerce_type` for every
+cell: a method dispatch, the template's options looked up again, a regex
+``sub`` and two replaces for each number, and a memoized
+:func:`~invoice2data.extract._dates.parse_date` call for each date. Once a
+block has :data:`MIN_ROWS` rows, :func:`coerce_rows` instead gathers each typed
+column and converts it in one go:
+
+- numbers are cleaned with a single ``str.translate`` table built once per
+  decimal separator (thousands separators, whitespace and ``'`` deleted, the
+  decimal separator turned into ``.``) and converted with ``float``;
+- dates are parsed once per distinct value, and when the column's first date
+  parses with the template's first ``date_formats`` entry, that format is
+  tried directly on the others before the tiered parser.
+
+The values are the ones :meth:`InvoiceTemplate.coerce_type` gives, cell for
+cell. Anything the column path does not cover the same way (a value that is
+not a string, a repeated decimal separator, an unknown type, a conversion
+error) sends the whole block back to the per-cell path, which then behaves,
+and raises, exactly as before.
+"""
+
+import datetime
+from collections.abc import Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from typing import Any
+
+from . import _dates
+from . import _regex
+
+
+if TYPE_CHECKING:
+    from .invoice_template import InvoiceTemplate
+
+
+#: Rows below which the per-cell path is used (it is as fast for few rows).
+MIN_ROWS = 32
+
+#: Characters whose presence sends a number through the separator cleanup in
+#: :meth:`InvoiceTemplate.parse_number` (its check reads ``r",.'\s"``).
+_CLEANUP_CHARS = frozenset(r",.'\s")
+
+#: The highest code point either regex engine matches with ``\s``.
+_LAST_SPACE = 0x3000
+
+
+class _FallbackError(Exception):
+    """A column the bulk path cannot convert exactly like the per-cell one."""
+
+
+def coerce_rows(
+    template: "InvoiceTemplate", rows: list[dict[str, Any]], types: Any
+) -> None:
+    """Coerce the typed fields of ``rows`` in place.
+
+    Args:
+        template (InvoiceTemplate): The template, for its options and its
+            per-cell :meth:`~InvoiceTemplate.coerce_type`.
+        rows (list[dict[str, Any]]): The parsed rows.
+        types (Any): The ``types`` setting: field name -> type name.
+    """
+    if not types:
+        return
+    if len(rows) >= MIN_ROWS and isinstance(types, dict):
+        try:
+            _coerce_columns(template, rows, types)
+        except _FallbackError:
+            pass
+        else:
+            return
+    for row in rows:
+        for name in row:
+            if name in types:
+                row[name] = template.coerce_type(row[name], types[name])
+
+
+def _coerce_columns(
+    template: "InvoiceTemplate", rows: list[dict[str, Any]], types: dict[str, Any]
+) -> None:
+    """Coerce ``rows`` column by column.
+
+    Every column is converted before any row is changed, so when one raises
+    :class:`_FallbackError` the rows are left as they were.
+
+    Args:
+        template (InvoiceTemplate): The template, for its options.
+        rows (list[dict[str, Any]]): The parsed rows.
+        types (dict[str, Any]): Field name -> type name.
+    """
+    columns = {
+        name: _column(template, [row[name] for row in rows if name in row], kind)
+        for name, kind in types.items()
+    }
+    for name, values in columns.items():
+        cells = iter(values)
+        for row in rows:
+            if name in row:
+                row[name] = next(cells)
+
+
+def _column(template: "InvoiceTemplate", values: list[Any], kind: Any) -> list[Any]:
+    """Convert one column's values to ``kind``.
+
+    Args:
+        template (InvoiceTemplate): The template, for its options.
+        values (list[Any]): The column's cells, in row order.
+        kind (Any): The type name.
+
+    Returns:
+        list[Any]: The converted cells.
+
+    Raises:
+        _FallbackError: If a value cannot be converted exactly as per cell.
+    """
+    if not all(isinstance(value, str) for value in values):
+        raise _FallbackError
+    options = template.options
+    if kind in ("int", "float"):
+        numbers = _numbers(values, options["decimal_separator"])
+        if kind == "float":
+            return numbers
+        try:
+            return list(map(int, numbers))
+        except (ValueError, OverflowError) as error:  # nan, inf
+            raise _FallbackError from error
+    if kind in ("date", "datetime"):
+        return _dates_of(
+            values,
+            tuple(options["date_formats"] or ()),
+            tuple(options["languages"] or ()),
+        )
+    raise _FallbackError
+
+
+def _numbers(values: list[str], decimal_separator: Any) -> list[float]:
+    """Parse a column of numbers as :meth:`InvoiceTemplate.parse_number` does.
+
+    Empty cells become 0.0, as in :meth:`InvoiceTemplate.coerce_type`.
+
+    Args:
+        values (list[str]): The cells.
+        decimal_separator (Any): The template's ``decimal_separator`` option.
+
+    Returns:
+        list[float]: The numbers.
+
+    Raises:
+        _FallbackError: If the separator is not a single character, a value holds it
+            twice, or a value is not a number.
+    """
+    if not isinstance(decimal_separator, str) or len(decimal_separator) != 1:
+        raise _FallbackError
+    table = _cleanup_table(decimal_separator)
+    disjoint = _CLEANUP_CHARS.isdisjoint
+    try:
+        return [
+            0.0
+            if not value
+            else float(value)
+            if disjoint(value)
+            else _cleaned(value, decimal_separator, table)
+            for value in values
+        ]
+    except ValueError as error:
+        raise _FallbackError from error
+
+
+def _cleaned(value: str, decimal_separator: str, table: dict[int, Any]) -> float:
+    """Parse one number holding separators.
+
+    Args:
+        value (str): The cell.
+        decimal_separator (str): The decimal separator.
+        table (dict[int, Any]): From :func:`_cleanup_table`.
+
+    Returns:
+        float: The number.
+
+    Raises:
+        _FallbackError: If the decimal separator appears more than once.
+    """
+    if value.count(decimal_separator) >= 2:
+        raise _FallbackError
+    return float(value.translate(table))
+
+
+@lru_cache(maxsize=8)
+def _cleanup_table(decimal_separator: str) -> dict[int, Any]:
+    """Return the ``str.translate`` table doing ``parse_number``'s cleanup.
+
+    Deletes the thousands separator, ``'`` and every character the active
+    regex engine treats as whitespace, then maps the decimal separator (unless
+    just deleted) to ``.``.
+
+    Args:
+        decimal_separator (str): A single-character decimal separator.
+
+    Returns:
+        dict[int, Any]: The translation table.
+    """
+    thousands_separator = "," if decimal_separator == "." else "."
+    candidates = "".join(map(chr, range(_LAST_SPACE + 1)))
+    table: dict[int, Any] = dict.fromkeys(
+        map(ord, _regex.findall(r"[\s']", candidates)), None
+    )
+    table[ord(thousands_separator)] = None
+    table.setdefault(ord(decimal_separator), ".")
+    return table
+
+
+def _dates_of(
+    values: list[str], date_formats: tuple[str, ...], languages: tuple[str, ...]
+) -> list[datetime.datetime | None]:
+    """Parse a column of dates, each distinct value once.
+
+    Args:
+        values (list[str]): The cells.
+        date_formats (tuple[str, ...]): The template's ``date_formats``.
+        languages (tuple[str, ...]): The template's ``languages``.
+
+    Returns:
+        list[datetime.datetime | None]: The dates (None where unparseable).
+    """
+
+    def tiered(value: str) -> datetime.datetime | None:
+        return _dates.parse_date(value, date_formats, languages)
+
+    parse: Callable[[str], datetime.datetime | None] = tiered
+    first = next((value for value in values if value), None)
+    if first is not None and _dates._try_strptime(first.strip(), date_formats[:1]):
+        parse = _with_format(date_formats[0], tiered)
+    parsed = {value: parse(value) for value in dict.fromkeys(values)}
+    return [parsed[value] for value in values]
+
+
+def _with_format(
+    date_format: str, fallback: Callable[[str], datetime.datetime | None]
+) -> Callable[[str], datetime.datetime | None]:
+    """Return a parser trying ``date_format`` before ``fallback``.
+
+    The tiered parser tries the template's first format first too, so this
+    only skips its dispatch for the values that format parses.
+
+    Args:
+        date_format (str): The template's first ``date_formats`` entry.
+        fallback (Callable[[str], datetime.datetime | None]): The tiered parser.
+
+    Returns:
+        Callable[[str], datetime.datetime | None]: The parser.
+    """
+    strptime = datetime.datetime.strptime
+
+    def parse(value: str) -> datetime.datetime | None:
+        try:
+            return strptime(value.strip(), date_format)
+        except (ValueError, TypeError):
+            return fallback(value)
+
+    return parse
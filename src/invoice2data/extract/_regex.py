@@ -5,14 +5,32 @@ wrappers so each pattern is compiled only once (via an LRU cache) instead of on
 every call. The engine is selected once at import time: the stdlib :mod:`re` by
 default, or the API-compatible third-party ``regex`` package when
 ``INVOICE2DATA_REGEX_ENGINE=regex`` is set in the environment.
+
+Matching can be bounded in time with :func:`time_limit`, and
+:func:`nested_quantifier` spots the patterns most likely to need it.
 """
 
+import contextlib
+import logging
 import os
 import re
+import signal
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from dataclasses import field
 from functools import lru_cache
 from typing import Any
+from typing import NamedTuple
 from typing import cast
 
+from ..exceptions import RegexTimeoutError
+
+
+logger = logging.getLogger(__name__)
 
 _engine: Any = re
 if os.environ.get("INVOICE2DATA_REGEX_ENGINE", "re").lower() == "regex":
@@ -26,6 +44,44 @@ if os.environ.get("INVOICE2DATA_REGEX_ENGINE", "re").lower() == "regex":
 #: Name of the active regex engine ("re" or "regex").
 ENGINE: str = _engine.__name__
 
+#: The active engine's exception for an invalid pattern.
+error: type[Exception] = _engine.error
+
+#: Whether the engine takes a ``timeout`` argument (only ``regex`` does).
+_NATIVE_TIMEOUT = ENGINE == "regex"
+
+
+def _timeout_from_env() -> float | None:
+    """Read ``INVOICE2DATA_REGEX_TIMEOUT``, in seconds.
+
+    Returns:
+        float | None: The time limit, or None when unset, invalid or not
+            positive.
+    """
+    try:
+        seconds = float(os.environ.get("INVOICE2DATA_REGEX_TIMEOUT", ""))
+    except ValueError:
+        return None
+    return seconds if seconds > 0 else None
+
+
+#: Default time limit, in seconds, for matching one field's patterns (None: no
+#: limit). Set with ``INVOICE2DATA_REGEX_TIMEOUT``; a template's
+#: ``options.regex_timeout`` overrides it.
+TIMEOUT: float | None = _timeout_from_env()
+
+
+class _Limit(NamedTuple):
+    """The time limit :func:`time_limit` set for the current context."""
+
+    deadline: float
+    seconds: float
+    field: str | None
+    template_name: str | None
+
+
+_limit: ContextVar[_Limit | None] = ContextVar("invoice2data_regex_limit", default=None)
+
 
 @lru_cache(maxsize=4096)
 def compile(pattern: str, flags: int = 0) -> "re.Pattern[str]":
@@ -53,7 +109,7 @@ def search(pattern: str, string: str, flags: int = 0) -> "re.Match[str] | None":
     Returns:
         re.Match[str] | None: A match object, or None if there is no match.
     """
-    return compile(pattern, flags).search(string)
+    return search_compiled(compile(pattern, flags), string)
 
 
 def findall(pattern: str, string: str, flags: int = 0) -> Any:
@@ -67,7 +123,7 @@ def findall(pattern: str, string: str, flags: int = 0) -> Any:
     Returns:
         Any: A list of matches (strings or tuples of groups).
     """
-    return compile(pattern, flags).findall(string)
+    return findall_compiled(compile(pattern, flags), string)
 
 
 def finditer(pattern: str, string: str, flags: int = 0) -> Any:
@@ -82,7 +138,74 @@ def finditer(pattern: str, string: str, flags: int = 0) -> Any:
         Any: A callable iterator yielding ``re.Match`` objects (or the active
             engine's equivalent).
     """
-    return compile(pattern, flags).finditer(string)
+    return finditer_compiled(compile(pattern, flags), string)
+
+
+def search_compiled(
+    compiled: "re.Pattern[str]", string: str, pos: int = 0
+) -> "re.Match[str] | None":
+    """Search ``string`` from ``pos`` for a compiled pattern, within the limit.
+
+    Args:
+        compiled (re.Pattern[str]): A pattern from :func:`compile`.
+        string (str): The text to search.
+        pos (int): Where to start searching. Defaults to 0.
+
+    Returns:
+        re.Match[str] | None: A match object, or None if there is no match.
+    """
+    if _NATIVE_TIMEOUT and (limit := _limit.get()) is not None:
+        return cast(
+            "re.Match[str] | None", _bounded(limit, compiled.search, string, pos)
+        )
+    return compiled.search(string, pos)
+
+
+def match_compiled(compiled: "re.Pattern[str]", string: str) -> "re.Match[str] | None":
+    """Match a compiled pattern at the start of ``string``, within the limit.
+
+    Args:
+        compiled (re.Pattern[str]): A pattern from :func:`compile`.
+        string (str): The text to match.
+
+    Returns:
+        re.Match[str] | None: A match object, or None if there is no match.
+    """
+    if _NATIVE_TIMEOUT and (limit := _limit.get()) is not None:
+        return cast("re.Match[str] | None", _bounded(limit, compiled.match, string))
+    return compiled.match(string)
+
+
+def findall_compiled(compiled: "re.Pattern[str]", string: str) -> Any:
+    """Return all non-overlapping matches of a compiled pattern, within the limit.
+
+    Args:
+        compiled (re.Pattern[str]): A pattern from :func:`compile`.
+        string (str): The text to search.
+
+    Returns:
+        Any: A list of matches (strings or tuples of groups).
+    """
+    if _NATIVE_TIMEOUT and (limit := _limit.get()) is not None:
+        return _bounded(limit, compiled.findall, string)
+    return compiled.findall(string)
+
+
+def finditer_compiled(compiled: "re.Pattern[str]", string: str, pos: int = 0) -> Any:
+    """Iterate over a compiled pattern's matches from ``pos``, within the limit.
+
+    Args:
+        compiled (re.Pattern[str]): A pattern from :func:`compile`.
+        string (str): The text to search.
+        pos (int): Where to start searching. Defaults to 0.
+
+    Returns:
+        Any: An iterator yielding ``re.Match`` objects (or the active engine's
+            equivalent).
+    """
+    if _NATIVE_TIMEOUT and (limit := _limit.get()) is not None:
+        return _bounded_iter(limit, _bounded(limit, compiled.finditer, string, pos))
+    return compiled.finditer(string, pos)
 
 
 def split(pattern: str, string: str, maxsplit: int = 0, flags: int = 0) -> Any:
@@ -97,7 +220,10 @@ def split(pattern: str, string: str, maxsplit: int = 0, flags: int = 0) -> Any:
     Returns:
         Any: A list of substrings.
     """
-    return compile(pattern, flags).split(string, maxsplit)
+    compiled = compile(pattern, flags)
+    if _NATIVE_TIMEOUT and (limit := _limit.get()) is not None:
+        return _bounded(limit, compiled.split, string, maxsplit)
+    return compiled.split(string, maxsplit)
 
 
 def sub(pattern: str, repl: str, string: str, count: int = 0, flags: int = 0) -> str:
@@ -113,4 +239,394 @@ def sub(pattern: str, repl: str, string: str, count: int = 0, flags: int = 0) ->
     Returns:
         str: The string with replacements applied.
     """
-    return compile(pattern, flags).sub(repl, string, count)
+    compiled = compile(pattern, flags)
+    if _NATIVE_TIMEOUT and (limit := _limit.get()) is not None:
+        return cast("str", _bounded(limit, compiled.sub, repl, string, count))
+    return compiled.sub(repl, string, count)
+
+
+@contextlib.contextmanager
+def time_limit(
+    seconds: float | None,
+    field: str | None = None,
+    template_name: str | None = None,
+) -> Iterator[None]:
+    """Raise :class:`RegexTimeoutError` if the block spends too long matching.
+
+    With the ``regex`` engine, every call through this module is given the
+    time left as its ``timeout``, on any thread; that includes the
+    ``*_compiled`` helpers, which the parsers use for the patterns they
+    compile up front. On the main thread, where ``setitimer`` is available
+    (not on Windows), a ``SIGALRM`` watchdog also interrupts the block: both
+    engines check for signals while matching, so this bounds the stdlib
+    engine too. Elsewhere -- worker threads, such as ``extract_data_async``'s
+    executor or race mode's readers -- stdlib matching is not bounded; a
+    warning says so once per process.
+
+    Args:
+        seconds (float | None): The time limit; None or 0 for no limit.
+        field (str | None): The field being extracted, for the error.
+        template_name (str | None): The template, for the error.
+
+    Yields:
+        None: Control to the guarded block.
+    """
+    if not seconds:
+        yield
+        return
+    limit = _Limit(time.perf_counter() + seconds, seconds, field, template_name)
+    token = _limit.set(limit)
+    try:
+        with _watchdog(limit):
+            yield
+    finally:
+        _limit.reset(token)
+
+
+@contextlib.contextmanager
+def _watchdog(limit: _Limit) -> Iterator[None]:
+    """Interrupt the block with a ``SIGALRM`` once ``limit`` is exceeded.
+
+    A timer already running (such as ``extract_many``'s per-file limit) is
+    kept: when it is due first it is left to fire, otherwise it is re-armed
+    with the time it had left once the block is done.
+
+    Args:
+        limit (_Limit): The time limit.
+
+    Yields:
+        None: Control to the guarded block.
+    """
+    if (
+        not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        if not _NATIVE_TIMEOUT:
+            _warn_unenforced()
+        yield
+        return
+    outer, interval = signal.getitimer(signal.ITIMER_REAL)
+    if outer and outer <= limit.seconds:
+        yield
+        return
+
+    def expire(signum: int, frame: Any) -> None:
+        raise RegexTimeoutError(limit.seconds, limit.field, limit.template_name)
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, limit.seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+        if outer:
+            elapsed = time.perf_counter() - (limit.deadline - limit.seconds)
+            signal.setitimer(signal.ITIMER_REAL, max(outer - elapsed, 1e-6), interval)
+
+
+@lru_cache(maxsize=1)
+def _warn_unenforced() -> None:
+    """Warn, once, that a time limit cannot bound the stdlib engine here."""
+    logger.warning(
+        "regex_timeout is not enforced off the main thread (or without "
+        "setitimer) with the stdlib engine; set INVOICE2DATA_REGEX_ENGINE=regex"
+    )
+
+
+def _bounded(limit: _Limit, method: Callable[..., Any], *args: Any) -> Any:
+    """Call a ``regex`` engine method with the time left as its ``timeout``.
+
+    Args:
+        limit (_Limit): The time limit.
+        method (Callable[..., Any]): The compiled pattern's method.
+        *args (Any): Its positional arguments.
+
+    Returns:
+        Any: What the method returns.
+
+    Raises:
+        RegexTimeoutError: If the deadline has passed or passes while matching.
+    """
+    remaining = limit.deadline - time.perf_counter()
+    if remaining <= 0:
+        raise RegexTimeoutError(limit.seconds, limit.field, limit.template_name)
+    try:
+        return method(*args, timeout=remaining)
+    except RegexTimeoutError:
+        raise
+    except TimeoutError as error:
+        raise RegexTimeoutError(
+            limit.seconds, limit.field, limit.template_name
+        ) from error
+
+
+def _bounded_iter(limit: _Limit, matches: Iterator[Any]) -> Iterator[Any]:
+    """Yield from a ``regex`` engine ``finditer``, reporting its timeout.
+
+    Args:
+        limit (_Limit): The time limit.
+        matches (Iterator[Any]): The iterator, created with a ``timeout``.
+
+    Yields:
+        Any: The match objects.
+
+    Raises:
+        RegexTimeoutError: If the deadline passes while iterating.
+    """
+    try:
+        yield from matches
+    except RegexTimeoutError:
+        raise
+    except TimeoutError as error:
+        raise RegexTimeoutError(
+            limit.seconds, limit.field, limit.template_name
+        ) from error
+
+
+#: An escape sequence, as one atom.
+_ESCAPE = re.compile(
+    r"\\(?:x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|N\{[^}]*\}|\d+|.)", re.DOTALL
+)
+
+#: What may follow ``(`` before a group's contents.
+_GROUP_PREFIX = re.compile(r"\(\?(?:P?<\w+>|[:>=!|]|<[=!]|[aiLmsux-]+:)?")
+
+#: A quantifier, with its lazy (``?``) or possessive (``+``) suffix.
+_QUANTIFIER = re.compile(r"(?:[*+?]|\{(\d*)(,?)(\d*)\})([?+]?)")
+
+#: Escapes standing for one literal character.
+_LITERAL_ESCAPES = {"\\n": "\n", "\\r": "\r", "\\t": "\t", "\\f": "\f", "\\v": "\v"}
+
+#: The characters tried to tell whether two one-character atoms overlap:
+#: ASCII, and a few others that classes commonly split on.
+_PROBE = (
+    "".join(map(chr, range(128))) + "\N{NO-BREAK SPACE}\u00e9\u00df\u20ac\u2009\u3000"
+)
+
+
+@dataclass
+class _Group:
+    """What :func:`nested_quantifier` knows about a group being scanned."""
+
+    start: int
+    atomic: bool = False
+    alternation: bool = False
+    #: The group's top-level atoms (None for a nested group), each with
+    #: whether it must match at least once.
+    items: list[tuple[str | None, bool]] = field(default_factory=list)
+    #: The atoms inside the group that repeat without bound (None for a group).
+    repeated: list[str | None] = field(default_factory=list)
+
+
+def nested_quantifier(pattern: str) -> str | None:
+    r"""Return the first repeated group that repeats a sub-pattern of its own.
+
+    Nested unbounded quantifiers, as in ``(a+)+`` or ``(\w+\s?)*``, let the
+    engine split the same text between the iterations in exponentially many
+    ways, which it tries one by one when the rest of the pattern fails to
+    match. A group is not reported when it is atomic or possessive, or when it
+    begins or ends with a literal character none of its repeated parts can
+    match, as in ``(?: \S+)*``: each iteration is then pinned to one
+    position.
+
+    This is a heuristic over the pattern's text; it does not catch every
+    pattern that backtracks badly (overlapping alternatives such as
+    ``(a|a)*`` are not looked at).
+
+    Args:
+        pattern (str): The regular expression pattern.
+
+    Returns:
+        str | None: The offending group's text, or None.
+    """
+    stack = [_Group(0)]
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "(":
+            prefix = _GROUP_PREFIX.match(pattern, i)
+            end = prefix.end() if prefix else i + 1
+            stack.append(_Group(i, atomic=pattern[i:end] == "(?>"))
+            i = end
+            continue
+        if char == "|":
+            stack[-1].alternation = True
+            i += 1
+            continue
+        group = stack.pop() if char == ")" and len(stack) > 1 else None
+        end = i + 1 if group else _atom_end(pattern, i)
+        atom = None if group else pattern[i:end]
+        quantifier = _QUANTIFIER.match(pattern, end)
+        mandatory, unbounded, possessive = _quantifier_kind(quantifier)
+        if quantifier:
+            end = quantifier.end()
+        parent = stack[-1]
+        parent.items.append((atom, mandatory))
+        if possessive or (group and group.atomic):
+            pass
+        elif group is None:
+            parent.repeated += [atom] if unbounded else []
+        elif not unbounded:
+            parent.repeated += group.repeated
+        elif group.repeated and not _separated(group):
+            return pattern[group.start : end]
+        else:
+            parent.repeated += group.repeated + [item for item, _ in group.items]
+        i = end
+    return None
+
+
+def _atom_end(pattern: str, start: int) -> int:
+    """Return the index just past the atom (not a group) starting at ``start``.
+
+    Args:
+        pattern (str): The pattern.
+        start (int): Where the atom starts.
+
+    Returns:
+        int: Where it ends.
+    """
+    if pattern[start] == "\\":
+        escape = _ESCAPE.match(pattern, start)
+        return escape.end() if escape else len(pattern)
+    if pattern[start] == "[":
+        return _class_end(pattern, start)
+    return start + 1
+
+
+def _class_end(pattern: str, start: int) -> int:
+    """Return the index just past the character class opening at ``start``.
+
+    Args:
+        pattern (str): The pattern.
+        start (int): The index of ``[``.
+
+    Returns:
+        int: The end of the class (the end of the pattern if unclosed).
+    """
+    i = start + 1
+    if pattern.startswith("^", i):
+        i += 1
+    if pattern.startswith("]", i):
+        i += 1
+    while i < len(pattern) and pattern[i] != "]":
+        i += 2 if pattern[i] == "\\" else 1
+    return min(i + 1, len(pattern))
+
+
+def _quantifier_kind(quantifier: "re.Match[str] | None") -> tuple[bool, bool, bool]:
+    """Describe the quantifier following an atom.
+
+    Args:
+        quantifier (re.Match[str] | None): A :data:`_QUANTIFIER` match.
+
+    Returns:
+        tuple[bool, bool, bool]: Whether the atom must match at least once,
+            whether it may repeat without bound, and whether it is possessive.
+    """
+    if quantifier is None:
+        return True, False, False
+    text = quantifier.group()
+    low, comma, high, suffix = quantifier.groups()
+    if text[0] == "{":
+        mandatory = bool(low) and int(low) > 0
+        unbounded = bool(comma) and not high
+    else:
+        mandatory = text[0] == "+"
+        unbounded = text[0] != "?"
+    return mandatory, unbounded, suffix == "+"
+
+
+def _separated(group: _Group) -> bool:
+    """Whether each iteration of ``group`` is pinned by a separator.
+
+    Args:
+        group (_Group): A group about to be repeated.
+
+    Returns:
+        bool: True if the group begins or ends with a single character (a
+            literal or a class) that none of its other repeated atoms can
+            match.
+    """
+    if group.alternation:
+        return False
+    for atom, mandatory in (group.items[0], group.items[-1]):
+        chars = _chars(atom) if mandatory and atom is not None else None
+        if not chars:
+            continue
+        others = list(group.repeated)
+        if atom in others:
+            others.remove(atom)
+        if others and not any(_matches_any(other, chars) for other in others):
+            return True
+    return False
+
+
+def _literal(atom: str) -> str | None:
+    """Return the character an atom stands for, if it is a literal.
+
+    Args:
+        atom (str): The atom's text.
+
+    Returns:
+        str | None: The character, or None if the atom is not a literal.
+    """
+    if len(atom) == 1:
+        return None if atom in ".^$" else atom
+    if atom in _LITERAL_ESCAPES:
+        return _LITERAL_ESCAPES[atom]
+    if len(atom) == 2 and atom[0] == "\\" and not atom[1].isalnum():
+        return atom[1]
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _atom(atom: str) -> "re.Pattern[str] | None":
+    """Compile an atom on its own, or return None if it is not a valid one.
+
+    Args:
+        atom (str): The atom's text.
+
+    Returns:
+        re.Pattern[str] | None: The compiled atom.
+    """
+    try:
+        return re.compile(atom, re.DOTALL)
+    except re.error:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _chars(atom: str) -> frozenset[str] | None:
+    """Return the characters (of :data:`_PROBE`) a one-character atom matches.
+
+    Args:
+        atom (str): The atom's text.
+
+    Returns:
+        frozenset[str] | None: The characters, or None if the atom can match
+            the empty string (an anchor, say) or is not valid on its own.
+    """
+    compiled = _atom(atom)
+    if compiled is None or compiled.fullmatch(""):
+        return None
+    literal = _literal(atom)
+    probe = _PROBE if literal is None else _PROBE + literal
+    return frozenset(char for char in probe if compiled.fullmatch(char))
+
+
+def _matches_any(atom: str | None, chars: frozenset[str]) -> bool:
+    """Whether ``atom`` can match one of ``chars`` (True when it cannot be told).
+
+    Args:
+        atom (str | None): The atom's text (None for a group).
+        chars (frozenset[str]): The characters.
+
+    Returns:
+        bool: Whether the atom may match one of the characters.
+    """
+    compiled = _atom(atom) if atom is not None else None
+    if compiled is None:
+        return True
+    return any(compiled.fullmatch(char) for char in chars)
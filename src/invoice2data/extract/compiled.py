@@ -0,0 +1,254 @@
+"""Compiled, immutable execution plans for templates.
+
+A template is a static description, yet :meth:`InvoiceTemplate.extract` used to
+re-derive the same facts from it for every document: which fields are dicts,
+static values or legacy regexes, which parser/plugin module handles them, the
+normalized ``replace`` pairs, the line rules merged with their defaults and the
+required-field list. :func:`compile_template` resolves all of that once into a
+:class:`CompiledTemplate`, so the per-document path only runs patterns.
+
+Compiling never raises. A field or plugin whose settings are invalid keeps the
+old, uncompiled call as its plan, so the error still surfaces from ``extract``
+exactly when and how it did before (and the template still loads).
+"""
+
+from collections.abc import Callable
+from collections.abc import Mapping
+from dataclasses import dataclass
+from logging import getLogger
+from typing import TYPE_CHECKING
+from typing import Any
+
+from . import _regex
+from .parsers import regex as regex_parser
+
+
+if TYPE_CHECKING:
+    import re
+
+    from .invoice_template import InvoiceTemplate
+
+
+__all__ = ["CompiledTemplate", "FieldPlan", "compile_template"]
+
+logger = getLogger(__name__)
+
+#: Required fields when a template doesn't declare ``required_fields``.
+DEFAULT_REQUIRED_FIELDS = ("date", "amount", "invoice_number", "issuer")
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    """How one entry of a template's ``fields`` produces its output.
+
+    Attributes:
+        name (str): The output key.
+        kind (str): ``parser`` (a ``parser:`` mapping), ``legacy`` (a bare regex
+            or list of regexes), ``static`` (a ``static_`` value), ``unknown``
+            (a ``parser:`` that isn't registered) or ``skip`` (a mapping
+            without ``parser:``, which produces nothing).
+        run (Callable[[Any, str], Any] | None): ``run(template, content)``
+            returning the value, or ``None`` for static/unknown fields.
+        value (Any): The value of a static field.
+        area (dict[str, Any] | None): The ``area`` to re-extract text from.
+        parser (str): The parser name, for log messages.
+    """
+
+    name: str
+    kind: str
+    run: Callable[[Any, str], Any] | None = None
+    value: Any = None
+    area: dict[str, Any] | None = None
+    parser: str = ""
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """Everything :meth:`InvoiceTemplate.extract` needs, resolved once.
+
+    Attributes:
+        replace (tuple[tuple[re.Pattern[str], str], ...] | None): The compiled
+            ``options.replace`` pairs, or ``None`` when they are malformed (the
+            input step then reports the error).
+        fields (tuple[FieldPlan, ...] | None): One plan per ``fields`` entry, in
+            order, or ``None`` when ``fields`` is missing or not a mapping.
+        plugins (tuple[Callable[..., Any], ...]): ``run(template, content,
+            output, invoice_file)`` for each plugin the template uses.
+        required_fields (tuple[str, ...] | None): Fields the output must
+            contain, or ``None`` when ``required_fields`` is not a list.
+    """
+
+    replace: "tuple[tuple[re.Pattern[str], str], ...] | None"
+    fields: tuple[FieldPlan, ...] | None
+    plugins: tuple[Callable[..., Any], ...]
+    required_fields: tuple[str, ...] | None
+
+
+def compile_template(
+    template: "InvoiceTemplate",
+    parsers: Mapping[str, Any],
+    plugins: Mapping[str, Any],
+) -> CompiledTemplate:
+    """Build the execution plan for a template.
+
+    Args:
+        template (InvoiceTemplate): The template to compile.
+        parsers (Mapping[str, Any]): Parser modules by ``parser:`` name.
+        plugins (Mapping[str, Any]): Plugin modules by top-level template key.
+
+    Returns:
+        CompiledTemplate: The plan. It reflects the template as it is now;
+            templates are not meant to be edited after loading.
+    """
+    fields = template.get("fields")
+    required = template.get("required_fields", DEFAULT_REQUIRED_FIELDS)
+    return CompiledTemplate(
+        replace=_compile_replace(template.options.get("replace", [])),
+        fields=tuple(
+            _compile_field(template, name, settings, parsers)
+            for name, settings in fields.items()
+        )
+        if isinstance(fields, dict)
+        else None,
+        plugins=tuple(
+            _compile_plugin(template, module)
+            for keyword, module in plugins.items()
+            if keyword in template
+        ),
+        required_fields=tuple(required) if isinstance(required, list | tuple) else None,
+    )
+
+
+def _compile_replace(
+    replace: Any,
+) -> "tuple[tuple[re.Pattern[str], str], ...] | None":
+    """Compile the ``options.replace`` pairs, or return ``None`` if malformed.
+
+    Args:
+        replace (Any): A ``[pattern, repl]`` pair or a list of them.
+
+    Returns:
+        tuple[tuple[re.Pattern[str], str], ...] | None: The compiled pairs.
+    """
+    if not isinstance(replace, list):
+        replace = [replace]
+    try:
+        if any(len(pair) != 2 for pair in replace):
+            return None
+        return tuple((_regex.compile(pair[0]), pair[1]) for pair in replace)
+    except Exception:  # noqa: BLE001 - reported by prepare_input instead
+        return None
+
+
+def _compile_field(
+    template: "InvoiceTemplate",
+    name: str,
+    settings: Any,
+    parsers: Mapping[str, Any],
+) -> FieldPlan:
+    """Resolve one ``fields`` entry to its plan.
+
+    Args:
+        template (InvoiceTemplate): The template being compiled.
+        name (str): The field key.
+        settings (Any): The field value from the template.
+        parsers (Mapping[str, Any]): Parser modules by name.
+
+    Returns:
+        FieldPlan: The plan for the field.
+    """
+    if isinstance(settings, dict):
+        if "parser" not in settings:
+            # Dict fields without a parser never produced output.
+            return FieldPlan(name, "skip")
+        parser_name = settings["parser"]
+        parser = parsers.get(parser_name) if isinstance(parser_name, str) else None
+        if parser is None:
+            return FieldPlan(name, "unknown", parser=parser_name)
+        return FieldPlan(
+            name,
+            "parser",
+            run=_prepare(template, name, settings, parser),
+            area=settings.get("area"),
+            parser=parser_name,
+        )
+
+    if name.startswith("static_"):
+        return FieldPlan(name.replace("static_", ""), "static", value=settings)
+
+    # Legacy syntax: the field name decides the type.
+    if name.startswith("sum_amount") and type(settings) is list:
+        name = name[4:]
+        legacy = {"regex": settings, "type": "float", "group": "sum"}
+    elif name.startswith("date") or name.endswith("date"):
+        legacy = {"regex": settings, "type": "date"}
+    elif name.startswith("amount"):
+        legacy = {"regex": settings, "type": "float"}
+    else:
+        legacy = {"regex": settings}
+    return FieldPlan(
+        name, "legacy", run=_prepare(template, name, legacy, regex_parser, True)
+    )
+
+
+def _prepare(
+    template: "InvoiceTemplate",
+    name: str,
+    settings: dict[str, Any],
+    parser: Any,
+    legacy: bool = False,
+) -> Callable[[Any, str], Any]:
+    """Return the parser's prepared function, or a plain ``parse`` call.
+
+    Parsers may expose ``prepare(template, field, settings)``; the others (and
+    settings the parser rejects) fall back to calling ``parse`` per document.
+
+    Args:
+        template (InvoiceTemplate): The template being compiled.
+        name (str): The field name.
+        settings (dict[str, Any]): The field settings.
+        parser (Any): The parser module.
+        legacy (bool): Whether this is a legacy-syntax regex field.
+
+    Returns:
+        Callable[[Any, str], Any]: ``run(template, content)``.
+    """
+    if hasattr(parser, "prepare"):
+        try:
+            if legacy:
+                return parser.prepare(template, name, settings, True)  # type: ignore[no-any-return]
+            return parser.prepare(template, name, settings)  # type: ignore[no-any-return]
+        except Exception as error:  # noqa: BLE001 - re-raised by `parse` on use
+            logger.debug(
+                "Template %s: field %s not compiled (%s)",
+                template.get("template_name"),
+                name,
+                error,
+            )
+
+    if legacy:
+        return lambda tpl, content: parser.parse(tpl, name, settings, content, True)
+    return lambda tpl, content: parser.parse(tpl, name, settings, content)
+
+
+def _compile_plugin(template: "InvoiceTemplate", module: Any) -> Callable[..., Any]:
+    """Return the plugin's prepared extractor, or its plain ``extract``.
+
+    Args:
+        template (InvoiceTemplate): The template being compiled.
+        module (Any): The plugin module.
+
+    Returns:
+        Callable[..., Any]: ``run(template, content, output, invoice_file)``.
+    """
+    if hasattr(module, "prepare"):
+        try:
+            return module.prepare(template)  # type: ignore[no-any-return]
+        except Exception as error:  # noqa: BLE001 - re-raised by `extract` on use
+            logger.debug(
+                "Template %s: plugin %s not compiled (%s)",
+                template.get("template_name"),
+                module.__name__,
+                error,
+            )
+    return module.extract  # type: ignore[no-any-return]
@@ -3,13 +3,16 @@
 Templates are initially read from .yml files and then kept as class.
 """
 
+import contextlib
 import unicodedata
 from collections import OrderedDict as OrderedDictType
+from collections.abc import Iterator
 from logging import DEBUG
 from logging import getLogger
 from pprint import pformat
 from typing import Any
 
+from ..exceptions import RegexTimeoutError
 from ..exceptions import RequiredFieldsMissingError
 from ..exceptions import TemplateSyntaxError
 from ..input import extract_text
@@ -19,6 +22,9 @@ from . import _regex
 from . import parsers
 from . import schema
 from . import unece_uom
+from .compiled import CompiledTemplate
+from .compiled import FieldPlan
+from .compiled import compile_template
 from .plugins import camelot
 from .plugins import lines
 from .plugins import tables
@@ -68,6 +74,8 @@ class InvoiceTemplate(OrderedDictType[str, Any]):
           Change the type of values.
       extract(optimized_str)
           Given a template file and a string, extract matching data fields.
+      compile()
+          Return the template's execution plan, built on first use.
     """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -95,6 +103,35 @@ class InvoiceTemplate(OrderedDictType[str, Any]):
         if "issuer" not in self.keys():
             self["issuer"] = self["keywords"][0]
 
+    def __reduce__(self) -> Any:
+        """Pickle from the template's items, without the compiled plan.
+
+        The default ``OrderedDict`` reduction calls ``__init__`` with no
+        arguments, which fails on the missing ``keywords``. The plan holds
+        closures and is rebuilt on first use.
+
+        Returns:
+            Any: The reduction tuple.
+        """
+        state = {k: v for k, v in vars(self).items() if k != "_compiled"}
+        return type(self), (list(self.items()),), state or None
+
+    def compile(self) -> CompiledTemplate:
+        """Return the execution plan :meth:`extract` runs, building it once.
+
+        :func:`~invoice2data.extract.loader.read_templates` compiles every
+        template it loads, so documents never pay for it. The plan reflects the
+        template at the time of the first call; edit templates before use.
+
+        Returns:
+            CompiledTemplate: The cached plan.
+        """
+        plan: CompiledTemplate | None = self.__dict__.get("_compiled")
+        if plan is None:
+            plan = compile_template(self, PARSERS_MAPPING, PLUGIN_MAPPING)
+            self.__dict__["_compiled"] = plan
+        return plan
+
     def prepare_input(self, extracted_str: str) -> str:
         """Input raw string and do transformations, as set in template file."""
         # Remove whitespace
@@ -113,18 +150,27 @@ class InvoiceTemplate(OrderedDictType[str, Any]):
         if self.options["lowercase"]:
             optimized_str = optimized_str.lower()
 
+        replace = self.compile().replace
+        if replace is not None:
+            for pattern, repl in replace:
+                optimized_str = pattern.sub(repl, optimized_str)
+            return optimized_str
+
+        # Malformed `replace` option: validate entry by entry to report it.
         if not isinstance(self.options.get("replace", []), list):
             self.options["replace"] = [self.options["replace"]]
 
         # Specific replace
-        for replace in self.options.get("replace", []):
-            if len(replace) != 2:
+        for replace_entry in self.options.get("replace", []):
+            if len(replace_entry) != 2:
                 raise TemplateSyntaxError(
                     "A `replace` entry must be a [pattern, repl] pair "
-                    f"(got {len(replace)} elements)",
+                    f"(got {len(replace_entry)} elements)",
                     self.get("template_name"),
                 )
-            optimized_str = _regex.sub(replace[0], replace[1], optimized_str)
+            optimized_str = _regex.sub(
+                replace_entry[0], replace_entry[1], optimized_str
+            )
 
         return optimized_str
 
@@ -252,7 +298,11 @@ class InvoiceTemplate(OrderedDictType[str, Any]):
         )
 
     def extract(
-        self, optimized_str: str, invoice_file: str, input_module: Any
+        self,
+        optimized_str: str,
+        invoice_file: str,
+        input_module: Any,
+        languages: tuple[str, ...] | None = None,
     ) -> dict[str, Any]:
         """Extracts data from the optimized string using the template.
 
@@ -260,28 +310,52 @@ class InvoiceTemplate(OrderedDictType[str, Any]):
             optimized_str (str): The optimized string.
             invoice_file (str): The path to the invoice file.
             input_module (Any): The input module used.
+            languages (tuple[str, ...] | None): The OCR languages the text was
+                read in, for ``area`` fields (None: the backend's default).
 
         Returns:
             dict[str, Any]: The extracted data.
 
+        Each field (and plugin) is given ``options.regex_timeout`` seconds,
+        defaulting to ``INVOICE2DATA_REGEX_TIMEOUT`` (no limit when neither is
+        set); one that takes longer is logged and left out, as a field that
+        does not match is, and its name listed under ``regex_timeouts``.
+
+        Raises:
+            TemplateSyntaxError: If the template's ``fields`` is missing or not
+                a mapping.
         """
+        plan = self.compile()
         output = _initialize_output_and_log(self, optimized_str)
 
-        for k, v in self["fields"].items():
-            if isinstance(v, dict):
-                optimized_str_for_parser = _handle_area(
-                    self, v, input_module, invoice_file, optimized_str
+        if plan.fields is None:
+            raise TemplateSyntaxError(
+                "`fields` must be a mapping of field names to settings",
+                self.get("template_name"),
+            )
+        timeouts: dict[str, RegexTimeoutError] = {}
+        for field in plan.fields:
+            if field.kind == "static":
+                logger.debug("field=%s | static value=%s", field.name, field.value)
+                output[field.name] = field.value
+            elif field.kind == "parser":
+                content = _handle_area(
+                    self,
+                    field,
+                    input_module,
+                    invoice_file,
+                    optimized_str,
+                    languages,
+                )
+                with _time_limit(self, field.name, timeouts):
+                    _handle_parser(self, field, content, output)
+            elif field.kind == "legacy":
+                with _time_limit(self, field.name, timeouts):
+                    _handle_legacy_syntax(self, field, optimized_str, output)
+            elif field.kind == "unknown":
+                logger.error(
+                    "Field %s has unknown parser %s set", field.name, field.parser
                 )
-
-                if "parser" in v:
-                    _handle_parser(self, k, v, optimized_str_for_parser, output)
-
-            elif k.startswith("static_"):
-                logger.debug("field=%s | static value=%s", k, v)
-                output[k.replace("static_", "")] = v
-
-            else:
-                _handle_legacy_syntax(self, k, v, optimized_str, output)
         # Fall back to the template's `options.currency` only when no field
         # extracted a currency. Prior versions unconditionally overwrote the
         # captured value with the option (default "EUR"), silently defeating
@@ -289,9 +363,12 @@ class InvoiceTemplate(OrderedDictType[str, Any]):
         output.setdefault("currency", self.options["currency"])
 
         # Run plugins (invoice_file is needed by path-based plugins like camelot):
-        for plugin_keyword, plugin_func in PLUGIN_MAPPING.items():
-            if plugin_keyword in self.keys():
-                plugin_func.extract(self, optimized_str, output, invoice_file)
+        for plugin in plan.plugins:
+            name = getattr(plugin, "__module__", "").rpartition(".")[2]
+            with _time_limit(self, name, timeouts):
+                plugin(self, optimized_str, output, invoice_file)
+        if timeouts:
+            output["regex_timeouts"] = sorted(timeouts)
         # Normalise line/tax_line field names to the canonical vocabulary before
         # any computation/validation runs on them. Then derive `unece_code` from
         # captured `uom` literals so the OCA Odoo importer can map it straight.
@@ -301,7 +378,7 @@ class InvoiceTemplate(OrderedDictType[str, Any]):
         _compute_line_tax(output)
         _validate_tax_total(output, self["template_name"])
         _validate_fields(self, output)
-        return _check_required_fields(self, output)
+        return _check_required_fields(self, output, timeouts)
 
 
 def _initialize_output_and_log(
@@ -330,17 +407,46 @@ def _initialize_output_and_log(
     return output
 
 
+@contextlib.contextmanager
+def _time_limit(
+    self: InvoiceTemplate, name: str, timeouts: dict[str, RegexTimeoutError]
+) -> Iterator[None]:
+    """Run one field or plugin under the template's ``regex_timeout``.
+
+    A :class:`RegexTimeoutError` is logged and recorded in ``timeouts``
+    instead of propagating, so the other fields are still extracted.
+
+    Args:
+        self (InvoiceTemplate): The template instance.
+        name (str): The field (or plugin) name.
+        timeouts (dict[str, RegexTimeoutError]): Collects the timeouts by name.
+
+    Yields:
+        None: Control to the extraction.
+    """
+    seconds = self.options.get("regex_timeout", _regex.TIMEOUT)
+    try:
+        with _regex.time_limit(seconds, name, self.get("template_name")):
+            yield
+    except RegexTimeoutError as error:
+        logger.warning("%s; skipped", error)
+        timeouts[name] = error
+
+
 def _handle_area(
     self: InvoiceTemplate,
-    v: dict[str, Any],
+    field: FieldPlan,
     input_module: Any,
     invoice_file: str,
     optimized_str: str,
+    languages: tuple[str, ...] | None = None,
 ) -> str:
     """Handle area-specific extraction."""
-    if "area" in v and supports_area(input_module):
-        logger.debug(f"Area was specified with parameters {v['area']}")
-        optimized_str_area: str = extract_text(input_module, invoice_file, v["area"])
+    if field.area is not None and supports_area(input_module):
+        logger.debug(f"Area was specified with parameters {field.area}")
+        optimized_str_area: str = extract_text(
+            input_module, invoice_file, field.area, languages
+        )
         logger.debug(
             "START pdftotext area result ===========================\n%s",
             optimized_str_area,
@@ -352,48 +458,29 @@ def _handle_area(
 
 def _handle_parser(
     self: InvoiceTemplate,
-    k: str,
-    v: dict[str, Any],
+    field: FieldPlan,
     optimized_str_for_parser: str,
     output: dict[str, Any],
 ) -> None:
     """Handle parsing using different parsers."""
-    if v["parser"] in PARSERS_MAPPING:
-        parser = PARSERS_MAPPING[v["parser"]]
-        value = parser.parse(self, k, v, optimized_str_for_parser)
-        if value or value == 0.0:
-            output[k] = value
-        else:
-            logger.warning("Failed to parse field %s with parser %s", k, v["parser"])
+    value = field.run(self, optimized_str_for_parser)  # type: ignore[misc]
+    if value or value == 0.0:
+        output[field.name] = value
     else:
-        logger.error("Field %s has unknown parser %s set", k, v["parser"])
+        logger.warning(
+            "Failed to parse field %s with parser %s", field.name, field.parser
+        )
 
 
 def _handle_legacy_syntax(
-    self: InvoiceTemplate, k: str, v: Any, optimized_str: str, output: dict[str, Any]
+    self: InvoiceTemplate, field: FieldPlan, optimized_str: str, output: dict[str, Any]
 ) -> None:
     """Handle legacy syntax for backward compatibility."""
-    result = None
-    if k.startswith("sum_amount") and type(v) is list:
-        k = k[4:]
-        result = parsers.regex.parse(
-            self, k, {"regex": v, "type": "float", "group": "sum"}, optimized_str, True
-        )
-    elif k.startswith("date") or k.endswith("date"):
-        result = parsers.regex.parse(
-            self, k, {"regex": v, "type": "date"}, optimized_str, True
-        )
-    elif k.startswith("amount"):
-        result = parsers.regex.parse(
-            self, k, {"regex": v, "type": "float"}, optimized_str, True
-        )
-    else:
-        result = parsers.regex.parse(self, k, {"regex": v}, optimized_str, True)
-
+    result = field.run(self, optimized_str)  # type: ignore[misc]
     if result or result == 0.0:
-        output[k] = result
+        output[field.name] = result
     else:
-        logger.warning("regexp for field %s didn't match", k)
+        logger.warning("regexp for field %s didn't match", field.name)
 
 
 def _to_float(value: Any) -> float | None:
@@ -600,11 +687,18 @@ def _validate_fields(self: InvoiceTemplate, output: dict[str, Any]) -> None:
 
 
 def _check_required_fields(
-    self: InvoiceTemplate, output: dict[str, Any]
+    self: InvoiceTemplate,
+    output: dict[str, Any],
+    timeouts: dict[str, RegexTimeoutError],
 ) -> dict[str, Any]:
-    """Check if all required fields are present in the output."""
-    if "required_fields" not in self.keys():
-        required_fields = ["date", "amount", "invoice_number", "issuer"]
+    """Check if all required fields are present in the output.
+
+    A missing field that timed out is the cause of the
+    :class:`RequiredFieldsMissingError` raised.
+    """
+    required = self.compile().required_fields
+    if required is not None:
+        required_fields = list(required)
     else:
         required_fields = []
         for v in self["required_fields"]:
@@ -625,4 +719,5 @@ def _check_required_fields(
     missing = set(required_fields) - set(fields)
     # RequiredFieldsMissingError subclasses ValueError, so the cascade's existing
     # `except ValueError` retry handling is unaffected.
-    raise RequiredFieldsMissingError(missing, self.get("template_name"))
+    cause = next((timeouts[name] for name in sorted(missing) if name in timeouts), None)
+    raise RequiredFieldsMissingError(missing, self.get("template_name")) from cause
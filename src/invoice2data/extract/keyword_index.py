@@ -0,0 +1,252 @@
+"""Aho-Corasick keyword index for template matching.
+
+:meth:`InvoiceTemplate.matches_input` checks a template's ``keywords`` /
+``exclude_keywords`` with one ``keyword in text`` scan per keyword, and
+:func:`invoice2data.api._match_template` runs it for every template in turn. That
+is fine for the ~200 bundled templates but dominates per-document latency once a
+deployment carries thousands of in-house templates.
+
+:class:`KeywordIndex` builds one automaton over the keywords of *all* templates,
+so a single pass over the text reports every keyword present; candidate templates
+then fall out of a per-template hit count. Matching keeps the exact semantics of
+the linear scan: plain substring containment, templates tried in the given
+(priority) order, first match wins.
+"""
+
+import threading
+from collections import OrderedDict
+from collections import deque
+from collections.abc import Iterator
+from collections.abc import Sequence
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from .invoice_template import InvoiceTemplate
+
+
+__all__ = ["KeywordIndex", "keyword_index"]
+
+logger = getLogger(__name__)
+
+#: How many distinct template lists keep a built index (see :func:`keyword_index`).
+_CACHE_SIZE = 8
+
+
+class KeywordIndex:
+    """Keyword automaton over a priority-ordered list of templates.
+
+    Templates whose keywords are not all strings (which the linear scan would
+    reject with a ``TypeError``) are not indexed; they are checked with
+    :meth:`InvoiceTemplate.matches_input` at their place in the order, so the
+    behaviour for them is unchanged.
+
+    Args:
+        templates (Sequence[InvoiceTemplate]): Templates in the order they should
+            be tried (highest priority first).
+    """
+
+    def __init__(self, templates: Sequence["InvoiceTemplate"]) -> None:
+        self.templates: tuple[InvoiceTemplate, ...] = tuple(templates)
+        keyword_ids: dict[str, int] = {}
+        #: Keyword ids a template needs (``keywords``) / must not see (``exclude``).
+        self._required: list[frozenset[int]] = []
+        self._excluded: list[frozenset[int]] = []
+        #: Positions of templates that fall back to ``matches_input``.
+        self._unindexed: set[int] = set()
+        for position, template in enumerate(self.templates):
+            keywords = template.get("keywords", [])
+            excludes = template.get("exclude_keywords", [])
+            if not all(isinstance(k, str) for k in [*keywords, *excludes]):
+                self._unindexed.add(position)
+                self._required.append(frozenset())
+                self._excluded.append(frozenset())
+                continue
+            self._required.append(
+                frozenset(keyword_ids.setdefault(k, len(keyword_ids)) for k in keywords)
+            )
+            self._excluded.append(
+                frozenset(keyword_ids.setdefault(k, len(keyword_ids)) for k in excludes)
+            )
+
+        self._keywords: list[str] = list(keyword_ids)
+        #: Keyword id -> positions of the templates that require it.
+        self._required_by: list[list[int]] = [[] for _ in self._keywords]
+        for position, required in enumerate(self._required):
+            for keyword_id in required:
+                self._required_by[keyword_id].append(position)
+        #: Templates that match regardless of the text (no keywords at all), plus
+        #: the unindexed ones -- both are always evaluated.
+        self._always: list[int] = sorted(
+            position
+            for position, required in enumerate(self._required)
+            if not required or position in self._unindexed
+        )
+        self._build_automaton()
+
+    def _build_automaton(self) -> None:
+        """Build the goto/fail/output tables for all non-empty keywords."""
+        goto: list[dict[str, int]] = [{}]
+        fail: list[int] = [0]
+        out: list[tuple[int, ...]] = [()]
+        #: "" is a substring of every string, so it is found without scanning.
+        self._empty: tuple[int, ...] = tuple(
+            keyword_id for keyword_id, kw in enumerate(self._keywords) if not kw
+        )
+        for keyword_id, keyword in enumerate(self._keywords):
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto.append({})
+                    fail.append(0)
+                    out.append(())
+                    goto[state][char] = nxt
+                state = nxt
+            out[state] += (keyword_id,)
+
+        # Breadth-first: a node's fail link points at the longest proper suffix
+        # that is also a trie path, and it inherits that node's outputs.
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in goto[state].items():
+                queue.append(nxt)
+                link = fail[state]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                target = goto[link].get(char, 0)
+                fail[nxt] = target if target != nxt else 0
+                out[nxt] += out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def found_keywords(self, text: str) -> set[int]:
+        """Return the ids of every indexed keyword occurring in ``text``.
+
+        Args:
+            text (str): The text to scan (one pass).
+
+        Returns:
+            set[int]: Ids of the keywords found.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set(self._empty)
+        state = 0
+        for char in text:
+            while True:
+                nxt = goto[state].get(char)
+                if nxt is not None:
+                    state = nxt
+                    break
+                if not state:
+                    break
+                state = fail[state]
+            if out[state]:
+                found.update(out[state])
+        return found
+
+    def candidates(self, text: str) -> list["InvoiceTemplate"]:
+        """Return every template matching ``text``, in priority order.
+
+        Args:
+            text (str): The extracted invoice text.
+
+        Returns:
+            list[InvoiceTemplate]: The matching templates, in index order.
+        """
+        return [self.templates[position] for position in self._matching(text)]
+
+    def match(self, text: str) -> "InvoiceTemplate | None":
+        """Return the first template matching ``text``, else ``None``.
+
+        Args:
+            text (str): The extracted invoice text.
+
+        Returns:
+            InvoiceTemplate | None: The same template the linear
+                ``matches_input`` scan would pick.
+        """
+        for position in self._matching(text):
+            template = self.templates[position]
+            logger.debug(
+                "Template: %s | Keywords matched. No exclude keywords found.",
+                template.get("template_name"),
+            )
+            return template
+        return None
+
+    def _matching(self, text: str) -> Iterator[int]:
+        """Yield positions of the matching templates, ascending.
+
+        Lazy, so :meth:`match` stops at the first hit.
+
+        Args:
+            text (str): The extracted invoice text.
+
+        Yields:
+            int: Template positions whose keywords all occur and whose exclude
+                keywords do not.
+        """
+        found = self.found_keywords(text)
+        hits: dict[int, int] = {}
+        for keyword_id in found:
+            for position in self._required_by[keyword_id]:
+                hits[position] = hits.get(position, 0) + 1
+        complete = [
+            position
+            for position, count in hits.items()
+            if count == len(self._required[position])
+        ]
+        for position in sorted({*complete, *self._always}):
+            template = self.templates[position]
+            if position in self._unindexed:
+                if template.matches_input(text):
+                    yield position
+                continue
+            if self._excluded[position] & found:
+                logger.debug(
+                    "Template: %s | Keywords matched. Exclude keyword found!",
+                    template.get("template_name"),
+                )
+                continue
+            yield position
+
+
+_cache: "OrderedDict[tuple[int, ...], KeywordIndex]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def keyword_index(templates: Sequence["InvoiceTemplate"]) -> KeywordIndex:
+    """Return the (cached) :class:`KeywordIndex` for a template list.
+
+    The cache is keyed by the identity and order of the templates, so the index
+    is built once per loaded template set rather than once per document. Each
+    cached index holds references to its templates, which keeps their ids from
+    being reused while the entry is alive. Templates are assumed not to have
+    their keywords edited after the index is built.
+
+    Args:
+        templates (Sequence[InvoiceTemplate]): Priority-ordered templates.
+
+    Returns:
+        KeywordIndex: The index for exactly this list.
+    """
+    key = tuple(map(id, templates))
+    with _cache_lock:
+        index = _cache.get(key)
+        if index is not None:
+            _cache.move_to_end(key)
+            return index
+    index = KeywordIndex(templates)
+    with _cache_lock:
+        _cache[key] = index
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return index
@@ -7,6 +7,7 @@ import contextlib
 import json
 import os
 from collections.abc import Callable
+from collections.abc import Iterator
 from functools import lru_cache
 from logging import getLogger
 from pathlib import Path
@@ -22,6 +23,7 @@ except ImportError:  # pragma: no cover
     from yaml import YAMLError
     from yaml import load
 
+from . import _regex
 from .invoice_template import InvoiceTemplate  # type: ignore[unused-ignore]
 
 
@@ -31,6 +33,12 @@ __all__ = ["ordered_load", "prepare_template", "read_templates"]
 
 logger = getLogger(__name__)
 
+#: Keys whose value is a regex or a list of regexes, wherever they appear in a
+#: template (``fields``, the ``lines`` and ``tables`` plugins).
+_PATTERN_KEYS = frozenset(
+    ("regex", "start", "end", "line", "first_line", "last_line", "skip_line", "body")
+)
+
 
 def ordered_load(
     stream: str, loader: Callable[[str], Any] = json.loads
@@ -80,11 +88,28 @@ def ordered_load(
             continue
         tpl = prepare_template(raw_tpl)
         if tpl:
-            output.append(InvoiceTemplate(tpl))
+            output.append(_compiled_template(tpl))
 
     return output
 
 
+def _compiled_template(tpl: dict[str, Any]) -> InvoiceTemplate:
+    """Wrap a prepared template and build its execution plan up front.
+
+    Compiling at load time (see :mod:`invoice2data.extract.compiled`) keeps the
+    per-document path free of template bookkeeping.
+
+    Args:
+        tpl (dict[str, Any]): A template returned by :func:`prepare_template`.
+
+    Returns:
+        InvoiceTemplate: The template, already compiled.
+    """
+    template = InvoiceTemplate(tpl)
+    template.compile()
+    return template
+
+
 def _load_template_file(path: Path) -> Any:
     """Read + parse a single template file, or return ``None`` on any issue.
 
@@ -181,7 +206,7 @@ def _read_templates_cached(
             tpl["template_name"] = name
             tpl = prepare_template(tpl)
             if tpl:
-                output.append(InvoiceTemplate(tpl))
+                output.append(_compiled_template(tpl))
     logger.info("Loaded %d templates from %s", len(output), folder)
     return tuple(output)
 
@@ -252,4 +277,91 @@ def prepare_template(tpl: dict[str, Any]) -> dict[str, Any] | None:
     # Set priority if not provided
     tpl.setdefault("priority", 5)
 
+    # ``match_pages``: how many leading pages the keywords need (two-phase mode).
+    match_pages = tpl.get("match_pages")
+    if match_pages is not None and (
+        isinstance(match_pages, bool)
+        or not isinstance(match_pages, int)
+        or match_pages < 1
+    ):
+        logger.warning(
+            "Template %s: ignoring 'match_pages: %r', expected a positive integer.",
+            tpl.get("template_name", "<stream>"),
+            match_pages,
+        )
+        del tpl["match_pages"]
+
+    options = tpl.get("options")
+    if not isinstance(options, dict):
+        options = {}
+    regex_timeout = options.get("regex_timeout")
+    if regex_timeout is not None and (
+        isinstance(regex_timeout, bool)
+        or not isinstance(regex_timeout, int | float)
+        or regex_timeout <= 0
+    ):
+        logger.warning(
+            "Template %s: ignoring 'regex_timeout: %r', expected a positive number"
+            " of seconds.",
+            tpl.get("template_name", "<stream>"),
+            regex_timeout,
+        )
+        del options["regex_timeout"]
+
+    _warn_backtracking(tpl)
     return tpl
+
+
+def _warn_backtracking(tpl: dict[str, Any]) -> None:
+    """Warn about template regexes prone to catastrophic backtracking.
+
+    The template still loads: the check is a heuristic (see
+    :func:`~invoice2data.extract._regex.nested_quantifier`), and a pattern it
+    flags only blows up on some inputs. ``options.regex_timeout`` bounds the
+    damage when one does.
+
+    Args:
+        tpl (dict[str, Any]): The template being prepared.
+    """
+    for pattern in dict.fromkeys(_template_patterns(tpl)):
+        group = _regex.nested_quantifier(pattern)
+        if group is not None:
+            logger.warning(
+                "Template %s: regex %r nests quantifiers in %r and can backtrack"
+                " catastrophically; make the repeated part unambiguous (or"
+                " atomic/possessive with INVOICE2DATA_REGEX_ENGINE=regex)",
+                tpl.get("template_name", "<stream>"),
+                pattern,
+                group,
+            )
+
+
+def _template_patterns(node: Any, key: Any = None) -> Iterator[str]:
+    """Yield the regexes in a template (or in part of one).
+
+    Args:
+        node (Any): A template, or a value inside one.
+        key (Any): The key ``node`` is stored under.
+
+    Yields:
+        str: Each regex.
+    """
+    if key in _PATTERN_KEYS:
+        values = node if isinstance(node, list) else [node]
+        yield from (value for value in values if isinstance(value, str))
+    elif key == "fields" and isinstance(node, dict):
+        for name, settings in node.items():
+            # Legacy fields are a bare regex or a list of regexes.
+            if isinstance(settings, str | list) and not name.startswith("static_"):
+                yield from _template_patterns(settings, "regex")
+            else:
+                yield from _template_patterns(settings)
+    elif key == "replace" and isinstance(node, list):
+        pairs = node if node and isinstance(node[0], list) else [node]
+        yield from (pair[0] for pair in pairs if pair and isinstance(pair[0], str))
+    elif isinstance(node, dict):
+        for child_key, child in node.items():
+            yield from _template_patterns(child, child_key)
+    elif isinstance(node, list):
+        for child in node:
+            yield from _template_patterns(child)
@@ -14,4 +14,10 @@ def parse(template, field, settings, content)
 
 Parser has to return a single value (e.g. number, date, string, array)
 or None in case of error. Such a value will be included in the output.
+
+A parser may also provide `prepare`, called once when the template is
+compiled. It validates the settings and returns the equivalent of `parse`
+with them bound:
+
+def prepare(template, field, settings) -> run(template, content)
 """
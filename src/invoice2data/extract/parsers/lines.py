@@ -3,12 +3,18 @@
 Initial work and maintenance by Holger Brunn @hbrunn
 """
 
+import re
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
 from logging import getLogger
 from re import Match
 from typing import TYPE_CHECKING
 from typing import Any
 
 from ...exceptions import TemplateSyntaxError
+from .. import _columns
 from .. import _regex
 from .regex import _normalize_replacements
 from .regex import _replace_value
@@ -22,6 +28,20 @@ logger = getLogger(__name__)
 
 DEFAULT_OPTIONS = {"line_separator": r"\n"}
 
+#: A global inline flag group such as ``(?m)`` (only allowed at the start).
+_GLOBAL_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+#: A named group or a reference to one, not escaped by a backslash.
+_GROUP_NAME = re.compile(r"(?<!\\)((?:\\\\)*)\(\?P([<=])(\w+)([>)])")
+#: Constructs a combined pattern cannot keep: numbered back-references (the
+#: groups are renumbered), conditionals, and the ``regex`` engine's
+#: ``(?<name>...)`` groups.
+_UNCOMBINABLE = re.compile(r"\\[1-9]|\(\?\(|\(\?<\w")
+#: Escapes and character classes (skipped as units), and the constructs that
+#: see the text before the search position: ``^``, ``\A`` and look-behinds.
+_CONTEXT_TOKEN = re.compile(
+    r"\\(.)|\[\^?\]?(?:\\.|[^\]\\])*\]|(\^)|(\(\?<[=!])", re.DOTALL
+)
+
 
 def parse_line(patterns: str | list[str], line: str) -> Match[str] | None:
     """Parse a line using a given pattern or list of patterns.
@@ -45,7 +65,202 @@ def parse_line(patterns: str | list[str], line: str) -> Match[str] | None:
     return None
 
 
-def parse_block(  # noqa: RUF100 C901
+@dataclass(frozen=True)
+class _LineMatcher:
+    """A rule's line patterns combined into one regex per parser state.
+
+    Each alternative is one pattern (``skip_line``, then ``first_line``, then
+    ``last_line``, then ``line``, each in list order) wrapped in a tagged
+    group, its own named groups renamed under the tag. The combined regex is
+    anchored at the start of the line and each alternative scans forward
+    lazily, so the first alternative to match anywhere in the line wins: the
+    same priority the patterns were searched in one by one.
+    """
+
+    #: Combined regex used before a ``first_line`` has matched.
+    seeking: "re.Pattern[str]"
+    #: Combined regex used after it, when ``last_line`` and ``line`` apply.
+    in_row: "re.Pattern[str]"
+    #: tag -> (role, combined group names, the template's names for them)
+    tags: dict[str, tuple[str, tuple[str, ...], tuple[str, ...]]]
+
+    def match(self, line: str, in_row: bool) -> tuple[str, dict[str, Any]] | None:
+        """Return which role matches ``line`` and its named groups.
+
+        Args:
+            line (str): The line.
+            in_row (bool): Whether a ``first_line`` has matched (and no
+                ``last_line`` since).
+
+        Returns:
+            tuple[str, dict[str, Any]] | None: ``("skip" | "first" | "last" |
+                "line", groupdict)``, or None if nothing matches.
+        """
+        match = _regex.match_compiled(self.in_row if in_row else self.seeking, line)
+        if match is None or match.lastgroup is None:
+            return None
+        role, combined, names = self.tags[match.lastgroup]
+        if len(combined) < 2:  # group() returns a tuple for two names or more
+            return role, {
+                name: match.group(group)
+                for group, name in zip(combined, names, strict=True)
+            }
+        return role, dict(zip(names, match.group(*combined), strict=True))
+
+
+@dataclass(frozen=True)
+class _Rule:
+    """One lines rule with its defaults merged and its settings normalized.
+
+    Built once per rule by :func:`prepare` (or per call by :func:`parse_by_rule`
+    / :func:`parse_block`), so parsing a block only has to run the patterns.
+    """
+
+    #: The rule settings, with `DEFAULT_OPTIONS` and `first_line` defaulted.
+    settings: dict[str, Any]
+    end_match: str
+    skip_patterns: tuple[str, ...]
+    replace_map: dict[str, list[tuple[str, str]]]
+    #: The line patterns as one regex, or None to search them one by one.
+    matcher: _LineMatcher | None = None
+
+
+def _block_rule(template: "InvoiceTemplate", settings: dict[str, Any]) -> _Rule:
+    """Validate the block-level settings (``line`` etc.) and normalize them.
+
+    Args:
+        template (InvoiceTemplate): The template, for error messages.
+        settings (dict[str, Any]): The rule settings; ``first_line`` is set in
+            place when neither ``first_line`` nor ``last_line`` is given.
+
+    Returns:
+        _Rule: The normalized rule (``end_match`` defaults to ``first``).
+
+    Raises:
+        TemplateSyntaxError: If ``settings`` is missing the required
+            ``line`` regex.
+    """
+    if "line" not in settings:
+        raise TemplateSyntaxError(
+            "`lines` parser: missing required `line` regex",
+            template.get("template_name"),
+        )
+    # As first_line and last_line are optional, if neither were provided,
+    # set the first_line to be the provided line parameter.
+    # In this way the code will simply loop through and extract the lines as expected.
+    if "first_line" not in settings and "last_line" not in settings:
+        settings["first_line"] = settings["line"]
+    skip_patterns = settings.get("skip_line") or ()
+    if not isinstance(skip_patterns, list | tuple):
+        skip_patterns = (skip_patterns,)
+    return _Rule(
+        settings=settings,
+        end_match="first",
+        skip_patterns=tuple(skip_patterns),
+        replace_map=_normalize_line_replace(settings.get("replace")),
+        matcher=_line_matcher(
+            tuple(skip_patterns),
+            _patterns(settings.get("first_line")),
+            _patterns(settings.get("last_line")),
+            _patterns(settings["line"]) or (),
+        ),
+    )
+
+
+def _patterns(setting: Any) -> tuple[str, ...] | None:
+    """Return a ``first_line``/``line``/``last_line`` setting as a tuple.
+
+    Args:
+        setting (Any): One pattern, a list of them, or None if not set.
+
+    Returns:
+        tuple[str, ...] | None: The patterns, or None if not set.
+    """
+    if setting is None:
+        return None
+    return tuple(setting) if isinstance(setting, list) else (setting,)
+
+
+@lru_cache(maxsize=256)
+def _line_matcher(
+    skip: tuple[str, ...],
+    first: tuple[str, ...] | None,
+    last: tuple[str, ...] | None,
+    line: tuple[str, ...],
+) -> _LineMatcher | None:
+    """Combine a rule's line patterns into a :class:`_LineMatcher`.
+
+    Args:
+        skip (tuple[str, ...]): The ``skip_line`` patterns.
+        first (tuple[str, ...] | None): The ``first_line`` patterns, if set.
+        last (tuple[str, ...] | None): The ``last_line`` patterns, if set.
+        line (tuple[str, ...]): The ``line`` patterns.
+
+    Returns:
+        _LineMatcher | None: The matcher, or None when a pattern cannot be
+            combined (see ``_UNCOMBINABLE``) and the patterns are searched one
+            by one instead.
+    """
+    roles = [("skip", skip), ("first", first or ())]
+    seeking_count = len(skip) + len(first or ())
+    roles += [("last", last or ()), ("line", line)]
+    alternatives: list[str] = []
+    tags: dict[str, tuple[str, tuple[str, ...], tuple[str, ...]]] = {}
+    for role, patterns in roles:
+        for pattern in patterns:
+            tag = f"_t{len(alternatives)}"
+            combined = _alternative(tag, pattern)
+            if combined is None:
+                return None
+            alternative, names = combined
+            alternatives.append(alternative)
+            tags[tag] = (role, tuple(f"{tag}_{name}" for name in names), names)
+    try:
+        seeking = _regex.compile("|".join(alternatives[:seeking_count]) or "(?!)")
+        in_row = _regex.compile("|".join(alternatives))
+    except _regex.error:
+        return None
+    if not set(tags) <= set(in_row.groupindex):
+        return None
+    return _LineMatcher(seeking, in_row, tags)
+
+
+def _alternative(tag: str, pattern: str) -> tuple[str, tuple[str, ...]] | None:
+    """Rewrite one line pattern as a tagged alternative of a combined regex.
+
+    Args:
+        tag (str): The alternative's group name.
+        pattern (str): The template's pattern.
+
+    Returns:
+        tuple[str, tuple[str, ...]] | None: The alternative and the pattern's
+            group names (renamed ``<tag>_<name>`` in it), or None if the
+            pattern cannot be combined.
+    """
+    flags = ""
+    while match := _GLOBAL_FLAGS.match(pattern):
+        flags += match.group(1)
+        pattern = pattern[match.end() :]
+    if _UNCOMBINABLE.search(pattern) or _GLOBAL_FLAGS.search(pattern):
+        return None
+    names: list[str] = []
+
+    def rename(group: Match[str]) -> str:
+        escapes, kind, name, close = group.groups()
+        if kind == "<":
+            names.append(name)
+        return f"{escapes}(?P{kind}{tag}_{name}{close}"
+
+    body = _GROUP_NAME.sub(rename, pattern)
+    # Only an unconditionally ^-anchored pattern can skip the forward scan.
+    anchored = body.startswith("^") and "m" not in flags and "|" not in body
+    if flags:
+        body = f"(?{flags}:{body})"
+    scan = "" if anchored else r"[\s\S]*?"
+    return f"{scan}(?P<{tag}>{body})", tuple(names)
+
+
+def parse_block(
     template: "InvoiceTemplate",
     field: str,
     settings: dict[str, Any],
@@ -67,18 +282,28 @@ def parse_block(  # noqa: RUF100 C901
     Returns:
         list[dict[str, Any]]: A list of dictionaries, where each dictionary
                                 represents an extracted row with field-value pairs.
-
-    Raises:
-        TemplateSyntaxError: If ``settings`` is missing the required
-            ``line`` regex.
     """
-    # Validate settings
-    if "line" not in settings:
-        raise TemplateSyntaxError(
-            "`lines` parser: missing required `line` regex",
-            template.get("template_name"),
-        )
+    return _parse_block(template, field, _block_rule(template, settings), content)
 
+
+def _parse_block(  # noqa: RUF100 C901
+    template: "InvoiceTemplate",
+    field: str,
+    rule: _Rule,
+    content: str,
+) -> list[dict[str, Any]]:
+    """Parse one block of lines with an already normalized rule.
+
+    Args:
+        template (InvoiceTemplate): The template containing extraction rules.
+        field (str): The name of the field to extract.
+        rule (_Rule): The normalized extraction rule.
+        content (str): The text content of the block.
+
+    Returns:
+        list[dict[str, Any]]: The extracted rows.
+    """
+    settings = rule.settings
     logger.debug("START lines block content ========================\n%s", content)
     logger.debug("END lines block content ==========================")
     lines: list[dict[str, Any]] = []
@@ -94,82 +319,65 @@ def parse_block(  # noqa: RUF100 C901
     # It will then switch to extracting line patterns until it either reaches last_line
     # or it reaches another first_line.
 
-    # As first_line and last_line are optional, if neither were provided,
-    # set the first_line to be the provided line parameter.
-    # In this way the code will simply loop through and extract the lines as expected.
-    if "first_line" not in settings and "last_line" not in settings:
-        settings["first_line"] = settings["line"]
     # As we enter the loop, we set the boolean for first_line being found to False,
     # This indicates the we are looking for the first_line pattern
     first_line_found = False
-    skip_patterns = settings.get("skip_line")
-    if skip_patterns and not isinstance(skip_patterns, list):
-        skip_patterns = [skip_patterns]
+    if rule.matcher is not None:
+        match_line = rule.matcher.match
+    else:
+
+        def match_line(line: str, in_row: bool) -> tuple[str, dict[str, Any]] | None:
+            return _match_each(rule, line, in_row)
+
     for line in _regex.split(settings["line_separator"], content):
         # If the line has empty lines in it , skip them
         if not line.strip("").strip("\n").strip("\r") or not line:
             continue
-        # `skip_line: pattern` or `skip_line: [pat1, pat2]` lets a template drop
-        # lines that match an unwanted shape (e.g. a sub-total / VAT footer that
-        # the line regex would otherwise wrongly match). Issue #652.
-        if skip_patterns and any(
-            _regex.search(pattern, line) for pattern in skip_patterns
-        ):
-            logger.debug("skip_line match on %r", line)
+        # One pass finds which pattern matches first, in the order: skip_line,
+        # first_line, then (once first_line was found) last_line and line.
+        found = match_line(line, first_line_found)
+        if found is None:
+            # If the line doesn't match anything, log and continue to next line
+            logger.debug("The following line doesn't match anything:\n*%s*", line)
             continue
-        if "first_line" in settings:
-            # Check if the current lines the first_line pattern
-            match = parse_line(settings["first_line"], line)
-            if match:
-                # The line matches the first_line pattern so append current row to output
-                # then assign a new current_row
-                if current_row:
-                    lines.append(current_row)
-                current_row = {
-                    field: value.strip() if value else ""
-                    for field, value in match.groupdict().items()
-                }
-                # Flip first_line_found boolean as first_line has been found
-                # This will allow last_line and line to be matched on below
-                first_line_found = True
-                continue
-        # Look for line or last_line only if the first has has been found
-        if first_line_found is True:
-            # If last_line was provided, check that
-            if "last_line" in settings:
-                # last_line pattern provided, so check if the current line is that line
-                match = parse_line(settings["last_line"], line)
-                if match:
-                    # This is the last_line, so parse all lines thus far,
-                    # append to output,
-                    # and reset current_row
-                    current_row = parse_current_row(match, current_row)
-                    if current_row:
-                        lines.append(current_row)
-                    current_row = {}
-                    # Flip first_line_found boolean to look for first_line again on next loop
-                    first_line_found = False
-                    continue
-            # If none of those have continued the loop, check if this is just a normal line
-            match = parse_line(settings["line"], line)
-            if match:
-                # This is one of the lines between first_line and last_line
-                # Parse the data and add it to the current_row
-                current_row = parse_current_row(match, current_row)
-                continue
-        # If the line doesn't match anything, log and continue to next line
-        logger.debug("The following line doesn't match anything:\n*%s*", line)
+        role, groups = found
+        if role == "skip":
+            # `skip_line: pattern` or `skip_line: [pat1, pat2]` lets a template
+            # drop lines that match an unwanted shape (e.g. a sub-total / VAT
+            # footer that the line regex would otherwise wrongly match). #652.
+            logger.debug("skip_line match on %r", line)
+        elif role == "first":
+            # The line matches the first_line pattern so append current row to output
+            # then assign a new current_row
+            if current_row:
+                lines.append(current_row)
+            current_row = {
+                field: value.strip() if value else "" for field, value in groups.items()
+            }
+            # Flip first_line_found boolean as first_line has been found
+            # This will allow last_line and line to be matched on below
+            first_line_found = True
+        elif role == "last":
+            # This is the last_line, so parse all lines thus far,
+            # append to output,
+            # and reset current_row
+            current_row = _merge_row(groups, current_row)
+            if current_row:
+                lines.append(current_row)
+            current_row = {}
+            # Flip first_line_found boolean to look for first_line again on next loop
+            first_line_found = False
+        else:
+            # This is one of the lines between first_line and last_line
+            # Parse the data and add it to the current_row
+            current_row = _merge_row(groups, current_row)
     if current_row:
         # All lines processed, so append whatever the final current_row was to output
         lines.append(current_row)
 
-    _apply_line_replace(settings, lines)
+    _apply_line_replace(rule.replace_map, lines)
 
-    types = settings.get("types", [])
-    for row in lines:
-        for name in row:
-            if name in types:
-                row[name] = template.coerce_type(row[name], types[name])
+    _columns.coerce_rows(template, lines, settings.get("types", []))
     return lines
 
 
@@ -197,17 +405,19 @@ def _normalize_line_replace(spec: Any) -> dict[str, list[tuple[str, str]]]:
     return {field: _normalize_replacements(pairs) for field, pairs in raw.items()}
 
 
-def _apply_line_replace(settings: dict[str, Any], lines: list[dict[str, Any]]) -> None:
+def _apply_line_replace(
+    replace_map: dict[str, list[tuple[str, str]]], lines: list[dict[str, Any]]
+) -> None:
     """Apply per-sub-field ``replace`` to each line row in place (issue #497).
 
     Lets a lines/tables template map captured sub-field values, e.g. units of
     measure ``PS`` -> ``unit``, before type coercion.
 
     Args:
-        settings (dict[str, Any]): The lines settings (may hold ``replace``).
+        replace_map (dict[str, list[tuple[str, str]]]): The normalized lines
+            ``replace`` setting (see :func:`_normalize_line_replace`).
         lines (list[dict[str, Any]]): The parsed rows, mutated in place.
     """
-    replace_map = _normalize_line_replace(settings.get("replace"))
     if not replace_map:
         return
     for row in lines:
@@ -216,22 +426,15 @@ def _apply_line_replace(settings: dict[str, Any], lines: list[dict[str, Any]]) -
                 row[field] = _replace_value(row[field], replacements)
 
 
-def parse_by_rule(
-    template: "InvoiceTemplate",
-    field: str,
-    rule: dict[str, Any],
-    content: str,
-) -> list[dict[str, Any]]:
-    """Parse lines from a block of text based on a rule.
+def _prepare_rule(template: "InvoiceTemplate", rule: dict[str, Any]) -> _Rule:
+    """Merge a rule with `DEFAULT_OPTIONS`, validate and normalize it.
 
     Args:
-        template (InvoiceTemplate): The template dictionary.
-        field (str): The field name.
-        rule (dict[str, Any]): The rule dictionary.
-        content (str): The text content to parse.
+        template (InvoiceTemplate): The template, for error messages.
+        rule (dict[str, Any]): The rule dictionary (left untouched).
 
     Returns:
-        list[dict[str, Any]]: The parsed lines.
+        _Rule: The normalized rule.
 
     Raises:
         TemplateSyntaxError: If ``rule`` is missing the required ``start``
@@ -253,8 +456,6 @@ def parse_by_rule(
             template.get("template_name"),
         )
 
-    blocks_count = 0
-    lines = []
     end_match_strategy = settings.get("end_match", "first")
     if end_match_strategy not in ("first", "last"):
         logger.warning(
@@ -263,31 +464,93 @@ def parse_by_rule(
             end_match_strategy,
         )
         end_match_strategy = "first"
+    # `line` itself is only required once a block is found, as before.
+    if "line" not in settings:
+        return _Rule(settings, end_match_strategy, (), {})
+    block = _block_rule(template, settings)
+    return _Rule(
+        settings,
+        end_match_strategy,
+        block.skip_patterns,
+        block.replace_map,
+        block.matcher,
+    )
 
-    # Try finding & parsing blocks of lines one by one
+
+def parse_by_rule(
+    template: "InvoiceTemplate",
+    field: str,
+    rule: dict[str, Any],
+    content: str,
+) -> list[dict[str, Any]]:
+    """Parse lines from a block of text based on a rule.
+
+    Args:
+        template (InvoiceTemplate): The template dictionary.
+        field (str): The field name.
+        rule (dict[str, Any]): The rule dictionary.
+        content (str): The text content to parse.
+
+    Returns:
+        list[dict[str, Any]]: The parsed lines.
+    """
+    return _parse_rule(template, field, _prepare_rule(template, rule), content)
+
+
+def _parse_rule(
+    template: "InvoiceTemplate",
+    field: str,
+    rule: _Rule,
+    content: str,
+) -> list[dict[str, Any]]:
+    """Find and parse every ``start``/``end`` block of a normalized rule.
+
+    Args:
+        template (InvoiceTemplate): The template dictionary.
+        field (str): The field name.
+        rule (_Rule): The normalized rule.
+        content (str): The text content to parse.
+
+    Returns:
+        list[dict[str, Any]]: The parsed lines.
+    """
+    settings = rule.settings
+    start_pattern = _regex.compile(settings["start"])
+    end_pattern = _regex.compile(settings["end"])
+    blocks_count = 0
+    lines = []
+
+    # Find & parse blocks of lines one by one, scanning the one buffer by
+    # position: only each block's own text is ever copied, so many blocks
+    # cost linear time. A pattern that looks before its match (``\A``, a
+    # single-line ``^``, look-behinds) is searched in a copy of the rest of
+    # the text instead, so that text still starts right after the previous
+    # match for it.
+    start_sliced = _sees_context(start_pattern)
+    end_sliced = _sees_context(end_pattern)
+    pos = 0
     while True:
-        start = _regex.search(settings["start"], content)
+        start = _find(start_pattern, content, pos, start_sliced)
         if not start:
             logger.debug("Failed to find lines block start")
             break
-        content = content[start.end() :]
-
-        if end_match_strategy == "last":
-            # Cross-page recipe: if `end` matches a per-page footer (e.g. a
-            # repeated total/separator block), use the LAST match in this
-            # `start`-bounded slice so the block can span all pages.
-            end_matches = list(_regex.finditer(settings["end"], content))
-            end = end_matches[-1] if end_matches else None
-        else:
-            end = _regex.search(settings["end"], content)
+        pos = start[1]
+
+        # Cross-page recipe: if `end` matches a per-page footer (e.g. a
+        # repeated total/separator block), use the LAST match after this
+        # `start` so the block can span all pages.
+        end = _find(end_pattern, content, pos, end_sliced, rule.end_match == "last")
         if not end:
             logger.debug("Failed to find lines block end")
             break
 
         blocks_count += 1
-        lines += parse_block(template, field, settings, content[0 : end.start()])
+        if "line" not in settings:
+            # Raises the missing-`line` error at the same point as before.
+            _block_rule(template, settings)
+        lines += _parse_block(template, field, rule, content[pos : end[0]])
 
-        content = content[end.end() :]
+        pos = end[1]
 
     if blocks_count == 0:
         logger.warning(
@@ -299,6 +562,61 @@ def parse_by_rule(
     return lines
 
 
+@lru_cache(maxsize=256)
+def _sees_context(pattern: "re.Pattern[str]") -> bool:
+    r"""Return whether a pattern can tell the text before the search position.
+
+    ``\A``, a ``^`` outside multi-line mode, and look-behinds match
+    differently at a position in the text than at the start of the rest of
+    it. A multi-line ``^`` is taken as unaffected, like ``\b``: both only
+    look at the one character before.
+
+    Args:
+        pattern (re.Pattern[str]): A compiled ``start`` or ``end`` pattern.
+
+    Returns:
+        bool: True if it has one of those constructs outside character
+            classes.
+    """
+    multiline = bool(pattern.flags & re.MULTILINE)
+    for token in _CONTEXT_TOKEN.finditer(pattern.pattern):
+        if token.group(1) == "A" or token.group(3):
+            return True
+        if token.group(2) and not multiline:
+            return True
+    return False
+
+
+def _find(
+    pattern: "re.Pattern[str]",
+    content: str,
+    pos: int,
+    sliced: bool,
+    last: bool = False,
+) -> tuple[int, int] | None:
+    """Return the span of ``pattern``'s first (or last) match from ``pos``.
+
+    Args:
+        pattern (re.Pattern[str]): The compiled pattern.
+        content (str): The whole text.
+        pos (int): Where to start searching.
+        sliced (bool): Search a copy of the text from ``pos``, where it starts,
+            rather than the whole text from ``pos``.
+        last (bool): Return the last match instead of the first.
+
+    Returns:
+        tuple[int, int] | None: The match's start and end in ``content``, or
+            None if there is none.
+    """
+    text, start, offset = (content[pos:], 0, pos) if sliced else (content, pos, 0)
+    if last:
+        found = deque(_regex.finditer_compiled(pattern, text, start), maxlen=1)
+        match = found[0] if found else None
+    else:
+        match = _regex.search_compiled(pattern, text, start)
+    return None if match is None else (offset + match.start(), offset + match.end())
+
+
 def parse(
     template: "InvoiceTemplate",
     field: str,
@@ -316,33 +634,68 @@ def parse(
     Returns:
         list[dict[str, Any]]: The parsed lines.
     """
-    if "rules" in settings:
-        # One field can have multiple sets of line-parsing rules
-        rules = settings["rules"]
-    else:
-        # Original syntax stored line-parsing rules in top field YAML object
-        keys = (
-            "start",
-            "end",
-            "end_match",
-            "line",
-            "first_line",
-            "last_line",
-            "skip_line",
-            "types",
-        )
-        rules = [{k: v for k, v in settings.items() if k in keys}]
-
     lines = []
-    for i, rule in enumerate(rules):
+    for i, rule in enumerate(_rules(settings)):
         logger.debug("Testing Rules set #%s", i)
-        new_lines = parse_by_rule(template, field, rule, content)
-        if new_lines is not None:
-            lines += new_lines
-
+        lines += parse_by_rule(template, field, rule, content)
     return lines
 
 
+def prepare(
+    template: "InvoiceTemplate",
+    field: str,
+    settings: dict[str, Any],
+) -> Callable[[Any, str], list[dict[str, Any]]]:
+    """Resolve a field's line rules once into a reusable parse function.
+
+    Args:
+        template (InvoiceTemplate): The template dictionary.
+        field (str): The field name.
+        settings (dict[str, Any]): The settings dictionary.
+
+    Returns:
+        Callable[[Any, str], list[dict[str, Any]]]: ``run(template, content)``,
+            equivalent to :func:`parse` with these settings.
+    """
+    rules = [_prepare_rule(template, rule) for rule in _rules(settings)]
+
+    def run(template: Any, content: str) -> list[dict[str, Any]]:
+        lines = []
+        for i, rule in enumerate(rules):
+            logger.debug("Testing Rules set #%s", i)
+            lines += _parse_rule(template, field, rule, content)
+        return lines
+
+    return run
+
+
+def _rules(settings: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the line-parsing rule sets of a field.
+
+    Args:
+        settings (dict[str, Any]): The field settings.
+
+    Returns:
+        list[dict[str, Any]]: The ``rules`` list, or the single rule held in the
+            field itself (original syntax).
+    """
+    if "rules" in settings:
+        # One field can have multiple sets of line-parsing rules
+        return list(settings["rules"])
+    # Original syntax stored line-parsing rules in top field YAML object
+    keys = (
+        "start",
+        "end",
+        "end_match",
+        "line",
+        "first_line",
+        "last_line",
+        "skip_line",
+        "types",
+    )
+    return [{k: v for k, v in settings.items() if k in keys}]
+
+
 def parse_current_row(
     match: Match[str] | None, current_row: dict[str, Any]
 ) -> dict[str, Any]:
@@ -356,10 +709,53 @@ def parse_current_row(
         dict[str, Any]: The updated current row dictionary.
     """
     if match:
-        for field, value in match.groupdict().items():
-            current_row[field] = "%s%s%s" % (
-                current_row.get(field, ""),
-                (current_row.get(field, "") and "\n") or "",
-                value.strip() if value else "",
-            )
+        return _merge_row(match.groupdict(), current_row)
+    return current_row
+
+
+def _merge_row(groups: dict[str, Any], current_row: dict[str, Any]) -> dict[str, Any]:
+    """Append a line's named groups to the current row, newline-separated.
+
+    Args:
+        groups (dict[str, Any]): The line match's named groups.
+        current_row (dict[str, Any]): The current row dictionary.
+
+    Returns:
+        dict[str, Any]: The updated current row dictionary.
+    """
+    for field, value in groups.items():
+        current_row[field] = "%s%s%s" % (
+            current_row.get(field, ""),
+            (current_row.get(field, "") and "\n") or "",
+            value.strip() if value else "",
+        )
     return current_row
+
+
+def _match_each(
+    rule: _Rule, line: str, in_row: bool
+) -> tuple[str, dict[str, Any]] | None:
+    """Search a rule's line patterns one by one, as :class:`_LineMatcher` does.
+
+    Args:
+        rule (_Rule): The normalized rule.
+        line (str): The line.
+        in_row (bool): Whether a ``first_line`` has matched (and no
+            ``last_line`` since).
+
+    Returns:
+        tuple[str, dict[str, Any]] | None: The matching role and its named
+            groups, or None.
+    """
+    settings = rule.settings
+    if any(_regex.search(pattern, line) for pattern in rule.skip_patterns):
+        return "skip", {}
+    if "first_line" in settings and (match := parse_line(settings["first_line"], line)):
+        return "first", match.groupdict()
+    if not in_row:
+        return None
+    if "last_line" in settings and (match := parse_line(settings["last_line"], line)):
+        return "last", match.groupdict()
+    if match := parse_line(settings["line"], line):
+        return "line", match.groupdict()
+    return None
@@ -13,6 +13,7 @@ For more detailed parsing "type" and "group" settings can be specified.
 
 import logging
 from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
 from .. import _regex
@@ -41,52 +42,92 @@ def parse(
     Returns:
         Any: The extracted value(s) or None if parsing fails.
     """
+    return prepare(template, field, settings, legacy)(template, content)
+
+
+def prepare(
+    template: Any,
+    field: str,
+    settings: dict[str, Any],
+    legacy: bool = False,
+) -> Callable[[Any, str], Any]:
+    """Resolve a field's settings once into a reusable parse function.
+
+    The regexes are compiled and the ``replace`` pairs normalized up front, so
+    the returned function only has to run them (see
+    :mod:`invoice2data.extract.compiled`).
+
+    Args:
+        template (Any): The template object.
+        field (str): The name of the field to extract.
+        settings (dict[str, Any]): The settings for the field extraction.
+        legacy (bool, optional): Whether to use legacy parsing. Defaults to False.
+
+    Returns:
+        Callable[[Any, str], Any]: ``run(template, content)``, equivalent to
+            :func:`parse` with these settings.
+    """
     if "regex" not in settings:
-        logger.warning('Field "%s" doesn\'t have regex specified', field)
-        return None
 
-    # `result` morphs from a list of matches to a coerced scalar/grouped value;
-    # keep it `Any` so mypyc doesn't strict-check it against the initial list type.
-    result: Any = _extract_matches(field, settings, content)
-    if result is None:
-        return None
+        def missing(template: Any, content: str) -> Any:
+            logger.warning('Field "%s" doesn\'t have regex specified', field)
+            return None
 
-    result = _apply_replace(settings, result)
+        return missing
 
-    result = _apply_extract_number(settings, result)
+    regexes = settings["regex"]
+    if not isinstance(regexes, list):
+        regexes = [regexes]
+    # Non-string entries are kept as-is and reported on every run, as before.
+    patterns = [
+        _regex.compile(regex) if isinstance(regex, str) else regex for regex in regexes
+    ]
+    replacements = (
+        _normalize_replacements(settings["replace"]) if "replace" in settings else None
+    )
 
-    result = _apply_type_coercion(template, settings, result)
+    def run(template: Any, content: str) -> Any:
+        # `result` morphs from a list of matches to a coerced scalar/grouped value;
+        # keep it `Any` so mypyc doesn't strict-check it against the initial list type.
+        result: Any = _extract_matches(field, settings, patterns, content)
+        if result is None:
+            return None
 
-    result = _apply_grouping(settings, result)
+        if replacements is not None:
+            # Field-level `replace` sanitizes each captured value (issue #497).
+            result = [_replace_value(value, replacements) for value in result]
 
-    result = _remove_duplicates(legacy, result)
+        result = _apply_extract_number(settings, result)
 
-    if isinstance(result, list) and len(result) == 1:
-        result = result[0]
+        result = _apply_type_coercion(template, settings, result)
 
-    return result
+        result = _apply_grouping(settings, result)
+
+        result = _remove_duplicates(legacy, result)
+
+        if isinstance(result, list) and len(result) == 1:
+            result = result[0]
+
+        return result
+
+    return run
 
 
 def _extract_matches(
-    field: str, settings: dict[str, Any], content: str
+    field: str, settings: dict[str, Any], patterns: list[Any], content: str
 ) -> list[Any] | None:
-    """Extract matches from the content using the given regexes."""
-    if isinstance(settings["regex"], list):
-        regexes = settings["regex"]
-    else:
-        regexes = [settings["regex"]]
-
+    """Extract matches from the content using the given compiled regexes."""
     result = []
-    for regex in regexes:
-        if not isinstance(regex, str):
+    for pattern in patterns:
+        if not hasattr(pattern, "findall"):
             logger.warning(
                 'Field "%s" regex is not a string (%s)',
                 field,
-                str(regex),
+                str(pattern),
             )
             continue
 
-        matches = _regex.findall(regex, content)
+        matches = _regex.findall_compiled(pattern, content)
         logger.debug(
             "field=\033[1m\033[93m%s\033[0m | regex=\033[36m%s\033[0m | matches=\033[1m\033[92m%s\033[0m",
             field,
@@ -97,7 +138,8 @@ def _extract_matches(
             for match in matches:
                 if isinstance(match, tuple):
                     logger.warning(
-                        "Regex can't contain multiple capturing groups %s", regex
+                        "Regex can't contain multiple capturing groups %s",
+                        pattern.pattern,
                     )
                     return None
             result += matches
@@ -124,18 +166,6 @@ def _replace_value(value: Any, replacements: list[tuple[str, str]]) -> Any:
     return value
 
 
-def _apply_replace(settings: dict[str, Any], result: list[Any]) -> list[Any]:
-    r"""Apply a field-level ``replace`` to each matched value (issue #497).
-
-    Lets a template use a simple regex and sanitize the captured value, e.g.
-    ``replace: ["\W+", ""]`` turns ``NL.999,999.999,B01`` into ``NL999999999B01``.
-    """
-    if "replace" not in settings:
-        return result
-    replacements = _normalize_replacements(settings["replace"])
-    return [_replace_value(value, replacements) for value in result]
-
-
 #: First numeric token in a string -- sign + digits with optional thousands /
 #: decimal separators (``.``, ``,``, whitespace, ``'``). Does NOT truncate
 #: large numbers: matches ``1234``, ``1234.56``, ``1.234,56``, ``1,234.56``,
@@ -17,4 +17,7 @@ def extract(settings, optimized_str, output, invoice_file=None)
 it; path-based plugins (e.g. `camelot`, which re-reads the PDF to detect
 tables) require it. A plugin may also expose `is_available() -> bool` so it can
 self-exclude when an optional dependency is missing.
+
+Like parsers, a plugin may provide `prepare(template)` returning a function with
+the `extract` signature, so its settings are validated once per template.
 """
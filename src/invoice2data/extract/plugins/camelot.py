@@ -25,6 +25,10 @@ Example::
 from logging import getLogger
 from typing import Any
 
+from ...exceptions import ExtractionTimeoutError
+from ...exceptions import RegexTimeoutError
+from ...input._memory import as_path
+
 
 logger = getLogger(__name__)
 
@@ -86,6 +90,11 @@ def extract(
         content (str): Unused — camelot reads the PDF directly.
         output (dict[str, Any]): Output dictionary to populate.
         invoice_file (str | None): Path to the source PDF (required).
+
+    Raises:
+        ExtractionTimeoutError: If the per-file time limit runs out while
+            camelot reads; that is not camelot failing.
+        RegexTimeoutError: Likewise, for the template's ``regex_timeout``.
     """
     if not is_available():
         logger.warning(
@@ -113,7 +122,9 @@ def extract(
             logger.warning("camelot: ignoring unknown option(s) %s", sorted(unknown))
 
         try:
-            tables = camelot.read_pdf(invoice_file, **read_kwargs)
+            tables = camelot.read_pdf(as_path(invoice_file), **read_kwargs)
+        except (ExtractionTimeoutError, RegexTimeoutError):
+            raise
         except Exception:
             logger.exception("camelot.read_pdf failed for %s", invoice_file)
             continue
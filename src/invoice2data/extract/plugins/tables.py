@@ -1,5 +1,7 @@
 """Plugin to extract tables from an invoice."""
 
+from collections.abc import Callable
+from itertools import pairwise
 from logging import getLogger
 from typing import TYPE_CHECKING
 from typing import Any
@@ -38,34 +40,61 @@ def extract(
         list[Any] | None: The extracted data as a list of dictionaries, or None if table parsing fails.
                                 Each dictionary represents a row in the table.
     """
-    for i, table in enumerate(self["tables"]):
-        logger.debug("Testing Rules set #%s", i)
+    return prepare(self)(self, content, output, invoice_file)
 
-        # Extract and validate settings
-        table = _extract_and_validate_settings(self, table)
-        if table is None:
-            continue
 
-        # Extract table body
-        table_body = _extract_table_body(content, table)
-        if table_body is None:
-            continue
+def prepare(
+    self: "InvoiceTemplate",
+) -> Callable[..., dict[str, Any] | None]:
+    """Validate the template's tables once and return a reusable extractor.
 
-        # Process table lines
-        table_data = _process_table_lines(self, table, table_body)
-        if table_data is None:
-            continue
+    Args:
+        self (InvoiceTemplate): The current instance of the class.  # noqa: DOC103
 
-        # Apply grouping to individual fields within table_data
-        for field, field_settings in table.get("fields", {}).items():
-            if "group" in field_settings:
-                grouped_value = _apply_grouping(field_settings, table_data.get(field))
-                if grouped_value is not None:
-                    table_data[field] = grouped_value
+    Returns:
+        Callable[..., dict[str, Any] | None]: ``run(template, content, output,
+            invoice_file=None)``, equivalent to :func:`extract`.
+    """
+    tables = [_extract_and_validate_settings(self, table) for table in self["tables"]]
+
+    def run(
+        template: "InvoiceTemplate",
+        content: str,
+        output: dict[str, Any],
+        invoice_file: str | None = None,
+    ) -> dict[str, Any] | None:
+        for i, table in enumerate(tables):
+            logger.debug("Testing Rules set #%s", i)
+            if table is None:
+                continue
+
+            if "columns" in table:
+                table_data = _process_table_columns(template, table, content)
+            else:
+                # Extract table body
+                table_body = _extract_table_body(content, table)
+                if table_body is None:
+                    continue
 
-        output.update(table_data)
+                # Process table lines
+                table_data = _process_table_lines(template, table, table_body)
+            if table_data is None:
+                continue
 
-    return output
+            # Apply grouping to individual fields within table_data
+            for field, field_settings in table.get("fields", {}).items():
+                if "group" in field_settings:
+                    grouped_value = _apply_grouping(
+                        field_settings, table_data.get(field)
+                    )
+                    if grouped_value is not None:
+                        table_data[field] = grouped_value
+
+            output.update(table_data)
+
+        return output
+
+    return run
 
 
 def _extract_and_validate_settings(
@@ -82,19 +111,62 @@ def _extract_and_validate_settings(
         dict[str, Any] | None: The validated table settings, or None if
                                    validation fails.
     """
-    plugin_settings = DEFAULT_OPTIONS.copy()
+    plugin_settings: dict[str, Any] = DEFAULT_OPTIONS.copy()
     plugin_settings.update(table)
     table = plugin_settings
 
-    for key in ("start", "end", "body"):
+    # With `columns`, rows are sliced by position and `body` is not used.
+    for key in ("start", "end") if "columns" in table else ("start", "end", "body"):
         if key not in table:
             raise TemplateSyntaxError(
                 f"`tables` plugin: missing required `{key}` regex",
                 self.get("template_name"),
             )
+    if "columns" in table:
+        table["columns"] = _validate_columns(self, table["columns"])
     return table
 
 
+def _validate_columns(self: "InvoiceTemplate", columns: Any) -> dict[str, Any]:
+    """Validate a ``columns`` setting.
+
+    Args:
+        self (InvoiceTemplate): The current instance of the class.  # noqa: DOC103
+        columns (Any): Field name -> ``[start, end]`` character offsets (``end``
+            null for the rest of the line), or field name -> a regex locating
+            the column's label in the header line.
+
+    Returns:
+        dict[str, Any]: Field name -> ``slice``, or field name -> label regex.
+
+    Raises:
+        TemplateSyntaxError: If ``columns`` is not such a mapping, or mixes
+            offsets and labels.
+    """
+    if not isinstance(columns, dict) or not columns:
+        raise TemplateSyntaxError(
+            "`tables` plugin: `columns` must map field names to offsets or labels",
+            self.get("template_name"),
+        )
+    if all(isinstance(label, str) for label in columns.values()):
+        return dict(columns)
+    slices = {}
+    for field, bounds in columns.items():
+        if (
+            not isinstance(bounds, list | tuple)
+            or len(bounds) != 2
+            or not isinstance(bounds[0], int)
+            or not isinstance(bounds[1], int | None)
+        ):
+            raise TemplateSyntaxError(
+                f"`tables` plugin: column {field!r} must be [start, end] character"
+                " offsets (or every column a header label)",
+                self.get("template_name"),
+            )
+        slices[field] = slice(*bounds)
+    return slices
+
+
 def _extract_table_body(content: str, table: dict[str, Any]) -> str | None:
     """Extract the table body from the content.
 
@@ -162,7 +234,112 @@ def _process_table_lines(
     return line_output
 
 
-def _process_table_line(  # noqa: C901
+def _process_table_columns(
+    self: "InvoiceTemplate",
+    table: dict[str, Any],
+    content: str,
+) -> dict[str, Any] | None:
+    """Slice the rows of a fixed-width table by column position.
+
+    The rows are the lines after the one the ``start`` match ends on, up to
+    the ``end`` match. Labels in ``columns`` are looked up in the line the
+    ``start`` match begins on (the header).
+
+    Args:
+        self (InvoiceTemplate): The current instance of the class.  # noqa: DOC103
+        table (dict[str, Any]): The validated table settings.
+        content (str): The content of the invoice.
+
+    Returns:
+        dict[str, Any] | None: Field name -> value (a list once there are
+            several rows), or None if the table or a label is not found, or a
+            date cannot be parsed.
+    """
+    start = _regex.search(table["start"], content)
+    end = _regex.search(table["end"], content)
+    if not start or not end:
+        logger.debug("Failed to find the start or the end of the table")
+        return None
+    header_start = content.rfind("\n", 0, start.start()) + 1
+    header_end = content.find("\n", start.start())
+    rows_start = start.end()
+    if rows_start > 0 and content[rows_start - 1] != "\n":
+        rows_start = content.find("\n", rows_start) + 1 or len(content)
+    rows = [
+        line
+        for line in _regex.split(
+            table["line_separator"], content[rows_start : end.start()]
+        )
+        if line.strip()
+    ]
+    columns = table["columns"]
+    if isinstance(next(iter(columns.values())), str):
+        header = content[header_start : header_end if header_end >= 0 else None]
+        columns = _header_columns(header, columns, rows)
+        if columns is None:
+            return None
+    fields = tuple(columns.items())
+    types = table.get("types", {})
+    output: dict[str, Any] = {}
+    for line in rows:
+        for field, part in fields:
+            # Blank cells are kept as None, so the columns stay aligned.
+            value = line[part].strip()
+            if not value:
+                _append(output, field, None)
+            elif not _store_value(self, table, field, value, types, output):
+                return None
+    return output
+
+
+def _header_columns(
+    header: str, labels: dict[str, str], rows: list[str]
+) -> dict[str, slice] | None:
+    """Infer column positions from where their labels sit in the header.
+
+    A column starts where its label starts, or further left (but not into the
+    previous label) when its values stick out to the left of the label, as
+    right-aligned numbers wider than their label do: the boundary is the
+    rightmost position before the label that is blank in every row. The first
+    column starts at the start of the line and the last one runs to its end.
+
+    Args:
+        header (str): The header line.
+        labels (dict[str, str]): Field name -> regex matching its label.
+        rows (list[str]): The table's rows.
+
+    Returns:
+        dict[str, slice] | None: Field name -> slice of a row, or None if a
+            label is not in the header.
+    """
+    spans = []
+    for field, label in labels.items():
+        match = _regex.search(label, header)
+        if not match:
+            logger.debug("Column label %r not found in header %r", label, header)
+            return None
+        spans.append((match.start(), match.end(), field))
+    spans.sort()
+    bounds: list[int | None] = [0]
+    for (_, previous_end, _), (start, _, _) in pairwise(spans):
+        bounds.append(
+            next(
+                (
+                    bound
+                    for bound in range(start, previous_end, -1)
+                    if all(not row[bound - 1 : bound].strip() for row in rows)
+                ),
+                start,
+            )
+        )
+    bounds.append(None)
+    slices = {
+        field: slice(bounds[i], bounds[i + 1]) for i, (*_, field) in enumerate(spans)
+    }
+    return {field: slices[field] for field in labels}
+
+
+def _process_table_line(
     self: "InvoiceTemplate",
     table: dict[str, Any],
     line: str,
@@ -194,33 +371,69 @@ def _process_table_line(  # noqa: C901
                 match.re.pattern,
                 value,
             )
-
-            if field.startswith("date") or field.endswith("date"):
-                value = self.parse_date(value)
-                if not value:
-                    logger.error("Date parsing failed on date *%s*", value)
-                    return False
-            elif field.startswith("amount"):
-                value = self.parse_number(value)
-            elif field in types:
-                value = self.coerce_type(value, types[field])
-            elif table.get("fields"):
-                # Writing templates is hard, so we also accept a nested form
-                # (in case someone mixes up the syntax), e.g.:
-                #     fields: {example_field: {"type": float, "group": sum}}
-                field_set = table["fields"].get(field, {})
-                if "type" in field_set:
-                    value = self.coerce_type(value, field_set.get("type"))
-
-            if field in output:
-                # Ensure output[field] is a list before appending
-                if not isinstance(output[field], list):
-                    output[field] = [output[field]]
-                output[field].append(value)
-            else:
-                output[field] = value
+            if not _store_value(self, table, field, value, types, output):
+                return False
         # Return True if a match is found and processed successfully
         return True
     logger.debug("The following line doesn't match anything:\n*%s*", line)
     # Return True to continue processing even if a line doesn't match
     return True
+
+
+def _store_value(
+    self: "InvoiceTemplate",
+    table: dict[str, Any],
+    field: str,
+    value: Any,
+    types: dict[str, Any],
+    output: dict[str, Any],
+) -> bool:
+    """Coerce one cell and add it to the field's values in ``output``.
+
+    Args:
+        self (InvoiceTemplate): The current instance of the class.
+        table (dict[str, Any]): The validated table settings.
+        field (str): The column's field name.
+        value (Any): The cell's text.
+        types (dict[str, Any]): A dictionary of type coercion rules.
+        output (dict[str, Any]): A dictionary to store the extracted data.
+
+    Returns:
+        bool: True if the value was stored, False if date parsing fails.
+    """
+    if field.startswith("date") or field.endswith("date"):
+        value = self.parse_date(value)
+        if not value:
+            logger.error("Date parsing failed on date *%s*", value)
+            return False
+    elif field.startswith("amount"):
+        value = self.parse_number(value)
+    elif field in types:
+        value = self.coerce_type(value, types[field])
+    elif table.get("fields"):
+        # Writing templates is hard, so we also accept a nested form
+        # (in case someone mixes up the syntax), e.g.:
+        #     fields: {example_field: {"type": float, "group": sum}}
+        field_set = table["fields"].get(field, {})
+        if "type" in field_set:
+            value = self.coerce_type(value, field_set.get("type"))
+
+    _append(output, field, value)
+    return True
+
+
+def _append(output: dict[str, Any], field: str, value: Any) -> None:
+    """Add a value to a field: stored as is first, as a list once repeated.
+
+    Args:
+        output (dict[str, Any]): A dictionary to store the extracted data.
+        field (str): The field name.
+        value (Any): The value.
+    """
+    if field in output:
+        # Ensure output[field] is a list before appending
+        if not isinstance(output[field], list):
+            output[field] = [output[field]]
+        output[field].append(value)
+    else:
+        output[field] = value
@@ -62,6 +62,7 @@ INVOICE_FIELDS: frozenset[str] = frozenset(
         "desc",
         # metadata auto-added to every result
         "template_name",  # which template matched (issue #618)
+        "regex_timeouts",  # fields and plugins cut short by options.regex_timeout
     }
 )
 
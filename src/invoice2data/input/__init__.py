@@ -4,6 +4,12 @@ See `__interface__` for the backend contract. `INPUT_MODULES` maps the stable
 backend name (the `--input-reader` value) to its module.
 """
 
+import asyncio
+import contextlib
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import Executor
 from functools import lru_cache
 from pathlib import Path
 from types import ModuleType
@@ -21,6 +27,9 @@ from . import pdfplumber
 from . import pdftotext
 from . import tesseract
 from . import text
+from ._memory import as_path
+from .disk_cache import cache_key
+from .disk_cache import get_disk_cache
 
 
 #: Registry: backend name (the ``--input-reader`` value) -> backend module.
@@ -52,6 +61,45 @@ def supports_area(module: ModuleType) -> bool:
     return bool(getattr(module, "SUPPORTS_AREA", False))
 
 
+def supports_languages(module: ModuleType) -> bool:
+    """Return whether a backend can be told which languages to OCR.
+
+    Args:
+        module (ModuleType): An input backend module.
+
+    Returns:
+        bool: True if the backend declares ``SUPPORTS_LANGUAGES = True``.
+    """
+    return bool(getattr(module, "SUPPORTS_LANGUAGES", False))
+
+
+def supports_bytes(module: ModuleType) -> bool:
+    """Return whether a backend reads in-memory documents itself.
+
+    Args:
+        module (ModuleType): An input backend module.
+
+    Returns:
+        bool: True if the backend declares ``SUPPORTS_BYTES = True``; the
+            others are given a temporary file instead.
+    """
+    return bool(getattr(module, "SUPPORTS_BYTES", False))
+
+
+def _source(module: ModuleType, invoicefile: str) -> str:
+    """Return what to pass ``module`` for ``invoicefile``.
+
+    Args:
+        module (ModuleType): An input backend module.
+        invoicefile (str): A path or an in-memory document name.
+
+    Returns:
+        str: ``invoicefile``, or a temporary copy of an in-memory document
+            for a backend that needs a real file.
+    """
+    return invoicefile if supports_bytes(module) else as_path(invoicefile)
+
+
 def is_available(module: ModuleType) -> bool:
     """Return whether a backend's runtime dependency is available.
 
@@ -66,42 +114,343 @@ def is_available(module: ModuleType) -> bool:
     return bool(checker()) if callable(checker) else True
 
 
-@lru_cache(maxsize=128)
+#: Extracted texts kept per process (full documents and areas alike).
+_TEXT_CACHE_SIZE = 128
+
+
+class _BlankTextError(Exception):
+    """Carries blank text out of :func:`_cached_to_text` so it is not memoized.
+
+    Backends return ``""`` when they cannot run (a missing library, a timed-out
+    OCR), so blank text is never kept: the next call tries again.
+
+    Args:
+        text (str): The blank text extracted.
+    """
+
+    def __init__(self, text: str) -> None:
+        super().__init__()
+        self.text = text
+
+
+def _reusable(text: str) -> bool:
+    """Return whether extracted text may be cached.
+
+    Args:
+        text (str): Text from a backend.
+
+    Returns:
+        bool: False for blank text, which may stand for a failed extraction.
+    """
+    return bool(text.strip())
+
+
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
 def _cached_to_text(
     module: ModuleType,
     invoicefile: str,
     mtime: float | None,
     area_key: tuple[tuple[str, Any], ...] | None,
+    languages: tuple[str, ...] | None = None,
 ) -> str:
-    """Memoized backend call (key includes file mtime + area for correctness)."""
-    if area_key is None:
-        return str(module.to_text(invoicefile))
-    return str(module.to_text(invoicefile, dict(area_key)))
+    """Memoized backend call (key includes file mtime + area for correctness).
+
+    Raises ``_BlankTextError`` instead of returning blank text, which must not be
+    memoized.
+    """
+    if area_key is None and languages is None:
+        batched = _batch_texts.get((module, invoicefile, mtime))
+        if batched is not None:
+            return batched
+    key, extracted = _disk_get(module, invoicefile, mtime, area_key, languages)
+    if extracted is not None:
+        return extracted
+    area = None if area_key is None else dict(area_key)
+    source = _source(module, invoicefile)
+    with _serialized(module):
+        if languages is not None:
+            extracted = str(module.to_text(source, area, languages=languages))
+        elif area is None:
+            extracted = str(module.to_text(source))
+        else:
+            extracted = str(module.to_text(source, area))
+    if not _reusable(extracted):
+        raise _BlankTextError(extracted)
+    _disk_put(key, extracted)
+    return extracted
+
+
+def _disk_get(
+    module: ModuleType,
+    invoicefile: str,
+    mtime: float | None,
+    area_key: tuple[tuple[str, Any], ...] | None,
+    languages: tuple[str, ...] | None = None,
+) -> tuple[str | None, str | None]:
+    """Look an extraction up in the persistent cache, when one is enabled.
+
+    Args:
+        module (ModuleType): The input backend.
+        invoicefile (str): Path to the document.
+        mtime (float | None): Its mtime.
+        area_key (tuple[tuple[str, Any], ...] | None): The sorted area items.
+        languages (tuple[str, ...] | None): The requested OCR languages.
+
+    Returns:
+        tuple[str | None, str | None]: The cache key (None when the cache is
+            off, the backend opts out or the file cannot be hashed) and the
+            cached text (None on a miss).
+    """
+    cache = get_disk_cache()
+    if cache is None or not getattr(module, "CACHE_TEXT", True):
+        return None, None
+    try:
+        key = cache_key(module, invoicefile, mtime, area_key, languages)
+    except OSError:
+        return None, None
+    return key, cache.get(key)
+
+
+def _disk_put(key: str | None, extracted: str) -> None:
+    """Store freshly extracted text under a key from :func:`_disk_get`.
+
+    Blank text is not stored (see :func:`_reusable`).
+
+    Args:
+        key (str | None): The key, or None to store nothing.
+        extracted (str): The text.
+    """
+    cache = get_disk_cache()
+    if key is not None and cache is not None and _reusable(extracted):
+        cache.put(key, extracted)
+
+
+#: One lock per backend not declared ``THREAD_SAFE``, by module name. Backends
+#: sharing a native library lock it themselves (PDFium: ``pdfium.LOCK``).
+_backend_locks: dict[str, threading.RLock] = {}
+_backend_locks_guard = threading.Lock()
+
+
+def _serialized(module: ModuleType) -> contextlib.AbstractContextManager[Any]:
+    """Return a context that keeps ``module`` from running on two threads at once.
+
+    Args:
+        module (ModuleType): An input backend module.
+
+    Returns:
+        contextlib.AbstractContextManager[Any]: The backend's own lock, or a
+            no-op for backends declaring ``THREAD_SAFE = True``.
+    """
+    if getattr(module, "THREAD_SAFE", False):
+        return contextlib.nullcontext()
+    with _backend_locks_guard:
+        return _backend_locks.setdefault(module.__name__, threading.RLock())
 
 
 def extract_text(
-    module: ModuleType, invoicefile: str, area: dict[str, Any] | None = None
+    module: ModuleType,
+    invoicefile: str,
+    area: dict[str, Any] | None = None,
+    languages: tuple[str, ...] | None = None,
 ) -> str:
     """Extract text with a backend, memoized per (backend, file, mtime, area).
 
     Avoids re-parsing the same document within a run -- e.g. when several template
     fields share one ``area``, or the same full text is requested again. The file
-    mtime is part of the key so a changed file is re-read.
+    mtime is part of the key so a changed file is re-read. With the persistent
+    cache enabled (:mod:`~invoice2data.input.disk_cache`), text is also shared
+    across processes and runs.
+
+    Args:
+        module (ModuleType): An input backend exposing ``to_text``.
+        invoicefile (str): Path to the document.
+        area (dict[str, Any] | None): Optional area-restriction passed through.
+        languages (tuple[str, ...] | None): OCR languages (ISO 639-1 codes, as
+            in a template's ``options.languages``; ``()`` for all), passed
+            to backends declaring ``SUPPORTS_LANGUAGES`` and ignored by the
+            rest. None leaves the backend's default.
+
+    Returns:
+        str: The extracted text.
+    """
+    area_key = tuple(sorted(area.items())) if area else None
+    if not supports_languages(module):
+        languages = None
+    try:
+        return _cached_to_text(
+            module, invoicefile, _mtime(invoicefile), area_key, languages
+        )
+    except _BlankTextError as blank:
+        return blank.text
+
+
+#: Whole-document texts produced by ``to_text_batch``, most recent last; read
+#: by :func:`_cached_to_text` and :func:`extract_text_batch`.
+_batch_texts: OrderedDict[tuple[ModuleType, str, float | None], str] = OrderedDict()
+
+
+def extract_text_batch(
+    module: ModuleType, invoicefiles: Sequence[str], batch_size: int | None = None
+) -> list[str]:
+    """Extract the text of many documents at once, for :func:`extract_text`.
+
+    Backends with a ``to_text_batch`` (the deep-learning OCR ones) OCR the
+    documents not cached yet in batches of pages gathered across documents,
+    which is much faster than one document at a time; the rest extract them
+    one by one. Either way the texts are memoized, so the
+    :func:`extract_text` calls of the following extractions find them.
+
+    Args:
+        module (ModuleType): An input backend exposing ``to_text``.
+        invoicefiles (Sequence[str]): Paths to the documents.
+        batch_size (int | None): Pages per batch; see
+            :func:`~invoice2data.input.ocr_pool.ocr_batch_size`.
+
+    Returns:
+        list[str]: Each document's text, in the order of ``invoicefiles``.
+    """
+    to_text_batch = getattr(module, "to_text_batch", None)
+    if not callable(to_text_batch):
+        return [extract_text(module, invoicefile) for invoicefile in invoicefiles]
+    texts: dict[str, str] = {}
+    missing: dict[str, tuple[float | None, str | None]] = {}
+    for invoicefile in invoicefiles:
+        mtime = _mtime(invoicefile)
+        batched = _batch_texts.get((module, invoicefile, mtime))
+        key, extracted = _disk_get(module, invoicefile, mtime, None)
+        if batched is not None or extracted is not None:
+            texts[invoicefile] = batched if batched is not None else str(extracted)
+        else:
+            missing[invoicefile] = (mtime, key)
+    if missing:
+        with _serialized(module):
+            sources = [_source(module, invoicefile) for invoicefile in missing]
+            extracted_texts = to_text_batch(sources, batch_size)
+        for (invoicefile, (mtime, key)), extracted in zip(
+            missing.items(), extracted_texts, strict=True
+        ):
+            texts[invoicefile] = str(extracted)
+            _disk_put(key, texts[invoicefile])
+            if not _reusable(texts[invoicefile]):
+                continue
+            _batch_texts[(module, invoicefile, mtime)] = texts[invoicefile]
+            if len(_batch_texts) > _TEXT_CACHE_SIZE:
+                _batch_texts.popitem(last=False)
+    return [texts[invoicefile] for invoicefile in invoicefiles]
+
+
+def extract_text_head(
+    module: ModuleType, invoicefile: str, pages: int
+) -> tuple[str, bool] | None:
+    """Extract the leading pages of a document, memoized like :func:`extract_text`.
+
+    When the persistent cache already holds the whole document's text, that is
+    returned instead; a head that turns out to be the whole document is stored
+    there as such.
+
+    Args:
+        module (ModuleType): An input backend.
+        invoicefile (str): Path to the document.
+        pages (int): How many leading pages are needed.
+
+    Returns:
+        tuple[str, bool] | None: The text and whether it is the whole document,
+            or None when the backend has no ``to_text_head``.
+    """
+    if not callable(getattr(module, "to_text_head", None)):
+        return None
+    return _cached_head(module, invoicefile, _mtime(invoicefile), pages)
+
+
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
+def _cached_head(
+    module: ModuleType, invoicefile: str, mtime: float | None, pages: int
+) -> tuple[str, bool]:
+    """Memoized ``to_text_head`` call (key includes file mtime)."""
+    key, extracted = _disk_get(module, invoicefile, mtime, None)
+    if extracted is not None:
+        return extracted, True
+    with _serialized(module):
+        head, whole = module.to_text_head(_source(module, invoicefile), pages)
+    head = str(head)
+    if whole:
+        _disk_put(key, head)
+    return head, bool(whole)
+
+
+#: Whole-document texts produced by ``to_text_async``, most recent last; the
+#: event-loop counterpart of :func:`_cached_to_text`'s cache.
+_async_texts: OrderedDict[tuple[ModuleType, str, float | None], str] = OrderedDict()
+
+
+async def extract_text_async(
+    module: ModuleType,
+    invoicefile: str,
+    area: dict[str, Any] | None = None,
+    *,
+    executor: Executor | None = None,
+    languages: tuple[str, ...] | None = None,
+) -> str:
+    """Extract text with a backend without blocking the running event loop.
+
+    Backends with a ``to_text_async`` coroutine (the command-line ones) are
+    awaited directly for the whole document; those results are memoized like
+    :func:`extract_text`'s. Everything else -- in-process backends, area
+    extraction and requested languages -- goes through :func:`extract_text` on
+    ``executor``.
 
     Args:
         module (ModuleType): An input backend exposing ``to_text``.
         invoicefile (str): Path to the document.
         area (dict[str, Any] | None): Optional area-restriction passed through.
+        executor (Executor | None): Where blocking extraction runs; the event
+            loop's default (bounded) executor when None.
+        languages (tuple[str, ...] | None): As for :func:`extract_text`.
 
     Returns:
         str: The extracted text.
     """
+    to_text_async = getattr(module, "to_text_async", None)
+    if not supports_languages(module):
+        languages = None
+    if area or languages is not None or to_text_async is None:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, extract_text, module, invoicefile, area, languages
+        )
+    mtime = _mtime(invoicefile)
+    key = (module, invoicefile, mtime)
+    if key in _async_texts:
+        _async_texts.move_to_end(key)
+        return _async_texts[key]
+    loop = asyncio.get_running_loop()
+    disk_key, extracted = await loop.run_in_executor(
+        executor, _disk_get, module, invoicefile, mtime, None
+    )
+    if extracted is None:
+        extracted = str(await to_text_async(_source(module, invoicefile)))
+        await loop.run_in_executor(executor, _disk_put, disk_key, extracted)
+        if not _reusable(extracted):
+            return extracted
+    _async_texts[key] = extracted
+    if len(_async_texts) > _TEXT_CACHE_SIZE:
+        _async_texts.popitem(last=False)
+    return extracted
+
+
+def _mtime(invoicefile: str) -> float | None:
+    """Return the file's mtime (part of the text cache keys), or None.
+
+    Args:
+        invoicefile (str): Path to the document.
+
+    Returns:
+        float | None: Modification time, or None if the file cannot be read.
+    """
     try:
-        mtime: float | None = Path(invoicefile).stat().st_mtime
+        return Path(invoicefile).stat().st_mtime
     except OSError:
-        mtime = None
-    area_key = tuple(sorted(area.items())) if area else None
-    return _cached_to_text(module, invoicefile, mtime, area_key)
+        return None
 
 
 def available_modules() -> dict[str, ModuleType]:
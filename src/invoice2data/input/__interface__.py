@@ -20,6 +20,73 @@ runtime dependency (a Python package or a system binary) is missing:
 
 If absent, the backend is assumed to be always available.
 
+A backend that shells out may also provide a coroutine extracting the whole
+document without blocking an event loop (used by `extract_data_async`):
+
+    async def to_text_async(path) -> str
+
+Backends without one are run on an executor thread, as is every area
+extraction. Unless a backend declares that its `to_text` may run on several
+threads at once, calls into it are serialized, each backend on its own lock
+(default False):
+
+    THREAD_SAFE = True
+
+A backend that calls PDFium through pypdfium2 holds `pdfium.LOCK` around those
+calls instead, as the library must not be entered from two threads at once,
+whichever backend enters it.
+
+A backend that can read just the leading pages of a document (used to match
+templates before paying for a whole long document, see the `match_pages` option
+of `extract_data`) provides
+
+    def to_text_head(path, pages) -> tuple[str, bool]
+
+returning the text of at least the first `pages` pages and whether that is the
+whole document, in which case it must equal `to_text(path)`.
+
+A backend whose engine is faster on batches (deep-learning OCR) may also
+extract many documents at once, running the engine on batches of `batch_size`
+pages gathered across them (used by `extract_many` with one worker, see
+`input.extract_text_batch`):
+
+    def to_text_batch(paths, batch_size=None) -> list[str]
+
+returning each document's text, equal to what `to_text(path)` returns.
+
+An OCR backend that can be told which languages to read (loading fewer
+language models is faster and often more accurate) declares
+
+    SUPPORTS_LANGUAGES = True
+
+and accepts them as a keyword argument:
+
+    def to_text(path, area_details=None, languages=None) -> str
+
+`languages` is a tuple of ISO 639-1 codes, as in a template's
+`options.languages`, `()` for every language the backend has, or None for its
+default (a small, fast first-pass set). The cascade re-reads a document with
+the matched template's languages, or with all of them when nothing matched.
+
+Text is kept in the persistent cache (`disk_cache`) when it is enabled, keyed
+by the file's content and the backend. A backend whose output depends on its
+configuration (languages, options) returns that configuration as a string, so
+changing it invalidates the cached text:
+
+    def cache_config() -> str
+
+A backend for which caching is pointless opts out (default True):
+
+    CACHE_TEXT = False
+
+`extract_data` also accepts a document as bytes or a binary file object; it is
+then passed around under a name like `memory:<sha256>.pdf` instead of a path.
+A backend that reads such names itself (with `_memory.read_bytes` or
+`_memory.open_binary`) declares so; every other backend is given a temporary
+file holding the document:
+
+    SUPPORTS_BYTES = True
+
 Backends are registered by name in `input/__init__.py` (the registry
 `INPUT_MODULES`); the name is the value used for the `--input-reader` CLI
 option and the `input_module` string argument of `extract_data`.
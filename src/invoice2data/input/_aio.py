@@ -0,0 +1,64 @@
+"""Non-blocking subprocess helper for the ``to_text_async`` backends.
+
+Command-line backends (pdftotext, tesseract) run their tools through
+:func:`run` so an event loop can keep hundreds of documents in flight. The
+number of child processes alive at once is capped per event loop
+(:data:`MAX_PROCESSES`): past that, documents queue for a slot instead of
+forking without bound.
+"""
+
+import asyncio
+import os
+import weakref
+from subprocess import DEVNULL
+from subprocess import PIPE
+
+
+#: Child processes an event loop runs at once; further calls wait for a slot.
+MAX_PROCESSES = 2 * (os.cpu_count() or 1)
+
+_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _slot() -> asyncio.Semaphore:
+    """Return the running loop's process-slot semaphore, creating it on first use.
+
+    Returns:
+        asyncio.Semaphore: Bounds concurrent children to :data:`MAX_PROCESSES`.
+    """
+    loop = asyncio.get_running_loop()
+    slot = _slots.get(loop)
+    if slot is None:
+        slot = _slots[loop] = asyncio.Semaphore(MAX_PROCESSES)
+    return slot
+
+
+async def run(
+    cmd: list[str], stdin: bytes | None = None, timeout: float | None = None
+) -> bytes:
+    """Run ``cmd`` without blocking the event loop and return its stdout.
+
+    Args:
+        cmd (list[str]): The command and its arguments.
+        stdin (bytes | None): Data to feed the process; it gets no stdin when
+            ``None``.
+        timeout (float | None): Seconds to wait before killing the process.
+
+    Returns:
+        bytes: Everything the process wrote to stdout. Raises ``TimeoutError``
+            if it did not finish within ``timeout``; it has been killed and
+            reaped by then, as it is when the caller is cancelled.
+    """
+    async with _slot():
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdin=DEVNULL if stdin is None else PIPE, stdout=PIPE
+        )
+        try:
+            out, _ = await asyncio.wait_for(proc.communicate(stdin), timeout)
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+    return out
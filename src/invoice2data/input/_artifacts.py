@@ -0,0 +1,196 @@
+"""Files derived from input documents, kept on disk within a size cap.
+
+OCR backends turn a scan into a text-layered PDF and then read the full text
+and every ``area`` field from it. :class:`ArtifactStore` keeps those PDFs so a
+document is OCRed once per run: entries are keyed by the source file's content
+hash (a renamed copy hits, an edited file misses) and the settings that shaped
+the output, live in a private temporary directory removed at exit, and the
+least recently used are deleted once the store passes its size cap.
+"""
+
+import atexit
+import hashlib
+import shutil
+import tempfile
+import threading
+from collections import Counter
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from logging import getLogger
+from pathlib import Path
+
+from .disk_cache import _content_hash
+
+
+logger = getLogger(__name__)
+
+
+class ArtifactStore:
+    """Derived files per (source content, settings), least recently used first out.
+
+    Args:
+        prefix (str): Name prefix of the temporary directory.
+        suffix (str): Extension of the stored files, e.g. ``".pdf"``.
+        max_bytes (int): Disk space the files may take; the least recently
+            used are deleted beyond it (never one in use or the latest).
+    """
+
+    def __init__(self, prefix: str, suffix: str, max_bytes: int) -> None:
+        self.prefix = prefix
+        self.suffix = suffix
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, int] = OrderedDict()  # key -> bytes
+        self._bytes = 0
+        self._directory: Path | None = None
+        self._pins: Counter[str] = Counter()  # key -> callers reading it
+        # Per key, held while building, so two threads never OCR the same
+        # document; other documents build meanwhile.
+        self._building: dict[str, threading.Lock] = {}
+        self._builders: Counter[str] = Counter()  # key -> callers of its lock
+        # Guards the bookkeeping above, never held while building.
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """Return the disk space the stored files take.
+
+        Returns:
+            int: Bytes.
+        """
+        return self._bytes
+
+    @contextmanager
+    def fetch(
+        self, source: str, config: str, build: Callable[[Path], bool]
+    ) -> Iterator[str | None]:
+        """Pin the artifact of ``source``, building it on a miss.
+
+        The artifact is not evicted until the ``with`` block exits, so read it
+        there.
+
+        Args:
+            source (str): Path to the input document.
+            config (str): The settings the artifact depends on.
+            build (Callable[[Path], bool]): Writes the artifact to the given
+                path (derived files may share its stem) and returns whether
+                it succeeded.
+
+        Yields:
+            str | None: Path to the artifact, or None if ``build`` failed.
+        """
+        key = self._key(source, config)
+        with self._lock:
+            building = self._building.setdefault(key, threading.Lock())
+            self._builders[key] += 1
+        hit = built = False
+        with building:
+            try:
+                with self._lock:
+                    target = self._dir() / f"{key}{self.suffix}"
+                    hit = key in self._entries
+                    if hit:
+                        self._entries.move_to_end(key)
+                        self._pins[key] += 1
+                built = hit or build(target)
+            finally:
+                with self._lock:
+                    self._builders[key] -= 1
+                    if not self._builders[key]:
+                        del self._builders[key], self._building[key]
+                    if not built:
+                        self._remove(key)
+                    elif not hit:
+                        self._pins[key] += 1
+                        self._add(key)
+        if not built:
+            yield None
+            return
+        try:
+            yield str(target)
+        finally:
+            with self._lock:
+                self._pins[key] -= 1
+                if not self._pins[key]:
+                    del self._pins[key]
+                self._evict()
+
+    def clear(self) -> None:
+        """Delete every stored file that is not in use."""
+        with self._lock:
+            for key in list(self._entries):
+                if key not in self._pins:
+                    self._remove(key)
+
+    def _key(self, source: str, config: str) -> str:
+        """Return the entry key of ``source`` under ``config``.
+
+        Args:
+            source (str): Path to the input document.
+            config (str): The settings.
+
+        Returns:
+            str: A SHA-256 hex digest.
+        """
+        mtime = Path(source).stat().st_mtime
+        parts = f"{_content_hash(source, mtime)}\0{config}"
+        return hashlib.sha256(parts.encode()).hexdigest()
+
+    def _dir(self) -> Path:
+        """Return the store's directory, created on first use.
+
+        Returns:
+            Path: The directory, removed when the interpreter exits.
+        """
+        if self._directory is None:
+            self._directory = Path(tempfile.mkdtemp(prefix=self.prefix))
+            atexit.register(shutil.rmtree, self._directory, ignore_errors=True)
+        return self._directory
+
+    def _files(self, key: str) -> list[Path]:
+        """Return the files an entry consists of.
+
+        Args:
+            key (str): The entry key.
+
+        Returns:
+            list[Path]: The artifact and the files sharing its stem.
+        """
+        return list(self._dir().glob(f"{key}*"))
+
+    def _add(self, key: str) -> None:
+        """Account for a freshly built entry, then evict down to the cap.
+
+        Args:
+            key (str): The entry key.
+        """
+        self._remove(key, delete=False)
+        size = sum(path.stat().st_size for path in self._files(key))
+        self._entries[key] = size
+        self._bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries not in use, down to the cap.
+
+        The most recently used entry is kept, however large.
+        """
+        for key in list(self._entries)[:-1]:
+            if self._bytes <= self.max_bytes:
+                return
+            if key not in self._pins:
+                logger.debug("Evicting OCR artifact %s", key)
+                self._remove(key)
+
+    def _remove(self, key: str, delete: bool = True) -> None:
+        """Forget an entry and, unless ``delete`` is False, delete its files.
+
+        Args:
+            key (str): The entry key.
+            delete (bool): Whether to delete the files too.
+        """
+        self._bytes -= self._entries.pop(key, 0)
+        if delete:
+            for path in self._files(key):
+                path.unlink(missing_ok=True)
@@ -0,0 +1,183 @@
+"""Compact, indexed word boxes for area extraction.
+
+Backends that crop areas from word positions (see :mod:`.pdftotext`) used to
+keep each word as a tuple of four floats, a page number and its text, and to
+scan and re-sort all of them for every area. :class:`WordBoxes` stores the
+same words in parallel ``array`` columns, sorted by page, top and left once,
+with each page's span of rows. A crop then bisects the rows of each requested
+page on their top coordinate and tests only the words in that band, however
+long the document. :class:`WordCache` keeps recently used documents' boxes
+within a memory budget rather than a count of documents.
+"""
+
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Hashable
+from collections.abc import Iterable
+from operator import itemgetter
+from operator import sub
+
+
+#: A word: ``(page, xMin, yMin, xMax, yMax, text)``, coords in points with a
+#: top-left origin and pages counted from 1.
+Word = tuple[int, float, float, float, float, str]
+
+#: Extra points searched above a band, so rounding in a word's height cannot
+#: hide it; the exact test still decides.
+_SLACK = 1.0
+
+
+class WordBoxes:
+    """A document's words, in columns ordered by ``(page, top, left)``.
+
+    Args:
+        words (Iterable[Word]): The document's words, in any order.
+    """
+
+    __slots__ = ("_spans", "_tallest", "_texts", "_x0", "_x1", "_y0", "_y1", "nbytes")
+
+    def __init__(self, words: Iterable[Word]) -> None:
+        ordered = sorted(words, key=itemgetter(0, 2, 1))
+        self._x0 = array("d", map(itemgetter(1), ordered))
+        self._y0 = array("d", map(itemgetter(2), ordered))
+        self._x1 = array("d", map(itemgetter(3), ordered))
+        self._y1 = array("d", map(itemgetter(4), ordered))
+        self._texts = tuple(map(itemgetter(5), ordered))
+        #: page -> (first row, row after the last), pages in ascending order.
+        self._spans: dict[int, tuple[int, int]] = {}
+        #: page -> height of its tallest word.
+        self._tallest: dict[int, float] = {}
+        pages = list(map(itemgetter(0), ordered))
+        start = 0
+        while start < len(pages):
+            page = pages[start]
+            end = bisect_right(pages, page, start)
+            self._spans[page] = (start, end)
+            heights = map(sub, self._y1[start:end], self._y0[start:end])
+            self._tallest[page] = max(heights)
+            start = end
+        #: Approximate memory held, for :class:`WordCache`'s budget.
+        self.nbytes = (
+            4 * self._x0.itemsize * len(self._x0)
+            + sys.getsizeof(self._texts)
+            + sum(map(sys.getsizeof, self._texts))
+            + 200 * len(self._spans)
+        )
+
+    def __len__(self) -> int:
+        """Return the number of words.
+
+        Returns:
+            int: The count.
+        """
+        return len(self._texts)
+
+    def select(
+        self, first: int, last: int, x0: float, y0: float, x1: float, y1: float
+    ) -> list[Word]:
+        """Return the words overlapping a rectangle on pages ``first``..``last``.
+
+        A word is kept when its box overlaps the rectangle's interior (edges
+        that only touch do not count).
+
+        Args:
+            first (int): First page, counted from 1.
+            last (int): Last page, inclusive.
+            x0 (float): Left edge, in points.
+            y0 (float): Top edge.
+            x1 (float): Right edge.
+            y1 (float): Bottom edge.
+
+        Returns:
+            list[Word]: The words, ordered by page, top and left.
+        """
+        selected: list[Word] = []
+        for page, (start, end) in self._spans.items():
+            if not first <= page <= last:
+                continue
+            # Rows are sorted by top, and no word is taller than the page's
+            # tallest: only tops in [y0 - tallest, y1) can overlap the band.
+            low = bisect_right(self._y0, y0 - self._tallest[page] - _SLACK, start, end)
+            high = bisect_left(self._y0, y1, low, end)
+            selected.extend(
+                (
+                    page,
+                    self._x0[row],
+                    self._y0[row],
+                    self._x1[row],
+                    self._y1[row],
+                    self._texts[row],
+                )
+                for row in range(low, high)
+                if self._x0[row] < x1 and self._x1[row] > x0 and self._y1[row] > y0
+            )
+        return selected
+
+
+class WordCache:
+    """Least-recently-used :class:`WordBoxes` per document, within a byte budget.
+
+    Args:
+        max_bytes (int): Memory the cached boxes may hold; the least recently
+            used are dropped beyond it. A document larger than the whole
+            budget is not kept.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, WordBoxes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory the cached boxes hold.
+
+        Returns:
+            int: Bytes, as estimated by :attr:`WordBoxes.nbytes`.
+        """
+        return self._bytes
+
+    def get(self, key: Hashable) -> WordBoxes | None:
+        """Return the boxes stored under ``key`` and mark them recently used.
+
+        Args:
+            key (Hashable): E.g. a document's path and mtime.
+
+        Returns:
+            WordBoxes | None: The boxes, or None on a miss.
+        """
+        with self._lock:
+            boxes = self._entries.get(key)
+            if boxes is not None:
+                self._entries.move_to_end(key)
+            return boxes
+
+    def put(self, key: Hashable, boxes: WordBoxes) -> None:
+        """Store ``boxes`` under ``key``, evicting as the budget requires.
+
+        Args:
+            key (Hashable): E.g. a document's path and mtime.
+            boxes (WordBoxes): The document's boxes.
+        """
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            if boxes.nbytes > self.max_bytes:
+                return
+            self._entries[key] = boxes
+            self._bytes += boxes.nbytes
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
@@ -0,0 +1,199 @@
+"""Documents given as bytes, addressed by a name derived from their content.
+
+:func:`~invoice2data.extract_data` accepts ``bytes``, ``memoryview`` and
+binary file objects as well as paths. :func:`registered` keeps such a document
+in memory under a name like ``memory:<sha256>.pdf`` for the duration of the
+call, and the cascade passes that name around wherever it would pass a path.
+Because the name is the content hash, the text caches (keyed by name, and by
+content for the persistent one) hit for the same bytes however they arrive.
+
+Backends declaring ``SUPPORTS_BYTES = True`` read the bytes with
+:func:`read_bytes` (PDFium and pdfplumber open buffers, pdftotext reads its
+stdin); for the rest, :func:`as_path` writes the document to a temporary file
+once, removed when the last call using it returns.
+"""
+
+import codecs
+import hashlib
+import io
+import os
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+from typing import Any
+
+
+#: What :func:`registered` (and so ``extract_data``) accepts as a document.
+Source = str | os.PathLike[str] | bytes | bytearray | memoryview | IO[bytes]
+
+#: Prefix of in-memory document names.
+PREFIX = "memory:"
+
+#: File extension by leading bytes, so suffix checks work on in-memory names.
+_SIGNATURES = (
+    (b"%PDF", ".pdf"),
+    (b"\x89PNG", ".png"),
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"II*\x00", ".tif"),
+    (b"MM\x00*", ".tif"),
+)
+
+_lock = threading.Lock()
+#: name -> [bytes, users, spilled path or None]
+_documents: dict[str, list[Any]] = {}
+
+
+def is_memory(name: str) -> bool:
+    """Return whether ``name`` addresses an in-memory document.
+
+    Args:
+        name (str): A path or an in-memory document name.
+
+    Returns:
+        bool: True for names made by :func:`registered`.
+    """
+    return name.startswith(PREFIX)
+
+
+@contextmanager
+def registered(source: Source) -> Iterator[str]:
+    """Make ``source`` addressable by name until the block exits.
+
+    Args:
+        source (Source): A path, which is passed through, or the document's
+            bytes or a binary file object (read from its current position).
+
+    Yields:
+        str: The path, or the in-memory document's name.
+
+    Raises:
+        TypeError: If ``source`` is a text file object.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        yield os.fspath(source)
+        return
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = bytes(source)
+    else:
+        data = source.read()
+        if not isinstance(data, bytes):
+            raise TypeError(f"expected a binary file object, got {source!r}")
+    name = f"{PREFIX}{hashlib.sha256(data).hexdigest()}{_suffix(data)}"
+    with _lock:
+        entry = _documents.setdefault(name, [data, 0, None])
+        entry[1] += 1
+    try:
+        yield name
+    finally:
+        with _lock:
+            entry[1] -= 1
+            spilled = None
+            if entry[1] == 0:
+                spilled = _documents.pop(name)[2]
+        if spilled is not None:
+            Path(spilled).unlink(missing_ok=True)
+
+
+def read_bytes(name: str) -> bytes:
+    """Return a document's bytes, from memory or from disk.
+
+    Args:
+        name (str): A path or an in-memory document name.
+
+    Returns:
+        bytes: The document.
+
+    Raises:
+        FileNotFoundError: If an in-memory document is no longer registered.
+    """
+    if not is_memory(name):
+        return Path(name).read_bytes()
+    with _lock:
+        entry = _documents.get(name)
+    if entry is None:
+        raise FileNotFoundError(f"In-memory document not registered: {name}")
+    data: bytes = entry[0]
+    return data
+
+
+def open_binary(name: str) -> IO[bytes]:
+    """Open a document for reading, from memory or from disk.
+
+    Args:
+        name (str): A path or an in-memory document name.
+
+    Returns:
+        IO[bytes]: A binary file object; close it when done.
+    """
+    if is_memory(name):
+        return io.BytesIO(read_bytes(name))
+    return Path(name).open("rb")
+
+
+def as_path(name: str) -> str:
+    """Return a file path holding the document, for path-only consumers.
+
+    Args:
+        name (str): A path or an in-memory document name.
+
+    Returns:
+        str: ``name`` itself for a path; for an in-memory document, a
+            temporary file with the same extension, written on first use and
+            removed once the document is no longer registered.
+
+    Raises:
+        FileNotFoundError: If an in-memory document is no longer registered.
+    """
+    if not is_memory(name):
+        return name
+    with _lock:
+        entry = _documents.get(name)
+        if entry is None:
+            raise FileNotFoundError(f"In-memory document not registered: {name}")
+        if entry[2] is None:
+            handle, spilled = tempfile.mkstemp(
+                prefix="invoice2data-", suffix=Path(name).suffix
+            )
+            with os.fdopen(handle, "wb") as file:
+                file.write(entry[0])
+            entry[2] = spilled
+        path: str = entry[2]
+    return path
+
+
+def digest(name: str) -> str | None:
+    """Return the content hash an in-memory document's name carries.
+
+    Args:
+        name (str): A path or an in-memory document name.
+
+    Returns:
+        str | None: The SHA-256 hex digest, or None for a path.
+    """
+    if not is_memory(name):
+        return None
+    return Path(name[len(PREFIX) :]).stem
+
+
+def _suffix(data: bytes) -> str:
+    """Guess a document's file extension from its leading bytes.
+
+    Args:
+        data (bytes): The document.
+
+    Returns:
+        str: ``.pdf``, an image extension, ``.txt`` for UTF-8 text, or ``""``.
+    """
+    for signature, suffix in _SIGNATURES:
+        if data.startswith(signature):
+            return suffix
+    head = data[:4096]
+    try:
+        # Incremental, so a character cut at the end of the head is fine.
+        codecs.getincrementaldecoder("utf-8")().decode(head)
+    except UnicodeDecodeError:
+        return ""
+    return ".txt" if b"\0" not in head else ""
@@ -0,0 +1,365 @@
+"""Persistent, content-addressed cache of extracted text.
+
+:func:`~invoice2data.input.extract_text` memoizes within one process only, so
+every CLI run and every batch worker used to re-parse (and re-OCR) the same
+documents. With the disk cache enabled, extracted text is also stored in a
+SQLite database that all processes share:
+
+- the key is a hash of the file's *content* (not its path or mtime) plus the
+  backend, the backend's configuration (:func:`cache_config` in
+  ``__interface__``) and the requested area, so a renamed or copied file still
+  hits and a changed one never does;
+- text is stored zlib-compressed;
+- the database runs in WAL mode with a busy timeout, so concurrent readers and
+  writers -- e.g. the workers of :func:`~invoice2data.extract_many` -- wait for
+  each other instead of failing;
+- the least recently used entries are evicted once the stored size passes a
+  bound. Triggers keep a running total, so a store does not scan the table,
+  and a hit refreshes an entry's age at most every :data:`TOUCH_INTERVAL`
+  seconds, so readers seldom write.
+
+Enable it with :func:`configure_disk_cache`, the ``INVOICE2DATA_CACHE_DIR``
+environment variable (size bound in MiB: ``INVOICE2DATA_CACHE_MAX_MB``) or the
+CLI's ``--cache-dir``. The cache is best-effort: a database error is logged and
+the text is extracted as if there were no cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from . import _memory
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "DiskTextCache",
+    "cache_key",
+    "configure_disk_cache",
+    "get_disk_cache",
+]
+
+#: Default bound on the compressed text stored, in bytes.
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+#: Seconds a hit may leave an entry's last-used time stale (eviction order is
+#: approximate to this much).
+TOUCH_INTERVAL = 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS texts (
+    key TEXT PRIMARY KEY,
+    text BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS texts_used ON texts (used);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO stats (name, value)
+    SELECT 'size', coalesce(sum(size), 0) FROM texts;
+CREATE TRIGGER IF NOT EXISTS texts_insert AFTER INSERT ON texts BEGIN
+    UPDATE stats SET value = value + new.size WHERE name = 'size';
+END;
+CREATE TRIGGER IF NOT EXISTS texts_delete AFTER DELETE ON texts BEGIN
+    UPDATE stats SET value = value - old.size WHERE name = 'size';
+END;
+"""
+
+
+class DiskTextCache:
+    """A size-bounded text cache in one SQLite file, safe across processes.
+
+    Args:
+        directory (str | os.PathLike[str]): Folder holding the database;
+            created if missing.
+        max_bytes (int): Evict least recently used entries beyond this much
+            compressed text.
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike[str], max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.path = self.directory / "texts.sqlite3"
+        self._local = threading.local()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the location only; the copy opens its own connections.
+
+        Returns:
+            tuple[Any, ...]: Constructor and arguments.
+        """
+        return (type(self), (self.directory, self.max_bytes))
+
+    def __repr__(self) -> str:
+        """Return a constructor-style representation.
+
+        Returns:
+            str: E.g. ``DiskTextCache('/tmp/c', max_bytes=1024)``.
+        """
+        return f"DiskTextCache({str(self.directory)!r}, max_bytes={self.max_bytes})"
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use.
+
+        Connections are neither shared between threads nor inherited across
+        ``fork``: a child process opens its own.
+
+        Returns:
+            sqlite3.Connection: An autocommit connection in WAL mode.
+        """
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            # So that REPLACE runs the delete trigger keeping the size total.
+            connection.execute("PRAGMA recursive_triggers=ON")
+            connection.executescript(_SCHEMA)
+            local.connection = connection
+            local.pid = os.getpid()
+        result: sqlite3.Connection = local.connection
+        return result
+
+    def get(self, key: str) -> str | None:
+        """Return the text stored under ``key``, marking it recently used.
+
+        An entry that cannot be decompressed is deleted and counts as a miss.
+
+        Args:
+            key (str): A key from :func:`cache_key`.
+
+        Returns:
+            str | None: The text, or None on a miss or a database error.
+        """
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                "SELECT text, used FROM texts WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            blob, used = row
+            try:
+                text = zlib.decompress(blob).decode("utf-8")
+            except (zlib.error, UnicodeDecodeError):
+                logger.warning("Text cache %s: dropping corrupt entry", self.path)
+                connection.execute("DELETE FROM texts WHERE key = ?", (key,))
+                return None
+            now = time.time()
+            if now - used > TOUCH_INTERVAL:
+                connection.execute(
+                    "UPDATE texts SET used = ? WHERE key = ?", (now, key)
+                )
+        except sqlite3.Error:
+            logger.warning("Text cache %s unreadable", self.path, exc_info=True)
+            return None
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store ``text`` under ``key``, then evict down to ``max_bytes``.
+
+        Args:
+            key (str): A key from :func:`cache_key`.
+            text (str): The extracted text.
+        """
+        blob = zlib.compress(text.encode("utf-8"))
+        try:
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO texts (key, text, size, used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, blob, len(blob), time.time()),
+            )
+            self._evict(connection)
+        except sqlite3.Error:
+            logger.warning("Text cache %s not writable", self.path, exc_info=True)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete least recently used entries until the total fits.
+
+        Args:
+            connection (sqlite3.Connection): This thread's connection.
+        """
+        (total,) = connection.execute(
+            "SELECT value FROM stats WHERE name = 'size'"
+        ).fetchone()
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+        freed = 0.0
+        doomed = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM texts ORDER BY used"
+        ):
+            doomed.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        connection.executemany("DELETE FROM texts WHERE key = ?", doomed)
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        try:
+            self._connection().execute("DELETE FROM texts")
+        except sqlite3.Error:
+            logger.warning("Text cache %s not writable", self.path, exc_info=True)
+
+
+#: The process-wide cache, once resolved (see :func:`get_disk_cache`).
+_cache: DiskTextCache | None = None
+_resolved = False
+
+
+def configure_disk_cache(
+    directory: str | os.PathLike[str] | None, max_bytes: int = DEFAULT_MAX_BYTES
+) -> DiskTextCache | None:
+    """Enable (or, with ``directory=None``, disable) the persistent text cache.
+
+    Overrides ``INVOICE2DATA_CACHE_DIR`` for this process and the workers of
+    :func:`~invoice2data.extract_many` it starts afterwards.
+
+    Args:
+        directory (str | os.PathLike[str] | None): Folder for the cache database,
+            or None to turn the cache off.
+        max_bytes (int): Size bound of the stored (compressed) text.
+
+    Returns:
+        DiskTextCache | None: The cache now in use.
+
+    Examples:
+        >>> from invoice2data.input.disk_cache import configure_disk_cache
+        >>> configure_disk_cache("~/.cache/invoice2data")  # doctest: +SKIP
+    """
+    global _cache, _resolved
+    _cache = None
+    if directory is not None:
+        _cache = DiskTextCache(Path(directory).expanduser(), max_bytes)
+    _resolved = True
+    return _cache
+
+
+def get_disk_cache() -> DiskTextCache | None:
+    """Return the cache in use, resolving the environment on first call.
+
+    Returns:
+        DiskTextCache | None: The cache, or None when it is disabled.
+    """
+    if not _resolved:
+        directory = os.environ.get("INVOICE2DATA_CACHE_DIR")
+        configure_disk_cache(directory or None, _max_bytes_from_env())
+    return _cache
+
+
+def _max_bytes_from_env() -> int:
+    """Read ``INVOICE2DATA_CACHE_MAX_MB`` (MiB, fractions allowed).
+
+    Returns:
+        int: The size bound in bytes; :data:`DEFAULT_MAX_BYTES`, with a
+            warning, when the variable is set but not a positive number.
+    """
+    value = os.environ.get("INVOICE2DATA_CACHE_MAX_MB", "").strip()
+    if not value:
+        return DEFAULT_MAX_BYTES
+    try:
+        megabytes = float(value)
+    except ValueError:
+        megabytes = 0
+    if not 0 < megabytes < float("inf"):
+        logger.warning(
+            "INVOICE2DATA_CACHE_MAX_MB=%r is not a positive number of MiB; "
+            "using the default",
+            value,
+        )
+        return DEFAULT_MAX_BYTES
+    return max(1, int(megabytes * 1024 * 1024))
+
+
+def cache_key(
+    module: ModuleType,
+    invoicefile: str,
+    mtime: float | None,
+    area_key: tuple[tuple[str, Any], ...] | None,
+    languages: tuple[str, ...] | None = None,
+) -> str:
+    """Return the cache key of one extraction.
+
+    Args:
+        module (ModuleType): The input backend.
+        invoicefile (str): Path to the document.
+        mtime (float | None): Its mtime, so the content hash is recomputed
+            only when the file changes.
+        area_key (tuple[tuple[str, Any], ...] | None): The sorted area items,
+            or None for the whole document.
+        languages (tuple[str, ...] | None): The requested OCR languages, or
+            None for the backend's default.
+
+    Returns:
+        str: A SHA-256 hex digest.
+    """
+    config = getattr(module, "cache_config", None)
+    parts = [
+        _content_hash(invoicefile, mtime),
+        module.__name__,
+        _version(),
+        config() if callable(config) else "",
+        area_key,
+    ]
+    if languages is not None:
+        parts.append(list(languages))
+    return hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _content_hash(invoicefile: str, mtime: float | None) -> str:
+    """Return the SHA-256 of a file's bytes, memoized per (path, mtime).
+
+    An in-memory document's name already carries its hash.
+
+    Args:
+        invoicefile (str): Path to the document, or an in-memory one's name.
+        mtime (float | None): Its mtime (cache key only).
+
+    Returns:
+        str: The hex digest.
+    """
+    in_memory = _memory.digest(invoicefile)
+    if in_memory is not None:
+        return in_memory
+    digest = hashlib.sha256()
+    with Path(invoicefile).open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _version() -> str:
+    """Return the installed invoice2data version (backend output may change).
+
+    Returns:
+        str: The version, or ``""`` when running from an uninstalled tree.
+    """
+    try:
+        return metadata.version("invoice2data")
+    except metadata.PackageNotFoundError:
+        return ""
@@ -6,13 +6,23 @@ without manual pre-processing (issue #526). Optional: install with
 weights download on first use). The OCR predictor is cached after the first call.
 
 docTR reads PDFs and images directly (PDF rendering via pypdfium2 under the hood),
-so this backend OCRs the whole document and has no area-restricted mode.
+so this backend OCRs the whole document and has no area-restricted mode. Pages
+go through the predictor separately and in parallel (see :mod:`.ocr_pool`; each
+concurrent page uses its own cached predictor), joined with form feeds in page
+order. :func:`to_text_batch` instead runs the predictor once per batch of pages
+gathered across many documents (see :func:`.ocr_pool.map_page_batches`).
 """
 
 import logging
+from collections.abc import Sequence
 from functools import lru_cache
 from typing import Any
 
+from . import pdfium
+from .ocr_pool import EngineSlots
+from .ocr_pool import map_page_batches
+from .ocr_pool import map_pages
+
 
 logger = logging.getLogger(__name__)
 
@@ -36,11 +46,23 @@ is_available = doctr_available
 #: docTR OCRs the whole document; it has no area-restricted mode.
 SUPPORTS_AREA = False
 
+#: Predictors are per slot (see :data:`_slots`); loading a PDF, which docTR
+#: does with pypdfium2, holds ``pdfium.LOCK``.
+THREAD_SAFE = True
+
+
+#: Lent to the pages OCR'd at the same time; :func:`_get_model` caches per slot.
+_slots = EngineSlots()
+
 
-@lru_cache(maxsize=1)
-def _get_model() -> Any:
+@lru_cache(maxsize=16)
+def _get_model(slot: int = 0) -> Any:
     """Build and cache the docTR OCR predictor (weights load on first call).
 
+    Args:
+        slot (int): The :data:`_slots` slot the predictor serves; predictors
+            are not shared between threads.
+
     Returns:
         Any: A pretrained ``ocr_predictor`` instance.
     """
@@ -53,18 +75,20 @@ def _render(result: Any) -> str:
     """Render a docTR result to plain text.
 
     Args:
-        result (Any): The docTR ``Document`` returned by the predictor.
+        result (Any): The docTR ``Document`` returned by the predictor, or
+            one of its pages.
 
     Returns:
-        str: The document text, one detected line per output line.
+        str: The text, one detected line per output line.
     """
     render = getattr(result, "render", None)
     if callable(render):
         return str(render())
     # Fallback: rebuild text from the stable export structure.
+    exported = result.export()
     lines = [
         " ".join(word["value"] for word in line.get("words", []))
-        for page in result.export().get("pages", [])
+        for page in exported.get("pages", [exported])
         for block in page.get("blocks", [])
         for line in block.get("lines", [])
     ]
@@ -89,11 +113,52 @@ def to_text(
             "docTR is not available. Install with 'pip install invoice2data[doctr]'"
         )
         return ""
+
+    def ocr_page(page: Any) -> str:
+        with _slots.borrow() as slot:
+            return _render(_get_model(slot)([page]))
+
+    return "\f".join(map_pages(ocr_page, list(_load(path))))
+
+
+def to_text_batch(paths: Sequence[str], batch_size: int | None = None) -> list[str]:
+    """OCR many documents, running the predictor once per batch of pages.
+
+    Args:
+        paths (Sequence[str]): Paths to the PDF or image files.
+        batch_size (int | None): Pages per predictor call; the configured
+            :func:`~invoice2data.input.ocr_pool.ocr_batch_size` when None.
+
+    Returns:
+        list[str]: Each document's text, as :func:`to_text` returns it, in
+            the order of ``paths``; empty strings if docTR is not available.
+    """
+    if not doctr_available():
+        logger.warning(
+            "docTR is not available. Install with 'pip install invoice2data[doctr]'"
+        )
+        return [""] * len(paths)
+
+    def ocr_batch(pages: list[Any]) -> list[str]:
+        with _slots.borrow() as slot:
+            result = _get_model(slot)(pages)
+        return [_render(page) for page in result.pages]
+
+    return map_page_batches(ocr_batch, map(_load, paths), batch_size)
+
+
+def _load(path: str) -> Any:
+    """Read a document's pages with docTR's loaders.
+
+    Args:
+        path (str): Path to the PDF or image file.
+
+    Returns:
+        Any: The page images (a list of arrays).
+    """
     from doctr.io import DocumentFile
 
     if path.lower().endswith(".pdf"):
-        document = DocumentFile.from_pdf(path)
-    else:
-        document = DocumentFile.from_images(path)
-    result = _get_model()(document)
-    return _render(result)
+        with pdfium.LOCK:
+            return DocumentFile.from_pdf(path)
+    return DocumentFile.from_images(path)
@@ -39,6 +39,9 @@ is_available = have_google_cloud
 #: Google Vision OCRs the whole document; it has no area-restricted mode.
 SUPPORTS_AREA = False
 
+#: Each call makes its own client and cloud requests.
+THREAD_SAFE = True
+
 
 def to_text(path: str, bucket_name: str | None = None, language: str = "en") -> str:
     """Sends PDF files to Google Cloud Vision for OCR.
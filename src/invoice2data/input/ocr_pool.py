@@ -0,0 +1,281 @@
+"""Bounded, order-preserving parallelism across the pages of one document.
+
+The OCR backends (:mod:`.tesseract`, :mod:`.paddleocr`, :mod:`.doctr`) used to
+OCR a multi-page scan in one pass, on one core. They now rasterize the pages
+separately and hand them to :func:`map_pages`, which OCRs up to
+:func:`max_ocr_workers` pages at a time and returns the results in page order.
+The engines release the GIL while they work (tesseract runs as child
+processes), so threads are enough. Engines that must not be shared between
+threads are cached per :class:`EngineSlots` slot: a page borrows the lowest
+free slot, so a document never builds more engines than pages it OCRs at once.
+
+Set the bound with :func:`configure_ocr_workers`, the
+``INVOICE2DATA_MAX_OCR_WORKERS`` environment variable or the CLI's
+``--max-ocr-workers``; ``1`` OCRs pages one after another. It applies per
+document: :func:`~invoice2data.extract_many` workers each get their own pool,
+so lower it when extracting many scans in parallel.
+
+Deep-learning engines are faster still on batches of pages. Their
+``to_text_batch`` functions gather the pages of many documents into batches of
+:func:`ocr_batch_size` pages with :func:`map_page_batches` and run the model
+once per batch. Set the size with :func:`configure_ocr_batch_size`, the
+``INVOICE2DATA_OCR_BATCH_SIZE`` environment variable or the CLI's
+``--ocr-batch-size``; lower it on CPU-only hosts, where a batch is not much
+faster than its pages one by one but takes as much memory as all of them.
+"""
+
+import heapq
+import os
+import threading
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sized
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TypeVar
+
+
+__all__ = [
+    "DEFAULT_MAX_OCR_WORKERS",
+    "DEFAULT_OCR_BATCH_SIZE",
+    "MAX_OCR_WORKERS_ENV",
+    "OCR_BATCH_SIZE_ENV",
+    "EngineSlots",
+    "configure_ocr_batch_size",
+    "configure_ocr_workers",
+    "map_page_batches",
+    "map_pages",
+    "max_ocr_workers",
+    "ocr_batch_size",
+]
+
+#: Environment variable holding the default bound.
+MAX_OCR_WORKERS_ENV = "INVOICE2DATA_MAX_OCR_WORKERS"
+
+#: Default bound when neither the function nor the environment sets one.
+DEFAULT_MAX_OCR_WORKERS = 4
+
+#: Environment variable holding the default batch size.
+OCR_BATCH_SIZE_ENV = "INVOICE2DATA_OCR_BATCH_SIZE"
+
+#: Default batch size when neither the function nor the environment sets one.
+DEFAULT_OCR_BATCH_SIZE = 8
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+_configured: int | None = None
+_configured_batch_size: int | None = None
+
+
+def configure_ocr_workers(workers: int | None) -> None:
+    """Set how many pages of one document are OCRed at a time.
+
+    Overrides ``INVOICE2DATA_MAX_OCR_WORKERS`` for this process and the
+    workers of :func:`~invoice2data.extract_many` it starts afterwards.
+
+    Args:
+        workers (int | None): The bound (at least 1), or None to go back to
+            the environment variable and the default.
+
+    Raises:
+        ValueError: If ``workers`` is below 1.
+
+    Examples:
+        >>> from invoice2data import configure_ocr_workers
+        >>> configure_ocr_workers(2)  # doctest: +SKIP
+    """
+    global _configured
+    if workers is not None and workers < 1:
+        raise ValueError(f"max OCR workers must be at least 1, got {workers}")
+    _configured = workers
+
+
+def max_ocr_workers() -> int:
+    """Return how many pages of one document may be OCRed at a time.
+
+    Returns:
+        int: The configured bound, else ``INVOICE2DATA_MAX_OCR_WORKERS``,
+            else the CPU count capped at :data:`DEFAULT_MAX_OCR_WORKERS`.
+    """
+    if _configured is not None:
+        return _configured
+    value = os.environ.get(MAX_OCR_WORKERS_ENV, "")
+    if value.strip().isdigit() and int(value) >= 1:
+        return int(value)
+    return min(DEFAULT_MAX_OCR_WORKERS, os.cpu_count() or 1)
+
+
+def configure_ocr_batch_size(size: int | None) -> None:
+    """Set how many pages batch OCR runs through a model at once.
+
+    Overrides ``INVOICE2DATA_OCR_BATCH_SIZE`` for this process.
+
+    Args:
+        size (int | None): The batch size (at least 1), or None to go back to
+            the environment variable and the default.
+
+    Raises:
+        ValueError: If ``size`` is below 1.
+
+    Examples:
+        >>> from invoice2data import configure_ocr_batch_size
+        >>> configure_ocr_batch_size(4)  # doctest: +SKIP
+    """
+    global _configured_batch_size
+    if size is not None and size < 1:
+        raise ValueError(f"OCR batch size must be at least 1, got {size}")
+    _configured_batch_size = size
+
+
+def ocr_batch_size() -> int:
+    """Return how many pages batch OCR runs through a model at once.
+
+    Returns:
+        int: The configured size, else ``INVOICE2DATA_OCR_BATCH_SIZE``, else
+            :data:`DEFAULT_OCR_BATCH_SIZE`.
+    """
+    if _configured_batch_size is not None:
+        return _configured_batch_size
+    value = os.environ.get(OCR_BATCH_SIZE_ENV, "")
+    if value.strip().isdigit() and int(value) >= 1:
+        return int(value)
+    return DEFAULT_OCR_BATCH_SIZE
+
+
+def map_pages(
+    func: Callable[[_T], _R], pages: Iterable[_T], prefetch: int = 0
+) -> list[_R]:
+    """Apply ``func`` to every page, up to :func:`max_ocr_workers` at a time.
+
+    ``pages`` is consumed lazily on the calling thread, one page per free
+    worker, so a generator rendering pages keeps at most that many in memory
+    (and may use libraries that must stay on one thread).
+
+    Args:
+        func (Callable[[_T], _R]): OCRs one page.
+        pages (Iterable[_T]): The pages (images, paths, ...), in order.
+        prefetch (int): Pages to take from ``pages`` ahead of the busy
+            workers, so rendering the next page overlaps OCRing this one.
+            With a prefetch even a single worker runs off the calling thread.
+
+    Returns:
+        list[_R]: The results, in page order. The first exception raised by
+            ``func`` propagates once the started pages are done.
+    """
+    workers = max_ocr_workers()
+    if isinstance(pages, Sized):
+        workers = min(workers, len(pages))
+    if workers <= 1 and prefetch <= 0:
+        return [func(page) for page in pages]
+    results: list[_R] = []
+    in_flight = max(workers, 1) + max(prefetch, 0)
+    with ThreadPoolExecutor(workers, thread_name_prefix="invoice2data-ocr") as pool:
+        pending: deque[Future[_R]] = deque()
+        for page in pages:
+            pending.append(pool.submit(func, page))
+            del page  # only the pending job holds it now
+            if len(pending) == in_flight:
+                results.append(pending.popleft().result())
+        results.extend(future.result() for future in pending)
+    return results
+
+
+def map_page_batches(
+    func: Callable[[list[_T]], list[str]],
+    documents: Iterable[Iterable[_T]],
+    size: int | None = None,
+) -> list[str]:
+    """OCR the pages of many documents in batches, returning each one's text.
+
+    Pages are taken in document order and handed to ``func`` ``size`` at a
+    time, so a batch may span documents; only one batch of pages is held at
+    once. The texts are scattered back to their documents.
+
+    Args:
+        func (Callable[[list[_T]], list[str]]): OCRs a batch of pages,
+            returning one text per page.
+        documents (Iterable[Iterable[_T]]): Each document's pages, in order.
+        size (int | None): Pages per batch; :func:`ocr_batch_size` when None.
+
+    Returns:
+        list[str]: One text per document, its pages joined with form feeds.
+
+    Raises:
+        ValueError: If ``func`` returns a different number of texts than it
+            was given pages.
+    """
+    texts: list[list[str]] = []
+    for owners, batch in _batches(documents, size or ocr_batch_size(), texts):
+        results = func(batch)
+        if len(results) != len(batch):
+            raise ValueError(
+                f"OCR returned {len(results)} texts for {len(batch)} pages"
+            )
+        for owner, result in zip(owners, results, strict=False):
+            texts[owner].append(result)
+    return ["\f".join(pages) for pages in texts]
+
+
+def _batches(
+    documents: Iterable[Iterable[_T]], size: int, texts: list[list[str]]
+) -> Iterator[tuple[list[int], list[_T]]]:
+    """Cut the pages of many documents into batches.
+
+    Args:
+        documents (Iterable[Iterable[_T]]): Each document's pages, in order.
+        size (int): Pages per batch.
+        texts (list[list[str]]): Gets an empty list per document read.
+
+    Yields:
+        tuple[list[int], list[_T]]: The index in ``texts`` of each page's
+            document, and the pages.
+    """
+    owners: list[int] = []
+    batch: list[_T] = []
+    for document in documents:
+        texts.append([])
+        for page in document:
+            owners.append(len(texts) - 1)
+            batch.append(page)
+            if len(batch) == size:
+                yield owners, batch
+                owners, batch = [], []
+    if batch:
+        yield owners, batch
+
+
+class EngineSlots:
+    """Small integers lent to concurrent callers, lowest free one first.
+
+    A backend caches its engines per ``(settings, slot)`` and borrows a slot
+    around each page, so no engine is used by two threads at once and serial
+    runs keep reusing slot 0.
+    """
+
+    def __init__(self) -> None:
+        self._free: list[int] = []
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def borrow(self) -> Iterator[int]:
+        """Lend a slot no other caller holds until the block exits.
+
+        Yields:
+            int: The slot.
+        """
+        with self._lock:
+            if self._free:
+                slot = heapq.heappop(self._free)
+            else:
+                slot = self._count
+                self._count += 1
+        try:
+            yield slot
+        finally:
+            with self._lock:
+                heapq.heappush(self._free, slot)
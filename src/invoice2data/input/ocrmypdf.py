@@ -1,11 +1,18 @@
-"""OCRmyPDF input module for invoice2data."""
+"""OCRmyPDF input module for invoice2data.
+
+The cleaned, text-layered PDF OCRmyPDF produces is kept per source content and
+settings (up to :data:`OCR_CACHE_BYTES` of them, see :mod:`._artifacts`), so
+the full text and every ``area`` field of a document are read from one OCR run.
+"""
 
 import logging
 import tempfile
+from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import Any
 
 from . import pdftotext
+from ._artifacts import ArtifactStore
 
 
 logger = logging.getLogger(__name__)
@@ -50,6 +57,22 @@ RECOMMENDED_SCAN_OPTIONS = {
 }
 
 
+#: Disk space the OCRed PDFs kept for :func:`to_text` may take.
+OCR_CACHE_BYTES = 256 * 1024 * 1024
+
+#: OCRmyPDF's output per document content and settings.
+_ocr_pdfs = ArtifactStore("invoice2data-ocrmypdf-", ".pdf", OCR_CACHE_BYTES)
+
+
+def cache_config() -> str:
+    """Return the OCR options, part of the persistent text-cache key.
+
+    Returns:
+        str: :data:`OPTIONS_DEFAULT`, canonicalized.
+    """
+    return repr(sorted(OPTIONS_DEFAULT.items()))
+
+
 def to_text(
     path: str,
     area_details: dict[str, Any] | None = None,
@@ -80,13 +103,39 @@ def to_text(
 
     logger.debug("Input reader config received: %s", input_reader_config)
 
-    pre_proc_output = pre_process_pdf(path, pre_conf=input_reader_config)
+    if "output_file" in input_reader_config:
+        pre_proc_output = pre_process_pdf(path, pre_conf=input_reader_config)
+        return (
+            pdftotext.to_text(pre_proc_output, area_details) if pre_proc_output else ""
+        )
 
-    if pre_proc_output:
-        return pdftotext.to_text(pre_proc_output, area_details)
+    with _ocr_pdf(path, input_reader_config) as pre_proc_output:
+        if pre_proc_output:
+            return pdftotext.to_text(pre_proc_output, area_details)
     return ""
 
 
+def _ocr_pdf(path: str, pre_conf: dict[str, Any]) -> AbstractContextManager[str | None]:
+    """Pin the OCRed PDF of ``path``, running OCRmyPDF on a miss.
+
+    Args:
+        path (str): Path to the PDF invoice file.
+        pre_conf (dict[str, Any]): Settings forwarded to ``ocrmypdf.ocr``,
+            without an ``output_file`` (such output is not cached).
+
+    Returns:
+        AbstractContextManager[str | None]: Gives the path to the kept PDF,
+            not evicted until the block exits, or None if OCRmyPDF failed.
+    """
+
+    def build(target: Path) -> bool:
+        conf = {**pre_conf, "output_file": str(target)}
+        return pre_process_pdf(path, pre_conf=conf) is not None
+
+    config = repr(sorted({**OPTIONS_DEFAULT, **pre_conf}.items()))
+    return _ocr_pdfs.fetch(path, config, build)
+
+
 def pre_process_pdf(path: str, pre_conf: dict[str, Any] | None = None) -> str | None:
     """Pre-process a PDF with ocrmypdf, returning the cleaned PDF path.
 
@@ -5,16 +5,31 @@ install with ``pip install invoice2data[paddleocr]`` (pulls in paddleocr +
 paddlepaddle + pypdfium2; model weights download on first use). The OCR engine is
 cached after the first call.
 
-PaddleOCR works on images, so PDFs are rendered to page images with pypdfium2
-first. The whole document is OCR'd; there is no area-restricted mode. The result
+PaddleOCR works on images, so PDFs are rendered to page images with pypdfium2.
+Pages are rendered one at a time as the OCR workers take them, plus one page
+of prefetch so the next render overlaps inference, and each bitmap is released
+once its page is OCR'd: peak memory depends on the worker count, not the page
+count. The pages are OCR'd in parallel (see :mod:`.ocr_pool`; each concurrent
+page uses its own cached engine) and joined with form feeds in page order.
+:func:`to_text_batch` instead runs the engine once per batch of pages gathered
+across many documents (see :func:`.ocr_pool.map_page_batches`). The
+whole document is OCR'd; there is no area-restricted mode. The result
 parser handles both the PaddleOCR 2.x (``[box, (text, score)]``) and 3.x
 (``{"rec_texts": [...]}``) shapes defensively.
 """
 
 import logging
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
 from functools import lru_cache
 from typing import Any
 
+from . import pdfium as _pdfium
+from .ocr_pool import EngineSlots
+from .ocr_pool import map_page_batches
+from .ocr_pool import map_pages
+
 
 logger = logging.getLogger(__name__)
 
@@ -38,13 +53,25 @@ is_available = paddleocr_available
 #: PaddleOCR OCRs the whole document; it has no area-restricted mode.
 SUPPORTS_AREA = False
 
+#: Engines are per slot (see :data:`_slots`); rendering holds ``pdfium.LOCK``.
+THREAD_SAFE = True
+
+
+#: Pages rendered ahead of the busy OCR workers.
+_PREFETCH = 1
 
-@lru_cache(maxsize=4)
-def _get_ocr(lang: str = "en") -> Any:
+#: Lent to the pages OCR'd at the same time; :func:`_get_ocr` caches per slot.
+_slots = EngineSlots()
+
+
+@lru_cache(maxsize=16)
+def _get_ocr(lang: str = "en", slot: int = 0) -> Any:
     """Build and cache a PaddleOCR engine for a language (weights load lazily).
 
     Args:
         lang (str): PaddleOCR language code. Defaults to "en".
+        slot (int): The :data:`_slots` slot the engine serves; engines are not
+            shared between threads.
 
     Returns:
         Any: A ``PaddleOCR`` instance.
@@ -54,22 +81,34 @@ def _get_ocr(lang: str = "en") -> Any:
     return PaddleOCR(lang=lang)
 
 
-def _page_arrays(path: str) -> list[Any]:
-    """Render a PDF's pages to image arrays with pypdfium2.
+def _page_arrays(path: str) -> Iterator[Any]:
+    """Render a PDF's pages to image arrays with pypdfium2, one at a time.
 
     Args:
         path (str): Path to the PDF file.
 
-    Returns:
-        list[Any]: One rendered page image (numpy array) per page.
+    Yields:
+        Any: One rendered page image (numpy array) per page, in order; the
+            document is closed once the generator is exhausted or dropped.
     """
     import pypdfium2 as pdfium
 
-    pdf = pdfium.PdfDocument(path)
+    with _pdfium.LOCK:
+        pdf = pdfium.PdfDocument(path)
+        count = len(pdf)
     try:
-        return [page.render(scale=2).to_numpy() for page in pdf]
+        for index in range(count):
+            with _pdfium.LOCK:
+                page = pdf[index]
+                try:
+                    image = page.render(scale=2).to_numpy()
+                finally:
+                    page.close()
+            yield image
+            del image
     finally:
-        pdf.close()
+        with _pdfium.LOCK:
+            pdf.close()
 
 
 def _extract_text(result: Any) -> str:
@@ -118,7 +157,52 @@ def to_text(
             "Install with 'pip install invoice2data[paddleocr]'"
         )
         return ""
-    ocr = _get_ocr(kwargs.get("lang", "en"))
-    sources = _page_arrays(path) if path.lower().endswith(".pdf") else [path]
-    pages = [_extract_text(ocr.ocr(source)) for source in sources]
-    return "\n".join(page for page in pages if page)
+    lang = kwargs.get("lang", "en")
+
+    def ocr_page(source: Any) -> str:
+        with _slots.borrow() as slot:
+            return _extract_text(_get_ocr(lang, slot).ocr(source))
+
+    if not path.lower().endswith(".pdf"):
+        return ocr_page(path)
+    return "\f".join(map_pages(ocr_page, _page_arrays(path), _PREFETCH))
+
+
+def to_text_batch(
+    paths: Sequence[str], batch_size: int | None = None, **kwargs: Any
+) -> list[str]:
+    """OCR many documents, running the engine once per batch of pages.
+
+    PaddleOCR 3.x predicts a list of images in one call; 2.x engines, which
+    take one image per call, go through the batch page by page.
+
+    Args:
+        paths (Sequence[str]): Paths to the PDF or image files.
+        batch_size (int | None): Pages per engine call; the configured
+            :func:`~invoice2data.input.ocr_pool.ocr_batch_size` when None.
+        **kwargs (Any): Optional ``lang``, as for :func:`to_text`.
+
+    Returns:
+        list[str]: Each document's text, as :func:`to_text` returns it, in
+            the order of ``paths``; empty strings if PaddleOCR is not
+            available.
+    """
+    if not paddleocr_available():
+        logger.warning(
+            "PaddleOCR is not available. "
+            "Install with 'pip install invoice2data[paddleocr]'"
+        )
+        return [""] * len(paths)
+    lang = kwargs.get("lang", "en")
+
+    def ocr_batch(pages: list[Any]) -> list[str]:
+        with _slots.borrow() as slot:
+            engine = _get_ocr(lang, slot)
+            if callable(getattr(engine, "predict", None)):  # PaddleOCR 3.x
+                return [_extract_text([result]) for result in engine.predict(pages)]
+            return [_extract_text(engine.ocr(page)) for page in pages]
+
+    def pages(path: str) -> Iterable[Any]:
+        return _page_arrays(path) if path.lower().endswith(".pdf") else [path]
+
+    return map_page_batches(ocr_batch, map(pages, paths), batch_size)
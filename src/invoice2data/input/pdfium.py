@@ -6,12 +6,25 @@ mode), so layout-sensitive templates should still pin ``input_module: pdftotext`
 Area (region) extraction is supported in-process via PDFium's
 ``get_text_bounded``; note its output is not identical to pdftotext's area output,
 so an area template targets one backend's text, not both.
+
+A template's full-text read and each of its ``area`` fields are separate
+calls, so the parsed document and its text pages are kept open in a small
+pool (:data:`_documents`, keyed by path and mtime) and shared between them:
+an area-heavy template parses its PDF once. The file is read into memory when
+opened, so a pooled document does not hold it open (Windows could not move or
+delete it otherwise).
 """
 
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from logging import getLogger
+from pathlib import Path
 from typing import Any
 
 from ..exceptions import TemplateSyntaxError
+from . import _memory
 
 
 logger = getLogger(__name__)
@@ -19,6 +32,21 @@ logger = getLogger(__name__)
 #: PDFium can extract a bounded region in-process (see _crop_pages).
 SUPPORTS_AREA = True
 
+#: Documents are read into memory anyway, so in-memory ones need no file.
+SUPPORTS_BYTES = True
+
+#: Each call into PDFium holds the lock below, so concurrent callers are safe.
+THREAD_SAFE = True
+
+#: Documents kept open at once; the least recently used is closed beyond it.
+_POOL_SIZE = 4
+
+#: Held around every call into PDFium, which must not be entered from two
+#: threads at once: by this backend and by everything else that opens PDFs
+#: with pypdfium2 (:mod:`.triage`, and the rendering in :mod:`.tesseract`,
+#: :mod:`.paddleocr` and :mod:`.doctr`). Other backends do not wait for it.
+LOCK = threading.RLock()
+
 
 def is_available() -> bool:
     """Return whether the optional ``pypdfium2`` package is importable.
@@ -47,24 +75,40 @@ def to_text(
     Returns:
         str: The extracted text, pages joined by newlines.
     """
-    import pypdfium2
-
-    document = pypdfium2.PdfDocument(path)
-    try:
+    with _documents.open(path) as document:
         if area_details is not None:
             pages = _crop_pages(document, area_details)
         else:
             pages = [
-                document[index].get_textpage().get_text_bounded()
+                document.textpage(index).get_text_bounded()
                 for index in range(len(document))
             ]
-    finally:
-        document.close()
     logger.debug("Text extraction made with pypdfium2")
     return _post_process("\n".join(pages))
 
 
-def _crop_pages(document: Any, area: dict[str, Any]) -> list[str]:
+def to_text_head(path: str, pages: int) -> tuple[str, bool]:
+    """Extract the text of the first ``pages`` pages only.
+
+    Args:
+        path (str): Path to the PDF file.
+        pages (int): How many leading pages to read.
+
+    Returns:
+        tuple[str, bool]: The text, as :func:`to_text` would produce it for
+            those pages, and whether they are the whole document (the text is
+            then exactly :func:`to_text`'s).
+    """
+    with _documents.open(path) as document:
+        count = len(document)
+        texts = [
+            document.textpage(index).get_text_bounded()
+            for index in range(min(pages, count))
+        ]
+    return _post_process("\n".join(texts)), count <= pages
+
+
+def _crop_pages(document: "_Document", area: dict[str, Any]) -> list[str]:
     """Extract each page's text within the area rectangle.
 
     The area is pixels at dpi ``r`` with a top-left origin (poppler convention);
@@ -72,7 +116,7 @@ def _crop_pages(document: Any, area: dict[str, Any]) -> list[str]:
     (``pt = px * 72 / r``) and the y axis is flipped using the page height.
 
     Args:
-        document (Any): An open ``pypdfium2.PdfDocument``.
+        document (_Document): An open document from :data:`_documents`.
         area (dict[str, Any]): Keys f, l, r, x, y, W, H.
 
     Returns:
@@ -94,20 +138,150 @@ def _crop_pages(document: Any, area: dict[str, Any]) -> list[str]:
 
     pages: list[str] = []
     for index in range(first - 1, min(last, len(document))):
-        page = document[index]
-        _, page_height = page.get_size()
+        _, page_height = document.page(index).get_size()
         left = x * factor
         right = (x + width) * factor
         top = page_height - y * factor
         bottom = page_height - (y + height) * factor
         pages.append(
-            page.get_textpage().get_text_bounded(
+            document.textpage(index).get_text_bounded(
                 left=left, bottom=bottom, right=right, top=top
             )
         )
     return pages
 
 
+class _Document:
+    """An open PDFium document whose pages and text pages are loaded once.
+
+    Args:
+        path (str): Path to the PDF file (read into memory), or an in-memory
+            document's name.
+    """
+
+    def __init__(self, path: str) -> None:
+        import pypdfium2
+
+        self.pdf = pypdfium2.PdfDocument(_memory.read_bytes(path))
+        self._pages: dict[int, tuple[Any, Any]] = {}
+
+    def __len__(self) -> int:
+        """Return the page count.
+
+        Returns:
+            int: Pages in the document.
+        """
+        return len(self.pdf)
+
+    def page(self, index: int) -> Any:
+        """Return a page, loading it on first use.
+
+        Args:
+            index (int): 0-based page index.
+
+        Returns:
+            Any: The ``pypdfium2.PdfPage``.
+        """
+        return self._load(index)[0]
+
+    def textpage(self, index: int) -> Any:
+        """Return a page's text page, built on first use.
+
+        Args:
+            index (int): 0-based page index.
+
+        Returns:
+            Any: The ``pypdfium2.PdfTextPage``.
+        """
+        return self._load(index)[1]
+
+    def close(self) -> None:
+        """Close the text pages, the pages and then the document."""
+        for page, textpage in self._pages.values():
+            textpage.close()
+            page.close()
+        self._pages.clear()
+        self.pdf.close()
+
+    def _load(self, index: int) -> tuple[Any, Any]:
+        """Return a page and its text page, loading them on first use.
+
+        Args:
+            index (int): 0-based page index.
+
+        Returns:
+            tuple[Any, Any]: The page and its text page.
+        """
+        loaded = self._pages.get(index)
+        if loaded is None:
+            page = self.pdf[index]
+            loaded = self._pages[index] = (page, page.get_textpage())
+        return loaded
+
+
+class _DocumentPool:
+    """Open documents per (path, mtime), the least recently used closed first.
+
+    Args:
+        size (int): Documents kept open at once.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._entries: OrderedDict[tuple[str, float], _Document] = OrderedDict()
+        # Held while a document is in use, so none is closed under a reader.
+        self._lock = LOCK
+
+    @contextmanager
+    def open(self, path: str) -> Iterator[_Document]:
+        """Lend the open document of ``path``, opening it on a miss.
+
+        Args:
+            path (str): Path to the PDF file.
+
+        Yields:
+            _Document: The document, open until the block exits.
+        """
+        key = (path, _mtime(path))
+        with self._lock:
+            document = self._entries.get(key)
+            if document is None:
+                document = _Document(path)
+                for stale in [entry for entry in self._entries if entry[0] == path]:
+                    self._entries.pop(stale).close()  # the file has changed
+                self._entries[key] = document
+                while len(self._entries) > self.size:
+                    self._entries.popitem(last=False)[1].close()
+            else:
+                self._entries.move_to_end(key)
+            yield document
+
+    def clear(self) -> None:
+        """Close every pooled document."""
+        with self._lock:
+            while self._entries:
+                self._entries.popitem()[1].close()
+
+
+#: The documents shared by :func:`to_text` and :func:`to_text_head` calls.
+_documents = _DocumentPool(_POOL_SIZE)
+
+
+def _mtime(path: str) -> float:
+    """Return the file's mtime (pool key), or 0.0 if it cannot be read.
+
+    Args:
+        path (str): File path.
+
+    Returns:
+        float: Modification time, or 0.0.
+    """
+    try:
+        return Path(path).stat().st_mtime
+    except OSError:
+        return 0.0
+
+
 def _post_process(text: str) -> str:
     r"""Normalise pypdfium2 text artifacts for template matching.
 
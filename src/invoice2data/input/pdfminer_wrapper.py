@@ -1,9 +1,17 @@
 """pdminer input module for invoice2data."""
 
 from io import StringIO
-from pathlib import Path
 from typing import Any
 
+from ._memory import open_binary
+
+
+#: Pure Python; every call parses with its own objects.
+THREAD_SAFE = True
+
+#: pdfminer parses file objects, so in-memory documents need no file.
+SUPPORTS_BYTES = True
+
 
 def is_available() -> bool:
     """Return whether the optional ``pdfminer.six`` package is importable.
@@ -20,7 +28,7 @@ def to_text(path: str, **kwargs: dict[str, Any]) -> str:
     """Wrapper around `pdfminer` to extract text from PDF.
 
     Args:
-        path (str): Path to the PDF file.
+        path (str): Path to the PDF file, or an in-memory document's name.
         **kwargs (dict[str, Any]): Keyword arguments to be passed to `pdfminer`.
 
     Returns:
@@ -37,7 +45,7 @@ def to_text(path: str, **kwargs: dict[str, Any]) -> str:
     laparams = LAParams()
     laparams.all_texts = True
     device = TextConverter(rsrcmgr, retstr, laparams=laparams)
-    with Path(path).open("rb") as fp:
+    with open_binary(path) as fp:
         interpreter = PDFPageInterpreter(rsrcmgr, device)
         password = ""
         maxpages = 0
@@ -1,11 +1,21 @@
 """pdfplumber input module for invoice2data."""
 
+from io import BytesIO
 from logging import getLogger
 from typing import Any
 
+from ._memory import is_memory
+from ._memory import read_bytes
+
 
 logger = getLogger(__name__)
 
+#: pdfplumber opens file objects, so in-memory documents need no file.
+SUPPORTS_BYTES = True
+
+#: Each call parses its own document in pure Python.
+THREAD_SAFE = True
+
 
 def is_available() -> bool:
     """Return whether the optional ``pdfplumber`` package is importable.
@@ -22,7 +32,7 @@ def to_text(path: str, **kwargs: dict[str, Any]) -> str:
     """Extract text from PDF using pdfplumber.
 
     Args:
-        path (str): Path to the PDF file.
+        path (str): Path to the PDF file, or an in-memory document's name.
         **kwargs (dict[str, Any]): Keyword arguments to be passed to `pdfplumber`.
 
     Returns:
@@ -37,7 +47,8 @@ def to_text(path: str, **kwargs: dict[str, Any]) -> str:
         logger.exception("Cannot import pdfplumber")
         raise
 
-    with pdfplumber.open(path, laparams={"detect_vertical": True}) as pdf:
+    source = BytesIO(read_bytes(path)) if is_memory(path) else path
+    with pdfplumber.open(source, laparams={"detect_vertical": True}) as pdf:
         raw_text = ""
         for page in pdf.pages:
             # The layout/tolerance params emulate `pdftotext -layout`, which the
@@ -4,22 +4,32 @@ Full-page extraction shells out to ``pdftotext -layout``. Area (region) extracti
 no longer re-runs ``pdftotext`` per area: word positions are read once via
 ``pdftotext -bbox-layout`` (cached per file) and the requested rectangle is cropped
 in Python, so several area fields on one document cost a single parse.
+
+In-memory documents are piped to the tool's stdin, without a temporary file.
 """
 
 import html
+import locale
 import re
 import shutil
-from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from ..exceptions import TemplateSyntaxError
+from ._boxes import Word
+from ._boxes import WordBoxes
+from ._boxes import WordCache
+from ._memory import is_memory
+from ._memory import read_bytes
 
 
 SUPPORTS_AREA = True
 
-#: A parsed word: ``(page, xMin, yMin, xMax, yMax, text)`` with coords in points.
-_Word = tuple[int, float, float, float, float, str]
+#: Each call runs its own pdftotext process.
+THREAD_SAFE = True
+
+#: In-memory documents go to pdftotext's stdin.
+SUPPORTS_BYTES = True
 
 #: Tokenizer for ``pdftotext -bbox-layout`` output: page boundaries + words with
 #: their bounding boxes (in PDF points).
@@ -32,6 +42,12 @@ _BBOX_TOKEN = re.compile(
 #: Words within this many points of each other's top are treated as one line.
 _LINE_TOLERANCE = 3.0
 
+#: Memory the word boxes of recently cropped documents may hold.
+WORD_CACHE_BYTES = 64 * 1024 * 1024
+
+#: Word boxes per ``(path, mtime)``.
+_word_cache = WordCache(WORD_CACHE_BYTES)
+
 
 def is_available() -> bool:
     """Return whether the poppler ``pdftotext`` binary is on the PATH.
@@ -57,24 +73,42 @@ def _mtime(path: str) -> float:
         return 0.0
 
 
-@lru_cache(maxsize=64)
-def _words(path: str, mtime: float) -> tuple[_Word, ...]:
-    """Parse word positions from ``pdftotext -bbox-layout`` once, cached per file.
+def _words(path: str, mtime: float) -> WordBoxes:
+    """Return the word positions of a document, parsed once per file.
+
+    Kept in :data:`_word_cache`; parsed with :func:`_bbox_words` on a miss.
 
     Args:
         path (str): PDF path.
         mtime (float): File mtime, part of the cache key so edits re-parse.
 
     Returns:
-        tuple[_Word, ...]: One word box per word, in points.
+        WordBoxes: The document's word boxes, in points.
+    """
+    boxes = _word_cache.get((path, mtime))
+    if boxes is None:
+        boxes = _bbox_words(path)
+        _word_cache.put((path, mtime), boxes)
+    return boxes
+
+
+def _bbox_words(path: str) -> WordBoxes:
+    """Parse word positions from ``pdftotext -bbox-layout``.
+
+    Args:
+        path (str): PDF path.
+
+    Returns:
+        WordBoxes: One word box per word, in points.
     """
     import subprocess
 
-    cmd = ["pdftotext", "-bbox-layout", "-q", path, "-"]
-    proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    words: list[_Word] = []
+    cmd = ["pdftotext", "-bbox-layout", "-q", _argument(path), "-"]
+    proc = subprocess.run(cmd, capture_output=True, check=False, input=_stdin(path))
+    stdout = proc.stdout.decode(locale.getpreferredencoding(False), errors="replace")
+    words: list[Word] = []
     page = 0
-    for match in _BBOX_TOKEN.finditer(proc.stdout):
+    for match in _BBOX_TOKEN.finditer(stdout):
         if match.group(1) is None:  # a <page> token
             page += 1
             continue
@@ -89,10 +123,10 @@ def _words(path: str, mtime: float) -> tuple[_Word, ...]:
                 html.unescape(text),
             )
         )
-    return tuple(words)
+    return WordBoxes(words)
 
 
-def _crop(words: tuple[_Word, ...], area: dict[str, Any]) -> str:
+def _crop(words: WordBoxes, area: dict[str, Any]) -> str:
     """Return the text of the words inside an area rectangle.
 
     The area is given in pixels at ``r`` dpi (pdftotext's convention); word boxes
@@ -100,7 +134,7 @@ def _crop(words: tuple[_Word, ...], area: dict[str, Any]) -> str:
     words are grouped into lines by vertical position and joined left-to-right.
 
     Args:
-        words (tuple[_Word, ...]): Word boxes from :func:`_words`.
+        words (WordBoxes): Word boxes from :func:`_words`.
         area (dict[str, Any]): Keys f, l, r, x, y, W, H.
 
     Returns:
@@ -113,15 +147,10 @@ def _crop(words: tuple[_Word, ...], area: dict[str, Any]) -> str:
     x1 = (float(area["x"]) + float(area["W"])) * factor
     y1 = (float(area["y"]) + float(area["H"])) * factor
 
-    selected = [
-        w
-        for w in words
-        if first <= w[0] <= last and w[1] < x1 and w[3] > x0 and w[2] < y1 and w[4] > y0
-    ]
-    selected.sort(key=lambda w: (w[0], w[2], w[1]))
+    selected = words.select(first, last, x0, y0, x1, y1)
 
-    lines: list[list[_Word]] = []
-    current: list[_Word] = []
+    lines: list[list[Word]] = []
+    current: list[Word] = []
     last_y: float | None = None
     last_page: int | None = None
     for word in selected:
@@ -148,7 +177,7 @@ def to_text(path: str, area_details: dict[str, Any] | None = None) -> str:
     """Extract text from a PDF file using pdftotext.
 
     Args:
-        path (str): Path to the PDF file.
+        path (str): Path to the PDF file, or an in-memory document's name.
         area_details (dict[str, Any] | None, optional): Restrict extraction to a
             region. Keys (pixels at ``r`` dpi): ``f``/``l`` (first/last page),
             ``x``/``y`` (top-left), ``W``/``H`` (size), ``r`` (resolution dpi).
@@ -158,17 +187,13 @@ def to_text(path: str, area_details: dict[str, Any] | None = None) -> str:
         str: The extracted text.
 
     Raises:
-        FileNotFoundError: If the specified PDF file is not found.
-        OSError: If pdftotext is not installed.
-    """
-    if not Path(path).exists():
-        raise FileNotFoundError(f"File not found: {path}")
-    if not shutil.which("pdftotext"):
-        raise OSError(
-            "pdftotext not installed. "
-            "Can be downloaded from https://poppler.freedesktop.org/"
-        )
+        TemplateSyntaxError: If ``area_details`` lacks a required key.
 
+    Notes:
+        Also raises ``FileNotFoundError`` for a missing file and ``OSError``
+        when pdftotext is not installed (see :func:`_check`).
+    """
+    _check(path)
     if area_details is not None:
         for key in ("f", "l", "r", "x", "y", "W", "H"):
             if key not in area_details:
@@ -180,8 +205,121 @@ def to_text(path: str, area_details: dict[str, Any] | None = None) -> str:
         # how many area fields a template defines.
         return _crop(_words(path, _mtime(path)), area_details)
 
-    import subprocess
+    return _run(_layout_cmd(path), path).decode("utf-8")
+
+
+def to_text_head(path: str, pages: int) -> tuple[str, bool]:
+    """Extract the ``-layout`` text of the first ``pages`` pages (plus one).
+
+    pdftotext ends every page with a form feed, so asking for one page more
+    than needed tells whether the document is longer: if it is not, the text
+    is exactly :func:`to_text`'s and no second run is needed.
+
+    Args:
+        path (str): Path to the PDF file, or an in-memory document's name.
+        pages (int): How many leading pages are needed.
+
+    Returns:
+        tuple[str, bool]: The text and whether it is the whole document.
+            Raises as :func:`_check` does.
+    """
+    _check(path)
+    cmd = _layout_cmd(path)
+    cmd[1:1] = ["-f", "1", "-l", str(pages + 1)]
+    text = _run(cmd, path).decode("utf-8")
+    return text, text.count("\f") <= pages
 
-    cmd = ["pdftotext", "-layout", "-q", "-enc", "UTF-8", path, "-"]
-    out, _ = subprocess.Popen(cmd, stdout=subprocess.PIPE).communicate()
+
+async def to_text_async(path: str) -> str:
+    """Extract the whole document's text without blocking the event loop.
+
+    The ``-layout`` text of :func:`to_text`, from a child process run with
+    :func:`asyncio.create_subprocess_exec`. Raises as :func:`_check` does.
+
+    Args:
+        path (str): Path to the PDF file, or an in-memory document's name.
+
+    Returns:
+        str: The extracted text.
+    """
+    _check(path)
+    from . import _aio
+
+    out = await _aio.run(_layout_cmd(path), stdin=_stdin(path))
     return out.decode("utf-8")
+
+
+def _check(path: str) -> None:
+    """Raise unless ``path`` exists and ``pdftotext`` is installed.
+
+    Args:
+        path (str): Path to the PDF file, or an in-memory document's name.
+
+    Raises:
+        FileNotFoundError: If the specified PDF file is not found.
+        OSError: If pdftotext is not installed.
+    """
+    if not is_memory(path) and not Path(path).exists():
+        raise FileNotFoundError(f"File not found: {path}")
+    if not shutil.which("pdftotext"):
+        raise OSError(
+            "pdftotext not installed. "
+            "Can be downloaded from https://poppler.freedesktop.org/"
+        )
+
+
+def _layout_cmd(path: str) -> list[str]:
+    """Return the ``pdftotext -layout`` command for the whole of ``path``.
+
+    Args:
+        path (str): Path to the PDF file.
+
+    Returns:
+        list[str]: The command line, writing UTF-8 text to stdout.
+    """
+    return ["pdftotext", "-layout", "-q", "-enc", "UTF-8", _argument(path), "-"]
+
+
+def _argument(path: str) -> str:
+    """Return pdftotext's input argument for ``path``.
+
+    Args:
+        path (str): Path to the PDF file, or an in-memory document's name.
+
+    Returns:
+        str: The path, or ``-`` (stdin) for an in-memory document.
+    """
+    return "-" if is_memory(path) else path
+
+
+def _stdin(path: str) -> bytes | None:
+    """Return what to feed pdftotext's stdin for ``path``.
+
+    Args:
+        path (str): Path to the PDF file, or an in-memory document's name.
+
+    Returns:
+        bytes | None: An in-memory document's bytes, else None.
+    """
+    return read_bytes(path) if is_memory(path) else None
+
+
+def _run(cmd: list[str], path: str) -> bytes:
+    """Run a pdftotext command on ``path`` and return its output.
+
+    Args:
+        cmd (list[str]): The command, from :func:`_layout_cmd`.
+        path (str): Path to the PDF file, or an in-memory document's name.
+
+    Returns:
+        bytes: The standard output.
+    """
+    import subprocess
+
+    data = _stdin(path)
+    if data is None:
+        out, _ = subprocess.Popen(cmd, stdout=subprocess.PIPE).communicate()
+    else:
+        process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        out, _ = process.communicate(data)
+    return bytes(out)
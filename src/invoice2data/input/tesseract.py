@@ -1,8 +1,38 @@
-"""Tesseract OCR input module for invoice2data."""
+"""Tesseract OCR input module for invoice2data.
+
+A document is OCRed once: tesseract's text-only PDF is kept (up to
+:data:`OCR_CACHE_BYTES` of them, see :mod:`._artifacts`) and both the full
+text and every ``area`` field are read from it. Areas are cropped in Python from the PDF's word boxes,
+as :mod:`.pdftotext` crops digital PDFs, instead of re-running the OCR
+pipeline per area.
+
+Each page of a PDF is rendered to its own image and OCRed by a separate
+tesseract process, up to :func:`~invoice2data.input.ocr_pool.max_ocr_workers`
+at a time. With pypdfium2 installed the pages are rendered in-process, one at a
+time as workers free up, and piped to tesseract as uncompressed grayscale
+images, so neither a rasterizing process nor PNG encoding is needed and memory
+stays flat however long the scan; otherwise ImageMagick writes them as PNGs.
+``pdfunite`` (shipped with pdftotext in poppler-utils) joins the pages' PDFs in
+page order.
+
+Every language given to tesseract's ``-l`` loads a model and slows recognition
+down, so :func:`to_text` reads a small first-pass set (:func:`configure_languages`,
+``INVOICE2DATA_TESSERACT_LANGUAGES``, else English) and the cascade re-OCRs
+with the matched template's ``options.languages``, or every installed language
+when no template matched (see ``SUPPORTS_LANGUAGES`` in ``__interface__``). The
+installed languages are asked of tesseract once per process.
+"""
 
 import mimetypes
+import os
+import re
 import shutil
 import tempfile
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from contextlib import AbstractContextManager
+from functools import lru_cache
 from logging import getLogger
 from pathlib import Path
 from subprocess import PIPE
@@ -14,12 +44,116 @@ from subprocess import run
 from typing import Any
 
 from ..exceptions import TemplateSyntaxError
+from . import pdfium
+from . import pdftotext
+from ._artifacts import ArtifactStore
+from .ocr_pool import map_pages
+from .ocr_pool import max_ocr_workers
 
 
 logger = getLogger(__name__)
 
 SUPPORTS_AREA = True
 
+SUPPORTS_LANGUAGES = True
+
+#: The OCR runs in child processes; in-process rendering holds ``pdfium.LOCK``.
+THREAD_SAFE = True
+
+#: Environment variable holding the first-pass languages, e.g. ``"eng+deu"``.
+LANGUAGES_ENV = "INVOICE2DATA_TESSERACT_LANGUAGES"
+
+#: ISO 639-1 codes (as in templates' ``options.languages``) -> tessdata names.
+#: Codes missing here are passed through, so tesseract's own names work too.
+_CODES: dict[str, tuple[str, ...]] = {
+    "af": ("afr",),
+    "am": ("amh",),
+    "ar": ("ara",),
+    "az": ("aze",),
+    "be": ("bel",),
+    "bg": ("bul",),
+    "bn": ("ben",),
+    "bs": ("bos",),
+    "ca": ("cat",),
+    "cs": ("ces",),
+    "cy": ("cym",),
+    "da": ("dan",),
+    "de": ("deu",),
+    "el": ("ell",),
+    "en": ("eng",),
+    "eo": ("epo",),
+    "es": ("spa",),
+    "et": ("est",),
+    "eu": ("eus",),
+    "fa": ("fas",),
+    "fi": ("fin",),
+    "fr": ("fra",),
+    "ga": ("gle",),
+    "gl": ("glg",),
+    "gu": ("guj",),
+    "he": ("heb",),
+    "hi": ("hin",),
+    "hr": ("hrv",),
+    "hu": ("hun",),
+    "hy": ("hye",),
+    "id": ("ind",),
+    "is": ("isl",),
+    "it": ("ita",),
+    "ja": ("jpn",),
+    "ka": ("kat",),
+    "kk": ("kaz",),
+    "km": ("khm",),
+    "kn": ("kan",),
+    "ko": ("kor",),
+    "lt": ("lit",),
+    "lv": ("lav",),
+    "mk": ("mkd",),
+    "ml": ("mal",),
+    "mn": ("mon",),
+    "mr": ("mar",),
+    "ms": ("msa",),
+    "mt": ("mlt",),
+    "ne": ("nep",),
+    "nl": ("nld",),
+    "no": ("nor",),
+    "pa": ("pan",),
+    "pl": ("pol",),
+    "pt": ("por",),
+    "ro": ("ron",),
+    "ru": ("rus",),
+    "si": ("sin",),
+    "sk": ("slk",),
+    "sl": ("slv",),
+    "sq": ("sqi",),
+    "sr": ("srp",),
+    "sv": ("swe",),
+    "sw": ("swa",),
+    "ta": ("tam",),
+    "te": ("tel",),
+    "th": ("tha",),
+    "tl": ("tgl",),
+    "tr": ("tur",),
+    "uk": ("ukr",),
+    "ur": ("urd",),
+    "uz": ("uzb",),
+    "vi": ("vie",),
+    "zh": ("chi_sim", "chi_tra"),
+}
+
+_configured_languages: tuple[str, ...] | None = None
+
+#: Seconds each step of the OCR pipeline may take before it is abandoned.
+_TIMEOUT = 180
+
+#: Resolution PDF pages are rendered at for OCR.
+_DPI = 300
+
+#: Disk space the text-only PDFs of OCRed documents may take.
+OCR_CACHE_BYTES = 256 * 1024 * 1024
+
+#: tesseract's PDF per document content and languages.
+_ocr_pdfs = ArtifactStore("invoice2data-tesseract-", ".pdf", OCR_CACHE_BYTES)
+
 
 def _imagemagick_cmd() -> list[str] | None:
     """Return the ImageMagick invocation prefix, or ``None`` when absent.
@@ -41,13 +175,117 @@ def _imagemagick_cmd() -> list[str] | None:
 
 
 def is_available() -> bool:
-    """Return whether the ``tesseract`` and ImageMagick binaries are present.
+    """Return whether ``tesseract`` and a PDF rasterizer are present.
+
+    Returns:
+        bool: True if ``tesseract`` is on the PATH and pypdfium2 or an
+            ImageMagick invocation (``magick`` or the legacy ``convert``) is
+            available.
+    """
+    return shutil.which("tesseract") is not None and (
+        _pdfium_available() or _imagemagick_cmd() is not None
+    )
+
+
+def _pdfium_available() -> bool:
+    """Return whether PDF pages can be rendered in-process.
+
+    Returns:
+        bool: True if pypdfium2 is installed.
+    """
+    return pdfium.is_available()
+
+
+def cache_config() -> str:
+    """Return the OCR languages, part of the persistent text-cache key.
+
+    Returns:
+        str: The ``-l`` argument :func:`to_text` passes to tesseract by
+            default.
+    """
+    return resolve_languages()
+
+
+def configure_languages(languages: Sequence[str] | None) -> None:
+    """Set the languages of the first OCR pass.
+
+    Overrides ``INVOICE2DATA_TESSERACT_LANGUAGES`` for this process.
+
+    Args:
+        languages (Sequence[str] | None): ISO 639-1 or tesseract codes, e.g.
+            ``["en", "de"]``; None goes back to the environment variable and
+            English.
+
+    Examples:
+        >>> from invoice2data.input import tesseract
+        >>> tesseract.configure_languages(["en", "fr"])  # doctest: +SKIP
+    """
+    global _configured_languages
+    _configured_languages = None if languages is None else tuple(languages)
+
+
+@lru_cache(maxsize=1)
+def installed_languages() -> tuple[str, ...]:
+    """Return the languages tesseract has, asking it once per process.
 
     Returns:
-        bool: True if both ``tesseract`` and an ImageMagick invocation
-            (``magick`` or the legacy ``convert``) are on the PATH.
+        tuple[str, ...]: tessdata names, e.g. ``("deu", "eng", "osd")``.
     """
-    return shutil.which("tesseract") is not None and _imagemagick_cmd() is not None
+    return tuple(sorted(filter(None, get_languages().split("+"))))
+
+
+def resolve_languages(languages: Sequence[str] | None = None) -> str:
+    """Return tesseract's ``-l`` argument for the requested languages.
+
+    Languages that are not installed are left out; when none is left, the
+    first-pass languages are used, and failing those every installed one.
+
+    Args:
+        languages (Sequence[str] | None): ISO 639-1 or tesseract codes, ``()``
+            for every installed language, or None for the first-pass set.
+
+    Returns:
+        str: E.g. ``"deu+eng"``.
+    """
+    installed = installed_languages()
+    requested = _first_pass_languages() if languages is None else languages
+    codes = _installed_codes(requested, installed)
+    if requested and not codes and languages is not None:
+        logger.warning(
+            "None of the OCR languages %s is installed; using the defaults",
+            ", ".join(languages),
+        )
+        codes = _installed_codes(_first_pass_languages(), installed)
+    return "+".join(codes or installed)
+
+
+def _first_pass_languages() -> Sequence[str]:
+    """Return the configured first-pass languages.
+
+    Returns:
+        Sequence[str]: From :func:`configure_languages`, else
+            ``INVOICE2DATA_TESSERACT_LANGUAGES``, else English.
+    """
+    if _configured_languages is not None:
+        return _configured_languages
+    value = os.environ.get(LANGUAGES_ENV, "").strip()
+    if value:
+        return re.split(r"[+,\s]+", value)
+    return ("eng",)
+
+
+def _installed_codes(languages: Sequence[str], installed: Sequence[str]) -> list[str]:
+    """Map languages to tessdata names, keeping the installed ones.
+
+    Args:
+        languages (Sequence[str]): ISO 639-1 or tesseract codes.
+        installed (Sequence[str]): The installed tessdata names.
+
+    Returns:
+        list[str]: The names, in request order, without duplicates.
+    """
+    wanted = (code for lang in languages for code in _CODES.get(lang.lower(), (lang,)))
+    return [code for code in dict.fromkeys(wanted) if code in installed]
 
 
 def _validate_area_details(area_details: dict[str, Any]) -> None:
@@ -67,7 +305,11 @@ def _validate_area_details(area_details: dict[str, Any]) -> None:
             )
 
 
-def to_text(path: str, area_details: dict[str, Any] | None = None) -> str:
+def to_text(
+    path: str,
+    area_details: dict[str, Any] | None = None,
+    languages: Sequence[str] | None = None,
+) -> str:
     """Extract text from image using tesseract OCR.
 
     Args:
@@ -75,13 +317,369 @@ def to_text(path: str, area_details: dict[str, Any] | None = None) -> str:
         area_details (dict[str, Any] | None, optional):
             Specific area in the image to extract text from.
             Defaults to None (extract from the entire image).
+        languages (Sequence[str] | None): Languages to OCR, as for
+            :func:`resolve_languages`. Defaults to the first-pass set.
 
     Returns:
         str: The extracted text.
 
+    Notes:
+        Raises ``FileNotFoundError`` if the specified image file is not found
+        and ``OSError`` if Tesseract OCR fails to extract text (see
+        :func:`_check`); ``TemplateSyntaxError`` if ``area_details`` lacks a
+        required key.
+    """
+    im_cmd = _check(path)
+    if area_details is not None:
+        _validate_area_details(area_details)
+
+    language = resolve_languages(languages)
+    logger.debug("tesseract language arg is, %s", language)
+    with _ocr_pdf(path, im_cmd, language) as ocr_pdf:
+        if ocr_pdf is None:
+            return ""
+
+        if area_details is not None:
+            # Crop from the OCR layer's word boxes: one OCR run per document
+            # however many area fields the template has.
+            words = pdftotext._words(ocr_pdf, pdftotext._mtime(ocr_pdf))
+            return pdftotext._crop(words, area_details)
+
+        pdftotext_cmd = _pdftotext_cmd(ocr_pdf)
+
+        logger.debug("Calling pdfttext with, %s", pdftotext_cmd)
+        extracted_str = b""
+        p3 = Popen(pdftotext_cmd, stdout=PIPE)
+        try:
+            out, _ = p3.communicate(timeout=_TIMEOUT)
+            extracted_str = out
+        except TimeoutExpired:
+            p3.kill()
+            logger.warning("pdftotext took too long - skipping")
+    return extracted_str.decode("utf-8")
+
+
+def _ocr_pdf(
+    path: str, im_cmd: list[str] | None, language: str
+) -> AbstractContextManager[str | None]:
+    """Pin tesseract's text-only PDF of ``path``, OCRing it on a miss.
+
+    Args:
+        path (str): Path to the image or PDF file.
+        im_cmd (list[str] | None): The ImageMagick invocation prefix, if any.
+        language (str): The ``-l`` argument.
+
+    Returns:
+        AbstractContextManager[str | None]: Gives the path to the PDF, kept
+            until the block exits, or None when a step timed out or a page
+            is missing (nothing is kept, so the next call OCRs again: a PDF
+            short of a page would shift the pages of ``area`` fields).
+    """
+
+    def build(target: Path) -> bool:
+        built = _run_ocr(path, im_cmd, language, str(target.with_suffix("")))
+        return built and target.exists()
+
+    return _ocr_pdfs.fetch(path, language, build)
+
+
+def _run_ocr(path: str, im_cmd: list[str] | None, language: str, output: str) -> bool:
+    """Rasterize (PDFs) and run tesseract, writing ``output``.pdf.
+
+    Args:
+        path (str): Path to the image or PDF file.
+        im_cmd (list[str] | None): The ImageMagick invocation prefix, if any.
+        language (str): The ``-l`` argument.
+        output (str): Output path without extension.
+
+    Returns:
+        bool: False if rasterizing or joining the pages timed out, or a page
+            is missing. Whether ``output``.pdf exists is for the caller to
+            check.
+
+    Raises:
+        OSError: If a PDF can be rendered neither by pypdfium2 nor by
+            ImageMagick.
+    """
+    mt = mimetypes.guess_type(path)
+    if mt[0] != "application/pdf":
+        _run_tesseract(language, path, output)
+        return True
+    # tesseract does not support pdf files, pre-processing is needed.
+    document = _open_pdf(path)
+    if document is not None:
+        logger.debug("PDF file detected, rendering pages with pypdfium2")
+        try:
+            with pdfium.LOCK:
+                count = len(document)
+            return _ocr_pages(language, _page_images(document), count, output)
+        finally:
+            with pdfium.LOCK:
+                document.close()
+    if im_cmd is None:
+        raise OSError(f"pypdfium2 cannot render {path} and imagemagick not installed.")
+    logger.debug("PDF file detected, start pre-processing by converting to png")
+    pages = _rasterize(im_cmd, path, output)
+    try:
+        return bool(pages) and _ocr_pages(language, pages, len(pages), output)
+    finally:
+        for page in pages:
+            Path(page).unlink(missing_ok=True)
+
+
+def _open_pdf(path: str) -> Any:
+    """Open a PDF with pypdfium2 for rendering.
+
+    Args:
+        path (str): The PDF.
+
+    Returns:
+        Any: A ``pypdfium2.PdfDocument``, or None when pypdfium2 is missing
+            or cannot read the file (ImageMagick may still manage).
+    """
+    if not _pdfium_available():
+        return None
+    import pypdfium2
+
+    try:
+        with pdfium.LOCK:
+            return pypdfium2.PdfDocument(path)
+    except pypdfium2.PdfiumError:
+        logger.debug("pypdfium2 cannot open %s", path, exc_info=True)
+        return None
+
+
+def _page_images(document: Any) -> Iterator[bytes]:
+    """Render a PDF's pages to grayscale PGM images, one at a time.
+
+    PGM is a header and the raw pixels, which tesseract reads from stdin
+    without decoding; only the page being consumed is held.
+
+    Args:
+        document (Any): A ``pypdfium2.PdfDocument``.
+
+    Yields:
+        bytes: One 8-bit PGM image per page, at :data:`_DPI`.
+    """
+    with pdfium.LOCK:
+        count = len(document)
+    for index in range(count):
+        with pdfium.LOCK:
+            image = _page_image(document, index)
+        yield image
+
+
+def _page_image(document: Any, index: int) -> bytes:
+    """Render one page of a PDF to a grayscale PGM image.
+
+    Args:
+        document (Any): A ``pypdfium2.PdfDocument``.
+        index (int): 0-based page index.
+
+    Returns:
+        bytes: An 8-bit PGM image at :data:`_DPI`.
+    """
+    page = document[index]
+    try:
+        bitmap = page.render(scale=_DPI / 72, grayscale=True)
+        width, height, stride = bitmap.width, bitmap.height, bitmap.stride
+        pixels = memoryview(bitmap.buffer).cast("B")
+        if stride != width:
+            pixels = memoryview(
+                b"".join(
+                    pixels[row * stride : row * stride + width] for row in range(height)
+                )
+            )
+        image = b"".join((f"P5\n{width} {height}\n255\n".encode(), pixels))
+        bitmap.close()
+    finally:
+        page.close()
+    return image
+
+
+def _rasterize(im_cmd: list[str], path: str, output: str) -> list[str]:
+    """Render every page of a PDF to ``output``-NNNN.png.
+
+    Args:
+        im_cmd (list[str]): The ImageMagick invocation prefix.
+        path (str): The (multi-page) PDF.
+        output (str): Output path without extension.
+
+    Returns:
+        list[str]: The page images in page order, or none if ImageMagick
+            timed out.
+    """
+    p1 = Popen(_convert_cmd(im_cmd, path, f"{output}-%04d.png"))
+    try:
+        p1.communicate(timeout=_TIMEOUT)
+    except TimeoutExpired:
+        p1.kill()
+        logger.warning("ImageMagick took too long to render pages - skipping")
+        return []
+    folder = Path(output).parent
+    stem = Path(output).name
+    pages = folder.glob(f"{stem}-*.png")
+    return [str(page) for page in sorted(pages, key=_page_number)]
+
+
+def _page_number(image: Path) -> int:
+    """Return the page index ImageMagick put in an image's name.
+
+    Args:
+        image (Path): E.g. ``abc-0012.png``.
+
+    Returns:
+        int: E.g. 12.
+    """
+    return int(image.stem.rsplit("-", 1)[1])
+
+
+def _ocr_pages(
+    language: str, pages: Iterable[str | bytes], count: int, output: str
+) -> bool:
+    """OCR page images in parallel and join their PDFs into ``output``.pdf.
+
+    Args:
+        language (str): The ``-l`` argument.
+        pages (Iterable[str | bytes]): The page images (paths or PGM data), in
+            page order; consumed as workers free up.
+        count (int): How many pages there are.
+        output (str): Output path without extension.
+
+    Returns:
+        bool: False if a page's PDF is missing (tesseract timed out on it;
+            then nothing is joined) or pdfunite failed.
+    """
+    if count == 1:
+        _run_tesseract(language, next(iter(pages)), output)
+        return True
+    if count == 0:
+        return False
+    outputs = [f"{output}-{index:04d}" for index in range(count)]
+    env = None
+    if min(max_ocr_workers(), count) > 1:
+        # One tesseract per core: its own OpenMP threads would oversubscribe.
+        env = {**os.environ, "OMP_THREAD_LIMIT": "1"}
+    try:
+        done = map_pages(
+            lambda job: _run_tesseract(language, job[0], job[1], env),
+            zip(pages, outputs, strict=False),
+        )
+        page_pdfs = [f"{stem}.pdf" for stem in outputs]
+        if len(done) < count or not all(map(os.path.exists, page_pdfs)):
+            logger.warning("tesseract left pages of %s.pdf out - skipping", output)
+            return False
+        unite_cmd = ["pdfunite", *page_pdfs, f"{output}.pdf"]
+        logger.debug("Calling pdfunite with args, %s", unite_cmd)
+        p3 = Popen(unite_cmd, stdout=PIPE)
+        try:
+            p3.communicate(timeout=_TIMEOUT)
+        except TimeoutExpired:
+            p3.kill()
+            Path(f"{output}.pdf").unlink(missing_ok=True)
+            logger.warning("pdfunite took too long - skipping")
+            return False
+        return p3.returncode == 0
+    finally:
+        for stem in outputs:
+            Path(f"{stem}.pdf").unlink(missing_ok=True)
+            Path(f"{stem}.txt").unlink(missing_ok=True)
+
+
+def _run_tesseract(
+    language: str,
+    image: str | bytes,
+    output: str,
+    env: dict[str, str] | None = None,
+) -> None:
+    """Run tesseract on one image, writing ``output``.pdf.
+
+    Args:
+        language (str): The ``-l`` argument.
+        image (str | bytes): The image path, or PGM data (at :data:`_DPI`) fed
+            to tesseract's stdin.
+        output (str): Output path without extension.
+        env (dict[str, str] | None): The process environment; inherited when
+            None.
+    """
+    if isinstance(image, bytes):
+        tess_cmd = _tesseract_cmd(language, "stdin", output, dpi=_DPI)
+    else:
+        tess_cmd = _tesseract_cmd(language, image, output)
+
+    logger.debug("Calling tesseract with args, %s", tess_cmd)
+    if isinstance(image, bytes):
+        p2 = Popen(tess_cmd, stdin=PIPE, stdout=PIPE, env=env)
+        try:
+            p2.communicate(image, timeout=_TIMEOUT)
+        except TimeoutExpired:
+            p2.kill()
+            logger.warning("tesseract took too long to OCR - skipping")
+        return
+    p2 = Popen(tess_cmd, stdout=PIPE, env=env)
+
+    # Wait for p2 to finish generating the pdf
+    try:
+        p2.wait(timeout=_TIMEOUT)
+    except TimeoutExpired:
+        p2.kill()
+        logger.warning("tesseract took too long to OCR - skipping")
+
+
+async def to_text_async(path: str) -> str:
+    """OCR the whole document without blocking the event loop.
+
+    PDFs run :func:`to_text` on a worker thread, so they are OCRed page by
+    page and kept in the same OCR PDF store as synchronous calls: both give
+    the same text, which the text caches share. An image runs the pipeline
+    of :func:`to_text` (tesseract, then pdftotext on tesseract's text-only
+    PDF) as child processes with :func:`asyncio.create_subprocess_exec`.
+    Tesseract writes into a private temporary directory, so concurrent calls
+    on same-named files do not overwrite each other's output.
+
+    Args:
+        path (str): Path to the image or PDF file.
+
+    Returns:
+        str: The extracted text, or ``""`` if a step timed out.
+
+    Notes:
+        Raises ``FileNotFoundError`` and ``OSError`` as :func:`to_text` does.
+    """
+    _check(path)
+
+    import asyncio
+
+    from . import _aio
+
+    if mimetypes.guess_type(path)[0] == "application/pdf":
+        return await asyncio.to_thread(to_text, path)
+    language = await asyncio.to_thread(resolve_languages)
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        output = str(Path(tmp_folder) / Path(path).stem)
+        try:
+            await _aio.run(_tesseract_cmd(language, path, output), timeout=_TIMEOUT)
+            out = await _aio.run(_pdftotext_cmd(output + ".pdf"), timeout=_TIMEOUT)
+        except TimeoutError:
+            logger.warning("tesseract took too long to OCR - skipping")
+            return ""
+    return out.decode("utf-8")
+
+
+def _check(path: str) -> list[str] | None:
+    """Raise unless ``path`` exists and tesseract and a rasterizer are installed.
+
+    Args:
+        path (str): Path to the image or PDF file.
+
+    Returns:
+        list[str] | None: The ImageMagick invocation prefix, or None when only
+            pypdfium2 is there to render PDFs.
+
     Raises:
         FileNotFoundError: If the specified image file is not found.
-        OSError: If Tesseract OCR fails to extract text.
+        OSError: If tesseract is not installed, or neither pypdfium2 nor
+            ImageMagick is.
     """
     if not Path(path).exists():
         raise FileNotFoundError(f"File not found: {path}")
@@ -89,18 +687,27 @@ def to_text(path: str, area_details: dict[str, Any] | None = None) -> str:
     if not shutil.which("tesseract"):
         raise OSError("tesseract not installed.")
     im_cmd = _imagemagick_cmd()
-    if im_cmd is None:
+    if im_cmd is None and not _pdfium_available():
         raise OSError("imagemagick not installed.")
+    return im_cmd
 
-    language = get_languages()
-    logger.debug("tesseract language arg is, %s", language)
-    timeout = 180
 
-    # convert the (multi-page) pdf file to a 300dpi png. ImageMagick 7+ takes
-    # the operation arguments directly after ``magick``; the legacy
-    # ``convert`` binary (IM 6) takes the same argument list, so the prefix
-    # returned by ``_imagemagick_cmd`` slots in cleanly here.
-    convert = [
+def _convert_cmd(im_cmd: list[str], path: str, pages: str) -> list[str]:
+    """Return the ImageMagick command rendering ``path`` to 300dpi PNGs.
+
+    ImageMagick 7+ takes the operation arguments directly after ``magick``;
+    the legacy ``convert`` binary (IM 6) takes the same argument list, so the
+    prefix returned by :func:`_imagemagick_cmd` slots in cleanly here.
+
+    Args:
+        im_cmd (list[str]): The ImageMagick invocation prefix.
+        path (str): The (multi-page) PDF.
+        pages (str): A ``%04d`` file pattern, written once per page.
+
+    Returns:
+        list[str]: The command line.
+    """
+    return [
         *im_cmd,
         "-units",
         "PixelsPerInch",
@@ -113,30 +720,32 @@ def to_text(path: str, area_details: dict[str, Any] | None = None) -> str:
         "off",
         "-resample",
         "300x300",
-        "-append",
-        "png:-",
+        "+adjoin",
+        pages,
     ]
-    mt = mimetypes.guess_type(path)
-    if mt[0] == "application/pdf":
-        # tesseract does not support pdf files, pre-processing is needed.
-        logger.debug("PDF file detected, start pre-processing by converting to png")
-        p1 = Popen(convert, stdout=PIPE)
-        tess_input = "stdin"
-        stdin = p1.stdout
-    else:
-        tess_input = path
-        stdin = None
 
-    inputfile = Path(path)
-    filename = inputfile.stem
 
-    tmp_folder = str(tempfile.gettempdir()) + "/"
-    logger.debug("temp dir is, *%s*", tmp_folder)
+def _tesseract_cmd(
+    language: str, tess_input: str, output: str, dpi: int | None = None
+) -> list[str]:
+    """Return the tesseract command writing ``output``.pdf and ``output``.txt.
 
-    tess_cmd = [
+    Args:
+        language (str): The ``-l`` argument.
+        tess_input (str): The image path, or ``"stdin"``.
+        output (str): Output path without extension.
+        dpi (int | None): The image's resolution, for formats that do not
+            record it (PGM); None reads it from the image.
+
+    Returns:
+        list[str]: The command line.
+    """
+    resolution = [] if dpi is None else ["--dpi", str(dpi)]
+    return [
         "tesseract",
         "-l",
         language,
+        *resolution,
         "--oem",
         "3",
         "--psm",
@@ -146,63 +755,34 @@ def to_text(path: str, area_details: dict[str, Any] | None = None) -> str:
         "-c",
         "textonly_pdf=1",
         tess_input,
-        tmp_folder + filename,
+        output,
         "pdf",
         "txt",
     ]
 
-    logger.debug("Calling tesseract with args, %s", tess_cmd)
-    p2 = Popen(tess_cmd, stdin=stdin, stdout=PIPE)
 
-    # Wait for p2 to finish generating the pdf
-    try:
-        p2.wait(timeout=timeout)
-    except TimeoutExpired:
-        p2.kill()
-        logger.warning("tesseract took too long to OCR - skipping")
+def _pdftotext_cmd(pdf: str) -> list[str]:
+    """Return the pdftotext command reading tesseract's PDF.
 
-    pdftotext_cmd = [
-        "pdftotext",
-        "-layout",
-        "-enc",
-        "UTF-8",
-    ]
-    if area_details is not None:
-        _validate_area_details(area_details)
-        # Convert all of the values to strings
-        for key in area_details:
-            area_details[key] = str(area_details[key])
-        pdftotext_cmd += [
-            "-f",
-            area_details["f"],
-            "-l",
-            area_details["l"],
-            "-r",
-            area_details["r"],
-            "-x",
-            area_details["x"],
-            "-y",
-            area_details["y"],
-            "-W",
-            area_details["W"],
-            "-H",
-            area_details["H"],
-        ]
-    pdftotext_cmd += [tmp_folder + filename + ".pdf", "-"]
-
-    logger.debug("Calling pdfttext with, %s", pdftotext_cmd)
-    extracted_str = b""
-    p3 = Popen(pdftotext_cmd, stdin=p2.stdout, stdout=PIPE)
-    try:
-        out, _ = p3.communicate(timeout=timeout)
-        extracted_str = out
-    except TimeoutExpired:
-        p3.kill()
-        logger.warning("pdftotext took too long - skipping")
-    return extracted_str.decode("utf-8")
+    Args:
+        pdf (str): The text-only PDF tesseract wrote.
+
+    Returns:
+        list[str]: The command line, writing UTF-8 text to stdout.
+    """
+    return ["pdftotext", "-layout", "-enc", "UTF-8", pdf, "-"]
 
 
 def get_languages() -> str:
+    """Ask tesseract for its installed languages (see :func:`installed_languages`).
+
+    Returns:
+        str: The languages, joined by ``+``.
+
+    Raises:
+        OSError: If tesseract fails to list them.
+    """
+
     def lang_error(output: str) -> str:
         logger.warning(  # Use logger.warning instead of assigning to it
             "Tesseract failed to report available languages.\n"
@@ -4,15 +4,28 @@
 
 from pathlib import Path
 
+from ._memory import is_memory
+from ._memory import read_bytes
+
+
+THREAD_SAFE = True
+#: Reading the file back is as cheap as the persistent cache.
+CACHE_TEXT = False
+
+#: In-memory text is decoded as UTF-8.
+SUPPORTS_BYTES = True
+
 
 def to_text(path: str) -> str:
     """Reads the content of a text file.
 
     Args:
-      path (str): The path to the text file.
+      path (str): The path to the text file, or an in-memory document's name.
 
     Returns:
       str: The content of the text file.
     """
+    if is_memory(path):
+        return read_bytes(path).decode("utf-8")
     with Path(path).open() as f:
         return f.read()
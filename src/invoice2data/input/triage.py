@@ -0,0 +1,154 @@
+"""Scanned-versus-digital triage of input documents.
+
+A scanned PDF has no text layer, so the default cascade parses it fully with
+pdfium, again with pdftotext, and only then falls back to OCR. :func:`classify`
+looks at the first few pages once, through PDFium, and counts per page the
+characters of its text layer and the share of the page covered by images:
+
+- a page with at least :data:`MIN_CHARS` characters is a *text* page (a scan
+  with an OCR text layer counts, since its text extracts fine);
+- a page with fewer, but images covering :data:`MIN_IMAGE_COVERAGE` of it, is an
+  *image* page;
+- anything else (blank, vector drawings) counts as neither.
+
+The document is :data:`SCANNED` when its sampled pages are image pages only,
+:data:`MIXED` when both kinds appear and :data:`TEXT` otherwise. Image files
+(JPEG, PNG, TIFF...) are scans by definition and are not opened. Results are
+memoized per path and mtime.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from . import _mtime
+from . import pdfium
+from ._memory import is_memory
+from ._memory import read_bytes
+
+
+__all__ = [
+    "MIN_CHARS",
+    "MIN_IMAGE_COVERAGE",
+    "MIXED",
+    "SAMPLE_PAGES",
+    "SCANNED",
+    "TEXT",
+    "Triage",
+    "classify",
+]
+
+#: Document kinds returned by :func:`classify`.
+TEXT = "text"
+SCANNED = "scanned"
+MIXED = "mixed"
+
+#: Pages inspected from the start of the document.
+SAMPLE_PAGES = 3
+#: Text-layer characters that make a page a text page.
+MIN_CHARS = 16
+#: Share of a page images must cover to make a textless page an image page.
+MIN_IMAGE_COVERAGE = 0.5
+
+_IMAGE_SUFFIXES = frozenset(
+    {".bmp", ".gif", ".jpeg", ".jpg", ".png", ".tif", ".tiff", ".webp"}
+)
+
+
+@dataclass(frozen=True)
+class Triage:
+    """How a document was classified.
+
+    Attributes:
+        kind (str): :data:`TEXT`, :data:`SCANNED` or :data:`MIXED`.
+        pages (int): Pages inspected.
+        text_pages (int): Of those, pages with a text layer.
+        image_pages (int): Of those, textless pages mostly covered by images.
+    """
+
+    kind: str
+    pages: int = 0
+    text_pages: int = 0
+    image_pages: int = 0
+
+
+def classify(path: str, pages: int = SAMPLE_PAGES) -> Triage:
+    """Classify a document as text, scanned or mixed.
+
+    Args:
+        path (str): Path to a PDF or image file.
+        pages (int): How many leading pages to inspect.
+
+    Returns:
+        Triage: The verdict. Opening the PDF needs ``pypdfium2``; a file it
+            cannot open raises its error.
+    """
+    if Path(path).suffix.lower() in _IMAGE_SUFFIXES:
+        return Triage(SCANNED)
+    return _classify_pdf(path, _mtime(path), pages)
+
+
+@lru_cache(maxsize=256)
+def _classify_pdf(path: str, mtime: float | None, pages: int) -> Triage:
+    """Memoized PDF classification (``mtime`` is part of the key only).
+
+    Args:
+        path (str): Path to the PDF.
+        mtime (float | None): Its mtime.
+        pages (int): How many leading pages to inspect.
+
+    Returns:
+        Triage: The verdict.
+    """
+    import pypdfium2
+
+    text_pages = image_pages = 0
+    with pdfium.LOCK:
+        source = read_bytes(path) if is_memory(path) else path
+        document = pypdfium2.PdfDocument(source)
+        try:
+            sampled = min(pages, len(document))
+            for index in range(sampled):
+                page = document[index]
+                if page.get_textpage().count_chars() >= MIN_CHARS:
+                    text_pages += 1
+                elif _image_coverage(page) >= MIN_IMAGE_COVERAGE:
+                    image_pages += 1
+        finally:
+            document.close()
+    if image_pages and not text_pages:
+        kind = SCANNED
+    elif image_pages:
+        kind = MIXED
+    else:
+        kind = TEXT
+    return Triage(kind, sampled, text_pages, image_pages)
+
+
+def _image_coverage(page: Any) -> float:
+    """Return the share of ``page`` covered by image objects (capped at 1).
+
+    Overlapping images are counted twice; scans are one full-page image, so
+    the approximation only matters for collages, which it overrates.
+
+    Args:
+        page (Any): A ``pypdfium2.PdfPage``.
+
+    Returns:
+        float: Covered area over page area.
+    """
+    import pypdfium2
+
+    width, height = page.get_size()
+    if width <= 0 or height <= 0:
+        return 0.0
+    covered = 0.0
+    for image in page.get_objects(
+        filter=[pypdfium2.raw.FPDF_PAGEOBJ_IMAGE], max_depth=2
+    ):
+        # ``get_pos`` was renamed ``get_bounds`` in pypdfium2 5.
+        bounds = getattr(image, "get_bounds", None) or image.get_pos
+        left, bottom, right, top = bounds()
+        covered += max(0.0, right - left) * max(0.0, top - bottom)
+    return float(min(1.0, covered / (width * height)))
@@ -0,0 +1,333 @@
+"""Backend routing learned from past extractions.
+
+The cascade in :func:`~invoice2data.extract_data` tries its backends in a
+fixed order, so a template that only ever completes on pdftotext -- because
+pdfium's text misses a field or drops its line items -- pays for a full
+template run on pdfium's text first, on every document. A template pinning
+``input_module:`` avoids the failed run but still costs a re-match.
+
+A :class:`RoutingTable` records, per template (and its issuer), which backends
+ran it, how often they produced a complete result and how long their text
+took. When a later document's first (cheapest) text matches that template by
+keyword, the cascade goes straight to the backend history says works, cheapest
+first:
+
+- the first backend is left alone once it has a record of complete results;
+- otherwise the route is the cheapest backend (by mean text extraction time)
+  that completed the template in at least :data:`MIN_SUCCESS_RATE` of its runs;
+- a routed run that fails counts as a miss and the ordinary cascade carries on,
+  so a stale route costs one extra extraction and then demotes itself.
+
+The table lives in a small JSON file, replaced atomically on
+:meth:`RoutingTable.save`. Increments are merged into whatever is on disk
+while holding an exclusive lock on a ``.lock`` file beside it (``flock``; not
+on Windows, where two writers saving at the same instant may lose one save's
+statistics), so the workers of :func:`~invoice2data.extract_many` share one
+file. :func:`~invoice2data.extract_data` saves at most every
+:data:`SAVE_INTERVAL` seconds; the rest is saved when the batch or the process
+ends, or by an explicit :meth:`RoutingTable.save`.
+"""
+
+import atexit
+import contextlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from .extract.invoice_template import InvoiceTemplate
+from .input import INPUT_MODULES
+from .input import is_available
+
+
+if sys.platform != "win32":
+    import fcntl
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["MIN_SUCCESS_RATE", "SAVE_INTERVAL", "RoutingTable"]
+
+#: Share of complete results a backend needs before documents are routed to it.
+MIN_SUCCESS_RATE = 0.8
+
+#: Seconds between the saves :meth:`RoutingTable.save_if_due` makes.
+SAVE_INTERVAL = 30.0
+
+_VERSION = 1
+
+
+class RoutingTable:
+    """Per-template backend statistics, persisted to a JSON file.
+
+    Unsaved statistics are saved when the interpreter exits.
+
+    Args:
+        path (str | os.PathLike[str]): The JSON file; read if it exists,
+            created on the first :meth:`save`.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = self._load()
+        #: Increments since the last save, in the same shape as ``_entries``.
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._saved_at = float("-inf")
+        atexit.register(_save_at_exit, weakref.ref(self))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the location only; the copy reads the file afresh.
+
+        Returns:
+            tuple[Any, ...]: Constructor and arguments.
+        """
+        return (type(self), (self.path,))
+
+    def __repr__(self) -> str:
+        """Return a constructor-style representation.
+
+        Returns:
+            str: E.g. ``RoutingTable('routes.json')``.
+        """
+        return f"RoutingTable({str(self.path)!r})"
+
+    def route(self, template: InvoiceTemplate, probe: Any) -> Any:
+        """Return the backend to extract ``template``'s documents with.
+
+        Args:
+            template (InvoiceTemplate): The template the probe text matched.
+            probe (Any): The backend that produced the probe text.
+
+        Returns:
+            Any: A backend module other than ``probe``, or None to carry on
+                with ``probe``'s text (no history, or ``probe`` is reliable).
+        """
+        with self._lock:
+            backends = self._entries.get(template["template_name"], {}).get(
+                "backends", {}
+            )
+            if _reliable(backends.get(_name(probe))):
+                return None
+            ranked = sorted(
+                (stats["seconds"] / stats["runs"], name)
+                for name, stats in backends.items()
+                if name != _name(probe) and _reliable(stats)
+            )
+        for _cost, name in ranked:
+            module = INPUT_MODULES.get(name)
+            if module is not None and is_available(module):
+                return module
+        return None
+
+    def record(
+        self, template: InvoiceTemplate, backend: Any, complete: bool, seconds: float
+    ) -> None:
+        """Count one run of ``template`` on ``backend``'s text.
+
+        Args:
+            template (InvoiceTemplate): The template that ran.
+            backend (Any): The backend whose text it ran on.
+            complete (bool): Whether the result was complete (every required
+                field, and line items when the template declares them).
+            seconds (float): What extracting the text cost.
+        """
+        increment = {"runs": 1, "successes": int(complete), "seconds": seconds}
+        self._add(template, {"backends": {_name(backend): increment}})
+
+    def hit(self, template: InvoiceTemplate) -> None:
+        """Count a routed document that the route completed.
+
+        Args:
+            template (InvoiceTemplate): The routed template.
+        """
+        self._add(template, {"hits": 1})
+
+    def miss(self, template: InvoiceTemplate) -> None:
+        """Count a routed document that fell back to the cascade.
+
+        Args:
+            template (InvoiceTemplate): The routed template.
+        """
+        self._add(template, {"misses": 1})
+
+    def statistics(self) -> dict[str, dict[str, Any]]:
+        """Return a copy of the table, keyed by template name.
+
+        Returns:
+            dict[str, dict[str, Any]]: Per template its ``issuer``, routing
+                ``hits`` and ``misses``, and per backend its ``runs``,
+                ``successes`` and total ``seconds``.
+        """
+        with self._lock:
+            result: dict[str, dict[str, Any]] = json.loads(json.dumps(self._entries))
+        return result
+
+    def save(self) -> None:
+        """Merge the unsaved statistics into the file, atomically.
+
+        Other processes saving to the same file wait for the lock file. A
+        write error is logged; the statistics stay pending for the next save.
+        """
+        with self._lock:
+            self._saved_at = time.monotonic()
+            if not self._pending:
+                return
+            try:
+                with _locked(self.path.with_name(f"{self.path.name}.lock")):
+                    entries = self._load()
+                    _merge(entries, self._pending)
+                    self._write(entries)
+            except OSError:
+                logger.warning(
+                    "Routing table %s not writable", self.path, exc_info=True
+                )
+                return
+            self._entries = entries
+            self._pending = {}
+
+    def save_if_due(self) -> None:
+        """Save, unless the last save was less than :data:`SAVE_INTERVAL` ago."""
+        if time.monotonic() - self._saved_at >= SAVE_INTERVAL:
+            self.save()
+
+    def _write(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Replace the file with ``entries`` via a temporary file beside it.
+
+        Args:
+            entries (dict[str, dict[str, Any]]): The whole table.
+
+        Raises:
+            OSError: If the folder or file cannot be written.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        handle, temporary = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as stream:
+                json.dump({"version": _VERSION, "templates": entries}, stream, indent=1)
+            Path(temporary).replace(self.path)
+        except OSError:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+
+    def _add(self, template: InvoiceTemplate, increment: dict[str, Any]) -> None:
+        """Apply ``increment`` to the template's entry, in memory.
+
+        Args:
+            template (InvoiceTemplate): The template.
+            increment (dict[str, Any]): Counters to add.
+        """
+        update = {template["template_name"]: {"issuer": template.get("issuer")}}
+        _merge(update, {template["template_name"]: increment})
+        with self._lock:
+            _merge(self._entries, update)
+            _merge(self._pending, update)
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Read the table file.
+
+        Returns:
+            dict[str, dict[str, Any]]: The entries; empty when the file is
+                missing, unreadable or of another version.
+        """
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.warning("Routing table %s unreadable", self.path, exc_info=True)
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _VERSION:
+            return {}
+        entries: dict[str, dict[str, Any]] = data.get("templates", {})
+        return entries
+
+
+@contextlib.contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive ``flock`` on ``path``, created if missing.
+
+    A no-op on Windows.
+
+    Args:
+        path (Path): The lock file.
+
+    Yields:
+        None: Control to the locked block.
+    """
+    if sys.platform == "win32":
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _save_at_exit(table: "weakref.ref[RoutingTable]") -> None:
+    """Save a table's pending statistics, if it is still alive.
+
+    Args:
+        table (weakref.ref[RoutingTable]): The table.
+    """
+    alive = table()
+    if alive is not None:
+        alive.save()
+
+
+def _name(module: Any) -> str:
+    """Return a backend's registry name (its module name if unregistered).
+
+    Args:
+        module (Any): A backend module.
+
+    Returns:
+        str: E.g. ``"pdftotext"``.
+    """
+    for name, registered in INPUT_MODULES.items():
+        if registered is module:
+            return name
+    return str(module.__name__)
+
+
+def _reliable(stats: dict[str, Any] | None) -> bool:
+    """Return whether a backend's record earns documents routed to it.
+
+    Args:
+        stats (dict[str, Any] | None): Its ``runs`` / ``successes`` counters.
+
+    Returns:
+        bool: At least one complete result, at :data:`MIN_SUCCESS_RATE` or better.
+    """
+    if not stats or not stats.get("successes"):
+        return False
+    return bool(stats["successes"] >= MIN_SUCCESS_RATE * stats["runs"])
+
+
+def _merge(target: dict[str, Any], increment: dict[str, Any]) -> None:
+    """Add ``increment``'s numbers into ``target``, recursively.
+
+    Args:
+        target (dict[str, Any]): Updated in place.
+        increment (dict[str, Any]): Numbers are added, dicts merged and other
+            values (the issuer) replace the target's.
+    """
+    for key, value in increment.items():
+        if isinstance(value, dict):
+            _merge(target.setdefault(key, {}), value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            target[key] = target.get(key, 0) + value
+        else:
+            target[key] = value
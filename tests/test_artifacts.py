@@ -0,0 +1,98 @@
+"""The OCR artifact store: pinned while read, built once per document."""
+
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from invoice2data.input._artifacts import ArtifactStore
+
+
+pytestmark = pytest.mark.windows_strict
+
+
+def _sources(tmp_path: Path, count: int) -> list[str]:
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"scan{index}.pdf"
+        path.write_bytes(f"%PDF-1.4 scan {index}".encode())
+        paths.append(str(path))
+    return paths
+
+
+def _write(target: Path) -> bool:
+    target.write_bytes(b"%PDF-1.4 ocr")
+    return True
+
+
+@pytest.fixture
+def store() -> Iterator[ArtifactStore]:
+    store = ArtifactStore("invoice2data-test-", ".pdf", len(b"%PDF-1.4 ocr"))
+    yield store
+    store.clear()
+
+
+def test_an_artifact_in_use_is_not_evicted(
+    store: ArtifactStore, tmp_path: Path
+) -> None:
+    first, second = _sources(tmp_path, 2)
+    with store.fetch(first, "", _write) as reading:
+        assert reading is not None
+        with store.fetch(second, "", _write) as latest:
+            assert Path(reading).exists()
+        assert Path(reading).exists()
+    assert not Path(reading).exists()  # evicted once released
+    assert latest is not None and Path(latest).exists()
+    assert store.nbytes == len(b"%PDF-1.4 ocr")
+
+
+def test_different_documents_build_at_once(
+    store: ArtifactStore, tmp_path: Path
+) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    def build(target: Path) -> bool:
+        barrier.wait()  # breaks unless both builds run together
+        return _write(target)
+
+    def fetch(source: str) -> bool:
+        with store.fetch(source, "", build) as path:
+            return path is not None
+
+    with ThreadPoolExecutor(2) as pool:
+        assert all(pool.map(fetch, _sources(tmp_path, 2)))
+
+
+def test_one_document_is_built_once(store: ArtifactStore, tmp_path: Path) -> None:
+    (source,) = _sources(tmp_path, 1)
+    builds: list[Path] = []
+
+    def build(target: Path) -> bool:
+        builds.append(target)
+        return _write(target)
+
+    def fetch(_: int) -> str | None:
+        with store.fetch(source, "", build) as path:
+            return path
+
+    with ThreadPoolExecutor(4) as pool:
+        paths = set(pool.map(fetch, range(8)))
+    assert len(builds) == 1
+    assert paths == {str(builds[0])}
+
+
+def test_a_failed_build_is_not_kept(store: ArtifactStore, tmp_path: Path) -> None:
+    (source,) = _sources(tmp_path, 1)
+
+    def fail(target: Path) -> bool:
+        target.write_bytes(b"partial")
+        raise OSError("cannot render")
+
+    with pytest.raises(OSError), store.fetch(source, "", fail):
+        pass
+    with store.fetch(source, "", lambda target: False) as path:
+        assert path is None
+    assert store.nbytes == 0
+    assert not list(store._dir().iterdir())
@@ -0,0 +1,262 @@
+"""``extract_data_async`` runs the same cascade as ``extract_data``, awaitably."""
+
+import asyncio
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from invoice2data import NoTemplateFoundError
+from invoice2data import extract_data
+from invoice2data import extract_data_async
+from invoice2data.ai.config import AIConfig
+from invoice2data.ai.fallback import ai_fallback_extract_async
+from invoice2data.ai.providers.mock import MockProvider
+from invoice2data.ai.providers.openai_compatible import OpenAICompatibleProvider
+from invoice2data.extract.loader import read_templates
+from invoice2data.input import _aio
+from invoice2data.input import _async_texts
+from invoice2data.input import extract_text_async
+from invoice2data.input import text
+
+
+pytestmark = pytest.mark.windows_strict
+
+COMPARE = Path(__file__).parent / "compare"
+TEMPLATES = read_templates()
+
+
+def test_same_result_as_extract_data() -> None:
+    for path in sorted(COMPARE.glob("*.txt")):
+        expected = extract_data(str(path), TEMPLATES)
+        assert asyncio.run(extract_data_async(str(path), TEMPLATES)) == expected
+
+
+def test_loads_templates_when_none_given() -> None:
+    path = str(COMPARE / "Orlen.txt")
+    assert asyncio.run(extract_data_async(path)) == extract_data(path)
+
+
+def test_many_documents_in_flight(tmp_path: Path) -> None:
+    source = (COMPARE / "Orlen.txt").read_text(encoding="utf-8")
+    paths = []
+    for index in range(200):
+        path = tmp_path / f"orlen-{index}.txt"
+        path.write_text(source, encoding="utf-8")
+        paths.append(str(path))
+
+    async def main() -> list[dict[str, Any]]:
+        return await asyncio.gather(*(extract_data_async(p, TEMPLATES) for p in paths))
+
+    results = asyncio.run(main())
+    assert len(results) == 200
+    assert all(r["issuer"] == results[0]["issuer"] for r in results)
+    assert results[0]["issuer"]
+
+
+def _sleepy_backend(delay: float, content: str) -> types.ModuleType:
+    """A backend whose async path sleeps and whose blocking path must not run."""
+    module = types.ModuleType("sleepy")
+
+    def to_text(path: str, area_details: Any = None) -> str:
+        raise AssertionError("the blocking path should not be used")
+
+    async def to_text_async(path: str) -> str:
+        await asyncio.sleep(delay)
+        return content
+
+    module.to_text = to_text  # type: ignore[attr-defined]
+    module.to_text_async = to_text_async  # type: ignore[attr-defined]
+    return module
+
+
+def test_async_backends_overlap(tmp_path: Path) -> None:
+    source = (COMPARE / "Orlen.txt").read_text(encoding="utf-8")
+    backend = _sleepy_backend(0.2, source)
+    paths = []
+    for index in range(20):
+        path = tmp_path / f"doc-{index}.pdf"
+        path.write_text(source, encoding="utf-8")
+        paths.append(str(path))
+
+    async def main() -> list[dict[str, Any]]:
+        return await asyncio.gather(
+            *(extract_data_async(p, TEMPLATES, backend) for p in paths)
+        )
+
+    start = time.perf_counter()
+    results = asyncio.run(main())
+    # Twenty 0.2s extractions, awaited together rather than one after another.
+    assert time.perf_counter() - start < 2.0
+    assert all(r["issuer"] for r in results)
+
+
+def test_async_text_is_memoized(tmp_path: Path) -> None:
+    calls: list[str] = []
+    module = types.ModuleType("counting")
+
+    async def to_text_async(path: str) -> str:
+        calls.append(path)
+        return "text"
+
+    module.to_text_async = to_text_async  # type: ignore[attr-defined]
+    path = tmp_path / "a.pdf"
+    path.write_bytes(b"")
+
+    async def main() -> None:
+        assert await extract_text_async(module, str(path)) == "text"
+        assert await extract_text_async(module, str(path)) == "text"
+
+    _async_texts.clear()
+    asyncio.run(main())
+    assert calls == [str(path)]
+
+
+def test_in_process_backend_runs_on_executor() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    path = str(COMPARE / "Orlen.txt")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = asyncio.run(
+            extract_data_async(path, TEMPLATES, text, executor=executor)
+        )
+    assert result == extract_data(path, TEMPLATES, text)
+
+
+def test_backends_not_declared_thread_safe_are_serialized(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    active: list[int] = []
+    peak: list[int] = []
+    module = types.ModuleType("native")
+
+    def to_text(path: str) -> str:
+        active.append(1)
+        peak.append(len(active))
+        time.sleep(0.01)
+        active.pop()
+        return "text"
+
+    module.to_text = to_text  # type: ignore[attr-defined]
+    paths = []
+    for index in range(8):
+        path = tmp_path / f"{index}.pdf"
+        path.write_bytes(b"")
+        paths.append(str(path))
+
+    async def main(executor: ThreadPoolExecutor) -> None:
+        await asyncio.gather(
+            *(extract_text_async(module, p, executor=executor) for p in paths)
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        asyncio.run(main(executor))
+    assert max(peak) == 1
+
+
+def test_backends_do_not_wait_for_each_other(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from invoice2data.input import extract_text
+    from invoice2data.input import pdfium
+
+    both_running = threading.Barrier(2, timeout=5)
+
+    def backend(name: str) -> types.ModuleType:
+        module = types.ModuleType(name)
+
+        def to_text(path: str) -> str:
+            both_running.wait()
+            return name
+
+        module.to_text = to_text  # type: ignore[attr-defined]
+        return module
+
+    path = tmp_path / "a.pdf"
+    path.write_bytes(b"")
+    # Neither waits for the PDFium lock, nor for the other backend.
+    with pdfium.LOCK, ThreadPoolExecutor(max_workers=2) as executor:
+        results = [
+            executor.submit(extract_text, backend(name), str(path))
+            for name in ("native_a", "native_b")
+        ]
+        assert [result.result() for result in results] == ["native_a", "native_b"]
+
+
+def test_raise_on_error(tmp_path: Path) -> None:
+    sample = tmp_path / "nomatch.txt"
+    sample.write_text("nothing to see here", encoding="utf-8")
+    assert asyncio.run(extract_data_async(str(sample), TEMPLATES)) == {}
+    with pytest.raises(NoTemplateFoundError):
+        asyncio.run(extract_data_async(str(sample), TEMPLATES, raise_on_error=True))
+
+
+def test_ai_fallback(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    canned = {"amount": "55.00", "date": "2024-03-01", "invoice_number": "X-1"}
+    monkeypatch.setattr(
+        "invoice2data.ai.fallback.get_provider", lambda: MockProvider(canned)
+    )
+    sample = tmp_path / "nomatch.txt"
+    sample.write_text("some unrecognized document text 12345", encoding="utf-8")
+
+    result = asyncio.run(extract_data_async(str(sample), TEMPLATES, ai_fallback=True))
+    assert result["extraction_method"] == "ai"
+    assert result["amount"] == 55.0
+
+
+def test_ai_fallback_prefers_async_provider_method() -> None:
+    class AsyncProvider(MockProvider):
+        def extract_structured(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+            raise AssertionError("the blocking path should not be used")
+
+        async def extract_structured_async(
+            self, *args: Any, **kwargs: Any
+        ) -> dict[str, Any]:
+            return {"invoice_number": "A-1"}
+
+    result = asyncio.run(ai_fallback_extract_async("text", provider=AsyncProvider()))
+    assert result == {"invoice_number": "A-1", "extraction_method": "ai"}
+
+
+def test_openai_compatible_extract_async(monkeypatch: pytest.MonkeyPatch) -> None:
+    httpx = pytest.importorskip("httpx")
+    captured: dict[str, Any] = {}
+
+    def handler(request: Any) -> Any:
+        captured["url"] = str(request.url)
+        captured["authorization"] = request.headers["Authorization"]
+        return httpx.Response(
+            200, json={"choices": [{"message": {"content": '{"amount": 121.0}'}}]}
+        )
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    provider = OpenAICompatibleProvider(
+        AIConfig("deepseek", "deepseek-chat", "https://api.deepseek.com/v1", "sekret")
+    )
+    result = asyncio.run(provider.extract_structured_async("total 121.00", {}))
+
+    assert result == {"amount": 121.0}
+    assert captured["url"] == "https://api.deepseek.com/v1/chat/completions"
+    assert captured["authorization"] == "Bearer sekret"
+
+
+def test_subprocess_helper_feeds_stdin_and_reads_stdout() -> None:
+    cmd = [sys.executable, "-c", "import sys; print(sys.stdin.read().upper())"]
+    assert asyncio.run(_aio.run(cmd, stdin=b"abc")).strip() == b"ABC"
+
+
+def test_subprocess_helper_kills_on_timeout() -> None:
+    cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        asyncio.run(_aio.run(cmd, timeout=0.5))
+    assert time.perf_counter() - start < 10
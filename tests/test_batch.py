@@ -0,0 +1,196 @@
+"""extract_many runs extract_data over a process pool, file by file."""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+from invoice2data import BatchResult
+from invoice2data import Invoice2Data
+from invoice2data import batch
+from invoice2data import extract_data
+from invoice2data import extract_many
+from invoice2data.__main__ import main
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.loader import read_templates
+from invoice2data.input import disk_cache
+from invoice2data.input import ocr_pool
+from invoice2data.input import text
+
+
+pytestmark = pytest.mark.windows_strict
+
+CUSTOM = Path(__file__).parent / "custom"
+TEMPLATES = str(CUSTOM / "templates")
+FILES = sorted(str(path) for path in CUSTOM.glob("*.txt"))
+
+#: Matches none of :data:`FILES`.
+NEVER = InvoiceTemplate(
+    [
+        ("issuer", "never"),
+        ("keywords", ["no such keyword"]),
+        ("template_name", "never.yml"),
+        ("fields", {"amount": r"(\d+)"}),
+    ]
+)
+
+needs_fork = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="patches the worker function through fork",
+)
+
+
+def test_results_match_serial_extraction_in_input_order() -> None:
+    templates = read_templates(TEMPLATES)
+    expected = [extract_data(path, templates) for path in FILES]
+    results = list(extract_many(FILES, TEMPLATES, workers=2))
+    assert [r.path for r in results] == FILES
+    assert [r.data for r in results] == expected
+    assert all(r.error is None for r in results)
+    assert all(r.data for r in results)
+
+
+def test_template_list_and_unordered_mode() -> None:
+    templates = read_templates(TEMPLATES)
+    results = list(
+        extract_many(FILES * 2, templates, workers=3, ordered=False, input_module=text)
+    )
+    assert sorted(r.path for r in results) == sorted(FILES * 2)
+    assert all(r.data["issuer"] for r in results)
+
+
+def test_single_worker_runs_in_process() -> None:
+    results = list(extract_many(FILES[:1], TEMPLATES, workers=1))
+    assert results[0].data == extract_data(FILES[0], read_templates(TEMPLATES))
+
+
+def test_single_worker_leaves_process_settings_alone(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(batch, "_templates", [])
+    monkeypatch.delenv(ocr_pool.MAX_OCR_WORKERS_ENV, raising=False)
+    monkeypatch.setattr(ocr_pool, "_configured", None)
+    monkeypatch.setattr(ocr_pool, "_configured_batch_size", None)
+    cache = disk_cache.get_disk_cache()
+
+    assert next(extract_many(FILES[:1], TEMPLATES, workers=1)).data
+
+    monkeypatch.setenv(ocr_pool.MAX_OCR_WORKERS_ENV, "3")
+    assert ocr_pool.max_ocr_workers() == 3  # still follows the environment
+    assert disk_cache.get_disk_cache() is cache
+    assert batch._templates == []
+
+
+def test_concurrent_single_worker_calls_keep_their_templates() -> None:
+    templates = read_templates(TEMPLATES)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def run(chosen: list[Any]) -> list[dict[str, Any]]:
+        results = extract_many(FILES, chosen, workers=1, input_module=text)
+        first = next(results)
+        barrier.wait()  # both calls have loaded their templates
+        return [first.data, *(r.data for r in results)]
+
+    with ThreadPoolExecutor(2) as pool:
+        everything = pool.submit(run, templates)
+        nothing = pool.submit(run, [NEVER])
+        assert all(everything.result())
+        assert not any(nothing.result())
+
+
+def test_unreadable_file_yields_empty_result(tmp_path: Path) -> None:
+    missing = str(tmp_path / "missing.txt")
+    results = list(extract_many([missing, FILES[0]], TEMPLATES, workers=2))
+    assert results[0] == BatchResult(missing, {}, None)
+    assert results[1].data
+
+
+def test_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    def slow(path: str, **kwargs: Any) -> dict[str, Any]:
+        time.sleep(5)
+        return {}
+
+    monkeypatch.setattr(batch, "extract_data", slow)
+    start = time.monotonic()
+    [result] = extract_many(FILES[:1], [], workers=1, timeout=0.2)
+    assert time.monotonic() - start < 2
+    assert result.error is not None
+    assert result.error.startswith("ExtractionTimeoutError")
+
+
+@pytest.mark.parametrize("input_module", [None, "text"])
+def test_timeout_in_the_backend_is_not_a_backend_failure(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, input_module: str | None
+) -> None:
+    def slow(path: str, **kwargs: Any) -> str:
+        time.sleep(5)
+        return ""
+
+    monkeypatch.setattr(text, "to_text", slow)
+    # A fresh copy, so no cached text spares the backend call.
+    invoice = tmp_path / "invoice.txt"
+    invoice.write_bytes(Path(FILES[0]).read_bytes())
+    start = time.monotonic()
+    [result] = extract_many(
+        [invoice], TEMPLATES, workers=1, input_module=input_module, timeout=0.2
+    )
+    assert time.monotonic() - start < 2
+    assert result.error is not None
+    assert result.error.startswith("ExtractionTimeoutError")
+
+
+@needs_fork
+def test_crashed_worker_costs_only_its_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    real = batch.extract_data
+
+    def crashy(path: str, **kwargs: Any) -> dict[str, Any]:
+        if path == "crash":
+            os._exit(1)
+        return real(path, **kwargs)
+
+    monkeypatch.setattr(batch, "extract_data", crashy)
+    paths = [FILES[0], "crash", *FILES[1:]]
+    results = list(extract_many(paths, TEMPLATES, workers=2))
+    assert [r.path for r in results] == paths
+    assert results[1].error is not None
+    assert results[1].error.startswith("BrokenProcessPool")
+    assert all(r.data for r in results if r.path != "crash")
+
+
+def test_unregistered_input_module_is_rejected() -> None:
+    with pytest.raises(ValueError, match="registered input module"):
+        list(extract_many(FILES, TEMPLATES, input_module="nope"))
+
+
+def test_invoice2data_class() -> None:
+    i2d = Invoice2Data(load_built_in_templates=False)
+    i2d.read_templates(TEMPLATES)
+    results = list(i2d.extract_many(FILES, workers=2))
+    assert all(r.data for r in results)
+
+
+def test_cli_jobs(tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    result = CliRunner().invoke(
+        main,
+        [
+            "--jobs",
+            "2",
+            "--exclude-built-in-templates",
+            "-t",
+            TEMPLATES,
+            "-f",
+            "json",
+            "-o",
+            str(out),
+            *FILES,
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "out.json").read_text().count('"issuer"') == len(FILES)
@@ -0,0 +1,115 @@
+"""Column-at-a-time coercion gives the values per-cell coercion gives."""
+
+import copy
+from typing import Any
+
+import pytest
+
+from invoice2data.exceptions import TemplateSyntaxError
+from invoice2data.extract import _columns
+from invoice2data.extract import _regex
+from invoice2data.extract.invoice_template import InvoiceTemplate
+
+
+pytestmark = pytest.mark.windows_strict
+
+NUMBERS = [
+    "12",
+    "",
+    "1,234.50",
+    "1.234,50",
+    "1 234,5",
+    "1\N{NO-BREAK SPACE}234.5",
+    "12'345.00",
+    "-3.5",
+    " 7 ",
+    "1e3",
+    "0,5",
+    "1_000",
+    "inf",
+]
+DATES = ["01.02.2024", "", "15.02.2024", "01.02.2024", "2024-03-05", "31.13.2024"]
+
+
+def _template(**options: Any) -> InvoiceTemplate:
+    return InvoiceTemplate(
+        [
+            ("issuer", "test"),
+            ("keywords", ["test"]),
+            ("template_name", "columns.yml"),
+            ("options", options),
+        ]
+    )
+
+
+def _per_cell(
+    template: InvoiceTemplate, rows: list[dict[str, Any]], types: dict[str, str]
+) -> list[dict[str, Any]]:
+    rows = copy.deepcopy(rows)
+    for row in rows:
+        for name in row:
+            if name in types:
+                row[name] = template.coerce_type(row[name], types[name])
+    return rows
+
+
+def _rows(values: list[str], name: str, repeat: int = 10) -> list[dict[str, Any]]:
+    return [{name: value, "text": "x"} for value in values * repeat]
+
+
+@pytest.mark.parametrize(
+    ("decimal_separator", "kind"), [(".", "float"), (",", "float"), (",", "int")]
+)
+def test_numbers_match_per_cell_coercion(decimal_separator: str, kind: str) -> None:
+    template = _template(decimal_separator=decimal_separator)
+    values = [value for value in NUMBERS if value.count(decimal_separator) < 2]
+    valid = []
+    for value in values:
+        try:
+            template.coerce_type(value, kind)
+        except (ValueError, OverflowError):
+            continue
+        valid.append(value)
+    rows = _rows(valid, "amount")
+    expected = _per_cell(template, rows, {"amount": kind})
+    _columns.coerce_rows(template, rows, {"amount": kind})
+    assert rows == expected
+    assert [type(row["amount"]) for row in rows] == [
+        type(row["amount"]) for row in expected
+    ]
+
+
+@pytest.mark.parametrize("date_formats", [["%d.%m.%Y"], ["%Y-%m-%d", "%d.%m.%Y"], []])
+def test_dates_match_per_cell_coercion(date_formats: list[str]) -> None:
+    template = _template(date_formats=date_formats)
+    rows = _rows(DATES, "date")
+    expected = _per_cell(template, rows, {"date": "date"})
+    _columns.coerce_rows(template, rows, {"date": "date"})
+    assert rows == expected
+
+
+def test_a_column_it_cannot_convert_falls_back_to_per_cell_errors() -> None:
+    template = _template(decimal_separator=",")
+    rows = [*_rows(["1,5", "2"], "amount"), {"amount": "1,2,3"}]
+    with pytest.raises(TemplateSyntaxError, match="more than once"):
+        _columns.coerce_rows(template, rows, {"amount": "float"})
+    rows = _rows(["1", "abc"], "qty")
+    with pytest.raises(ValueError, match="abc"):
+        _columns.coerce_rows(template, rows, {"qty": "int"})
+    with pytest.raises(TemplateSyntaxError, match="Unknown field type"):
+        _columns.coerce_rows(template, _rows(["1"], "qty", 40), {"qty": "decimal"})
+
+
+def test_short_blocks_stay_per_cell(monkeypatch: pytest.MonkeyPatch) -> None:
+    template = _template()
+    monkeypatch.setattr(
+        _columns, "_coerce_columns", lambda *args: pytest.fail("bulk path used")
+    )
+    rows = _rows(["1.5"], "amount", _columns.MIN_ROWS - 1)
+    _columns.coerce_rows(template, rows, {"amount": "float"})
+    assert rows[0]["amount"] == 1.5
+
+
+def test_no_whitespace_above_the_cleanup_range() -> None:
+    above = "".join(map(chr, range(_columns._LAST_SPACE + 1, 0x110000)))
+    assert _regex.search(r"\s", above) is None
@@ -0,0 +1,130 @@
+"""Templates are compiled once into an immutable plan that ``extract`` runs."""
+
+import pickle
+from typing import Any
+
+import pytest
+
+from invoice2data.exceptions import TemplateSyntaxError
+from invoice2data.extract.compiled import CompiledTemplate
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.loader import read_templates
+
+
+pytestmark = pytest.mark.windows_strict
+
+TEXT = """ACME Corp
+Invoice number: INV-42
+Date: 2024-03-01
+Total: 1,234.50
+Tax: 10.00
+Tax: 5.00
+Items
+1 Widget 3
+2 Gadget 4
+End
+"""
+
+
+def _tpl(**extra: Any) -> InvoiceTemplate:
+    tpl: dict[str, Any] = {
+        "template_name": "acme.yml",
+        "issuer": "ACME",
+        "keywords": ["ACME"],
+        "exclude_keywords": [],
+        "fields": {
+            "invoice_number": {"parser": "regex", "regex": r"Invoice number: (\S+)"},
+            "date": r"Date: (\d{4}-\d{2}-\d{2})",
+            "amount": {
+                "parser": "regex",
+                "regex": r"Total: ([\d,.]+)",
+                "type": "float",
+            },
+            "sum_amount_tax": [r"Tax: ([\d.]+)"],
+            "static_vat": "NL123",
+            "lines": {
+                "parser": "lines",
+                "start": "Items",
+                "end": "End",
+                "line": r"(?P<pos>\d+) (?P<name>\w+) (?P<qty>\d+)",
+                "types": {"qty": "int"},
+            },
+        },
+    }
+    tpl.update(extra)
+    return InvoiceTemplate(tpl)
+
+
+def test_plan_is_built_once_and_cached() -> None:
+    template = _tpl()
+    plan = template.compile()
+    assert isinstance(plan, CompiledTemplate)
+    assert template.compile() is plan
+    kinds = {field.name: field.kind for field in plan.fields or ()}
+    assert kinds == {
+        "invoice_number": "parser",
+        "date": "legacy",
+        "amount": "parser",
+        "amount_tax": "legacy",
+        "vat": "static",
+        "lines": "parser",
+    }
+    assert plan.required_fields == ("date", "amount", "invoice_number", "issuer")
+
+
+def test_loader_compiles_templates() -> None:
+    assert all("_compiled" in vars(t) for t in read_templates())
+
+
+def test_extract_runs_the_plan() -> None:
+    template = _tpl()
+    text = template.prepare_input(TEXT)
+    result = template.extract(text, "in.txt", None)
+    assert result["invoice_number"] == "INV-42"
+    assert result["amount"] == 1234.5
+    assert result["amount_tax"] == 15.0
+    assert result["vat"] == "NL123"
+    assert result["date"].year == 2024
+    assert result["lines"] == [
+        {"pos": "1", "name": "Widget", "qty": 3},
+        {"pos": "2", "name": "Gadget", "qty": 4},
+    ]
+    # Running it twice gives the same answer (no settings mutated in between).
+    assert template.extract(text, "in.txt", None) == result
+
+
+def test_replace_option_is_precompiled() -> None:
+    template = _tpl(options={"replace": [["Corp", "Inc"], ["INV-", "N"]]})
+    assert template.prepare_input("ACME Corp INV-1") == "ACME Inc N1"
+
+
+def test_malformed_replace_still_raises_on_use() -> None:
+    template = _tpl(options={"replace": [["a", "b", "c"]]})
+    assert template.compile().replace is None
+    with pytest.raises(TemplateSyntaxError):
+        template.prepare_input(TEXT)
+
+
+def test_invalid_field_settings_defer_their_error_to_extract() -> None:
+    fields = {"lines": {"parser": "lines", "line": "(?P<x>.)"}}  # no start/end
+    template = _tpl(fields=fields, required_fields=["lines"])
+    template.compile()  # loading must not fail
+    with pytest.raises(TemplateSyntaxError, match="start"):
+        template.extract(TEXT, "in.txt", None)
+
+
+def test_missing_fields_is_a_template_error() -> None:
+    template = InvoiceTemplate({"template_name": "x.yml", "keywords": ["x"]})
+    assert template.compile().fields is None
+    with pytest.raises(TemplateSyntaxError, match="fields"):
+        template.extract(TEXT, "in.txt", None)
+
+
+def test_pickle_drops_the_plan() -> None:
+    template = _tpl(options={"decimal_separator": ","})
+    template.compile()
+    clone = pickle.loads(pickle.dumps(template))  # noqa: S301
+    assert clone == template
+    assert clone.options == template.options
+    assert "_compiled" not in vars(clone)
+    assert clone.extract(clone.prepare_input(TEXT), "in.txt", None)["vat"] == "NL123"
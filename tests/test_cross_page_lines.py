@@ -12,6 +12,10 @@ Confirms the building blocks for multi-page invoices:
   pages where the ``end`` pattern repeats per-page (e.g. a footer).
 """
 
+from typing import Any
+
+import pytest
+
 from invoice2data.extract.invoice_template import InvoiceTemplate
 from invoice2data.extract.parsers import lines as lines_parser
 
@@ -175,3 +179,44 @@ def test_end_match_invalid_value_falls_back_to_first() -> None:
     content = "ITEMS\nSKU0001\nDone\n"
     rows = lines_parser.parse_by_rule(_TPL, "lines", settings, content)
     assert [r["sku"] for r in rows] == ["SKU0001"]
+
+
+# === Repeated blocks are scanned in place ===
+
+
+def test_repeated_blocks_are_each_parsed_from_their_own_text(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Every block is found; only each block's own text is handed on."""
+    settings = {
+        "line_separator": r"\n",
+        "start": r"(?m)^ITEMS$",
+        "end": r"(?m)^Done$",
+        "line": r"(?m)^(?P<sku>SKU\d+)$",
+    }
+    content = "".join(f"ITEMS\nSKU{i:04d}\nDone\nnoise\n" for i in range(500))
+    blocks: list[str] = []
+    parse_block = lines_parser._parse_block
+
+    def record(template: Any, field: str, rule: Any, block: str) -> Any:
+        blocks.append(block)
+        return parse_block(template, field, rule, block)
+
+    monkeypatch.setattr(lines_parser, "_parse_block", record)
+    rows = lines_parser.parse_by_rule(_TPL, "lines", settings, content)
+    assert [r["sku"] for r in rows] == [f"SKU{i:04d}" for i in range(500)]
+    assert blocks == [f"\nSKU{i:04d}\n" for i in range(500)]
+
+
+@pytest.mark.parametrize("start", [r"^ITEMS", r"\AITEMS"])
+def test_anchored_start_matches_right_after_the_previous_block(start: str) -> None:
+    r"""``^`` and ``\A`` see the text after the previous ``end``, as before."""
+    settings = {
+        "line_separator": r"\n",
+        "start": start,
+        "end": r"Done\n",
+        "line": r"(?m)^(?P<sku>SKU\d+)$",
+    }
+    content = "".join(f"ITEMS\nSKU{i:04d}\nDone\n" for i in range(3))
+    rows = lines_parser.parse_by_rule(_TPL, "lines", settings, content)
+    assert [r["sku"] for r in rows] == ["SKU0000", "SKU0001", "SKU0002"]
@@ -0,0 +1,253 @@
+"""The persistent text cache is shared across processes and keyed by content."""
+
+import multiprocessing
+import os
+import pickle
+import sys
+import types
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from invoice2data.input import _cached_to_text
+from invoice2data.input import disk_cache
+from invoice2data.input import extract_text
+from invoice2data.input.disk_cache import DiskTextCache
+from invoice2data.input.disk_cache import configure_disk_cache
+from invoice2data.input.disk_cache import get_disk_cache
+
+
+pytestmark = pytest.mark.windows_strict
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[DiskTextCache]:
+    enabled = configure_disk_cache(tmp_path / "cache")
+    assert enabled is not None
+    _cached_to_text.cache_clear()
+    yield enabled
+    configure_disk_cache(None)
+    _cached_to_text.cache_clear()
+
+
+def _backend(calls: list[str], name: str = "fake_ocr") -> types.ModuleType:
+    module = types.ModuleType(name)
+
+    def to_text(path: str, area: dict[str, int] | None = None) -> str:
+        calls.append(path)
+        return f"text of {Path(path).read_bytes()!r} in {area}"
+
+    module.to_text = to_text  # type: ignore[attr-defined]
+    return module
+
+
+def _pdf(folder: Path, name: str, content: bytes = b"%PDF-1.4 one") -> str:
+    path = folder / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_text_survives_the_in_process_cache(
+    cache: DiskTextCache, tmp_path: Path
+) -> None:
+    calls: list[str] = []
+    backend = _backend(calls)
+    pdf = _pdf(tmp_path, "a.pdf")
+    first = extract_text(backend, pdf)
+    _cached_to_text.cache_clear()  # as in a new process
+    assert extract_text(backend, pdf) == first
+    assert calls == [pdf]
+
+
+def test_key_is_the_content_not_the_path(cache: DiskTextCache, tmp_path: Path) -> None:
+    calls: list[str] = []
+    backend = _backend(calls)
+    extract_text(backend, _pdf(tmp_path, "a.pdf"))
+    extract_text(backend, _pdf(tmp_path, "copy.pdf"))
+    assert len(calls) == 1
+    extract_text(backend, _pdf(tmp_path, "other.pdf", b"%PDF-1.4 two"))
+    assert len(calls) == 2
+
+
+def test_backend_area_and_config_are_part_of_the_key(
+    cache: DiskTextCache, tmp_path: Path
+) -> None:
+    calls: list[str] = []
+    backend = _backend(calls)
+    pdf = _pdf(tmp_path, "a.pdf")
+    extract_text(backend, pdf)
+    extract_text(_backend(calls, "other_backend"), pdf)
+    extract_text(backend, pdf, {"f": 1, "l": 1, "x": 0, "y": 0, "W": 9, "H": 9})
+    assert len(calls) == 3
+
+    backend.cache_config = lambda: "deu"  # type: ignore[attr-defined]
+    _cached_to_text.cache_clear()
+    extract_text(backend, pdf)
+    assert len(calls) == 4
+
+
+def test_backends_can_opt_out(cache: DiskTextCache, tmp_path: Path) -> None:
+    calls: list[str] = []
+    backend = _backend(calls)
+    backend.CACHE_TEXT = False  # type: ignore[attr-defined]
+    pdf = _pdf(tmp_path, "a.pdf")
+    extract_text(backend, pdf)
+    _cached_to_text.cache_clear()
+    extract_text(backend, pdf)
+    assert len(calls) == 2
+
+
+def test_text_is_compressed(tmp_path: Path) -> None:
+    cache = DiskTextCache(tmp_path)
+    text = "Invoice line 1  Widget  10.00\n" * 1000
+    cache.put("k", text)
+    assert cache.get("k") == text
+    with cache._connection() as connection:
+        (size,) = connection.execute("SELECT size FROM texts").fetchone()
+    assert size < len(text) / 10
+
+
+def test_least_recently_used_entries_are_evicted(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(disk_cache, "TOUCH_INTERVAL", 0)
+    cache = DiskTextCache(tmp_path, max_bytes=2500)
+    blobs = {key: os.urandom(1000).hex() for key in "abc"}  # ~1.1 KB compressed
+    cache.put("a", blobs["a"])
+    cache.put("b", blobs["b"])
+    assert cache.get("a") is not None  # "b" is now the least recently used
+    cache.put("c", blobs["c"])
+    assert cache.get("b") is None
+    assert cache.get("a") == blobs["a"]
+    assert cache.get("c") == blobs["c"]
+
+
+def test_a_recent_hit_does_not_write(tmp_path: Path) -> None:
+    cache = DiskTextCache(tmp_path)
+    cache.put("k", "text")
+    connection = cache._connection()
+    changes = connection.total_changes
+    assert cache.get("k") == "text"
+    assert connection.total_changes == changes
+
+
+def test_the_size_total_follows_replacements_and_evictions(tmp_path: Path) -> None:
+    cache = DiskTextCache(tmp_path, max_bytes=2500)
+    for key in "abab":
+        cache.put(key, os.urandom(1000).hex())
+    cache.put("c", "short")
+    connection = cache._connection()
+    (total,) = connection.execute("SELECT value FROM stats").fetchone()
+    (actual,) = connection.execute("SELECT sum(size) FROM texts").fetchone()
+    assert total == actual <= 2500
+    cache.clear()
+    assert connection.execute("SELECT value FROM stats").fetchone() == (0,)
+
+
+def test_a_corrupt_entry_is_a_miss_and_dropped(tmp_path: Path) -> None:
+    cache = DiskTextCache(tmp_path)
+    cache.put("k", "text")
+    connection = cache._connection()
+    connection.execute("UPDATE texts SET text = ? WHERE key = 'k'", (b"garbage",))
+    assert cache.get("k") is None
+    assert connection.execute("SELECT count(*) FROM texts").fetchone() == (0,)
+
+
+def test_blank_text_is_not_cached(cache: DiskTextCache, tmp_path: Path) -> None:
+    texts = ["", "recovered"]
+    calls: list[str] = []
+    module = types.ModuleType("flaky_ocr")
+
+    def to_text(path: str) -> str:
+        calls.append(path)
+        return texts[len(calls) - 1]
+
+    module.to_text = to_text  # type: ignore[attr-defined]
+    pdf = _pdf(tmp_path, "a.pdf")
+    assert extract_text(module, pdf) == ""
+    assert extract_text(module, pdf) == "recovered"
+    _cached_to_text.cache_clear()
+    assert extract_text(module, pdf) == "recovered"
+    assert len(calls) == 2
+
+
+def test_a_broken_database_is_a_miss(tmp_path: Path) -> None:
+    (tmp_path / "texts.sqlite3").write_bytes(b"not a database" * 100)
+    cache = DiskTextCache(tmp_path)
+    assert cache.get("k") is None
+    cache.put("k", "text")  # logged, not raised
+
+
+def test_environment_enables_the_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(disk_cache, "_resolved", False)
+    monkeypatch.setattr(disk_cache, "_cache", None)
+    monkeypatch.setenv("INVOICE2DATA_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("INVOICE2DATA_CACHE_MAX_MB", "3")
+    cache = get_disk_cache()
+    assert cache is not None
+    assert cache.directory == tmp_path
+    assert cache.max_bytes == 3 * 1024 * 1024
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("1.5", 3 * 512 * 1024),
+        ("lots", disk_cache.DEFAULT_MAX_BYTES),
+        ("-2", disk_cache.DEFAULT_MAX_BYTES),
+        ("nan", disk_cache.DEFAULT_MAX_BYTES),
+    ],
+)
+def test_the_size_bound_from_the_environment(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    tmp_path: Path,
+    value: str,
+    expected: int,
+) -> None:
+    monkeypatch.setattr(disk_cache, "_resolved", False)
+    monkeypatch.setattr(disk_cache, "_cache", None)
+    monkeypatch.setenv("INVOICE2DATA_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("INVOICE2DATA_CACHE_MAX_MB", value)
+    cache = get_disk_cache()
+    assert cache is not None
+    assert cache.max_bytes == expected
+    assert ("INVOICE2DATA_CACHE_MAX_MB" in caplog.text) == (value != "1.5")
+
+
+def test_pickles_without_its_connections(tmp_path: Path) -> None:
+    cache = DiskTextCache(tmp_path, max_bytes=1234)
+    cache.put("k", "text")
+    clone = pickle.loads(pickle.dumps(cache))  # noqa: S301
+    assert (clone.directory, clone.max_bytes) == (tmp_path, 1234)
+    assert clone.get("k") == "text"
+
+
+def _hammer(directory: str, worker: int) -> None:
+    cache = DiskTextCache(directory, max_bytes=200_000)
+    for index in range(100):
+        text = f"text {worker} {index} " * 50
+        cache.put(f"{worker}-{index}", text)
+        cache.get(f"{(worker + 1) % 4}-{index}")
+        if cache.get(f"{worker}-{index}") != text:
+            sys.exit(1)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses fork")
+def test_concurrent_writers_share_one_database(tmp_path: Path) -> None:
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_hammer, args=(str(tmp_path), worker))
+        for worker in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+    assert [process.exitcode for process in processes] == [0, 0, 0, 0]
+    cache = DiskTextCache(tmp_path)
+    for worker in range(4):
+        assert cache.get(f"{worker}-99") == f"text {worker} 99 " * 50
@@ -0,0 +1,97 @@
+"""Documents given as bytes or file objects are extracted like paths."""
+
+import hashlib
+import io
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from invoice2data import extract_data
+from invoice2data.extract.loader import read_templates
+from invoice2data.input import _cached_to_text
+from invoice2data.input import _memory
+from invoice2data.input import disk_cache
+from invoice2data.input import extract_text
+from invoice2data.input import is_available
+from invoice2data.input import pdfium
+from invoice2data.input import pdfminer_wrapper
+from invoice2data.input import pdfplumber
+from invoice2data.input import pdftotext
+from invoice2data.input import tesseract
+from invoice2data.input import text
+
+
+pytestmark = pytest.mark.windows_strict
+
+AWS = Path(__file__).parent / "compare" / "AmazonWebServices.pdf"
+OYO = Path(__file__).parent / "compare" / "oyo.pdf"
+
+
+@pytest.fixture(scope="module")
+def templates() -> list[Any]:
+    return read_templates()
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview, io.BytesIO])
+def test_buffers_extract_like_the_path(templates: list[Any], wrap: Any) -> None:
+    expected = extract_data(str(AWS), templates, pdfium)
+    assert expected["issuer"] == "Amazon Web Services"
+    assert extract_data(wrap(AWS.read_bytes()), templates, pdfium) == expected
+    assert not _memory._documents  # unregistered on return
+
+
+def test_an_open_binary_file_is_read(templates: list[Any]) -> None:
+    with AWS.open("rb") as file:
+        assert (
+            extract_data(file, templates, "pdfium")["issuer"] == "Amazon Web Services"
+        )
+
+
+@pytest.mark.parametrize("module", [pdfium, pdfplumber, pdfminer_wrapper, pdftotext])
+def test_buffer_backends_read_the_bytes_themselves(
+    module: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if not is_available(module):
+        pytest.skip(f"{module.__name__} not available")
+    monkeypatch.setattr(_memory, "as_path", None)  # no temporary file
+    expected = module.to_text(str(OYO))
+    with _memory.registered(OYO.read_bytes()) as name:
+        assert module.to_text(name) == expected
+
+
+def test_names_carry_the_content_hash() -> None:
+    data = OYO.read_bytes()
+    with _memory.registered(data) as first, _memory.registered(data) as second:
+        assert first == second
+        assert first.endswith(".pdf")
+        assert _memory.digest(first) == hashlib.sha256(data).hexdigest()
+        assert disk_cache._content_hash(first, None) == _memory.digest(first)
+    assert not _memory._documents
+    with _memory.registered(OYO) as path:
+        assert path == str(OYO)
+
+
+def test_backends_without_buffer_support_get_a_temporary_file(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seen: list[str] = []
+
+    def to_text(path: str) -> str:
+        seen.append(path)
+        return Path(path).read_text()
+
+    monkeypatch.setattr(tesseract, "to_text", to_text)
+    _cached_to_text.cache_clear()
+    with _memory.registered(b"Total: 12.00\n") as name:
+        assert name.endswith(".txt")
+        assert extract_text(tesseract, name) == "Total: 12.00\n"
+        assert extract_text(text, name) == "Total: 12.00\n"
+        assert Path(seen[0]).suffix == ".txt"
+        assert Path(seen[0]).exists()
+    assert not Path(seen[0]).exists()
+
+
+def test_text_file_objects_are_rejected() -> None:
+    with pytest.raises(TypeError, match="binary"):
+        extract_data(io.StringIO("text"), [])  # type: ignore[arg-type]
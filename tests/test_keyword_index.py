@@ -0,0 +1,114 @@
+"""The keyword index picks the same template as the linear ``matches_input`` scan."""
+
+from typing import Any
+
+import pytest
+from hypothesis import given
+from hypothesis import settings
+from hypothesis import strategies as st
+
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.keyword_index import KeywordIndex
+from invoice2data.extract.keyword_index import keyword_index
+from invoice2data.extract.loader import read_templates
+
+
+pytestmark = pytest.mark.windows_strict
+
+
+def _tpl(name: str, keywords: Any, exclude: Any = ()) -> InvoiceTemplate:
+    return InvoiceTemplate(
+        {
+            "template_name": name,
+            "issuer": name,
+            "keywords": list(keywords),
+            "exclude_keywords": list(exclude),
+        }
+    )
+
+
+def _linear(text: str, templates: list[InvoiceTemplate]) -> InvoiceTemplate | None:
+    for template in templates:
+        if template.matches_input(text):
+            return template
+    return None
+
+
+def test_first_match_in_list_order() -> None:
+    templates = [
+        _tpl("a", ["ACME", "Invoice"]),
+        _tpl("b", ["Invoice"]),
+        _tpl("c", ["ACME"]),
+    ]
+    index = KeywordIndex(templates)
+    assert index.match("ACME Invoice 42") is templates[0]
+    assert index.match("Invoice 42") is templates[1]
+    assert index.match("nothing") is None
+    assert index.candidates("ACME Invoice") == templates
+
+
+def test_exclude_keywords_skip_to_next_candidate() -> None:
+    templates = [_tpl("a", ["Invoice"], ["Credit note"]), _tpl("b", ["Invoice"])]
+    index = KeywordIndex(templates)
+    assert index.match("Invoice") is templates[0]
+    assert index.match("Invoice / Credit note") is templates[1]
+
+
+def test_overlapping_and_nested_keywords() -> None:
+    # "he" inside "she" inside "ushers": only found via the failure links.
+    templates = [_tpl("x", ["hers", "she"]), _tpl("y", ["he", "his"])]
+    index = KeywordIndex(templates)
+    assert index.match("ushers") is templates[0]
+    assert index.match("this hen") is templates[1]
+
+
+def test_empty_keyword_and_keywordless_template() -> None:
+    templates = [_tpl("x", ["", "zzz"]), _tpl("y", [])]
+    index = KeywordIndex(templates)
+    assert index.match("") is templates[1]
+    assert index.match("zzz") is templates[0]
+
+
+def test_non_string_keywords_fall_back_to_matches_input() -> None:
+    odd = _tpl("odd", [2024])
+    with pytest.raises(TypeError):
+        odd.matches_input("2024")  # what the linear scan does today
+    index = KeywordIndex([_tpl("a", ["A"]), odd])
+    assert index.match("A") is not None
+    with pytest.raises(TypeError):
+        index.match("B")
+
+
+def test_bundled_templates_agree_with_linear_scan() -> None:
+    templates = read_templates()
+    index = KeywordIndex(templates)
+    for template in templates:
+        text = " ".join(template["keywords"])
+        assert index.match(text) is _linear(text, templates)
+
+
+def test_keyword_index_is_cached_per_template_list() -> None:
+    templates = [_tpl("a", ["A"]), _tpl("b", ["B"])]
+    assert keyword_index(templates) is keyword_index(list(templates))
+    assert keyword_index(templates[::-1]) is not keyword_index(templates)
+
+
+_words = st.sampled_from(["ab", "abc", "bc", "c", "Total", "tal", "ACME", "é€"])
+
+
+@settings(max_examples=200, deadline=None)
+@given(
+    specs=st.lists(
+        st.tuples(
+            st.lists(_words, max_size=3), st.lists(_words, max_size=2, unique=True)
+        ),
+        min_size=1,
+        max_size=8,
+    ),
+    text=st.lists(_words, max_size=8).map(" ".join),
+)
+def test_matches_linear_scan(specs: list[Any], text: str) -> None:
+    templates = [_tpl(str(i), kw, ex) for i, (kw, ex) in enumerate(specs)]
+    index = KeywordIndex(templates)
+    assert index.match(text) is _linear(text, templates)
+    assert index.candidates(text) == [t for t in templates if t.matches_input(text)]
@@ -0,0 +1,78 @@
+"""The combined line matcher agrees with searching the patterns one by one."""
+
+import dataclasses
+from typing import Any
+
+import pytest
+
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.parsers import lines
+
+
+pytestmark = pytest.mark.windows_strict
+
+_TPL = InvoiceTemplate(
+    [("issuer", "test"), ("keywords", ["test"]), ("template_name", "matcher.yml")]
+)
+
+CONTENT = (
+    "Item 1 Widget   3  4.50\n"
+    "  blue, large\n"
+    "  Subtotal 13.50 Item 9\n"
+    "ITEM 2 gadget   1  2.00\n"
+    "  end of item 2\n"
+    "Page 1 of 2 Item 3 page 1\n"
+    "Item 3 Gizmo    2  1.00\n"
+    "  red\n"
+)
+
+RULES: list[dict[str, Any]] = [
+    {"line": r"(?P<no>\d+)\s+(?P<name>\w+)"},
+    {
+        "first_line": r"(?i)^item (?P<no>\d+) (?P<name>\w+)",
+        "line": r"^\s+(?P<name>[a-z, ]+)$",
+        "skip_line": [r"Subtotal", r"^Page \d"],
+    },
+    {
+        "first_line": [r"^Item (?P<no>\d+)", r"(?i)item (?P<no>\d+)"],
+        "line": r"(?P<detail>\w+)$",
+        "last_line": r"end of item (?P<end>\d+)|(?P<colour>red)",
+    },
+    {
+        # A named back-reference is renamed along with its group.
+        "line": r"(?P<word>[a-z])(?P=word)",
+        "first_line": r"^Item (?P<no>\d)",
+    },
+]
+
+
+def _rule(settings: dict[str, Any]) -> Any:
+    return lines._block_rule(_TPL, {**lines.DEFAULT_OPTIONS, **settings})
+
+
+@pytest.mark.parametrize("rule", RULES)
+def test_combined_matcher_parses_like_the_patterns_one_by_one(
+    rule: dict[str, Any],
+) -> None:
+    combined = _rule(rule)
+    assert combined.matcher is not None
+    separate = dataclasses.replace(combined, matcher=None)
+    expected = lines._parse_block(_TPL, "lines", separate, CONTENT)
+    assert expected
+    assert lines._parse_block(_TPL, "lines", combined, CONTENT) == expected
+
+
+def test_skip_line_wins_over_an_earlier_line_match() -> None:
+    rule = _rule({"line": r"^Item (?P<no>\d+)", "skip_line": r"Subtotal"})
+    assert rule.matcher is not None
+    assert rule.matcher.match("Item 1 Subtotal", True) == ("skip", {})
+    assert rule.matcher.match("Item 1", False) == ("first", {"no": "1"})
+    assert rule.matcher.match("Subtotal", False) == ("skip", {})
+    assert rule.matcher.match("nothing", True) is None
+
+
+def test_numbered_back_references_are_searched_one_by_one() -> None:
+    rule = _rule({"line": r"(\w)\1(?P<rest>\w*)"})
+    assert rule.matcher is None
+    rows = lines._parse_block(_TPL, "lines", rule, "abba\nabc\nxxy\n")
+    assert rows == [{"rest": "a"}, {"rest": "y"}]
@@ -0,0 +1,121 @@
+"""Two-phase matching: leading pages first, the whole document only on a match."""
+
+import asyncio
+import types
+from pathlib import Path
+
+import pytest
+
+from invoice2data import api
+from invoice2data import extract_data
+from invoice2data import extract_data_async
+from invoice2data.extract.loader import ordered_load
+from invoice2data.extract.loader import prepare_template
+from invoice2data.extract.loader import read_templates
+from invoice2data.input import pdfium
+
+
+pytestmark = pytest.mark.windows_strict
+
+COMPARE = Path(__file__).parent / "compare"
+TEMPLATES = read_templates()
+ORLEN = (COMPARE / "Orlen.txt").read_text(encoding="utf-8")
+
+
+def _backend(
+    name: str, head: str, full: str, calls: list[str], whole: bool = False
+) -> types.ModuleType:
+    module = types.ModuleType(name)
+
+    def to_text(path: str) -> str:
+        calls.append(f"{name}:full")
+        return full
+
+    def to_text_head(path: str, pages: int) -> tuple[str, bool]:
+        calls.append(f"{name}:head{pages}")
+        return head, whole
+
+    module.to_text = to_text  # type: ignore[attr-defined]
+    module.to_text_head = to_text_head  # type: ignore[attr-defined]
+    return module
+
+
+@pytest.fixture
+def document(tmp_path: Path) -> str:
+    path = tmp_path / "long.pdf"
+    path.write_bytes(b"%PDF-1.4")
+    return str(path)
+
+
+def test_unmatched_head_skips_the_full_read(
+    document: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+    reader = _backend("fake", "nothing to see here", ORLEN, calls)
+    monkeypatch.setattr(api, "DEFAULT_INPUT_READERS", [reader])
+    assert extract_data(document, TEMPLATES, match_pages=1) == {}
+    assert calls == ["fake:head1"]
+
+
+def test_matched_head_reads_the_whole_document(
+    document: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+    reader = _backend("fake", ORLEN[:400], ORLEN, calls)
+    monkeypatch.setattr(api, "DEFAULT_INPUT_READERS", [reader])
+    assert extract_data(document, TEMPLATES, match_pages=1)["issuer"]
+    assert calls == ["fake:head1", "fake:full"]
+
+
+def test_whole_head_is_not_read_twice(
+    document: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+    reader = _backend("fake", ORLEN, "unused", calls, whole=True)
+    monkeypatch.setattr(api, "DEFAULT_INPUT_READERS", [reader])
+    result = asyncio.run(extract_data_async(document, TEMPLATES, match_pages=2))
+    assert result["issuer"]
+    assert calls == ["fake:head2"]
+
+
+def test_templates_can_ask_for_more_pages(
+    document: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+    reader = _backend("fake", "", "", calls)
+    monkeypatch.setattr(api, "DEFAULT_INPUT_READERS", [reader])
+    templates = [*TEMPLATES, *ordered_load('[{"keywords": ["x"], "match_pages": 4}]')]
+    extract_data(document, templates, match_pages=2)
+    assert calls[0] == "fake:head4"
+
+
+def test_backends_without_a_head_read_everything(
+    document: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+    reader = _backend("fake", "", ORLEN, calls)
+    del reader.to_text_head
+    monkeypatch.setattr(api, "DEFAULT_INPUT_READERS", [reader])
+    assert extract_data(document, TEMPLATES, match_pages=1)["issuer"]
+    assert calls == ["fake:full"]
+
+
+def test_pdfium_head(tmp_path: Path) -> None:
+    pypdfium2 = pytest.importorskip("pypdfium2")
+    source = pypdfium2.PdfDocument(str(COMPARE / "oyo.pdf"))
+    document = pypdfium2.PdfDocument.new()
+    document.import_pages(source, [0, 0, 0])
+    path = str(tmp_path / "three.pdf")
+    document.save(path)
+
+    head, whole = pdfium.to_text_head(path, 1)
+    assert not whole
+    assert head == pdfium.to_text(str(COMPARE / "oyo.pdf"))
+    assert pdfium.to_text_head(path, 3) == (pdfium.to_text(path), True)
+
+
+@pytest.mark.parametrize("value", [0, -1, "2", True, 1.5])
+def test_invalid_template_hint_is_dropped(value: object) -> None:
+    tpl = prepare_template({"keywords": ["x"], "match_pages": value})
+    assert tpl is not None
+    assert "match_pages" not in tpl
@@ -0,0 +1,230 @@
+"""Pages of many documents are OCRed in model-sized batches and scattered back."""
+
+import signal
+import sys
+import time
+import types
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from invoice2data import extract_many
+from invoice2data.input import INPUT_MODULES
+from invoice2data.input import _cached_to_text
+from invoice2data.input import doctr
+from invoice2data.input import extract_text
+from invoice2data.input import extract_text_batch
+from invoice2data.input import ocr_pool
+from invoice2data.input import paddleocr
+
+
+pytestmark = pytest.mark.windows_strict
+
+
+@pytest.fixture(autouse=True)
+def _unconfigured(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.delenv(ocr_pool.OCR_BATCH_SIZE_ENV, raising=False)
+    ocr_pool.configure_ocr_batch_size(None)
+    yield
+    ocr_pool.configure_ocr_batch_size(None)
+
+
+def _ocr(batches: list[list[str]]) -> Any:
+    def ocr(pages: list[str]) -> list[str]:
+        batches.append(list(pages))
+        return [page.upper() for page in pages]
+
+    return ocr
+
+
+def test_batches_span_documents_and_texts_go_back_to_theirs() -> None:
+    batches: list[list[str]] = []
+    documents = [["a1", "a2", "a3"], [], ["b1"], ["c1", "c2"]]
+    texts = ocr_pool.map_page_batches(_ocr(batches), documents, 4)
+    assert texts == ["A1\fA2\fA3", "", "B1", "C1\fC2"]
+    assert batches == [["a1", "a2", "a3", "b1"], ["c1", "c2"]]
+
+
+def test_batch_size_from_function_then_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    assert ocr_pool.ocr_batch_size() == ocr_pool.DEFAULT_OCR_BATCH_SIZE
+    monkeypatch.setenv(ocr_pool.OCR_BATCH_SIZE_ENV, "3")
+    assert ocr_pool.ocr_batch_size() == 3
+    batches: list[list[str]] = []
+    ocr_pool.map_page_batches(_ocr(batches), [["1", "2", "3", "4"]])
+    assert [len(batch) for batch in batches] == [3, 1]
+    ocr_pool.configure_ocr_batch_size(2)
+    assert ocr_pool.ocr_batch_size() == 2
+    with pytest.raises(ValueError, match="at least 1"):
+        ocr_pool.configure_ocr_batch_size(0)
+
+
+def test_missing_texts_are_an_error() -> None:
+    with pytest.raises(ValueError, match="1 texts for 2 pages"):
+        ocr_pool.map_page_batches(lambda pages: pages[:1], [["a", "b"]])
+
+
+def test_doctr_runs_the_cached_predictor_once_per_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[list[str]] = []
+
+    class Page:
+        def __init__(self, page: str) -> None:
+            self.page = page
+
+        def render(self) -> str:
+            return self.page
+
+    def predictor(pages: list[str]) -> Any:
+        calls.append(list(pages))
+        return types.SimpleNamespace(pages=[Page(page) for page in pages])
+
+    models: list[Any] = []
+    fake_io = types.ModuleType("doctr.io")
+    fake_io.DocumentFile = types.SimpleNamespace(  # type: ignore[attr-defined]
+        from_pdf=lambda path: [f"{path}:1", f"{path}:2"],
+        from_images=lambda path: [f"{path}:1"],
+    )
+    fake_models = types.ModuleType("doctr.models")
+    fake_models.ocr_predictor = lambda pretrained=True: models.append(1) or predictor  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "doctr", types.ModuleType("doctr"))
+    monkeypatch.setitem(sys.modules, "doctr.io", fake_io)
+    monkeypatch.setitem(sys.modules, "doctr.models", fake_models)
+    doctr._get_model.cache_clear()
+    try:
+        texts = doctr.to_text_batch(["a.pdf", "b.png", "c.pdf"], batch_size=3)
+    finally:
+        doctr._get_model.cache_clear()
+    assert texts == ["a.pdf:1\fa.pdf:2", "b.png:1", "c.pdf:1\fc.pdf:2"]
+    assert calls == [["a.pdf:1", "a.pdf:2", "b.png:1"], ["c.pdf:1", "c.pdf:2"]]
+    assert models == [1]
+
+
+@pytest.mark.parametrize("batched", [True, False])
+def test_paddleocr_predicts_batches_or_falls_back_to_pages(
+    monkeypatch: pytest.MonkeyPatch, batched: bool
+) -> None:
+    calls: list[Any] = []
+
+    class FakeOCR:
+        def __init__(self, **kwargs: object) -> None:
+            pass
+
+        def ocr(self, source: str, **kwargs: object) -> object:
+            calls.append(source)
+            return [{"rec_texts": [source]}]
+
+    class BatchOCR(FakeOCR):
+        def predict(self, sources: list[str]) -> list[object]:
+            calls.append(list(sources))
+            return [{"rec_texts": [source]} for source in sources]
+
+    fake_module = types.ModuleType("paddleocr")
+    fake_module.PaddleOCR = BatchOCR if batched else FakeOCR  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "paddleocr", fake_module)
+    monkeypatch.setattr(paddleocr, "paddleocr_available", lambda: True)
+    monkeypatch.setattr(paddleocr, "_page_arrays", lambda path: iter(["p1", "p2"]))
+    paddleocr._get_ocr.cache_clear()
+    try:
+        texts = paddleocr.to_text_batch(["scan.pdf", "photo.png"], batch_size=8)
+    finally:
+        paddleocr._get_ocr.cache_clear()
+    assert texts == ["p1\fp2", "photo.png"]
+    assert calls == (
+        [["p1", "p2", "photo.png"]] if batched else ["p1", "p2", "photo.png"]
+    )
+
+
+def _backend(calls: list[Any]) -> types.ModuleType:
+    module = types.ModuleType("fake_batch_ocr")
+
+    def to_text(path: str) -> str:
+        calls.append(path)
+        return f"single {Path(path).name}"
+
+    def to_text_batch(paths: list[str], batch_size: int | None = None) -> list[str]:
+        calls.append(list(paths))
+        return [f"batched {Path(path).name}" for path in paths]
+
+    module.to_text = to_text  # type: ignore[attr-defined]
+    module.to_text_batch = to_text_batch  # type: ignore[attr-defined]
+    return module
+
+
+@pytest.fixture
+def scans(tmp_path: Path) -> list[str]:
+    paths = []
+    for name in ("one", "two", "three"):
+        path = tmp_path / f"{name}.png"
+        path.write_bytes(name.encode())
+        paths.append(str(path))
+    return paths
+
+
+def test_extract_text_finds_the_batched_texts(scans: list[str]) -> None:
+    calls: list[Any] = []
+    module = _backend(calls)
+    _cached_to_text.cache_clear()
+    assert extract_text_batch(module, scans) == [
+        "batched one.png",
+        "batched two.png",
+        "batched three.png",
+    ]
+    assert [extract_text(module, scan) for scan in scans] == [
+        "batched one.png",
+        "batched two.png",
+        "batched three.png",
+    ]
+    assert extract_text_batch(module, scans[:1]) == ["batched one.png"]
+    assert calls == [scans]
+
+
+def test_single_worker_batch_ocrs_groups_of_files(
+    scans: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[Any] = []
+    monkeypatch.setitem(INPUT_MODULES, "fake_batch_ocr", _backend(calls))
+    _cached_to_text.cache_clear()
+    ocr_pool.configure_ocr_batch_size(2)
+    results = list(extract_many(scans, [], 1, input_module="fake_batch_ocr"))
+    assert [result.path for result in results] == scans
+    assert calls == [scans[:2], scans[2:]]
+
+
+@pytest.mark.skipif(not hasattr(signal, "setitimer"), reason="needs SIGALRM")
+def test_a_batch_that_overruns_times_out_its_files(
+    scans: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[Any] = []
+    module = _backend(calls)
+
+    def to_text_batch(paths: list[str], batch_size: int | None = None) -> list[str]:
+        time.sleep(5)
+        return []
+
+    module.to_text_batch = to_text_batch  # type: ignore[attr-defined]
+    monkeypatch.setitem(INPUT_MODULES, "fake_batch_ocr", module)
+    _cached_to_text.cache_clear()
+    ocr_pool.configure_ocr_batch_size(2)
+    start = time.monotonic()
+    results = list(
+        extract_many(scans, [], 1, input_module="fake_batch_ocr", timeout=0.1)
+    )
+    assert time.monotonic() - start < 3
+    assert [result.path for result in results] == scans
+    assert all(
+        result.error and result.error.startswith("ExtractionTimeoutError")
+        for result in results
+    )
+    assert calls == []  # not retried one by one
+
+
+def test_doctr_renders_pages_from_their_export() -> None:
+    page = types.SimpleNamespace(
+        export=lambda: {"blocks": [{"lines": [{"words": [{"value": "Total"}]}]}]}
+    )
+    assert doctr._render(page) == "Total"
@@ -0,0 +1,139 @@
+"""OCR backends read a small language set first and re-OCR only when needed."""
+
+import asyncio
+import types
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from invoice2data import api
+from invoice2data import extract_data
+from invoice2data import extract_data_async
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.input.disk_cache import cache_key
+
+
+pytestmark = pytest.mark.windows_strict
+
+#: The first pass garbles the umlauts; the German pass reads the total too.
+GARBLED = "ACME GmbH Rechnung R-1 Datum 2024-01-31 Gesamt"
+GERMAN = "ACME GmbH Rechnung R-1 Datum 2024-01-31 Gesamtbetrag 121.00"
+AREA = {"f": 1, "l": 1, "r": 72, "x": 0, "y": 0, "W": 100, "H": 20}
+
+
+def _template(languages: list[str], area: bool = False) -> InvoiceTemplate:
+    fields: dict[str, Any] = {
+        "amount": {
+            "parser": "regex",
+            "regex": r"Gesamtbetrag\s+(\d+\.\d\d)",
+            "type": "float",
+        },
+        "date": {"parser": "regex", "regex": r"Datum\s+(\S+)", "type": "date"},
+        "invoice_number": {"parser": "regex", "regex": r"Rechnung\s+(\S+)"},
+    }
+    if area:
+        fields["customer"] = {"parser": "regex", "regex": r"(\w+)", "area": AREA}
+    return InvoiceTemplate(
+        {
+            "template_name": "de.acme.yml",
+            "issuer": "ACME",
+            "keywords": ["ACME GmbH"],
+            "fields": fields,
+            "options": {"languages": languages, "date_formats": ["%Y-%m-%d"]},
+        }
+    )
+
+
+def _backend(calls: list[Any], texts: dict[Any, str]) -> types.ModuleType:
+    module = types.ModuleType("fake_ocr")
+    module.SUPPORTS_AREA = True  # type: ignore[attr-defined]
+    module.SUPPORTS_LANGUAGES = True  # type: ignore[attr-defined]
+
+    def to_text(
+        path: str,
+        area: dict[str, Any] | None = None,
+        languages: tuple[str, ...] | None = None,
+    ) -> str:
+        calls.append((languages, area is not None))
+        return "Kunde" if area else texts.get(languages, "")
+
+    module.to_text = to_text  # type: ignore[attr-defined]
+    return module
+
+
+@pytest.fixture
+def document(tmp_path: Path) -> str:
+    path = tmp_path / "scan.png"
+    path.write_bytes(b"\x89PNG\r\n")
+    return str(path)
+
+
+def test_template_languages_trigger_a_targeted_second_pass(
+    document: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[Any] = []
+    reader = _backend(calls, {None: GARBLED, ("de",): GERMAN})
+    monkeypatch.setattr(api, "DEFAULT_INPUT_READERS", [reader])
+    result = extract_data(document, [_template(["de"], area=True)])
+    assert result["amount"] == 121.0
+    assert result["customer"] == "Kunde"
+    # Areas are read in the languages of the pass that produced the text.
+    assert calls == [(None, False), (("de",), False), (("de",), True)]
+
+
+def test_no_languages_no_second_pass(
+    document: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[Any] = []
+    reader = _backend(calls, {None: GERMAN})
+    monkeypatch.setattr(api, "DEFAULT_INPUT_READERS", [reader])
+    assert extract_data(document, [_template([])])["amount"] == 121.0
+    assert calls == [(None, False)]
+
+
+def test_unmatched_first_pass_retries_with_every_language(
+    document: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[Any] = []
+    reader = _backend(calls, {None: "unreadable", (): GERMAN})
+    monkeypatch.setattr(api, "DEFAULT_INPUT_READERS", [reader])
+    assert extract_data(document, [_template([])])["amount"] == 121.0
+    assert calls == [(None, False), ((), False)]
+
+
+def test_unmatched_second_pass_keeps_the_first(
+    document: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[Any] = []
+    reader = _backend(calls, {None: GERMAN, ("de",): "garbled"})
+    monkeypatch.setattr(api, "DEFAULT_INPUT_READERS", [reader])
+    assert extract_data(document, [_template(["de"])])["amount"] == 121.0
+
+
+def test_backends_without_languages_read_once(
+    document: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[Any] = []
+    reader = types.ModuleType("plain")
+    reader.to_text = lambda path: calls.append(path) or GERMAN  # type: ignore[attr-defined]
+    monkeypatch.setattr(api, "DEFAULT_INPUT_READERS", [reader])
+    assert extract_data(document, [_template(["de"])])["amount"] == 121.0
+    assert calls == [document]
+
+
+def test_async_second_pass(document: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[Any] = []
+    reader = _backend(calls, {None: GARBLED, ("de",): GERMAN})
+    monkeypatch.setattr(api, "DEFAULT_INPUT_READERS", [reader])
+    result = asyncio.run(extract_data_async(document, [_template(["de"])]))
+    assert result["amount"] == 121.0
+    assert calls == [(None, False), (("de",), False)]
+
+
+def test_languages_are_part_of_the_disk_cache_key(document: str) -> None:
+    reader = _backend([], {})
+    default = cache_key(reader, document, None, None)
+    assert default == cache_key(reader, document, None, None, None)
+    assert default != cache_key(reader, document, None, None, ("de",))
+    assert cache_key(reader, document, None, None, ()) != default
@@ -0,0 +1,201 @@
+"""Pages of one document are OCRed on a bounded pool and reassembled in order."""
+
+import sys
+import threading
+import time
+import types
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from invoice2data.input import doctr
+from invoice2data.input import ocr_pool
+from invoice2data.input import paddleocr
+
+
+pytestmark = pytest.mark.windows_strict
+
+
+@pytest.fixture(autouse=True)
+def _unconfigured(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.delenv(ocr_pool.MAX_OCR_WORKERS_ENV, raising=False)
+    ocr_pool.configure_ocr_workers(None)
+    yield
+    ocr_pool.configure_ocr_workers(None)
+
+
+def test_results_keep_page_order_and_respect_the_bound() -> None:
+    ocr_pool.configure_ocr_workers(3)
+    lock = threading.Lock()
+    running = peak = 0
+
+    def ocr(page: int) -> str:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01 * (page % 3))  # later pages may finish first
+        with lock:
+            running -= 1
+        return f"page {page}"
+
+    assert ocr_pool.map_pages(ocr, range(10)) == [f"page {i}" for i in range(10)]
+    assert 1 < peak <= 3
+
+
+def test_one_worker_runs_in_the_calling_thread() -> None:
+    ocr_pool.configure_ocr_workers(1)
+    threads = ocr_pool.map_pages(lambda _: threading.current_thread(), [1, 2])
+    assert threads == [threading.current_thread()] * 2
+
+
+def test_page_errors_propagate() -> None:
+    ocr_pool.configure_ocr_workers(2)
+
+    def ocr(page: int) -> int:
+        if page == 1:
+            raise OSError("bad page")
+        return page
+
+    with pytest.raises(OSError, match="bad page"):
+        ocr_pool.map_pages(ocr, [0, 1, 2])
+
+
+def test_bound_from_function_then_environment_then_cpus(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(ocr_pool.os, "cpu_count", lambda: 16)
+    assert ocr_pool.max_ocr_workers() == ocr_pool.DEFAULT_MAX_OCR_WORKERS
+    monkeypatch.setenv(ocr_pool.MAX_OCR_WORKERS_ENV, "6")
+    assert ocr_pool.max_ocr_workers() == 6
+    ocr_pool.configure_ocr_workers(2)
+    assert ocr_pool.max_ocr_workers() == 2
+    monkeypatch.setenv(ocr_pool.MAX_OCR_WORKERS_ENV, "zero")
+    ocr_pool.configure_ocr_workers(None)
+    assert ocr_pool.max_ocr_workers() == ocr_pool.DEFAULT_MAX_OCR_WORKERS
+    with pytest.raises(ValueError, match="at least 1"):
+        ocr_pool.configure_ocr_workers(0)
+
+
+def test_engine_slots_lend_the_lowest_free_slot() -> None:
+    slots = ocr_pool.EngineSlots()
+    with slots.borrow() as first, slots.borrow() as second:
+        assert (first, second) == (0, 1)
+    with slots.borrow() as again:
+        assert again == 0
+
+
+def test_paddleocr_joins_pages_with_form_feeds(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ocr_pool.configure_ocr_workers(2)
+    engines: list[Any] = []
+
+    class FakeOCR:
+        def __init__(self, **kwargs: object) -> None:
+            engines.append(self)
+
+        def ocr(self, source: str, **kwargs: object) -> object:
+            time.sleep(0.01)
+            return [{"rec_texts": [source.upper()]}]
+
+    fake_module = types.ModuleType("paddleocr")
+    fake_module.PaddleOCR = FakeOCR  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "paddleocr", fake_module)
+    monkeypatch.setattr(paddleocr, "paddleocr_available", lambda: True)
+    monkeypatch.setattr(paddleocr, "_page_arrays", lambda path: ["one", "two", "three"])
+    paddleocr._get_ocr.cache_clear()
+    try:
+        assert paddleocr.to_text("scan.pdf") == "ONE\fTWO\fTHREE"
+    finally:
+        paddleocr._get_ocr.cache_clear()
+    assert 1 <= len(engines) <= 2  # one engine per page in flight, reused
+
+
+def test_doctr_predicts_each_page_separately(monkeypatch: pytest.MonkeyPatch) -> None:
+    ocr_pool.configure_ocr_workers(2)
+
+    class Result:
+        def __init__(self, pages: list[str]) -> None:
+            self.pages = pages
+
+        def render(self) -> str:
+            return "+".join(self.pages)
+
+    fake_io = types.ModuleType("doctr.io")
+    fake_io.DocumentFile = types.SimpleNamespace(  # type: ignore[attr-defined]
+        from_pdf=lambda path: ["p1", "p2", "p3"]
+    )
+    fake_models = types.ModuleType("doctr.models")
+    fake_models.ocr_predictor = lambda pretrained=True: Result  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "doctr", types.ModuleType("doctr"))
+    monkeypatch.setitem(sys.modules, "doctr.io", fake_io)
+    monkeypatch.setitem(sys.modules, "doctr.models", fake_models)
+    doctr._get_model.cache_clear()
+    try:
+        assert doctr.to_text("scan.pdf") == "p1\fp2\fp3"
+    finally:
+        doctr._get_model.cache_clear()
+
+
+def test_prefetch_bounds_pages_taken_ahead_of_the_workers() -> None:
+    ocr_pool.configure_ocr_workers(1)
+    taken = 0
+    ahead: list[int] = []
+
+    def pages() -> Iterator[int]:
+        nonlocal taken
+        for page in range(6):
+            taken += 1
+            yield page
+
+    def ocr(page: int) -> int:
+        time.sleep(0.01)
+        ahead.append(taken - page - 1)  # pages taken after this one
+        return page
+
+    assert ocr_pool.map_pages(ocr, pages(), prefetch=1) == list(range(6))
+    assert max(ahead) <= 1  # never more than one page waiting
+    assert max(ahead) == 1  # ... but the next page is ready while OCRing
+
+
+def test_paddleocr_streams_pages_and_closes_the_renderer(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ocr_pool.configure_ocr_workers(1)
+    alive: set[int] = set()
+    peak = 0
+    closed = False
+
+    def page_arrays(path: str) -> Iterator[int]:
+        nonlocal peak, closed
+        try:
+            for page in range(20):
+                alive.add(page)
+                peak = max(peak, len(alive))
+                yield page
+        finally:
+            closed = True
+
+    class FakeOCR:
+        def __init__(self, **kwargs: object) -> None:
+            pass
+
+        def ocr(self, source: int, **kwargs: object) -> object:
+            alive.discard(source)
+            return [{"rec_texts": [str(source)]}]
+
+    fake_module = types.ModuleType("paddleocr")
+    fake_module.PaddleOCR = FakeOCR  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "paddleocr", fake_module)
+    monkeypatch.setattr(paddleocr, "paddleocr_available", lambda: True)
+    monkeypatch.setattr(paddleocr, "_page_arrays", page_arrays)
+    paddleocr._get_ocr.cache_clear()
+    try:
+        text = paddleocr.to_text("scan.pdf")
+    finally:
+        paddleocr._get_ocr.cache_clear()
+    assert text == "\f".join(str(page) for page in range(20))
+    assert peak <= 1 + paddleocr._PREFETCH + 1  # in OCR, prefetched, rendering
+    assert closed
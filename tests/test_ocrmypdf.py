@@ -53,3 +53,48 @@ def test_pre_process_pdf_passes_options_and_returns_cleaned_path(
     assert captured["deskew"] is True  # pre-processing knob forwarded
     assert captured["redo_ocr"] is True  # default preserved
     assert "invoice2data_ocrmypdf_" in out  # unique temp dir, collision-safe
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    runs: list[str] = []
+
+    def ocr(path: str, **kwargs: object) -> int:
+        runs.append(path)
+        Path(str(kwargs["output_file"])).write_bytes(b"%PDF-1.4 cleaned")
+        return 0
+
+    monkeypatch.setitem(sys.modules, "ocrmypdf", types.SimpleNamespace(ocr=ocr))
+    monkeypatch.setattr(ocrmypdf, "ocrmypdf_available", lambda: True)
+    monkeypatch.setattr(ocrmypdf.pdftotext, "to_text", lambda path, area=None: path)
+    ocrmypdf._ocr_pdfs.clear()
+    return runs
+
+
+def test_text_and_areas_share_one_ocr_run(fake_ocr: list[str], tmp_path: Path) -> None:
+    src = tmp_path / "scan.pdf"
+    src.write_bytes(b"%PDF-1.4 scan")
+    area = {"f": 1, "l": 1, "r": 72, "x": 0, "y": 0, "W": 100, "H": 100}
+
+    full = ocrmypdf.to_text(str(src))
+    assert ocrmypdf.to_text(str(src), area) == full
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(src.read_bytes())
+    assert ocrmypdf.to_text(str(copy)) == full  # keyed by content, not path
+    assert fake_ocr == [str(src)]
+
+    ocrmypdf.to_text(str(src), input_reader_config={"deskew": True})
+    assert len(fake_ocr) == 2  # other settings, other output
+
+
+def test_ocr_cache_is_capped(
+    fake_ocr: list[str], monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(ocrmypdf._ocr_pdfs, "max_bytes", 20)
+    paths = []
+    for index in range(3):
+        src = tmp_path / f"scan{index}.pdf"
+        src.write_bytes(f"%PDF-1.4 scan {index}".encode())
+        paths.append(ocrmypdf.to_text(str(src)))
+    assert [Path(path).exists() for path in paths] == [False, False, True]
+    assert ocrmypdf._ocr_pdfs.nbytes == len(b"%PDF-1.4 cleaned")
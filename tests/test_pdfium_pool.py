@@ -0,0 +1,81 @@
+"""The pdfium backend parses a document once for its full text and every area."""
+
+import os
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+pypdfium2 = pytest.importorskip("pypdfium2")
+
+from invoice2data.input import pdfium  # noqa: E402
+
+
+pytestmark = pytest.mark.windows_strict
+
+OYO = Path(__file__).parent / "compare" / "oyo.pdf"
+TOP = {"f": 1, "l": 1, "r": 72, "x": 0, "y": 0, "W": 600, "H": 150}
+BOTTOM = {"f": 1, "l": 1, "r": 72, "x": 0, "y": 150, "W": 600, "H": 700}
+
+
+@pytest.fixture(autouse=True)
+def _empty_pool() -> Iterator[None]:
+    pdfium._documents.clear()
+    yield
+    pdfium._documents.clear()
+
+
+@pytest.fixture
+def opened(monkeypatch: pytest.MonkeyPatch) -> list[Any]:
+    documents: list[Any] = []
+    real = pypdfium2.PdfDocument
+
+    def document(source: Any) -> Any:
+        documents.append(real(source))
+        return documents[-1]
+
+    monkeypatch.setattr(pypdfium2, "PdfDocument", document)
+    return documents
+
+
+def test_full_text_and_areas_share_one_parse(opened: list[Any]) -> None:
+    full = pdfium.to_text(str(OYO))
+    top = pdfium.to_text(str(OYO), TOP)
+    bottom = pdfium.to_text(str(OYO), BOTTOM)
+    assert pdfium.to_text_head(str(OYO), 1) == (full, True)
+    assert len(opened) == 1
+    assert "PAYMENT RECEIPT" in top
+    assert top != bottom
+    pdfium._documents.clear()
+    assert pdfium.to_text(str(OYO), TOP) == top  # same text from a fresh parse
+
+
+def test_least_recently_used_document_is_closed(
+    tmp_path: Path, opened: list[Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(pdfium._documents, "size", 2)
+    paths = []
+    for name in ("a", "b", "c"):
+        paths.append(str(tmp_path / f"{name}.pdf"))
+        shutil.copy(OYO, paths[-1])
+    for path in paths:
+        pdfium.to_text(path)
+    assert [len(document) for document in opened[1:]] == [1, 1]
+    with pytest.raises(Exception):  # noqa: B017 - closed by eviction
+        len(opened[0])
+    pdfium.to_text(paths[0])
+    assert len(opened) == 4
+
+
+def test_a_changed_file_is_reopened(tmp_path: Path, opened: list[Any]) -> None:
+    path = tmp_path / "scan.pdf"
+    shutil.copy(OYO, path)
+    pdfium.to_text(str(path))
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    pdfium.to_text(str(path), TOP)
+    assert len(opened) == 2
+    assert len(pdfium._documents._entries) == 1  # the stale one was closed
@@ -0,0 +1,157 @@
+"""Race mode starts the cascade's backends together but keeps its preference."""
+
+import asyncio
+import time
+import types
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from invoice2data import api
+from invoice2data import extract_data
+from invoice2data import extract_data_async
+from invoice2data.extract.loader import read_templates
+from invoice2data.routing import RoutingTable
+
+
+pytestmark = pytest.mark.windows_strict
+
+COMPARE = Path(__file__).parent / "compare"
+TEMPLATES = read_templates()
+ORLEN = (COMPARE / "Orlen.txt").read_text(encoding="utf-8")
+# Also matches the Orlen template, but extracts a different date.
+ORLEN_FEBRUARY = ORLEN.replace("2021-01-01", "2021-02-02")
+
+
+def _backend(name: str, delay: float, content: str) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.THREAD_SAFE = True  # type: ignore[attr-defined]
+    module.calls = []  # type: ignore[attr-defined]
+
+    def to_text(path: str) -> str:
+        module.calls.append(path)  # type: ignore[attr-defined]
+        time.sleep(delay)
+        return content
+
+    module.to_text = to_text  # type: ignore[attr-defined]
+    return module
+
+
+@pytest.fixture
+def pdf(tmp_path: Path) -> str:
+    path = tmp_path / "invoice.pdf"
+    path.write_text(ORLEN, encoding="utf-8")
+    # Compile the templates now, outside the timed sections.
+    extract_data(str(COMPARE / "Orlen.txt"), TEMPLATES)
+    return str(path)
+
+
+def _readers(monkeypatch: pytest.MonkeyPatch, *modules: types.ModuleType) -> None:
+    monkeypatch.setattr(api, "DEFAULT_INPUT_READERS", list(modules))
+
+
+def test_fallback_costs_the_slower_backend_not_both(
+    monkeypatch: pytest.MonkeyPatch, pdf: str
+) -> None:
+    _readers(
+        monkeypatch,
+        _backend("garbled", 0.4, "no template matches this"),
+        _backend("layout", 0.4, ORLEN),
+    )
+    start = time.perf_counter()
+    result = extract_data(pdf, TEMPLATES, race=True)
+    elapsed = time.perf_counter() - start
+
+    assert result["date"] == datetime(2021, 1, 1)
+    assert elapsed < 0.75
+
+    _readers(
+        monkeypatch,
+        _backend("garbled", 0.0, "no template matches this"),
+        _backend("layout", 0.0, ORLEN),
+    )
+    assert extract_data(pdf, TEMPLATES) == result
+
+
+def test_preferred_backend_wins_even_when_slower(
+    monkeypatch: pytest.MonkeyPatch, pdf: str
+) -> None:
+    slow_first = _backend("slow_first", 0.3, ORLEN)
+    fast_second = _backend("fast_second", 0.0, ORLEN_FEBRUARY)
+    _readers(monkeypatch, slow_first, fast_second)
+
+    result = extract_data(pdf, TEMPLATES, race=True)
+
+    assert result["date"] == datetime(2021, 1, 1)
+    assert fast_second.calls == [pdf]  # it ran, and its text was discarded
+
+
+def test_does_not_wait_for_the_loser(monkeypatch: pytest.MonkeyPatch, pdf: str) -> None:
+    _readers(monkeypatch, _backend("quick", 0.0, ORLEN), _backend("sluggish", 2, ""))
+    start = time.perf_counter()
+    assert extract_data(pdf, TEMPLATES, race=True)["date"] == datetime(2021, 1, 1)
+    assert time.perf_counter() - start < 1.5
+
+
+def test_forced_backend_does_not_race(
+    monkeypatch: pytest.MonkeyPatch, pdf: str
+) -> None:
+    unused = _backend("unused", 0.0, ORLEN)
+    forced = _backend("forced", 0.0, ORLEN)
+    _readers(monkeypatch, unused, forced)
+    assert extract_data(pdf, TEMPLATES, forced, race=True)
+    assert unused.calls == []
+
+
+def test_async_race_cancels_the_loser(
+    monkeypatch: pytest.MonkeyPatch, pdf: str
+) -> None:
+    cancelled: list[str] = []
+
+    def async_backend(name: str, delay: float, content: str) -> types.ModuleType:
+        module = _backend(name, 0.0, content)
+
+        async def to_text_async(path: str) -> str:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+            return content
+
+        module.to_text_async = to_text_async  # type: ignore[attr-defined]
+        return module
+
+    _readers(
+        monkeypatch,
+        async_backend("first", 0.1, ORLEN),
+        async_backend("second", 5, ORLEN_FEBRUARY),
+    )
+    start = time.perf_counter()
+    result = asyncio.run(extract_data_async(pdf, TEMPLATES, race=True))
+
+    assert result["date"] == datetime(2021, 1, 1)
+    assert cancelled == ["second"]
+    assert time.perf_counter() - start < 2.5
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"match_pages": 1}, {"routing": "routes.json"}],
+    ids=["match_pages", "routing"],
+)
+def test_match_pages_and_routing_take_precedence(
+    monkeypatch: pytest.MonkeyPatch, pdf: str, tmp_path: Path, options: dict[str, Any]
+) -> None:
+    if "routing" in options:
+        options = {"routing": RoutingTable(tmp_path / options["routing"])}
+    first = _backend("first", 0.0, ORLEN)
+    unreached = _backend("unreached", 0.0, ORLEN_FEBRUARY)
+    _readers(monkeypatch, first, unreached)
+
+    result = extract_data(pdf, TEMPLATES, race=True, **options)
+
+    assert result["date"] == datetime(2021, 1, 1)
+    assert unreached.calls == []
@@ -0,0 +1,240 @@
+"""Regex time limits and the load-time nested-quantifier check."""
+
+import concurrent.futures
+import importlib
+import logging
+import signal
+import time
+from typing import Any
+
+import pytest
+
+from invoice2data.exceptions import RegexTimeoutError
+from invoice2data.exceptions import RequiredFieldsMissingError
+from invoice2data.extract import _regex
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.loader import prepare_template
+from invoice2data.extract.loader import read_templates
+
+
+pytestmark = pytest.mark.windows_strict
+
+#: Takes 2**40 steps to fail on :data:`SLOW_TEXT`.
+SLOW = r"(a+)+$"
+SLOW_TEXT = "a" * 40 + "!"
+
+needs_setitimer = pytest.mark.skipif(
+    not hasattr(signal, "setitimer"), reason="the watchdog needs setitimer"
+)
+
+
+@pytest.fixture
+def regex_engine() -> Any:
+    """Switch to the third-party ``regex`` engine for one test."""
+    pytest.importorskip("regex")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("INVOICE2DATA_REGEX_ENGINE", "regex")
+        yield importlib.reload(_regex)
+    importlib.reload(_regex)
+
+
+def _template(fields: dict[str, Any], **options: Any) -> InvoiceTemplate:
+    return InvoiceTemplate(
+        [
+            ("issuer", "test"),
+            ("keywords", ["test"]),
+            ("template_name", "timeout.yml"),
+            ("fields", fields),
+            ("required_fields", ["invoice_number"]),
+            ("options", options),
+        ]
+    )
+
+
+@needs_setitimer
+def test_watchdog_interrupts_the_stdlib_engine() -> None:
+    start = time.perf_counter()
+    with (
+        pytest.raises(RegexTimeoutError, match="'total'") as info,
+        _regex.time_limit(0.1, "total", "t.yml"),
+    ):
+        _regex.search(SLOW, SLOW_TEXT)
+    assert time.perf_counter() - start < 5
+    assert (info.value.seconds, info.value.field) == (0.1, "total")
+    assert signal.getitimer(signal.ITIMER_REAL)[0] == 0
+
+
+@needs_setitimer
+def test_an_outer_timer_is_kept() -> None:
+    def outer(signum: int, frame: Any) -> None:
+        raise KeyboardInterrupt
+
+    previous = signal.signal(signal.SIGALRM, outer)
+    signal.setitimer(signal.ITIMER_REAL, 30)
+    try:
+        with _regex.time_limit(5):
+            _regex.search(r"\d+", "abc 123")
+        assert signal.getsignal(signal.SIGALRM) is outer
+        assert 25 < signal.getitimer(signal.ITIMER_REAL)[0] <= 30
+        # An outer timer due first is left to fire.
+        signal.setitimer(signal.ITIMER_REAL, 0.1)
+        with pytest.raises(KeyboardInterrupt), _regex.time_limit(5):
+            _regex.search(SLOW, SLOW_TEXT)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def test_no_limit_is_a_no_op() -> None:
+    with _regex.time_limit(None):
+        assert _regex.search(r"\d+", "abc 123") is not None
+
+
+def test_regex_engine_times_out_off_the_main_thread(regex_engine: Any) -> None:
+    def run(function: Any) -> Any:
+        with regex_engine.time_limit(0.1, "total"):
+            return function(r"^(a|a)*$", SLOW_TEXT)
+
+    with concurrent.futures.ThreadPoolExecutor(1) as pool:
+        for function in (regex_engine.search, regex_engine.finditer):
+            with pytest.raises(RegexTimeoutError, match="'total'"):
+                list(pool.submit(run, function).result() or ())
+
+
+@needs_setitimer
+def test_a_timed_out_field_is_skipped_and_the_others_extracted() -> None:
+    template = _template(
+        {"invoice_number": r"No (\d+)", "name": SLOW}, regex_timeout=0.1
+    )
+    output = template.extract(f"No 42\n{SLOW_TEXT}", "x.txt", None)
+    assert output["invoice_number"] == "42"
+    assert "name" not in output
+
+
+@needs_setitimer
+def test_a_timed_out_optional_field_is_listed_in_the_result() -> None:
+    template = _template(
+        {"invoice_number": r"No (\d+)", "name": SLOW, "note": r"Note (\w+)"},
+        regex_timeout=0.1,
+    )
+    output = template.extract(f"No 42\n{SLOW_TEXT}", "x.txt", None)
+    assert output["regex_timeouts"] == ["name"]
+    assert "regex_timeouts" not in template.extract("No 42", "x.txt", None)
+
+
+def test_an_unenforceable_limit_warns_once(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr(_regex, "_NATIVE_TIMEOUT", False)
+    _regex._warn_unenforced.cache_clear()
+
+    def run() -> None:
+        with _regex.time_limit(5):
+            _regex.search(r"\d+", "abc 123")
+
+    with (
+        caplog.at_level(logging.WARNING),
+        concurrent.futures.ThreadPoolExecutor(1) as pool,
+    ):
+        pool.submit(run).result()
+        pool.submit(run).result()
+    assert caplog.text.count("INVOICE2DATA_REGEX_ENGINE=regex") == 1
+
+
+@needs_setitimer
+def test_a_timed_out_required_field_is_the_cause() -> None:
+    template = _template({"invoice_number": SLOW}, regex_timeout=0.1)
+    with pytest.raises(RequiredFieldsMissingError) as info:
+        template.extract(SLOW_TEXT, "x.txt", None)
+    assert isinstance(info.value.__cause__, RegexTimeoutError)
+    assert info.value.__cause__.field == "invoice_number"
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"(a+)+$",
+        r"(\w+\s?)*$",
+        r"(?:\w+ ?)*",
+        r"(\d+,?)+",
+        r"(x+x+)+y",
+        r"(.*,)*x",
+        r"(a{2,})+",
+        r"(a|b+)*",
+        r"(?:ß\w+)*",
+    ],
+)
+def test_nested_quantifiers_are_reported(pattern: str) -> None:
+    assert _regex.nested_quantifier(pattern) is not None
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"(?P<item>\S+(?: \S+)*)",
+        r"(?:\s+\S+)*",
+        r"(?:\d+\.)+\d+",
+        r"(?:(?: \S+)*\n)+",
+        r"(a+b+)+",
+        r"(?>a+)+",
+        r"(a+)++",
+        r"(a{2,3})+",
+        r"[(]+a+\)+",
+        r"(?:\S|[ ]\w\w)*",
+    ],
+)
+def test_unambiguous_repetition_is_not_reported(pattern: str) -> None:
+    assert _regex.nested_quantifier(pattern) is None
+
+
+def test_loader_warns_about_nested_quantifiers(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    template = {
+        "template_name": "redos.yml",
+        "keywords": ["x"],
+        "fields": {
+            "amount": r"Total (\d+,?)+",
+            "static_note": "(a+)+ is not a regex here",
+        },
+        "lines": {"start": "Items", "end": "Total", "line": r"(?P<name>(?:\w+ ?)*)"},
+        "options": {"regex_timeout": "soon"},
+    }
+    with caplog.at_level(logging.WARNING):
+        assert prepare_template(template) is not None
+    warnings = [r.getMessage() for r in caplog.records if "backtrack" in r.message]
+    assert len(warnings) == 2
+    assert "'(\\\\d+,?)+'" in warnings[0]
+    assert "(?:\\\\w+ ?)*" in warnings[1]
+    assert "regex_timeout" in caplog.text
+    assert "regex_timeout" not in template["options"]
+
+
+def test_bundled_templates_pass_the_check(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING):
+        for template in read_templates():
+            prepare_template(dict(template))
+    assert "backtrack" not in caplog.text
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        {"parser": "regex", "regex": r"(?:a|aa)+$"},
+        {"parser": "lines", "start": r"(?:a|aa)+$", "end": "End", "line": r"(\w+)"},
+        {"parser": "lines", "start": "No", "end": "$", "line": r"(?P<x>(?:a|aa)+$)"},
+    ],
+    ids=["regex", "lines-start", "lines-line"],
+)
+def test_compiled_patterns_time_out_off_the_main_thread(
+    regex_engine: Any, rule: dict[str, Any]
+) -> None:
+    template = _template(
+        {"invoice_number": r"No (\d+)", "slow": rule}, regex_timeout=0.2
+    )
+    text = f"No 42\n{SLOW_TEXT}\n"
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(1) as pool:
+        output = pool.submit(template.extract, text, "x.txt", None).result()
+    assert time.perf_counter() - start < 5
+    assert output["regex_timeouts"] == ["slow"]
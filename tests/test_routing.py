@@ -0,0 +1,218 @@
+"""The routing table learns which backend completes a template and goes there."""
+
+import json
+import multiprocessing
+import pickle
+import sys
+import types
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from invoice2data import RoutingTable
+from invoice2data import api
+from invoice2data import extract_data
+from invoice2data import routing
+from invoice2data.extract.loader import read_templates
+from invoice2data.input import INPUT_MODULES
+
+
+pytestmark = pytest.mark.windows_strict
+
+COMPARE = Path(__file__).parent / "compare"
+TEMPLATES = read_templates()
+ORLEN = (COMPARE / "Orlen.txt").read_text(encoding="utf-8")
+# Still matches the Orlen template by keyword, but the required date is gone.
+ORLEN_UNDATED = ORLEN.replace("Data wystawienia: 2021-01-01", "")
+ORLEN_TEMPLATE = next(t for t in TEMPLATES if t["template_name"] == "pl.orlen.yml")
+
+
+def _backend(name: str, content: str) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.content = content  # type: ignore[attr-defined]
+    module.to_text = lambda path: module.content  # type: ignore[attr-defined]
+    return module
+
+
+@pytest.fixture
+def backends(monkeypatch: pytest.MonkeyPatch) -> tuple[Any, Any]:
+    flat = _backend("flat", ORLEN_UNDATED)
+    layout = _backend("layout", ORLEN)
+    monkeypatch.setitem(INPUT_MODULES, "flat", flat)
+    monkeypatch.setitem(INPUT_MODULES, "layout", layout)
+    monkeypatch.setattr(api, "DEFAULT_INPUT_READERS", [flat, layout])
+    return flat, layout
+
+
+@pytest.fixture
+def runs(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Names of the backends each template run used."""
+    seen: list[str] = []
+    run_template = api._run_template
+
+    def counting(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        seen.append(args[3].__name__)
+        return run_template(*args, **kwargs)
+
+    monkeypatch.setattr(api, "_run_template", counting)
+    return seen
+
+
+def _documents(folder: Path, count: int) -> list[str]:
+    paths = []
+    for index in range(count):
+        path = folder / f"invoice-{index}.pdf"
+        path.write_bytes(b"%PDF")
+        paths.append(str(path))
+    return paths
+
+
+def test_learns_the_backend_that_completes_a_template(
+    backends: tuple[Any, Any], runs: list[str], tmp_path: Path
+) -> None:
+    first, second = _documents(tmp_path, 2)
+    table_file = tmp_path / "routes.json"
+
+    expected = extract_data(first, TEMPLATES, routing=RoutingTable(table_file))
+    assert runs == ["flat", "layout"]
+
+    runs.clear()
+    table = RoutingTable(table_file)  # as in the next run
+    assert extract_data(second, TEMPLATES, routing=table) == expected
+    assert runs == ["layout"]
+
+    entry = RoutingTable(table_file).statistics()["pl.orlen.yml"]
+    assert entry["issuer"] == ORLEN_TEMPLATE["issuer"]
+    assert (entry["hits"], entry.get("misses", 0)) == (1, 0)
+    assert entry["backends"]["flat"]["runs"] == 1
+    assert entry["backends"]["flat"]["successes"] == 0
+    assert entry["backends"]["layout"]["runs"] == 2
+    assert entry["backends"]["layout"]["successes"] == 2
+
+
+def test_a_failing_route_falls_back_and_demotes_itself(
+    backends: tuple[Any, Any], runs: list[str], tmp_path: Path
+) -> None:
+    flat, layout = backends
+    table = RoutingTable(tmp_path / "routes.json")
+    documents = iter(_documents(tmp_path, 4))
+    extract_data(next(documents), TEMPLATES, routing=table)
+
+    # The documents change: now only the first backend's text is complete.
+    flat.content, layout.content = ORLEN, ORLEN_UNDATED
+    runs.clear()
+    assert extract_data(next(documents), TEMPLATES, routing=table)
+    assert runs == ["layout", "flat"]
+    assert table.statistics()["pl.orlen.yml"]["misses"] == 1
+
+    # flat has now completed the template, so it is no longer routed around.
+    runs.clear()
+    assert extract_data(next(documents), TEMPLATES, routing=table)
+    assert runs == ["flat"]
+
+
+def test_reliable_first_backend_is_not_routed(tmp_path: Path) -> None:
+    table = RoutingTable(tmp_path / "routes.json")
+    pdftotext, pdfium = INPUT_MODULES["pdftotext"], INPUT_MODULES["pdfium"]
+    table.record(ORLEN_TEMPLATE, pdftotext, True, 0.5)
+    assert table.route(ORLEN_TEMPLATE, pdftotext) is None
+    table.record(ORLEN_TEMPLATE, pdfium, True, 0.1)
+    assert table.route(ORLEN_TEMPLATE, pdfium) is None
+
+
+def test_cheapest_reliable_backend_wins(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    cheap, dear, probe = _backend("cheap", ""), _backend("dear", ""), _backend("p", "")
+    for name, module in (("cheap", cheap), ("dear", dear), ("probe", probe)):
+        monkeypatch.setitem(INPUT_MODULES, name, module)
+    table = RoutingTable(tmp_path / "routes.json")
+    table.record(ORLEN_TEMPLATE, probe, False, 0.1)
+    table.record(ORLEN_TEMPLATE, dear, True, 2.0)
+    table.record(ORLEN_TEMPLATE, cheap, True, 0.5)
+    assert table.route(ORLEN_TEMPLATE, probe) is cheap
+    table.record(ORLEN_TEMPLATE, cheap, False, 0.5)  # 1 of 2: below the bar
+    assert table.route(ORLEN_TEMPLATE, probe) is dear
+
+
+def test_writers_sharing_a_file_merge(tmp_path: Path) -> None:
+    path = tmp_path / "routes.json"
+    backend = INPUT_MODULES["pdftotext"]
+    one, two = RoutingTable(path), RoutingTable(path)
+    one.record(ORLEN_TEMPLATE, backend, True, 1.0)
+    two.record(ORLEN_TEMPLATE, backend, True, 2.0)
+    one.save()
+    two.save()
+    stats = RoutingTable(path).statistics()["pl.orlen.yml"]["backends"]["pdftotext"]
+    assert stats == {"runs": 2, "successes": 2, "seconds": 3.0}
+    leftovers = {p.name for p in tmp_path.iterdir()} - {"routes.json.lock"}
+    assert leftovers == {"routes.json"}
+
+
+def _save_repeatedly(path: str) -> None:
+    table = RoutingTable(path)
+    for _ in range(25):
+        table.record(ORLEN_TEMPLATE, INPUT_MODULES["pdftotext"], True, 1.0)
+        table.save()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses fork and flock")
+def test_processes_saving_at_once_lose_nothing(tmp_path: Path) -> None:
+    path = tmp_path / "routes.json"
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_save_repeatedly, args=(str(path),)) for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+    assert [process.exitcode for process in processes] == [0, 0, 0, 0]
+    stats = RoutingTable(path).statistics()["pl.orlen.yml"]["backends"]["pdftotext"]
+    assert stats["runs"] == 100
+
+
+def test_saves_between_documents_are_spaced_out(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    path = tmp_path / "routes.json"
+    table = RoutingTable(path)
+    table.hit(ORLEN_TEMPLATE)
+    table.save_if_due()
+    table.hit(ORLEN_TEMPLATE)
+    table.save_if_due()  # too soon
+    assert RoutingTable(path).statistics()["pl.orlen.yml"]["hits"] == 1
+    monkeypatch.setattr(routing, "SAVE_INTERVAL", 0)
+    table.save_if_due()
+    assert RoutingTable(path).statistics()["pl.orlen.yml"]["hits"] == 2
+
+
+def test_unreadable_file_starts_afresh(tmp_path: Path) -> None:
+    path = tmp_path / "routes.json"
+    path.write_text("{not json", encoding="utf-8")
+    table = RoutingTable(path)
+    assert table.statistics() == {}
+    table.hit(ORLEN_TEMPLATE)
+    table.save()
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["templates"]["pl.orlen.yml"]["hits"] == 1
+
+
+def test_forced_backend_is_neither_routed_nor_recorded(
+    backends: tuple[Any, Any], tmp_path: Path
+) -> None:
+    flat, _layout = backends
+    table = RoutingTable(tmp_path / "routes.json")
+    (document,) = _documents(tmp_path, 1)
+    extract_data(document, TEMPLATES, flat, routing=table)
+    assert table.statistics() == {}
+
+
+def test_pickles_as_its_path(tmp_path: Path) -> None:
+    table = RoutingTable(tmp_path / "routes.json")
+    table.hit(ORLEN_TEMPLATE)
+    table.save()
+    clone = pickle.loads(pickle.dumps(table))  # noqa: S301
+    assert clone.path == table.path
+    assert clone.statistics() == table.statistics()
@@ -0,0 +1,145 @@
+"""The ``tables`` plugin's ``columns`` mode slices fixed-width rows by position."""
+
+import datetime
+from typing import Any
+
+import pytest
+
+from invoice2data.exceptions import TemplateSyntaxError
+from invoice2data.extract.invoice_template import InvoiceTemplate
+from invoice2data.extract.plugins import tables
+
+
+pytestmark = pytest.mark.windows_strict
+
+OYO = """\
+Guest Name: Sanjay                                                Date: 31/12/2017
+
+Hotel Details                                   Check In     Check Out     Rooms
+OYO 4189 Resort Nanganallur,                    31/12/2017   01/01/2018      1
+Booking ID
+"""
+
+ITEMS = """\
+Invoice 42
+Item            Qty      Price     Amount
+Screws M4        10       0.15       1.50
+Nut                       0.10
+Washer, steel   200       0.02       4.00
+Total                                5.50
+"""
+
+
+def _template(table: dict[str, Any]) -> InvoiceTemplate:
+    return InvoiceTemplate(
+        [
+            ("issuer", "test"),
+            ("keywords", ["test"]),
+            ("template_name", "columns.yml"),
+            ("tables", [table]),
+        ]
+    )
+
+
+def _extract(table: dict[str, Any], content: str) -> dict[str, Any] | None:
+    return tables.extract(_template(table), content, {})
+
+
+def test_columns_from_header_labels() -> None:
+    output = _extract(
+        {
+            "start": "Hotel Details",
+            "end": "Booking ID",
+            "columns": {
+                "hotel_details": "Hotel Details",
+                "date_check_in": "Check In",
+                "date_check_out": "Check Out",
+                "qty_rooms": "Rooms",
+            },
+            "types": {"qty_rooms": "int"},
+        },
+        OYO,
+    )
+    assert output == {
+        "hotel_details": "OYO 4189 Resort Nanganallur,",
+        "date_check_in": datetime.datetime(2017, 12, 31),
+        "date_check_out": datetime.datetime(2018, 1, 1),
+        "qty_rooms": 1,
+    }
+
+
+def test_columns_from_offsets_keep_blank_cells_aligned() -> None:
+    output = _extract(
+        {
+            "start": r"Item\s+Qty",
+            "end": "Total",
+            "columns": {
+                "description": [0, 16],
+                "qty": [16, 21],
+                "price": [21, 32],
+                "amount_line": [32, None],
+            },
+            "types": {"qty": "int", "price": "float"},
+            "fields": {"amount_line": {"group": "sum"}},
+        },
+        ITEMS,
+    )
+    assert output == {
+        "description": ["Screws M4", "Nut", "Washer, steel"],
+        "qty": [10, None, 200],
+        "price": [0.15, 0.1, 0.02],
+        "amount_line": 5.5,
+    }
+
+
+def test_labels_and_offsets_slice_like_the_body_regex() -> None:
+    common = {"start": r"Item\s+Qty", "end": "Total", "types": {"qty": "int"}}
+    regex = _extract(
+        {
+            **common,
+            "body": r"(?P<item>\S+(?: \S+)*)\s+(?P<qty>\d+)\s+"
+            r"(?P<price>[\d.]+)\s+(?P<amount>[\d.]+)",
+        },
+        ITEMS.replace("Nut                       0.10\n", ""),
+    )
+    labels = _extract(
+        {
+            **common,
+            "columns": {
+                "item": "Item",
+                "qty": "Qty",
+                "price": "Price",
+                "amount": "Amount",
+            },
+        },
+        ITEMS.replace("Nut                       0.10\n", ""),
+    )
+    assert regex is not None
+    assert labels == regex
+
+
+def test_a_missing_label_skips_the_table() -> None:
+    table = {"start": "Hotel Details", "end": "Booking ID", "columns": {"x": "Nope"}}
+    assert _extract(table, OYO) == {}
+
+
+@pytest.mark.parametrize(
+    "columns", [["a", "b"], {"a": [0]}, {"a": "Item", "b": [0, 4]}, {}]
+)
+def test_malformed_columns_are_a_template_error(columns: Any) -> None:
+    with pytest.raises(TemplateSyntaxError, match=r"columns|column"):
+        _extract({"start": "Item", "end": "Total", "columns": columns}, ITEMS)
+
+
+def test_body_is_still_required_without_columns() -> None:
+    with pytest.raises(TemplateSyntaxError, match="`body`"):
+        _extract({"start": "Item", "end": "Total"}, ITEMS)
+
+
+def test_right_aligned_values_wider_than_their_label() -> None:
+    content = "Code   Net\nA     1234.00\nBB      5.00\nEnd\n"
+    output = _extract(
+        {"start": "Code", "end": "End", "columns": {"code": "Code", "net": "Net"}},
+        content,
+    )
+    assert output == {"code": ["A", "BB"], "net": ["1234.00", "5.00"]}
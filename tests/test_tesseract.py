@@ -4,6 +4,7 @@ These tests exercise ``input/tesseract.py`` without needing real ``tesseract`` /
 ImageMagick / ``pdftotext`` binaries or image fixtures.
 """
 
+import asyncio
 import subprocess
 from pathlib import Path
 from typing import Any
@@ -12,11 +13,24 @@ from unittest.mock import MagicMock
 import pytest
 
 from invoice2data.input import tesseract
+from invoice2data.input._boxes import WordBoxes
+
+
+COMPARE = Path(__file__).parent / "compare"
 
 
 pytestmark = pytest.mark.windows_strict
 
 
+@pytest.fixture(autouse=True)
+def _fresh_ocr_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Identical fixture bytes would otherwise share one cached OCR result."""
+    tesseract._ocr_pdfs.clear()
+    tesseract.installed_languages.cache_clear()
+    monkeypatch.setattr(tesseract, "_configured_languages", None)
+    monkeypatch.delenv(tesseract.LANGUAGES_ENV, raising=False)
+
+
 def test_is_available_true(mocker: "pytest_mock.MockerFixture") -> None:  # type: ignore[name-defined]  # noqa
     mocker.patch("invoice2data.input.tesseract.shutil.which", return_value="/usr/bin/x")
     assert tesseract.is_available() is True
@@ -29,9 +43,21 @@ def test_is_available_false_when_convert_missing(
         "invoice2data.input.tesseract.shutil.which",
         side_effect=lambda name: "/usr/bin/tesseract" if name == "tesseract" else None,
     )
+    mocker.patch("invoice2data.input.tesseract._pdfium_available", return_value=False)
     assert tesseract.is_available() is False
 
 
+def test_is_available_without_imagemagick_when_pypdfium2_renders(
+    mocker: "pytest_mock.MockerFixture",  # type: ignore[name-defined]  # noqa
+) -> None:
+    mocker.patch(
+        "invoice2data.input.tesseract.shutil.which",
+        side_effect=lambda name: "/usr/bin/tesseract" if name == "tesseract" else None,
+    )
+    mocker.patch("invoice2data.input.tesseract._pdfium_available", return_value=True)
+    assert tesseract.is_available() is True
+
+
 def test_imagemagick_cmd_prefers_magick_over_convert(
     mocker: "pytest_mock.MockerFixture",  # type: ignore[name-defined]  # noqa
 ) -> None:
@@ -109,6 +135,7 @@ def test_to_text_requires_imagemagick(
         "invoice2data.input.tesseract.shutil.which",
         side_effect=lambda name: "/usr/bin/tesseract" if name == "tesseract" else None,
     )
+    mocker.patch("invoice2data.input.tesseract._pdfium_available", return_value=False)
     with pytest.raises(OSError, match="imagemagick not installed"):
         tesseract.to_text(str(pdf))
 
@@ -116,14 +143,32 @@ def test_to_text_requires_imagemagick(
 def _mock_pipeline(
     mocker: "pytest_mock.MockerFixture",  # type: ignore[name-defined]  # noqa
     output: bytes = b"Extracted invoice text\n",
+    pages: int = 1,
 ) -> Any:
-    """Mock the binaries lookup, language detection and the Popen pipeline."""
+    """Mock the binaries lookup, language detection and the Popen pipeline.
+
+    ImageMagick "renders" ``pages`` page images, tesseract "writes" a PDF
+    for each and pdfunite joins them, as the real tools do.
+    """
     mocker.patch("invoice2data.input.tesseract.shutil.which", return_value="/usr/bin/x")
     mocker.patch("invoice2data.input.tesseract.get_languages", return_value="eng")
     popen = mocker.patch("invoice2data.input.tesseract.Popen")
     proc = popen.return_value
     proc.communicate.return_value = (output, b"")
     proc.wait.return_value = 0
+    proc.returncode = 0
+
+    def start(cmd: list[str], **kwargs: Any) -> Any:
+        if cmd[0] in {"magick", "convert"} and "%04d" in cmd[-1]:
+            for index in range(pages):
+                Path(cmd[-1] % index).write_bytes(b"\x89PNG\r\n")
+        if cmd[0] == "tesseract":
+            Path(cmd[-3] + ".pdf").write_bytes(b"%PDF-1.4")
+        if cmd[0] == "pdfunite":
+            Path(cmd[-1]).write_bytes(b"%PDF-1.4")
+        return proc
+
+    popen.side_effect = start
     return popen
 
 
@@ -148,24 +193,144 @@ def test_to_text_image_pipeline(
     assert tesseract.to_text(str(img)) == "Extracted invoice text\n"
 
 
-def test_to_text_with_area_details(
+def test_to_text_ocrs_pages_in_parallel_and_joins_them_in_order(
     tmp_path: Path,
     mocker: "pytest_mock.MockerFixture",  # type: ignore[name-defined]  # noqa
 ) -> None:
+    """Each page gets its own tesseract; pdfunite joins them in page order."""
     pdf = tmp_path / "invoice.pdf"
     pdf.write_bytes(b"%PDF-1.4")
+    popen = _mock_pipeline(mocker, pages=3)
+    mocker.patch("invoice2data.input.tesseract.max_ocr_workers", return_value=2)
+    mocker.patch("invoice2data.input.ocr_pool.max_ocr_workers", return_value=2)
+
+    assert tesseract.to_text(str(pdf)) == "Extracted invoice text\n"
+
+    calls = [call for call in popen.call_args_list if call.args]
+    tess = [call for call in calls if call.args[0][0] == "tesseract"]
+    assert sorted(Path(call.args[0][-4]).name[-8:] for call in tess) == [
+        "0000.png",
+        "0001.png",
+        "0002.png",
+    ]
+    assert all(call.kwargs["env"]["OMP_THREAD_LIMIT"] == "1" for call in tess)
+    unite = next(call.args[0] for call in calls if call.args[0][0] == "pdfunite")
+    assert [Path(arg).name[-8:] for arg in unite[1:-1]] == [
+        "0000.pdf",
+        "0001.pdf",
+        "0002.pdf",
+    ]
+    assert not list(tesseract._ocr_pdfs._dir().glob("*-0*.*"))  # pages cleaned up
+
+
+def test_async_pdf_without_pdfium_matches_the_sync_pipeline(
+    tmp_path: Path,
+    mocker: "pytest_mock.MockerFixture",  # type: ignore[name-defined]  # noqa
+) -> None:
+    """Both paths share the text cache, so they must OCR a PDF the same way."""
+    pdf = tmp_path / "invoice.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+    popen = _mock_pipeline(mocker, pages=3)
+    mocker.patch("invoice2data.input.tesseract._pdfium_available", return_value=False)
+
+    text = asyncio.run(tesseract.to_text_async(str(pdf)))
+
+    assert text == tesseract.to_text(str(pdf)) == "Extracted invoice text\n"
+    commands = [call.args[0] for call in popen.call_args_list if call.args]
+    assert all("-append" not in command for command in commands)
+    assert [command[0] for command in commands].count("tesseract") == 3  # kept
+
+
+def _scan(tmp_path: Path, pages: int) -> Path:
+    """Write a ``pages``-page PDF that pypdfium2 can render."""
+    pypdfium2 = pytest.importorskip("pypdfium2")
+    source = pypdfium2.PdfDocument(str(COMPARE / "oyo.pdf"))
+    document = pypdfium2.PdfDocument.new()
+    document.import_pages(source, [0] * pages)
+    target = tmp_path / "scan.pdf"
+    document.save(str(target))
+    return target
+
+
+def test_to_text_renders_pages_in_process_without_imagemagick(
+    tmp_path: Path,
+    mocker: "pytest_mock.MockerFixture",  # type: ignore[name-defined]  # noqa
+) -> None:
+    """pypdfium2 renders each page; tesseract reads it as a PGM from stdin."""
+    pdf = _scan(tmp_path, 2)
     popen = _mock_pipeline(mocker)
-    area = {"f": 1, "l": 1, "r": 100, "x": 0, "y": 0, "W": 600, "H": 200}
+    mocker.patch(
+        "invoice2data.input.tesseract.shutil.which",
+        side_effect=lambda name: None if name in {"magick", "convert"} else "/x",
+    )
 
-    assert tesseract.to_text(str(pdf), area) == "Extracted invoice text\n"
+    assert tesseract.to_text(str(pdf)) == "Extracted invoice text\n"
 
-    pdftotext_cmd = next(
-        call.args[0]
-        for call in popen.call_args_list
-        if call.args and call.args[0][0] == "pdftotext"
+    commands = [call.args[0] for call in popen.call_args_list if call.args]
+    assert not [cmd for cmd in commands if cmd[0] in {"magick", "convert"}]
+    tess = [cmd for cmd in commands if cmd[0] == "tesseract"]
+    assert len(tess) == 2
+    assert all(cmd[cmd.index("--dpi") + 1] == "300" for cmd in tess)
+    assert all("stdin" in cmd for cmd in tess)
+    communicated = popen.return_value.communicate.call_args_list
+    pgms = [call.args[0] for call in communicated if call.args]
+    assert len(pgms) == 2
+    for image in pgms:
+        magic, size, depth, pixels = image.split(b"\n", 3)
+        width, height = map(int, size.split())
+        assert (magic, depth, len(pixels)) == (b"P5", b"255", width * height)
+
+
+def test_pages_are_rendered_as_workers_free_up(
+    tmp_path: Path,
+    mocker: "pytest_mock.MockerFixture",  # type: ignore[name-defined]  # noqa
+) -> None:
+    """Memory stays flat: no more pages are rendered than are being OCRed."""
+    pdf = _scan(tmp_path, 4)
+    mocker.patch("invoice2data.input.ocr_pool.max_ocr_workers", return_value=1)
+    mocker.patch("invoice2data.input.tesseract.max_ocr_workers", return_value=1)
+    rendered = 0
+    in_flight: list[int] = []
+    render = tesseract._page_images
+
+    def counting(document: Any) -> Any:
+        nonlocal rendered
+        for image in render(document):
+            rendered += 1
+            yield image
+
+    def ocr(language: str, image: Any, output: str, env: Any = None) -> None:
+        in_flight.append(rendered)
+
+    mocker.patch("invoice2data.input.tesseract._page_images", counting)
+    mocker.patch("invoice2data.input.tesseract._run_tesseract", ocr)
+    mocker.patch("invoice2data.input.tesseract.Popen")
+    tesseract._run_ocr(str(pdf), None, "eng", str(tmp_path / "out"))
+    assert in_flight == [1, 2, 3, 4]
+
+
+def test_to_text_with_area_details(
+    tmp_path: Path,
+    mocker: "pytest_mock.MockerFixture",  # type: ignore[name-defined]  # noqa
+) -> None:
+    """Areas are cropped from the OCR layer's word boxes; the OCR runs once."""
+    pdf = tmp_path / "invoice.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+    popen = _mock_pipeline(mocker)
+    words = WordBoxes(
+        [(1, 10.0, 10.0, 60.0, 20.0, "Invoice"), (1, 10.0, 300.0, 60.0, 310.0, "Total")]
     )
-    assert "-W" in pdftotext_cmd
-    assert "600" in pdftotext_cmd  # area values are stringified into the command
+    bbox = mocker.patch("invoice2data.input.pdftotext._bbox_words", return_value=words)
+    top = {"f": 1, "l": 1, "r": 72, "x": 0, "y": 0, "W": 600, "H": 200}
+    bottom = {"f": 1, "l": 1, "r": 72, "x": 0, "y": 200, "W": 600, "H": 200}
+
+    assert tesseract.to_text(str(pdf), top) == "Invoice"
+    assert tesseract.to_text(str(pdf), bottom) == "Total"
+
+    commands = [call.args[0][0] for call in popen.call_args_list if call.args]
+    assert commands.count("tesseract") == 1
+    assert "pdftotext" not in commands
+    bbox.assert_called_once()
 
 
 def test_to_text_missing_area_key_raises_template_syntax_error(
@@ -195,6 +360,56 @@ def test_to_text_tesseract_timeout_still_returns(
     assert tesseract.to_text(str(pdf)) == "Extracted invoice text\n"
 
 
+def test_a_missing_page_is_not_joined_or_kept(
+    tmp_path: Path,
+    mocker: "pytest_mock.MockerFixture",  # type: ignore[name-defined]  # noqa
+) -> None:
+    """A page tesseract timed out on would shift the pages after it."""
+    pdf = tmp_path / "invoice.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+    popen = _mock_pipeline(mocker, pages=3)
+    start = popen.side_effect
+
+    def page_timed_out(cmd: list[str], **kwargs: Any) -> Any:
+        proc = start(cmd, **kwargs)
+        if cmd[0] == "tesseract" and cmd[-3].endswith("-0001"):
+            Path(cmd[-3] + ".pdf").unlink()
+        return proc
+
+    popen.side_effect = page_timed_out
+    assert tesseract.to_text(str(pdf)) == ""
+    assert tesseract.to_text(str(pdf)) == ""
+    commands = [call.args[0][0] for call in popen.call_args_list if call.args]
+    assert "pdfunite" not in commands
+    assert commands.count("tesseract") == 6  # not kept, so OCRed again
+    assert tesseract._ocr_pdfs.nbytes == 0
+
+
+@pytest.mark.parametrize("step", ["magick", "pdfunite"])
+def test_a_timed_out_render_or_join_is_not_kept(
+    tmp_path: Path,
+    mocker: "pytest_mock.MockerFixture",  # type: ignore[name-defined]  # noqa
+    step: str,
+) -> None:
+    pdf = tmp_path / "invoice.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+    popen = _mock_pipeline(mocker, pages=2)
+    start = popen.side_effect
+
+    def slow(cmd: list[str], **kwargs: Any) -> Any:
+        proc = start(cmd, **kwargs)
+        if cmd[0] != step:
+            return proc
+        slow_proc = mocker.MagicMock()
+        slow_proc.communicate.side_effect = subprocess.TimeoutExpired(step, 180)
+        return slow_proc
+
+    popen.side_effect = slow
+    assert tesseract.to_text(str(pdf)) == ""
+    assert tesseract._ocr_pdfs.nbytes == 0
+    assert not list(tesseract._ocr_pdfs._dir().glob("*.pdf"))
+
+
 def test_to_text_pdftotext_timeout_returns_empty(
     tmp_path: Path,
     mocker: "pytest_mock.MockerFixture",  # type: ignore[name-defined]  # noqa
@@ -236,3 +451,61 @@ def test_get_languages_error_in_output(
     mocker.patch("invoice2data.input.tesseract.run", return_value=proc)
     with pytest.raises(OSError, match="Error opening data file"):
         tesseract.get_languages()
+
+
+def _installed(mocker: "pytest_mock.MockerFixture", languages: str) -> Any:  # type: ignore[name-defined]  # noqa
+    return mocker.patch(
+        "invoice2data.input.tesseract.get_languages", return_value=languages
+    )
+
+
+def test_installed_languages_are_asked_once(
+    mocker: "pytest_mock.MockerFixture",  # type: ignore[name-defined]  # noqa
+) -> None:
+    query = _installed(mocker, "osd+eng+deu")
+    assert tesseract.installed_languages() == ("deu", "eng", "osd")
+    assert tesseract.cache_config() == "eng"
+    assert tesseract.resolve_languages(["de"]) == "deu"
+    query.assert_called_once()
+
+
+def test_resolve_languages(
+    mocker: "pytest_mock.MockerFixture",  # type: ignore[name-defined]  # noqa
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _installed(mocker, "eng+deu+fra+chi_sim")
+    resolve = tesseract.resolve_languages
+    assert resolve() == "eng"  # first pass: English
+    assert resolve(["de", "en"]) == "deu+eng"  # template codes, in order
+    assert resolve(["zh", "deu"]) == "chi_sim+deu"  # uninstalled ones dropped
+    assert resolve(()) == "chi_sim+deu+eng+fra"  # every installed language
+    assert resolve(["pl"]) == "eng"  # none installed: back to the first pass
+    monkeypatch.setenv(tesseract.LANGUAGES_ENV, "fra+deu")
+    assert resolve() == "fra+deu"
+    tesseract.configure_languages(["de"])
+    assert resolve() == "deu"
+
+
+def test_resolve_languages_without_english(
+    mocker: "pytest_mock.MockerFixture",  # type: ignore[name-defined]  # noqa
+) -> None:
+    _installed(mocker, "deu+fra")
+    assert tesseract.resolve_languages() == "deu+fra"
+
+
+def test_to_text_passes_requested_languages(
+    tmp_path: Path,
+    mocker: "pytest_mock.MockerFixture",  # type: ignore[name-defined]  # noqa
+) -> None:
+    img = tmp_path / "invoice.png"
+    img.write_bytes(b"\x89PNG\r\n")
+    popen = _mock_pipeline(mocker)
+    _installed(mocker, "eng+deu")
+    tesseract.to_text(str(img))
+    tesseract.to_text(str(img), languages=("de",))
+    languages = [
+        call.args[0][2]
+        for call in popen.call_args_list
+        if call.args[0][0] == "tesseract"
+    ]
+    assert languages == ["eng", "deu"]
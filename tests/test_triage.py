@@ -0,0 +1,124 @@
+"""Triage tells scans from text PDFs and sends scans straight to OCR."""
+
+import asyncio
+import types
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from invoice2data import api
+from invoice2data import extract_data
+from invoice2data import extract_data_async
+from invoice2data.extract.loader import read_templates
+from invoice2data.input.triage import MIXED
+from invoice2data.input.triage import SCANNED
+from invoice2data.input.triage import TEXT
+from invoice2data.input.triage import classify
+
+
+pytestmark = pytest.mark.windows_strict
+
+pypdfium2 = pytest.importorskip("pypdfium2")
+
+COMPARE = Path(__file__).parent / "compare"
+TEMPLATES = read_templates()
+ORLEN = (COMPARE / "Orlen.txt").read_text(encoding="utf-8")
+
+
+def _pdf(path: Path, *pages: str) -> str:
+    """Write a PDF whose pages are ``"text"`` (copied) or ``"scan"`` (rendered)."""
+    source = pypdfium2.PdfDocument(str(COMPARE / "oyo.pdf"))
+    document = pypdfium2.PdfDocument.new()
+    for kind in pages:
+        if kind == "text":
+            document.import_pages(source, [0])
+            continue
+        width, height = source[0].get_size()
+        page = document.new_page(width, height)
+        image = pypdfium2.PdfImage.new(document)
+        image.set_bitmap(source[0].render(scale=0.5))
+        image.set_matrix(pypdfium2.PdfMatrix().scale(width, height))
+        page.insert_obj(image)
+        page.gen_content()
+    document.save(str(path))
+    return str(path)
+
+
+def test_classifies_pages(tmp_path: Path) -> None:
+    assert classify(str(COMPARE / "oyo.pdf")).kind == TEXT
+    scan = classify(_pdf(tmp_path / "scan.pdf", "scan", "scan"))
+    assert (scan.kind, scan.pages, scan.image_pages) == (SCANNED, 2, 2)
+    assert classify(_pdf(tmp_path / "mixed.pdf", "text", "scan")).kind == MIXED
+
+
+def test_only_leading_pages_are_inspected(tmp_path: Path) -> None:
+    path = _pdf(tmp_path / "late.pdf", "scan", "scan", "scan", "text")
+    assert classify(path).kind == SCANNED
+    assert classify(path, pages=4).kind == MIXED
+
+
+def test_images_are_scans(tmp_path: Path) -> None:
+    assert classify(str(tmp_path / "receipt.JPG")).kind == SCANNED
+
+
+def _backend(name: str, content: str, calls: list[str]) -> types.ModuleType:
+    module = types.ModuleType(name)
+
+    def to_text(path: str) -> str:
+        calls.append(name)
+        return content
+
+    module.to_text = to_text  # type: ignore[attr-defined]
+    return module
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    seen: list[str] = []
+    monkeypatch.setattr(
+        api,
+        "DEFAULT_INPUT_READERS",
+        [_backend("pdfium", "", seen), _backend("pdftotext", "", seen)],
+    )
+    monkeypatch.setattr(api, "DEFAULT_OCR_READERS", [_backend("ocr", ORLEN, seen)])
+    return seen
+
+
+def test_scans_go_straight_to_ocr(calls: list[str], tmp_path: Path) -> None:
+    scan = _pdf(tmp_path / "scan.pdf", "scan")
+    assert extract_data(scan, TEMPLATES, triage=True)["issuer"]
+    assert calls == ["ocr"]
+
+
+def test_async_scans_go_straight_to_ocr(calls: list[str], tmp_path: Path) -> None:
+    scan = _pdf(tmp_path / "scan.pdf", "scan")
+    result = asyncio.run(extract_data_async(scan, TEMPLATES, triage=True))
+    assert result["issuer"]
+    assert calls == ["ocr"]
+
+
+@pytest.mark.parametrize("pages", [("text",), ("text", "scan")])
+def test_text_and_mixed_documents_take_the_cascade(
+    calls: list[str], tmp_path: Path, pages: Any
+) -> None:
+    extract_data(_pdf(tmp_path / "doc.pdf", *pages), TEMPLATES, triage=True)
+    assert calls[:2] == ["pdfium", "pdftotext"]
+    assert "ocr" not in calls
+
+
+def test_unreadable_documents_take_the_cascade(
+    calls: list[str], tmp_path: Path
+) -> None:
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+    extract_data(str(broken), TEMPLATES, triage=True)
+    assert calls[:2] == ["pdfium", "pdftotext"]
+
+
+def test_without_an_ocr_backend_scans_take_the_cascade(
+    calls: list[str], monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(api, "DEFAULT_OCR_READERS", [])
+    extract_data(_pdf(tmp_path / "scan.pdf", "scan"), TEMPLATES, triage=True)
+    assert calls[:2] == ["pdfium", "pdftotext"]
@@ -0,0 +1,77 @@
+"""Indexed word boxes crop exactly what a scan of every word would."""
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from invoice2data.input._boxes import Word
+from invoice2data.input._boxes import WordBoxes
+from invoice2data.input._boxes import WordCache
+
+
+pytestmark = pytest.mark.windows_strict
+
+_coord = st.floats(min_value=0, max_value=800, allow_nan=False)
+
+
+@st.composite
+def _word(draw: st.DrawFn) -> Word:
+    x, y = draw(_coord), draw(_coord)
+    width = draw(st.floats(min_value=0.1, max_value=200))
+    height = draw(st.floats(min_value=0.1, max_value=40))
+    return (draw(st.integers(1, 4)), x, y, x + width, y + height, draw(st.text()))
+
+
+def _scan(
+    words: list[Word], first: int, last: int, x0: float, y0: float, x1: float, y1: float
+) -> list[Word]:
+    selected = [
+        w
+        for w in words
+        if first <= w[0] <= last and w[1] < x1 and w[3] > x0 and w[2] < y1 and w[4] > y0
+    ]
+    return sorted(selected, key=lambda w: (w[0], w[2], w[1]))
+
+
+@given(
+    words=st.lists(_word(), max_size=60),
+    pages=st.tuples(st.integers(1, 4), st.integers(1, 4)),
+    corner=st.tuples(_coord, _coord),
+    size=st.tuples(_coord, _coord),
+)
+def test_select_matches_a_full_scan(
+    words: list[Word],
+    pages: tuple[int, int],
+    corner: tuple[float, float],
+    size: tuple[float, float],
+) -> None:
+    first, last = pages
+    x0, y0 = corner
+    x1, y1 = x0 + size[0], y0 + size[1]
+    boxes = WordBoxes(words)
+    assert len(boxes) == len(words)
+    assert boxes.select(first, last, x0, y0, x1, y1) == _scan(
+        words, first, last, x0, y0, x1, y1
+    )
+
+
+def test_cache_stays_within_its_budget() -> None:
+    boxes = WordBoxes([(1, 0.0, 0.0, 10.0, 10.0, "word")] * 100)
+    cache = WordCache(max_bytes=boxes.nbytes * 2)
+    for key in range(3):
+        cache.put(key, boxes)
+    assert cache.get(0) is None
+    assert cache.get(1) is boxes
+    assert cache.nbytes == boxes.nbytes * 2
+
+    cache.put(3, boxes)  # evicts 2, the least recently used
+    assert cache.get(2) is None
+    assert cache.get(1) is boxes
+
+
+def test_documents_over_budget_are_not_kept() -> None:
+    boxes = WordBoxes([(1, 0.0, 0.0, 10.0, 10.0, "word")])
+    cache = WordCache(max_bytes=boxes.nbytes - 1)
+    cache.put("doc", boxes)
+    assert cache.get("doc") is None
+    assert cache.nbytes == 0